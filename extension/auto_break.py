@@ -13,7 +13,7 @@ from gtools.core.growtopia.items_dat import item_database
 from gtools.core.growtopia.packet import NetPacket, NetType, PreparedPacket, TankFlags, TankPacket, TankType
 from gtools.core.growtopia.particles import ParticleID
 from gtools.core.growtopia.player import CharacterFlags
-from gtools.core.growtopia.world import ItemSuckerTile
+from gtools.core.growtopia.world import ItemSuckerTile, TileExtraType
 from gtools.core.mixer import AudioMixer, Sound
 from gtools.core.task_scheduler import schedule_task
 from gtools.protogen.extension_pb2 import (
@@ -29,6 +29,7 @@ from gtools.protogen.extension_pb2 import (
     Interest,
     InterestCallFunction,
     InterestState,
+    InterestStateUpdate,
     PendingPacket,
 )
 from gtools.proxy.extension.client.sdk import Extension, dispatch, register_thread
@@ -91,7 +92,8 @@ class AutoBreakExtension(Extension):
     def __init__(self) -> None:
         super().__init__(
             name="auto_break",
-            interest=[Interest(interest=INTEREST_STATE_UPDATE)],
+            # every kind of update, but other players are of no interest and our position is only read when punching
+            interest=[Interest(interest=INTEREST_STATE_UPDATE, state_update=InterestStateUpdate(me=True, position_rate=20))],
         )
         self.enabled = False
         self.target: list[ivec2] = []
@@ -275,7 +277,7 @@ class AutoBreakExtension(Extension):
     @dispatch(s.command_toggle("/gaut", id=s.auto))
     def _gaut_status(self, _event: PendingPacket) -> PendingPacket | None:
         if self.state.world:
-            for sucker in self.state.world.find_tile(where=lambda x: x.extra and isinstance(x.extra, ItemSuckerTile)):
+            for sucker in self.state.world.tiles_with_extra(TileExtraType.ITEM_SUCKER_TILE):
                 assert sucker.extra
                 extra = sucker.extra.get(ItemSuckerTile)
 
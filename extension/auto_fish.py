@@ -12,8 +12,21 @@ from gtools.protogen.extension_pb2 import (
     INTEREST_STATE_UPDATE,
     INTEREST_TILE_CHANGE_REQUEST,
     Interest,
+    InterestStateUpdate,
     PendingPacket,
 )
+from gtools.protogen.state_pb2 import (
+    STATE_ENTER_WORLD,
+    STATE_EXIT_WORLD,
+    STATE_MODIFY_INVENTORY,
+    STATE_MODIFY_ITEM,
+    STATE_PLAYER_UPDATE,
+    STATE_SEND_INVENTORY,
+    STATE_SET_CHARACTER_STATE,
+    STATE_SET_MY_PLAYER,
+    STATE_TILE_CHANGE_REQUEST,
+    STATE_UPDATE_STATUS,
+)
 from gtools.proxy.extension.client.sdk import Extension, dispatch
 from gtools.core.growtopia.packet import NetPacket, NetType, PreparedPacket, TankFlags, TankPacket, TankType
 from gtools.proxy.extension.client.sdk_utils import helper
@@ -26,7 +39,31 @@ s = helper()
 
 class AutoFishExtension(Extension):
     def __init__(self) -> None:
-        super().__init__(name="auto_fish", interest=[Interest(interest=INTEREST_STATE_UPDATE)])
+        super().__init__(
+            name="auto_fish",
+            interest=[
+                Interest(
+                    interest=INTEREST_STATE_UPDATE,
+                    # only what the bait check and facing need, nothing about other players or the world's tiles
+                    state_update=InterestStateUpdate(
+                        what=[
+                            STATE_SET_MY_PLAYER,
+                            STATE_UPDATE_STATUS,
+                            STATE_ENTER_WORLD,
+                            STATE_EXIT_WORLD,
+                            STATE_SEND_INVENTORY,
+                            STATE_MODIFY_INVENTORY,
+                            STATE_MODIFY_ITEM,
+                            STATE_TILE_CHANGE_REQUEST,
+                            STATE_PLAYER_UPDATE,
+                            STATE_SET_CHARACTER_STATE,
+                        ],
+                        me=True,
+                        position_rate=10,
+                    ),
+                )
+            ],
+        )
 
         self.enabled = False
         self.fish_pos = ivec2(-1, -1)
@@ -88,3 +88,33 @@ EXPORT int32_t proton_hash(const void *data_, size_t len) {
 
   return h;
 }
+
+EXPORT uint32_t rolling_chksum(const uint8_t *buf, size_t len, uint32_t shift) {
+  uint32_t chksum = 0;
+  for (size_t i = 0; i < len; i++) {
+    uint8_t shifted = (uint8_t)(buf[i] + shift + i + 2);
+    chksum += shift + (uint32_t)i + shifted;
+  }
+  return chksum;
+}
+
+EXPORT uint32_t rolling_chksum2(const uint8_t *buf, size_t len, uint32_t shift) {
+  uint32_t chksum = 0;
+  for (size_t i = 0; i < len; i++) {
+    chksum += shift + (uint32_t)i + buf[i];
+  }
+  return chksum;
+}
+
+EXPORT void rolling_shift(const uint8_t *buf, uint8_t *out, size_t len, uint32_t shift) {
+  for (size_t i = 0; i < len; i++) {
+    out[i] = (uint8_t)(buf[i] + shift + i);
+  }
+}
+
+EXPORT void hex_rolling_shift(const uint8_t *buf, uint8_t *out, size_t len) {
+  for (size_t i = 0; i < len; i++) {
+    uint8_t shift = (buf[i] >= 'a' && buf[i] <= 'f') ? 0x9E : 0xBE;
+    out[i] = (uint8_t)(buf[i] + shift + i);
+  }
+}
@@ -2,60 +2,118 @@ import ctypes
 from datetime import datetime
 import hashlib
 import random
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
 from gtools.core.dll_loader import DLL
 
 crypto_lib = DLL("gtools/core/growtopia", "crypto")
-if crypto_lib.supported:
-    crypto_lib.proton_hash.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
-    crypto_lib.proton_hash.restype = ctypes.c_int32
 
-    def proton_hash(data: bytes) -> int:
-        return crypto_lib.proton_hash(data, len(data))
 
-else:
+def _native(name: str, argtypes: list[Any], restype: Any) -> Callable[..., Any] | None:
+    # older builds of the library only export proton_hash
+    if not crypto_lib.supported:
+        return None
+    fn = getattr(crypto_lib, name, None)
+    if fn is not None:
+        fn.argtypes = argtypes
+        fn.restype = restype
+    return fn
+
+
+_c_proton_hash = _native("proton_hash", [ctypes.c_void_p, ctypes.c_size_t], ctypes.c_int32)
+_c_rolling_chksum = _native("rolling_chksum", [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_uint32], ctypes.c_uint32)
+_c_rolling_chksum2 = _native("rolling_chksum2", [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_uint32], ctypes.c_uint32)
+_c_rolling_shift = _native("rolling_shift", [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_size_t, ctypes.c_uint32], None)
+_c_hex_rolling_shift = _native("hex_rolling_shift", [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_size_t], None)
+
+# below this numpy's per call overhead costs more than the python loop saves
+_NUMPY_MIN = 64
+
+_HEX_LOWER = np.zeros(256, dtype=bool)
+_HEX_LOWER[np.frombuffer(b"abcdef", dtype=np.uint8)] = True
+
+
+def _proton_hash_py(data: bytes) -> int:
+    # every step depends on the carry of the previous one, there is nothing to vectorize within one buffer
+    h = 0x55555555
+    for b in data:
+        h = (((h << 5) | (h >> 27)) + b) & 0xFFFFFFFF
+    return h - 0x100000000 if h & 0x80000000 else h
 
-    def proton_hash(data: bytes) -> int:
-        hash_val = 0x55555555
 
-        for byte in data:
-            hash_val = byte + ((hash_val & 0xFFFFFFFF) >> 27) + ((hash_val << 5) & 0xFFFFFFFF)
-            hash_val &= 0xFFFFFFFF
+def proton_hash(data: bytes) -> int:
+    if _c_proton_hash is not None:
+        return _c_proton_hash(data, len(data))
+    return _proton_hash_py(data)
 
-        if hash_val & 0x80000000:
-            hash_val -= 0x100000000
 
-        return hash_val
+def proton_hash_many(items: Sequence[bytes]) -> list[int]:
+    """proton_hash of many buffers at once, one numpy lane per buffer so the python loop runs per byte position"""
+    if _c_proton_hash is not None or len(items) < 8:
+        return [proton_hash(x) for x in items]
+
+    lengths = np.fromiter((len(x) for x in items), dtype=np.int64, count=len(items))
+    width = int(lengths.max(initial=0))
+    data = np.zeros((len(items), width), dtype=np.uint32)
+    for i, x in enumerate(items):
+        data[i, : len(x)] = np.frombuffer(x, dtype=np.uint8)
+
+    h = np.full(len(items), 0x55555555, dtype=np.uint32)
+    for col in range(width):
+        active = lengths > col
+        step = ((h << np.uint32(5)) | (h >> np.uint32(27))) + data[:, col]
+        h = np.where(active, step, h)
+
+    return h.view(np.int32).tolist()
+
+
+def _index(n: int, shift: int) -> np.ndarray:
+    return np.arange(shift, shift + n, dtype=np.int64)
 
 
 def rolling_chksum(buf: bytes, shift: int) -> int:
-    chksum = 0
-    for i, b in enumerate(buf):
-        shifted = (b + shift + i + 2) & 0xFF
-        chksum = (chksum + shift + i + shifted) & 0xFFFFFFFF
+    if _c_rolling_chksum is not None:
+        return _c_rolling_chksum(bytes(buf), len(buf), shift & 0xFFFFFFFF)
 
-    return chksum
+    # sum of (shift + i) is closed form, only the wrapped byte term needs the array
+    n = len(buf)
+    shifted = (np.frombuffer(buf, dtype=np.uint8) + _index(n, shift + 2)) & 0xFF
+    return (n * shift + n * (n - 1) // 2 + int(shifted.sum())) & 0xFFFFFFFF
 
 
 def rolling_chksum2(buf: bytes, shift: int) -> int:
-    chksum = 0
-    for i, b in enumerate(buf):
-        chksum = (chksum + shift + i + b) & 0xFFFFFFFF
+    if _c_rolling_chksum2 is not None:
+        return _c_rolling_chksum2(bytes(buf), len(buf), shift & 0xFFFFFFFF)
 
-    return chksum
+    n = len(buf)
+    total = sum(buf) if n < _NUMPY_MIN else int(np.frombuffer(buf, dtype=np.uint8).sum(dtype=np.int64))
+    return (n * shift + n * (n - 1) // 2 + total) & 0xFFFFFFFF
 
 
 def rolling_shift(buf: bytes, shift: int) -> bytes:
-    return bytes([(b + shift + i) & 0xFF for i, b in enumerate(buf)])
-
+    if _c_rolling_shift is not None:
+        out = ctypes.create_string_buffer(len(buf))
+        _c_rolling_shift(bytes(buf), out, len(buf), shift & 0xFFFFFFFF)
+        return out.raw
 
-def hex_rolling_shift(buf: bytes) -> bytes:
-    arr = bytearray(len(buf))
+    if len(buf) < _NUMPY_MIN:
+        return bytes([(b + shift + i) & 0xFF for i, b in enumerate(buf)])
+    return ((np.frombuffer(buf, dtype=np.uint8) + _index(len(buf), shift)) & 0xFF).astype(np.uint8).tobytes()
 
-    for i, b in enumerate(buf):
-        shift = 0x9E if chr(b) in "abcdef" else 0xBE
-        arr[i] = (b + shift + i) & 0xFF
 
-    return bytes(arr)
+def hex_rolling_shift(buf: bytes) -> bytes:
+    if _c_hex_rolling_shift is not None:
+        out = ctypes.create_string_buffer(len(buf))
+        _c_hex_rolling_shift(bytes(buf), out, len(buf))
+        return out.raw
+
+    if len(buf) < _NUMPY_MIN:
+        return bytes([(b + (0x9E if _HEX_LOWER[b] else 0xBE) + i) & 0xFF for i, b in enumerate(buf)])
+    arr = np.frombuffer(buf, dtype=np.uint8)
+    shift = np.where(_HEX_LOWER[arr], 0x9E, 0xBE)
+    return ((arr + shift + np.arange(len(buf), dtype=np.int64)) & 0xFF).astype(np.uint8).tobytes()
 
 
 class MersenneTwister:
@@ -116,6 +116,9 @@ class Inventory(Serializable):
 
         return item
 
+    def copy(self) -> "Inventory":
+        return Inventory(self.max_slot, OrderedDict((k, Item(v.id, v.amount, v.flags)) for k, v in self.items_map.items()))
+
     def get(self, id: int, default: Item | None = None) -> Item | None:
         return self.items_map.get(id, default)
 
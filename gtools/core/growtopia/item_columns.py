@@ -0,0 +1,192 @@
+from dataclasses import dataclass, fields
+import hashlib
+import logging
+import os
+from pathlib import Path
+import tempfile
+import zipfile
+from typing import Any, Callable, get_type_hints
+
+import numpy as np
+import numpy.typing as npt
+import xxhash
+
+from gtools import setting
+from gtools.core.growtopia.items_dat import Item, ItemDatabase, ItemInfoColor
+
+logger = logging.getLogger("item-columns")
+
+_CACHE_VERSION = 1
+
+# not worth reporting, they change whenever the file they belong to does
+DIFF_IGNORED = frozenset(("id", "texture_file_hash", "extra_file_hash", "renderer_data_file_hash"))
+
+
+def _field_kinds() -> dict[str, tuple[str, Callable[[Any], Any]]]:
+    """field -> (column kind, converter from the column value back to the Item value)"""
+    hints = get_type_hints(Item)
+    kinds: dict[str, tuple[str, Callable[[Any], Any]]] = {}
+    for f in fields(Item):
+        t = hints[f.name]
+        if t is bytes:
+            kinds[f.name] = ("bytes", bytes)
+        elif t is ItemInfoColor:
+            kinds[f.name] = ("int", ItemInfoColor)
+        elif getattr(t, "__origin__", None) is tuple:
+            kinds[f.name] = ("tuple", lambda row: tuple(int(x) for x in row))
+        elif isinstance(t, type) and issubclass(t, int):
+            kinds[f.name] = ("int", int if t is int else t)
+        else:
+            raise TypeError(f"no column kind for Item.{f.name}: {t}")
+    return kinds
+
+
+_KINDS = _field_kinds()
+FIELDS = list(_KINDS)
+
+
+@dataclass(slots=True)
+class ItemColumns:
+    """struct-of-arrays view of an item database, rows sorted by id.
+
+    numeric fields (enums and flags included) are int64 columns, tuples are 2d int64 columns and byte
+    strings are a blob + offsets with an xxh64 per row so diffs only touch strings whose hash moved
+    """
+
+    version: int
+    ids: npt.NDArray[np.int64]
+    ints: dict[str, npt.NDArray[np.int64]]
+    hashes: dict[str, npt.NDArray[np.uint64]]
+    blobs: dict[str, bytes]
+    offsets: dict[str, npt.NDArray[np.int64]]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_database(cls, db: ItemDatabase) -> "ItemColumns":
+        items = [db.items[i] for i in sorted(db.items)]
+        ints: dict[str, npt.NDArray[np.int64]] = {}
+        hashes: dict[str, npt.NDArray[np.uint64]] = {}
+        blobs: dict[str, bytes] = {}
+        offsets: dict[str, npt.NDArray[np.int64]] = {}
+
+        for name, (kind, _) in _KINDS.items():
+            values = [getattr(item, name) for item in items]
+            if kind == "bytes":
+                blobs[name] = b"".join(values)
+                offsets[name] = np.concatenate(([0], np.cumsum([len(v) for v in values], dtype=np.int64)))
+                hashes[name] = np.fromiter((xxhash.xxh64_intdigest(v) for v in values), dtype=np.uint64, count=len(values))
+            elif kind == "tuple":
+                ints[name] = np.array(values, dtype=np.int64).reshape(len(values), -1)
+            else:
+                ints[name] = np.fromiter((int(v) for v in values), dtype=np.int64, count=len(values))
+
+        return cls(db.version, ints["id"], ints, hashes, blobs, offsets)
+
+    def bytes_at(self, name: str, row: int) -> bytes:
+        off = self.offsets[name]
+        return self.blobs[name][off[row] : off[row + 1]]
+
+    def item(self, row: int) -> Item:
+        item = Item()
+        for name, (kind, convert) in _KINDS.items():
+            if kind == "bytes":
+                value = self.bytes_at(name, row)
+            else:
+                value = convert(self.ints[name][row])
+            setattr(item, name, value)
+        return item
+
+    def save(self, path: Path) -> None:
+        arrays: dict[str, npt.NDArray[Any]] = {
+            "meta": np.array([_CACHE_VERSION, self.version], dtype=np.int64),
+            "schema": np.frombuffer(ItemDatabase._schema_hash().encode(), dtype=np.uint8),
+        }
+        for name, col in self.ints.items():
+            arrays[f"int_{name}"] = col
+        for name in self.blobs:
+            arrays[f"hash_{name}"] = self.hashes[name]
+            arrays[f"off_{name}"] = self.offsets[name]
+            arrays[f"blob_{name}"] = np.frombuffer(self.blobs[name], dtype=np.uint8)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)  # pyright: ignore[reportArgumentType]
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @classmethod
+    def load(cls, path: Path) -> "ItemColumns | None":
+        try:
+            with np.load(path) as data:
+                cache_version, version = (int(x) for x in data["meta"])
+                if cache_version != _CACHE_VERSION or data["schema"].tobytes().decode() != ItemDatabase._schema_hash():
+                    return None
+
+                ints: dict[str, npt.NDArray[np.int64]] = {}
+                hashes: dict[str, npt.NDArray[np.uint64]] = {}
+                blobs: dict[str, bytes] = {}
+                offsets: dict[str, npt.NDArray[np.int64]] = {}
+                for name, (kind, _) in _KINDS.items():
+                    if kind == "bytes":
+                        hashes[name] = data[f"hash_{name}"]
+                        offsets[name] = data[f"off_{name}"]
+                        blobs[name] = data[f"blob_{name}"].tobytes()
+                    else:
+                        ints[name] = data[f"int_{name}"]
+        except (OSError, KeyError, ValueError, EOFError, zipfile.BadZipFile) as e:
+            logger.warning(f"ignoring unreadable column cache {path}: {e}")
+            return None
+
+        return cls(version, ints["id"], ints, hashes, blobs, offsets)
+
+
+def _cache_dir() -> Path:
+    return setting.appdir / "cache" / "item_columns"
+
+
+def load_columns(path: Path, cache_dir: Path | None = None) -> ItemColumns:
+    """columns for an items.dat file, parsed once and then served from a cache keyed by the file's sha256"""
+    data = path.read_bytes()
+    cache = (cache_dir or _cache_dir()) / f"{hashlib.sha256(data).hexdigest()}.npz"
+    if cache.exists() and (cols := ItemColumns.load(cache)) is not None:
+        return cols
+
+    # straight to deserialize, ItemDatabase.load would keep every version alive in its memory cache
+    cols = ItemColumns.from_database(ItemDatabase.deserialize(data))
+    try:
+        cols.save(cache)
+    except OSError as e:
+        logger.warning(f"failed to write column cache {cache}: {e}")
+    return cols
+
+
+@dataclass(slots=True)
+class ColumnDiff:
+    added: npt.NDArray[np.intp]  # rows in new
+    removed: npt.NDArray[np.intp]  # rows in old
+    # (row in new, row in old, changed fields in Item field order)
+    modified: list[tuple[int, int, list[str]]]
+
+
+def diff_columns(new: ItemColumns, old: ItemColumns, ignore: frozenset[str] = DIFF_IGNORED) -> ColumnDiff:
+    _, new_rows, old_rows = np.intersect1d(new.ids, old.ids, assume_unique=True, return_indices=True)
+    added = np.flatnonzero(~np.isin(new.ids, old.ids, assume_unique=True))
+    removed = np.flatnonzero(~np.isin(old.ids, new.ids, assume_unique=True))
+
+    names = [name for name in FIELDS if name not in ignore]
+    changed = np.zeros((len(new_rows), len(names)), dtype=bool)
+    for j, name in enumerate(names):
+        if name in new.hashes:
+            changed[:, j] = new.hashes[name][new_rows] != old.hashes[name][old_rows]
+        else:
+            mask = new.ints[name][new_rows] != old.ints[name][old_rows]
+            changed[:, j] = mask.any(axis=1) if mask.ndim > 1 else mask
+
+    modified = [(int(new_rows[r]), int(old_rows[r]), [names[j] for j in np.flatnonzero(changed[r])]) for r in np.flatnonzero(changed.any(axis=1))]
+    return ColumnDiff(added, removed, modified)
@@ -0,0 +1,238 @@
+from dataclasses import fields
+import logging
+import os
+from pathlib import Path
+import re
+import sqlite3
+import tempfile
+import threading
+from typing import Any, Iterable, get_type_hints
+
+import xxhash
+
+from gtools import setting
+from gtools.core.growtopia.items_dat import _ITEMS_DAT_CANDIDATES, Item, ItemDatabase, ItemInfoColor
+
+logger = logging.getLogger("item-index")
+
+SCHEMA_VERSION = 1
+
+# fixed size byte arrays, everything else that is bytes is a length prefixed string
+_BLOB_FIELDS = frozenset(("cybot_related", "body_render_mask"))
+_INDEXED = ("item_type", "rarity", "flags", "flags2", "texture_file", "clothing_type")
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def _columns() -> list[tuple[str, str]]:
+    hints = get_type_hints(Item)
+    cols: list[tuple[str, str]] = []
+    for f in fields(Item):
+        t = hints[f.name]
+        if t is bytes:
+            cols.append((f.name, "BLOB" if f.name in _BLOB_FIELDS else "TEXT"))
+        elif getattr(t, "__origin__", None) is tuple:
+            cols.extend((f"{f.name}_{i}", "INTEGER") for i in range(2))
+        else:
+            cols.append((f.name, "INTEGER"))
+    return cols
+
+
+_COLUMNS = _columns()
+
+
+def _row(item: Item) -> list[Any]:
+    out: list[Any] = []
+    for f in fields(Item):
+        v = getattr(item, f.name)
+        if isinstance(v, bytes):
+            out.append(v if f.name in _BLOB_FIELDS else v.decode("utf-8", errors="replace"))
+        elif isinstance(v, tuple):
+            out.extend(v)
+        elif isinstance(v, ItemInfoColor):
+            out.append(int(v))
+        else:
+            out.append(int(v))
+    return out
+
+
+def fts_query(text: str) -> str:
+    """plain text to an fts5 query, every word must match as a prefix"""
+    return " ".join(f'"{tok}"*' for tok in _TOKEN.findall(text))
+
+
+class ItemIndex:
+    """read only sqlite index of one items.dat, built once per file hash.
+
+    `items` has a column per Item field (tuples split into `_0`/`_1`), `items_fts` is an fts5 index over
+    name and info (the description). indexed: id, item_type, rarity, flags, flags2, texture_file, clothing_type
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        meta = dict(self._conn.execute("SELECT key, value FROM meta").fetchall())
+        self.version = int(meta["items_version"])
+        self.source_hash = str(meta["source_hash"])
+
+    def __repr__(self) -> str:
+        return f"ItemIndex({self.path.name}, version={self.version})"
+
+    @staticmethod
+    def build(db: ItemDatabase, path: Path) -> None:
+        """write the index for `db` to `path`, built in a temp file so readers never see half of it"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        os.close(fd)
+
+        try:
+            conn = sqlite3.connect(tmp)
+            try:
+                conn.execute("PRAGMA journal_mode=OFF")
+                conn.execute("PRAGMA synchronous=OFF")
+                with conn:
+                    conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+                    conn.executemany(
+                        "INSERT INTO meta VALUES (?, ?)",
+                        [
+                            ("schema_version", str(SCHEMA_VERSION)),
+                            ("item_schema", ItemDatabase._schema_hash()),
+                            ("items_version", str(db.version)),
+                            ("source_hash", db._source_hash),
+                        ],
+                    )
+
+                    conn.execute(f"CREATE TABLE items ({', '.join(f'{name} {kind}' for name, kind in _COLUMNS)}, PRIMARY KEY (id)) WITHOUT ROWID")
+                    conn.executemany(f"INSERT INTO items VALUES ({', '.join('?' for _ in _COLUMNS)})", (_row(db.items[i]) for i in sorted(db.items)))
+                    for name in _INDEXED:
+                        conn.execute(f"CREATE INDEX items_{name} ON items ({name})")
+
+                    conn.execute("CREATE VIRTUAL TABLE items_fts USING fts5(name, info, tokenize='unicode61')")
+                    conn.execute("INSERT INTO items_fts (rowid, name, info) SELECT id, name, info FROM items")
+                conn.execute("VACUUM")
+            finally:
+                conn.close()
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _is_current(path: Path) -> bool:
+        try:
+            with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as conn:
+                meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.Error:
+            return False
+        return meta.get("schema_version") == str(SCHEMA_VERSION) and meta.get("item_schema") == ItemDatabase._schema_hash()
+
+    @staticmethod
+    def path_for(version: int, source_hash: str, base_dir: Path | None = None) -> Path:
+        return (base_dir or setting.appdir / "item_database") / f"v{version}" / f"index_{source_hash}.sqlite"
+
+    @classmethod
+    def for_database(cls, db: ItemDatabase, base_dir: Path | None = None) -> "ItemIndex":
+        path = cls.path_for(db.version, db._source_hash, base_dir)
+        if not cls._is_current(path):
+            logger.info(f"building item index v{db.version} ({len(db.items)} items) at {path}")
+            cls.build(db, path)
+        return cls(path)
+
+    @classmethod
+    def for_file(cls, source: str | Path, base_dir: Path | None = None) -> "ItemIndex":
+        """index for an items.dat, only parses the file when no index for its hash exists yet"""
+        data = Path(source).read_bytes()
+        path = cls.path_for(int.from_bytes(data[:2], "little"), xxhash.xxh64_hexdigest(data), base_dir)
+        if cls._is_current(path):
+            return cls(path)
+        return cls.for_database(ItemDatabase.load(data), base_dir)
+
+    @classmethod
+    def latest(cls, base_dir: Path | None = None) -> "ItemIndex":
+        for path in _ITEMS_DAT_CANDIDATES:
+            if not path.is_file() or path.stat().st_size == 0:
+                continue
+            try:
+                return cls.for_file(path, base_dir)
+            except Exception as e:
+                logger.error(f"latest: failed indexing {path}: {e}")
+
+        raise FileNotFoundError("no valid items.dat found. checked: " + ", ".join(str(p) for p in _ITEMS_DAT_CANDIDATES))
+
+    def execute(self, sql: str, params: Iterable[Any] = ()) -> list[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def get(self, id: int) -> sqlite3.Row | None:
+        rows = self.execute("SELECT * FROM items WHERE id = ?", (id,))
+        return rows[0] if rows else None
+
+    def search(self, text: str, limit: int = 20) -> list[sqlite3.Row]:
+        """full text search over name and description, names weigh more"""
+        query = fts_query(text)
+        if not query:
+            return []
+        return self.execute(
+            "SELECT items.* FROM items_fts JOIN items ON items.id = items_fts.rowid WHERE items_fts MATCH ? ORDER BY bm25(items_fts, 10.0, 1.0) LIMIT ?",
+            (query, limit),
+        )
+
+    def find(
+        self,
+        *,
+        text: str | None = None,
+        item_type: int | Iterable[int] | None = None,
+        min_rarity: int | None = None,
+        max_rarity: int | None = None,
+        flags_all: int = 0,
+        flags_any: int = 0,
+        texture_file: str | None = None,
+        order_by: str = "id",
+        limit: int | None = None,
+    ) -> list[sqlite3.Row]:
+        """filtered query, every given condition must hold. blank `text` is no text filter"""
+        where: list[str] = []
+        params: list[Any] = []
+        if text is not None and text.strip():
+            # an empty MATCH is an fts5 syntax error, text without a single word matches nothing like in `search`
+            if not (query := fts_query(text)):
+                return []
+            where.append("id IN (SELECT rowid FROM items_fts WHERE items_fts MATCH ?)")
+            params.append(query)
+        if item_type is not None:
+            types = [int(item_type)] if isinstance(item_type, int) else [int(t) for t in item_type]
+            where.append(f"item_type IN ({', '.join('?' for _ in types)})")
+            params.extend(types)
+        if min_rarity is not None:
+            where.append("rarity >= ?")
+            params.append(min_rarity)
+        if max_rarity is not None:
+            where.append("rarity <= ?")
+            params.append(max_rarity)
+        if flags_all:
+            where.append("flags & ? = ?")
+            params.extend((int(flags_all), int(flags_all)))
+        if flags_any:
+            where.append("flags & ? != 0")
+            params.append(int(flags_any))
+        if texture_file is not None:
+            where.append("texture_file = ?")
+            params.append(texture_file)
+
+        if order_by.lstrip("-") not in {name for name, _ in _COLUMNS}:
+            raise ValueError(f"unknown column {order_by!r}")
+        order = f"{order_by[1:]} DESC" if order_by.startswith("-") else order_by
+
+        sql = "SELECT * FROM items"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return self.execute(sql, params)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -5,20 +5,19 @@ import pickle
 import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from enum import IntEnum
+from enum import IntEnum, IntFlag
 from pathlib import Path
 from typing import Any, ClassVar, Hashable, Literal, Sequence, overload
 
 import xxhash
-from rapidfuzz import fuzz, process
-from zmq import IntFlag
 
 from gtools import setting
 from gtools.core.buffer import Buffer
+from gtools.core.lazy import lazy_import
 from gtools.core.utils import get_home
 
 if not os.environ.get("NO_BAKED", None):
-    from gtools.baked import items
+    items = lazy_import("gtools.baked.items")
 
 
 class WeatherType(IntEnum):
@@ -1130,6 +1129,8 @@ class ItemDatabase:
         cutoff: float = 0.6,
         return_scores: bool = False,
     ) -> Sequence[tuple[Item, float]] | Sequence[Item]:
+        from rapidfuzz import fuzz, process
+
         self._ensure_name_index()
         query_str = query if isinstance(query, str) else query.decode()
         query_norm = query_str.strip().lower()
@@ -1371,12 +1372,22 @@ class ItemDatabase:
         return dir_.is_dir() and any(p.is_file() for p in dir_.iterdir())
 
 
-item_database = ItemDatabase.latest()
+item_database: ItemDatabase
+
+
+def __getattr__(name: str) -> Any:
+    # loading items.dat is the slowest part of importing this module, defer it to first use
+    if name == "item_database":
+        global item_database
+        item_database = ItemDatabase.latest()
+        return item_database
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def reload_item_database(data: bytes | None = None) -> ItemDatabase:
     global item_database
-    v0, count0 = item_database.version, item_database.item_count
+    prev = globals()["item_database"] if "item_database" in globals() else __getattr__("item_database")
+    v0, count0 = prev.version, prev.item_count
     if data:
         item_database = ItemDatabase.load(data, cached=True)
     else:
@@ -1,3 +1,4 @@
+import bisect
 from collections import defaultdict
 from enum import Enum
 import logging
@@ -6,9 +7,12 @@ from pathlib import Path
 from typing import Any, Callable
 import threading
 
+import numpy as np
+
 from gtools import setting
+from gtools.core.lazy import lazy_import
 from gtools.core.midi import GM_INSTRUMENTS
-from gtools.core.mixer import AudioMixer, Sound
+from gtools.core.mixer import CHANNELS, TARGET_SR, AudioMixer, Sound, _perceptual_to_linear
 from gtools.baked.items import (
     SHEET_MUSIC_COLON_BASS_NOTE,
     SHEET_MUSIC_COLON_BLANK,
@@ -45,6 +49,9 @@ from gtools.baked.items import (
     SHEET_MUSIC_COLON_WINTERFEST,
 )
 
+# only the offline renderer writes files
+sf = lazy_import("soundfile")
+
 
 def _invert_dict[K, V](d: dict[K, V]) -> dict[V, K]:
     inv = {}
@@ -374,6 +381,127 @@ MIDI_DRUMS_TO_INSTRUMENT_SET = {
 }
 
 _SOUNDS: dict[Path, Sound] = {}
+_MARKERS = (InstrumentSet.REPEAT_BEGIN, InstrumentSet.REPEAT_END, InstrumentSet.BLANK)
+
+
+def _get_sound(note: Note) -> Sound:
+    path = note.to_path()
+    if path not in _SOUNDS:
+        _SOUNDS[path] = Sound.from_file(str(path))
+    return _SOUNDS[path]
+
+
+class CompiledSheet:
+    """sorted, column indexed view of the notes with a precomputed repeat jump table.
+
+    columns only holds timestamps that have at least one note, so seeking is a bisect instead of a scan,
+    and update_columns() only touches the columns (and repeat rows) that actually changed.
+    """
+
+    def __init__(self, notes: list[Note] | None = None) -> None:
+        self.columns: list[int] = []
+        # playable notes per column (no repeat markers or blanks)
+        self.events: dict[int, tuple[Note, ...]] = {}
+        # rows of the repeat ends per column, in the order they were added
+        self.repeat_ends: dict[int, tuple[int, ...]] = {}
+        # (end column, row) -> begin column, None means jump to the start of the sheet
+        self.jumps: dict[tuple[int, int], int | None] = {}
+
+        self._begins_by_row: defaultdict[int, list[int]] = defaultdict(list)
+        self._ends_by_row: defaultdict[int, list[int]] = defaultdict(list)
+
+        by_column: defaultdict[int, list[Note]] = defaultdict(list)
+        for note in notes or []:
+            by_column[note.timestamp].append(note)
+
+        self.update_columns(by_column)
+
+    @property
+    def start(self) -> int:
+        return self.columns[0] if self.columns else 0
+
+    @property
+    def end(self) -> int:
+        return self.columns[-1] if self.columns else 0
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def update_columns(self, changes: dict[int, list[Note]]) -> None:
+        """replace the content of each column in `changes`, an empty list removes the column"""
+        dirty_rows: set[int] = set()
+
+        for col, notes in changes.items():
+            for row in self._rows_of(col, self._begins_by_row):
+                self._begins_by_row[row].remove(col)
+                dirty_rows.add(row)
+            for row in self.repeat_ends.pop(col, ()):
+                self._ends_by_row[row].remove(col)
+                self.jumps.pop((col, row), None)
+                dirty_rows.add(row)
+            self.events.pop(col, None)
+
+            i = bisect.bisect_left(self.columns, col)
+            present = i < len(self.columns) and self.columns[i] == col
+            if not notes:
+                if present:
+                    self.columns.pop(i)
+                continue
+            if not present:
+                self.columns.insert(i, col)
+
+            events: list[Note] = []
+            ends: list[int] = []
+            for note in notes:
+                if note.instrument == InstrumentSet.REPEAT_BEGIN:
+                    row = note.to_index()
+                    begins = self._begins_by_row[row]
+                    i = bisect.bisect_left(begins, col)
+                    if i == len(begins) or begins[i] != col:
+                        begins.insert(i, col)
+                    dirty_rows.add(row)
+                elif note.instrument == InstrumentSet.REPEAT_END:
+                    row = note.to_index()
+                    if row not in ends:
+                        ends.append(row)
+                        bisect.insort(self._ends_by_row[row], col)
+                    dirty_rows.add(row)
+                elif note.instrument != InstrumentSet.BLANK:
+                    events.append(note)
+
+            if events:
+                self.events[col] = tuple(events)
+            if ends:
+                self.repeat_ends[col] = tuple(ends)
+
+        for row in dirty_rows:
+            begins = self._begins_by_row[row]
+            for end_col in self._ends_by_row[row]:
+                i = bisect.bisect_left(begins, end_col)
+                self.jumps[end_col, row] = begins[i - 1] if i > 0 else None
+
+    def _rows_of(self, col: int, by_row: dict[int, list[int]]) -> list[int]:
+        rows: list[int] = []
+        for row, cols in by_row.items():
+            i = bisect.bisect_left(cols, col)
+            if i < len(cols) and cols[i] == col:
+                rows.append(row)
+        return rows
+
+    def seek(self, timestamp: int) -> int:
+        """index into columns of the first column at or after timestamp"""
+        return bisect.bisect_left(self.columns, timestamp)
+
+    def next_column(self, timestamp: int) -> int | None:
+        i = self.seek(timestamp)
+        return self.columns[i] if i < len(self.columns) else None
+
+    def repeat_ends_in(self, row: int, lo: int, hi: int) -> list[int]:
+        """columns of the repeat ends on `row` in [lo, hi)"""
+        cols = self._ends_by_row.get(row)
+        if not cols:
+            return []
+        return cols[bisect.bisect_left(cols, lo) : bisect.bisect_left(cols, hi)]
 
 
 class Sheet:
@@ -385,10 +513,11 @@ class Sheet:
         self.any = bool(notes)
         for note in notes:
             self.notes[note.timestamp].append(note)
+        self._compiled = CompiledSheet(notes)
 
         if notes:
-            self.start = min(notes, key=lambda x: x.timestamp).timestamp
-            self.end = max(notes, key=lambda x: x.timestamp).timestamp
+            self.start = self._compiled.start
+            self.end = self._compiled.end
         else:
             self.start = 0
             self.end = 0
@@ -412,6 +541,13 @@ class Sheet:
         else:
             self._can_go.set()
 
+    @property
+    def compiled(self) -> CompiledSheet:
+        return self._compiled
+
+    def all_notes(self) -> list[Note]:
+        return [note for col in self._compiled.columns for note in self.notes[col]]
+
     @property
     def total_notes(self) -> int:
         return sum(len(n) for n in self.notes.values())
@@ -431,10 +567,11 @@ class Sheet:
         self.any = bool(notes)
         for note in notes:
             self.notes[note.timestamp].append(note)
+        self._compiled = CompiledSheet(notes)
 
         if notes:
-            self.start = min(notes, key=lambda x: x.timestamp).timestamp
-            self.end = max(notes, key=lambda x: x.timestamp).timestamp
+            self.start = self._compiled.start
+            self.end = self._compiled.end
         else:
             self.start = 0
             self.end = 0
@@ -443,10 +580,13 @@ class Sheet:
             self.playhead = min(self.playhead, self.end)
 
     def add_notes(self, notes: list[Note]) -> None:
+        touched: set[int] = set()
         for note in notes:
             self.notes[note.timestamp].append(note)
+            touched.add(note.timestamp)
 
         self._notes = notes
+        self._compiled.update_columns({col: self.notes[col] for col in touched})
 
         self.any = bool(self.notes)
 
@@ -459,26 +599,32 @@ class Sheet:
 
         self.playhead = min(self.playhead, self.end)
 
+    def update_columns(self, changes: dict[int, list[Note]]) -> None:
+        """replace whole columns in place, only the changed columns are recompiled"""
+        for col, notes in changes.items():
+            if notes:
+                self.notes[col] = list(notes)
+            else:
+                self.notes.pop(col, None)
+
+        self._compiled.update_columns(changes)
+
+        self.any = bool(self._compiled.columns)
+        self.start = self._compiled.start
+        self.end = self._compiled.end
+
+        if self._pending_backtrack is not None and self._pending_backtrack not in self.notes:
+            self._pending_backtrack = None
+        self._activated_repeats = {key for key in self._activated_repeats if key[0] not in changes}
+
     def _preload(self) -> None:
-        for col in range(self.start, self.end):
-            if col == 10:
+        for col in self._compiled.columns:
+            if col >= 10:
                 self._can_go.set()
-            for note in self.notes[col]:
-                if note.instrument in (InstrumentSet.REPEAT_BEGIN, InstrumentSet.REPEAT_END, InstrumentSet.BLANK):
-                    continue
-                path = note.to_path()
-                if path not in _SOUNDS:
-                    _SOUNDS[path] = Sound.from_file(str(path))
+            for note in self._compiled.events.get(col, ()):
+                _get_sound(note)
         self._can_go.set()
 
-    def _find_repeat_begin(self, end_note: Note) -> int:
-        row = end_note.to_index()
-        for col in range(end_note.timestamp - 1, self.start - 1, -1):
-            for note in self.notes[col]:
-                if note.instrument == InstrumentSet.REPEAT_BEGIN and note.to_index() == row:
-                    return col
-        return self.start
-
     def advance_playhead(self, n: int = 1) -> None:
         if not self.any:
             return
@@ -494,34 +640,26 @@ class Sheet:
             self.playhead = self._pending_backtrack
             self._pending_backtrack = None
 
-        for note in self.notes[self.playhead]:
-            if note.instrument != InstrumentSet.REPEAT_END:
-                continue
-            key = (note.timestamp, note.to_index())
+        compiled = self._compiled
+        for row in compiled.repeat_ends.get(self.playhead, ()):
+            key = (self.playhead, row)
             if key in self._activated_repeats:
                 continue
 
             self._activated_repeats.add(key)
-            backtrack = self._find_repeat_begin(note)
-            row = note.to_index()
+            backtrack = compiled.jumps.get(key)
+            if backtrack is None:
+                backtrack = self.start
 
-            for col in range(backtrack, self.playhead):
-                for inner in self.notes[col]:
-                    if inner.instrument == InstrumentSet.REPEAT_END and inner.to_index() == row:
-                        self._activated_repeats.discard((inner.timestamp, inner.to_index()))
+            for col in compiled.repeat_ends_in(row, backtrack, self.playhead):
+                self._activated_repeats.discard((col, row))
 
             self._pending_backtrack = backtrack
             break
 
-        for note in self.notes[self.playhead]:
-            if note.instrument in (InstrumentSet.REPEAT_BEGIN, InstrumentSet.REPEAT_END, InstrumentSet.BLANK):
-                continue
-
+        for note in compiled.events.get(self.playhead, ()):
             if self.mixer:
-                path = note.to_path()
-                if path not in _SOUNDS:
-                    _SOUNDS[path] = Sound.from_file(str(path))
-                self.mixer.play(_SOUNDS[path], note.volume)
+                self.mixer.play(_get_sound(note), note.volume)
 
             if self.on_note_played:
                 self.on_note_played(note)
@@ -541,6 +679,20 @@ class Sheet:
             self._activated_repeats.clear()
             self._pending_backtrack = None
 
+    def seek_to(self, timestamp: int) -> None:
+        """move the playhead to timestamp, repeat state is reset when moving backward"""
+        if not self.any:
+            return
+
+        if timestamp < self.playhead:
+            self._activated_repeats.clear()
+        self._pending_backtrack = None
+        self.playhead = timestamp
+
+    def next_event(self, timestamp: int | None = None) -> int | None:
+        """timestamp of the first column with notes at or after timestamp (defaults to the playhead)"""
+        return self._compiled.next_column(self.playhead if timestamp is None else timestamp)
+
     def update(self, dt: float) -> bool:
         if not self.any:
             return False
@@ -558,6 +710,42 @@ class Sheet:
         return any_change
 
 
+def render_sheet(sheet: Sheet, out: Path | str | None = None, *, master_gain: float = 1.0, max_ticks: int = 1_000_000) -> np.ndarray:
+    """render one pass of the sheet (repeats included) offline, without an audio device.
+
+    returns the stereo float32 buffer at TARGET_SR, and writes it to `out` if given.
+    """
+    player = Sheet(sheet.bpm, sheet.all_notes(), mixer=None)
+    if not player.any or player.bps == 0:
+        return np.zeros((0, CHANNELS), dtype=np.float32)
+
+    scheduled: list[tuple[int, Note]] = []
+    tick = 0
+    player.on_note_played = lambda note: scheduled.append((tick, note))
+    while player.playhead <= player.end and tick < max_ticks:
+        player.advance_playhead()
+        tick += 1
+
+    if tick >= max_ticks:
+        sheet.logger.warning(f"render stopped after {max_ticks} ticks, the sheet might have a repeat that never ends")
+
+    samples_per_tick = TARGET_SR / player.bps
+    sounds = [(int(t * samples_per_tick), _get_sound(note), note.volume) for t, note in scheduled]
+    length = max([offset + len(sound.data) for offset, sound, _ in sounds], default=0)
+    length = max(length, int(tick * samples_per_tick))
+
+    buf = np.zeros((length, CHANNELS), dtype=np.float32)
+    for offset, sound, gain in sounds:
+        buf[offset : offset + len(sound.data)] += sound.data * gain
+
+    buf *= _perceptual_to_linear(master_gain)
+
+    if out is not None:
+        sf.write(str(out), buf, TARGET_SR)
+
+    return buf
+
+
 def compress_notes(note_list: list[Note], low_octave: int = 0, high_octave: int = 1, search_octaves: int = 6, window_size: int = 8) -> list[Note]:
     low = 12 * low_octave + 1
     high = 12 * high_octave + 12
@@ -433,7 +433,7 @@ class NetPacket(Serializable):
 
 
 class PreparedPacket:
-    def __init__(self, packet: NetPacket | bytes, direction: Direction, flags: ENetPacketFlag) -> None:
+    def __init__(self, packet: NetPacket | bytes, direction: Direction, flags: ENetPacketFlag, session: int | None = None) -> None:
         if isinstance(packet, NetPacket):
             self._packet = packet
             self._packet_raw = packet.serialize()
@@ -443,6 +443,8 @@ class PreparedPacket:
 
         self.direction = direction
         self.flags = flags
+        # proxy session, None is the default session
+        self.session = session
 
     @property
     def as_net(self) -> NetPacket:
@@ -458,6 +460,7 @@ class PreparedPacket:
             packet=pending.buf,
             direction=pending.direction,
             flags=ENetPacketFlag(pending.packet_flags),
+            session=pending.session if pending.HasField("session") else None,
         )
 
     def to_pending(self) -> PendingPacket:
@@ -465,10 +468,12 @@ class PreparedPacket:
             buf=self.as_raw,
             direction=self.direction,
             packet_flags=self.flags,
+            session=self.session,
         )
 
     def __repr__(self) -> str:
-        return f"PreparedPacket(packet={self.as_net}, direction={self.direction}, flags={self.flags})"
+        session = f", session={self.session}" if self.session is not None else ""
+        return f"PreparedPacket(packet={self.as_net}, direction={self.direction}, flags={self.flags}{session})"
 
 
 if __name__ == "__main__":
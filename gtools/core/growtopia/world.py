@@ -3,10 +3,14 @@ from collections import defaultdict
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum, IntFlag, IntEnum, auto
+import copy
 import itertools
 import logging
+import mmap
 from pathlib import Path
-from typing import Any, Callable, Iterator, Literal, Type, overload
+import struct
+import time
+from typing import Any, Callable, Iterable, Iterator, Literal, Type, overload
 
 from pyglm import glm
 from pyglm.glm import ivec2, vec2
@@ -134,6 +138,8 @@ from gtools.core.growtopia.packet import NetPacket, TankFlags, TankPacket
 from gtools.core.growtopia.player import Player
 from gtools.core.growtopia.rttex import RTTexManager
 from gtools.core.mixer import AudioMixer
+from gtools.core.spatial import TileBucketIndex
+from gtools.core.tile_index import TileEntry, TileIndex
 from gtools.protogen import growtopia_pb2
 import numpy as np
 import numpy.typing as npt
@@ -533,12 +539,37 @@ class TileExtra:
         self.serialize_into(s, fg_id, bg_id, format_version)
         return s.getvalue()
 
+    @staticmethod
+    def skip_extra(s: Buffer, fg: int = -1, bg: int = -1, format_version: int = 999999999) -> bool:
+        """move `s` past an extra without decoding it, False (with `s` untouched) if its type has no known layout"""
+        if s.eof():
+            raise EOFError(f"attempt to read tile extra beyond end (rpos={s.rpos})")
+        layout = _TILE_EXTRA_LAYOUT.get(s.buffer[s.rpos])
+        if layout is None:
+            return False
+
+        item = item_database.get(fg or bg)
+        if item.id == DATA_STARSHIP_HULL and format_version > 4 or item.flags2 & ItemInfoFlag2.GUILD_ITEM != 0:
+            return False
+
+        buf = s.buffer
+        pos = s.rpos + 1
+        for size in layout:
+            if size == _STR:
+                size = 2 + int.from_bytes(buf[pos : pos + 2], "little")
+            pos += size
+        if pos > len(buf):
+            raise EOFError(f"attempt to skip tile extra beyond end (rpos={s.rpos}, end={pos}, len={len(buf)})")
+
+        s.rpos = pos
+        return True
+
     @classmethod
     def new(cls, type: TileExtraType) -> "TileExtra":
         extra = _TILE_EXTRA_REGISTRY.get(type)
         if not extra:
             raise NotImplementedError(f"no tile extra for id {type}")
-        return extra()
+        return extra(type=TileExtraType(type))
 
     def get[T](self, expect: Type[T]) -> T:
         if not isinstance(self, expect):
@@ -2389,6 +2420,69 @@ _TILE_EXTRA_REGISTRY: dict[int, type[TileExtra]] = {
     TileExtraType.FRIENDS_ENTRANCE_TILE: FriendsEntranceTile,
 }
 
+# byte layout of the extras that can be stepped over without decoding them, an int is that many bytes and _STR
+# a u16 length prefixed string. extras not listed (versioned or variable length ones) are decoded right away
+_STR = -1
+_TILE_EXTRA_LAYOUT: dict[int, tuple[int, ...]] = {
+    TileExtraType.DOOR_TILE: (_STR, 1),
+    TileExtraType.SIGN_TILE: (_STR, 4),
+    TileExtraType.SEED_TILE: (5,),
+    TileExtraType.UNK_SCROLL_BULETTIN: (),
+    TileExtraType.MAILBOX_TILE: (_STR, _STR, _STR, 1),
+    TileExtraType.BULLETIN_TILE: (_STR, _STR, _STR, 1),
+    TileExtraType.DICE_TILE: (1,),
+    TileExtraType.ACHIEVEMENT_BLOCK_TILE: (5,),
+    TileExtraType.HEART_MONITOR_TILE: (4, _STR),
+    TileExtraType.DONATION_BOX_TILE: (_STR, _STR, _STR, 1),
+    TileExtraType.STUFF_FOR_TOYS_TILE: (_STR, _STR, _STR, 1),
+    TileExtraType.MANNEQUIN_TILE: (_STR, 23),
+    TileExtraType.BUNNY_EGG_TILE: (4,),
+    TileExtraType.TEAM_TILE: (1,),
+    TileExtraType.GAME_GENERATOR_TILE: (),
+    TileExtraType.XENONITE_CRYSTAL_TILE: (5,),
+    TileExtraType.PHONE_BOOTH_TILE: (18,),
+    TileExtraType.CRYSTAL_TILE: (_STR,),
+    TileExtraType.CRIME_IN_PROGRESS_TILE: (_STR, 5),
+    TileExtraType.DISPLAY_BLOCK_TILE: (4,),
+    TileExtraType.VENDING_MACHINE_TILE: (8,),
+    TileExtraType.GIVING_TREE_TILE: (6,),
+    TileExtraType.COUNTRY_FLAG_TILE: (_STR,),
+    TileExtraType.WEATHER_MACHINE_TILE: (4,),
+    TileExtraType.SPOTLIGHT_TILE: (),
+    TileExtraType.SOLAR_COLLECTOR_TILE: (5,),
+    TileExtraType.FORGE_TILE: (4,),
+    TileExtraType.STEAM_ORGAN_TILE: (5,),
+    TileExtraType.LOBSTER_TRAP_TILE: (),
+    TileExtraType.PAINTING_EASEL_TILE: (4, _STR),
+    TileExtraType.PET_BATTLE_CAGE_TILE: (_STR, 12),
+    TileExtraType.STEAM_ENGINE_TILE: (4,),
+    TileExtraType.LOCK_BOT_TILE: (4,),
+    TileExtraType.SPIRIT_STORAGE_UNIT_TILE: (4,),
+    TileExtraType.SHELF_TILE: (16,),
+    TileExtraType.CHALLENGE_TIMER_TILE: (),
+    TileExtraType.FISH_WALL_MOUNT_TILE: (_STR, 5),
+    TileExtraType.GUILD_WEATHER_MACHINE_TILE: (9,),
+    TileExtraType.FOSSIL_PREP_STATION_TILE: (4,),
+    TileExtraType.DNA_EXTRACTOR_TILE: (),
+    TileExtraType.BLASTER_TILE: (),
+    TileExtraType.CHEMSYNTH_TANK_TILE: (8,),
+    TileExtraType.AUDIO_RACK_TILE: (_STR, 4),
+    TileExtraType.GEIGER_CHARGER_TILE: (4,),
+    TileExtraType.ADVENTURE_BEGINS_TILE: (),
+    TileExtraType.TOMB_ROBBER_TILE: (),
+    TileExtraType.BALLOON_O_MATIC_TILE: (5,),
+    TileExtraType.TRAINING_PORT_TILE: (35,),
+    TileExtraType.ITEM_SUCKER_TILE: (14,),
+    TileExtraType.GROWSCAN_TILE: (1,),
+    TileExtraType.STORMY_CLOUD_TILE: (12,),
+    TileExtraType.SAFE_VAULT_TILE: (),
+    TileExtraType.ANGELIC_COUNTING_CLOUD_TILE: (4, _STR),
+    TileExtraType.COMPLETIONIST_TILE: (4,),
+    TileExtraType.PINEAPPLE_GUZZLER_TILE: (4,),
+    TileExtraType.KRANKEN_GALATIC_BLOCK_TILE: (8,),
+    TileExtraType.FRIENDS_ENTRANCE_TILE: (8,),
+}
+
 
 class TileFlags(IntFlag):
     NONE = 0
@@ -2436,6 +2530,13 @@ _COLOR_MATRICES = {
 COLOR_MASK = TileFlags.PAINTED_RED | TileFlags.PAINTED_GREEN | TileFlags.PAINTED_BLUE
 COLOR_SHIFT = TileFlags.PAINTED_RED.bit_length() - 1
 
+# the parser tests flags as plain ints, IntFlag arithmetic goes through the enum machinery for every tile
+_HAS_EXTRA_DATA = int(TileFlags.HAS_EXTRA_DATA)
+_LOCKED = int(TileFlags.LOCKED)
+_TILE_FLAGS: dict[int, TileFlags] = {}
+# fg, bg, parent index, flags
+_TILE_HEADER = struct.Struct("<4H")
+
 
 @dataclass(slots=True)
 class Tile:
@@ -2455,8 +2556,45 @@ class Tile:
     overlay_tex_index: int = 0  # ON_FIRE, IS_WET
     json_data: dict = field(default_factory=dict)
 
+    # a lazy parse leaves `extra` and `json_data` unset, they are decoded from these on first read. the fg, bg and
+    # format version `_extra_raw` was parsed with
+    _extra_args: tuple[int, int, int] | None = field(default=None, repr=False, compare=False)
+    _json_raw: bytes = field(default=b"", repr=False, compare=False)
+
     logger = logging.getLogger("tile")
 
+    def __getattr__(self, name: str) -> Any:
+        # only reached for an unset slot
+        if name == "extra":
+            fg, bg, format_version = self._extra_args or (self.fg_id, self.bg_id, 999999999)
+            self.extra = TileExtra.deserialize_extra(Buffer(self._extra_raw), fg, bg, format_version)
+            return self.extra
+        if name == "json_data":
+            self.json_data = cbor2.loads(self._json_raw) if self._json_raw else {}
+            return self.json_data
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def pending(self, name: str) -> bool:
+        """whether `extra` or `json_data` is still waiting to be decoded"""
+        try:
+            object.__getattribute__(self, name)
+        except AttributeError:
+            return True
+        return False
+
+    def copy(self) -> "Tile":
+        """a copy that shares nothing mutable with this tile, what isn't decoded yet stays that way"""
+        tile = Tile.__new__(Tile)
+        for name in Tile.__slots__:
+            if not self.pending(name):
+                setattr(tile, name, getattr(self, name))
+        tile.pos = ivec2(self.pos)
+        if not self.pending("extra"):
+            tile.extra = copy.deepcopy(self.extra)
+        if not self.pending("json_data"):
+            tile.json_data = dict(self.json_data)
+        return tile
+
     def get_paint_index(self) -> int:
         return (int(self.flags) & COLOR_MASK) >> COLOR_SHIFT
 
@@ -2512,23 +2650,39 @@ class Tile:
     def front(self) -> int:
         return self.fg_id if self.fg_id > 0 else self.bg_id if self.bg_id > 0 else 0
 
+    @property
+    def extra_type(self) -> int:
+        """type of `extra`, read off the raw bytes if it isn't decoded yet"""
+        if self.pending("extra"):
+            return self._extra_raw[0] if self._extra_raw else TileExtraType.NONE
+        return self.extra.type if self.extra else TileExtraType.NONE
+
     @classmethod
-    def from_proto(cls, proto: growtopia_pb2.Tile) -> "Tile":
-        return cls(
+    def from_proto(cls, proto: growtopia_pb2.Tile, lazy: bool | None = None) -> "Tile":
+        lazy = setting.world_lazy_extra if lazy is None else lazy
+        tile = cls(
             fg_id=proto.fg_id,
             bg_id=proto.bg_id,
             parent_index=proto.parent_index,
             lock_index=proto.lock_index,
             flags=TileFlags(proto.flags),
-            extra=TileExtra.deserialize_extra(Buffer(proto.extra), proto.fg_id, proto.bg_id) if proto.extra else None,
+            extra=TileExtra.deserialize_extra(Buffer(proto.extra), proto.fg_id, proto.bg_id) if proto.extra and not lazy else None,
             _extra_raw=proto.extra,
             index=proto.index,
             pos=ivec2(proto.x, proto.y),
             fg_tex_index=proto.fg_tex_index,
             bg_tex_index=proto.bg_tex_index,
             overlay_tex_index=proto.overlay_tex_index,
-            json_data=cbor2.loads(proto.json_data) if proto.json_data else {},
+            json_data=cbor2.loads(proto.json_data) if proto.json_data and not lazy else {},
+            _extra_args=(proto.fg_id, proto.bg_id, 999999999),
+            _json_raw=proto.json_data,
         )
+        if lazy:
+            if proto.extra:
+                del tile.extra
+            if proto.json_data:
+                del tile.json_data
+        return tile
 
     def to_proto(self) -> growtopia_pb2.Tile:
         return growtopia_pb2.Tile(
@@ -2544,36 +2698,47 @@ class Tile:
             fg_tex_index=self.fg_tex_index,
             bg_tex_index=self.bg_tex_index,
             overlay_tex_index=self.overlay_tex_index,
-            json_data=cbor2.dumps(self.json_data) if self.json_data else None,
+            json_data=self._json_raw if self.pending("json_data") else cbor2.dumps(self.json_data) if self.json_data else None,
         )
 
     @classmethod
-    def deserialize(cls, s: Buffer, format_version: int = 999999999999, strict: bool = True) -> "Tile":
+    def deserialize(cls, s: Buffer, format_version: int = 999999999999, strict: bool = True, lazy: bool = False) -> "Tile":
         tile = cls()
-        tile.fg_id = s.read_u16()
-        tile.bg_id = s.read_u16()
+        if s.remaining() < _TILE_HEADER.size:
+            raise EOFError(f"attempt to read tile beyond end (rpos={s.rpos}, len={len(s.buffer)})")
+        tile.fg_id, tile.bg_id, tile.parent_index, flags = _TILE_HEADER.unpack_from(s.buffer, s.rpos)
+        s.rpos += _TILE_HEADER.size
         if strict:
             if tile.fg_id > item_database.item_count:
                 raise ValueError(f"illegal foreground item: {tile.fg_id}")
             if tile.bg_id > item_database.item_count:
                 raise ValueError(f"illegal background item: {tile.bg_id}")
 
-        tile.parent_index = s.read_u16()
-        tile.flags = TileFlags(s.read_u16())
+        if (tile_flags := _TILE_FLAGS.get(flags)) is None:
+            tile_flags = _TILE_FLAGS[flags] = TileFlags(flags)
+        tile.flags = tile_flags
 
-        if tile.flags & TileFlags.LOCKED:
+        if flags & _LOCKED:
             tile.lock_index = s.read_u16()
 
-        if tile.flags & TileFlags.HAS_EXTRA_DATA:
+        if flags & _HAS_EXTRA_DATA:
             start = s.rpos
-            tile.extra = TileExtra.deserialize_extra(s, tile.fg_id, tile.bg_id, format_version)
+            if lazy and TileExtra.skip_extra(s, tile.fg_id, tile.bg_id, format_version):
+                tile._extra_args = (tile.fg_id, tile.bg_id, format_version)
+                del tile.extra
+            else:
+                tile.extra = TileExtra.deserialize_extra(s, tile.fg_id, tile.bg_id, format_version)
             extra_size = s.rpos - start
 
             s.rpos = start
             tile._extra_raw = s.read_bytes(extra_size)
 
         if tile.fg_id in CBOR_IDs:
-            tile.json_data = cbor2.loads(s.read_pascal_bytes("I"))
+            if lazy:
+                tile._json_raw = s.read_pascal_bytes("I")
+                del tile.json_data
+            else:
+                tile.json_data = cbor2.loads(s.read_pascal_bytes("I"))
 
         return tile
 
@@ -2587,11 +2752,14 @@ class Tile:
             s.write_u16(self.lock_index)
 
         if self.flags & TileFlags.HAS_EXTRA_DATA:
-            if self.extra is not None:
+            # nothing could have changed an extra that was never decoded
+            if self.pending("extra"):
+                s.write_bytes(self._extra_raw)
+            elif self.extra is not None:
                 self.extra.serialize_into(s, self.fg_id, self.bg_id, format_version)
 
         if self.fg_id in CBOR_IDs:
-            s.write_pascal_bytes("I", cbor2.dumps(self.json_data))
+            s.write_pascal_bytes("I", self._json_raw if self.pending("json_data") else cbor2.dumps(self.json_data))
 
         return s.getvalue()
 
@@ -2755,6 +2923,187 @@ class Npc:
         )
 
 
+def _plausible_tile_header(buf: bytes | bytearray, offset: int, nb_tiles: int) -> bool:
+    if offset + _TILE_HEADER.size > len(buf):
+        return False
+    fg, bg, parent, flags = _TILE_HEADER.unpack_from(buf, offset)
+    count = item_database.item_count
+    # odd ids are seeds, a background never is one and a seed always has its extra
+    return fg <= count and bg <= count and not bg & 1 and (not fg & 1 or bool(flags & _HAS_EXTRA_DATA)) and parent < nb_tiles
+
+
+def _extra_offset(buf: bytes | bytearray, offset: int) -> int:
+    return offset + _TILE_HEADER.size + (2 if buf[offset + 6] & _LOCKED else 0)
+
+
+class _ResyncSpent(Exception):
+    pass
+
+
+class _TileResync:
+    """finds where parsing can pick up again after a tile that doesn't parse. a candidate boundary is exact if the
+    tiles from there parse, skipping any further bad tile the same way, and end right where the dropped items and
+    weather fill the rest of the buffer. parses are memoized by offset, candidates soon run into each other's tiles.
+    the bytes parsed and offsets tried come out of one budget per world, once it's spent no boundary is found"""
+
+    def __init__(self, s: Buffer, version: int, nb_tiles: int) -> None:
+        self._s = s
+        self._buf = s.buffer
+        self._version = version
+        self._nb_tiles = nb_tiles
+        # tile offset -> offset of the tile after it, -1 if none parses there
+        self._succ: dict[int, int] = {}
+        # tile offset -> offset of the first tile after it that doesn't parse, and how many do until then
+        self._run: dict[int, tuple[int, int]] = {}
+        self._solved: dict[tuple[int, int], tuple[int, bool] | None] = {}
+        # bad tiles further on looked past, per world
+        self._budget = 64
+        self._work = int(setting.world_resync_budget * len(self._buf))
+
+    @property
+    def spent(self) -> bool:
+        return self._work <= 0
+
+    def _spend(self, n: int) -> None:
+        self._work -= n
+        if self._work < 0:
+            raise _ResyncSpent
+
+    def _next(self, o: int) -> int:
+        if (after := self._succ.get(o)) is None:
+            after = -1
+            if _plausible_tile_header(self._buf, o, self._nb_tiles):
+                self._s.rpos = o
+                try:
+                    Tile.deserialize(self._s, self._version, lazy=True)
+                    after = self._s.rpos
+                except Exception:
+                    pass
+                # charged by what was read, a garbage list length can have one parse run to the end of the buffer
+                self._spend(self._s.rpos - o)
+            self._succ[o] = after
+        return after
+
+    def _run_from(self, o: int) -> tuple[int, int]:
+        path: list[int] = []
+        while (run := self._run.get(o)) is None:
+            if (after := self._next(o)) < 0:
+                run = self._run[o] = (o, 0)
+                break
+            path.append(o)
+            o = after
+        stop, steps = run
+        for q in reversed(path):
+            steps += 1
+            self._run[q] = (stop, steps)
+        return stop, steps
+
+    def _nth(self, o: int, n: int) -> int:
+        for _ in range(n):
+            o = self._succ[o]
+        return o
+
+    def _tail_fits(self, offset: int) -> bool:
+        buf = self._buf
+        if offset + 20 > len(buf):
+            return False
+        nb_items = int.from_bytes(buf[offset + 12 : offset + 16], "little")
+        return offset + 20 + nb_items * 16 + 12 == len(buf)
+
+    def boundary(self, offset: int, tiles_left: int) -> tuple[int, bool] | None:
+        """(where the next tile starts, exact) searched for in the resync window from `offset`. without an exact one
+        it's the first candidate among those that parse the furthest. `s` is left where it was"""
+        key = (offset, tiles_left)
+        if key in self._solved:
+            return self._solved[key]
+
+        rpos = self._s.rpos
+        try:
+            result = self._boundary(offset, tiles_left)
+        except _ResyncSpent:
+            return None
+        finally:
+            self._s.rpos = rpos
+        self._solved[key] = result
+        return result
+
+    def _boundary(self, offset: int, tiles_left: int) -> tuple[int, bool] | None:
+        confirm = min(setting.world_resync_confirm, tiles_left)
+        fallback: tuple[bool, int, int] | None = None
+        for o in range(offset, min(offset + setting.world_resync_window, len(self._buf))):
+            self._spend(1)
+            if tiles_left == 0:
+                if self._tail_fits(o):
+                    return o, True
+                continue
+
+            stop, steps = self._run_from(o)
+            if steps < confirm:
+                continue
+            if steps >= tiles_left:
+                if self._tail_fits(self._nth(o, tiles_left)):
+                    return o, True
+                continue
+
+            # the tiles run into another one that doesn't parse, if its header looks right that's another bad extra
+            clean = _plausible_tile_header(self._buf, stop, self._nb_tiles)
+            if clean and self._budget > 0:
+                self._budget -= 1
+                if (after := self.boundary(_extra_offset(self._buf, stop) + 1, tiles_left - steps - 1)) and after[1]:
+                    return o, True
+            if fallback is None or (clean, stop) > fallback[:2]:
+                fallback = (clean, stop, o)
+        return (fallback[2], False) if fallback else None
+
+
+@dataclass(slots=True)
+class ParseIssue:
+    """a tile `World.deserialize` couldn't parse"""
+
+    tile: int
+    # where the tile starts
+    offset: int
+    error: str
+    # fg, bg and flags at `offset`, None if they don't look like a tile header. then the tile before took too few or
+    # too many bytes and is the real culprit
+    header: tuple[int, int, int] | None
+    # type byte of the extra that failed, or of the one before if the header is off
+    extra_type: int | None
+    # where the next tile was found, None if there was none in the search window
+    resumed_at: int | None
+    # whether the tiles from there, resynced the same way past any later bad one, end exactly where the world does.
+    # if not the tile indices after this one are likely off, with several bad tiles they still can be
+    exact: bool = False
+    # the bytes around it, from the previous tile if the header is off
+    dump_offset: int = 0
+    data: bytes = b""
+
+    @property
+    def suspect(self) -> str:
+        if self.extra_type is None:
+            return "none"
+        try:
+            return TileExtraType(self.extra_type).name
+        except ValueError:
+            return f"unknown 0x{self.extra_type:02x}"
+
+    def hexdump(self) -> str:
+        lines: list[str] = []
+        for i in range(0, len(self.data), 16):
+            chunk = self.data[i : i + 16]
+            text = "".join(chr(b) if 32 <= b < 127 else "." for b in chunk)
+            mark = ">" if self.dump_offset + i <= self.offset < self.dump_offset + i + 16 else " "
+            lines.append(f"{mark}{self.dump_offset + i:08x}: {chunk.hex(' '):<47}  {text}")
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        header = f"fg={self.header[0]} bg={self.header[1]} flags=0x{self.header[2]:04x}" if self.header else "implausible header"
+        resumed = "no tile boundary found"
+        if self.resumed_at is not None:
+            resumed = f"resumed at {self.resumed_at} (+{self.resumed_at - self.offset}{'' if self.exact else ', inexact'})"
+        return f"tile {self.tile} at offset {self.offset}: {self.error}\n  {header}, suspect extra {self.suspect}, {resumed}\n{self.hexdump()}"
+
+
 class WorldEvent(Enum):
     TILE_UPDATE = auto()
     DROPPED_UPDATE = auto()
@@ -2794,6 +3143,8 @@ class World:
     logger = logging.getLogger("world")
     npcs: dict[int, Npc] = field(default_factory=dict)
     sheet: Sheet | None = None
+    # tiles `deserialize` had to skip past
+    parse_issues: list[ParseIssue] = field(default_factory=list, repr=False)
 
     class SheetFlags(IntFlag):
         NONE = 0
@@ -2806,6 +3157,31 @@ class World:
     _batching: bool = False
     _event_buffer: defaultdict[WorldEvent, list[tuple]] = field(default_factory=lambda: defaultdict(list), init=False, repr=False)
     live: bool = False
+    # when the world data was received, the `time_passed` of its trees counts up to here
+    received_at: float = field(default_factory=time.time, repr=False)
+
+    # tile indices / positions collected while coalescing, None when not inside `coalesce()`
+    _dirty_connections: set[int] | None = field(default=None, init=False, repr=False)
+    _dirty_sheet: set[tuple[int, int]] | None = field(default=None, init=False, repr=False)
+
+    # spatial indexes, built lazily on first query and then maintained incrementally
+    _spatial_ready: bool = field(default=False, init=False, repr=False)
+    _dropped_index: TileBucketIndex[DroppedItem] = field(default_factory=TileBucketIndex, init=False, repr=False)
+    _player_index: TileBucketIndex[Player] = field(default_factory=TileBucketIndex, init=False, repr=False)
+    _npc_index: TileBucketIndex[Npc] = field(default_factory=TileBucketIndex, init=False, repr=False)
+
+    # tile index (item, extra type, lock, tree ready time), built lazily on first query and then maintained
+    # incrementally by the methods that change tiles
+    _tiles_ready: bool = field(default=False, init=False, repr=False)
+    _tile_index: TileIndex = field(default_factory=TileIndex, init=False, repr=False)
+    # a `fork()` shares the index of the world it was forked from until it changes a tile
+    _tile_index_shared: bool = field(default=False, init=False, repr=False)
+    # tile index -> wall clock time a seed was planted there while we were in the world
+    _planted_at: dict[int, float] = field(default_factory=dict, init=False, repr=False)
+
+    # indices of the tiles a `fork()` has copied for itself, the rest are still shared with the world it was forked
+    # from. None when every tile is owned
+    _owned_tiles: set[int] | None = field(default=None, init=False, repr=False)
 
     @overload
     def subscribe(self, event: Literal[WorldEvent.DROPPED_UPDATE], *, single: Callable[[], Any] | None = None, batch: Callable[[], Any] | None = None) -> None: ...
@@ -2842,9 +3218,38 @@ class World:
             self._batching = False
             self._event_buffer.clear()
 
+    @contextmanager
+    def coalesce(self):
+        """apply many tile changes as one: connections are recomputed once over the union of the dirty 3x3
+        regions when the outermost scope exits, and listeners get a single deduplicated batch"""
+        if self._dirty_connections is not None:
+            yield
+            return
+
+        self._dirty_connections = set()
+        self._dirty_sheet = set()
+        try:
+            with self.batch():
+                try:
+                    yield
+                finally:
+                    dirty, self._dirty_connections = self._dirty_connections, None
+                    dirty_sheet, self._dirty_sheet = self._dirty_sheet, None
+
+                    for idx in dirty:
+                        if (tile := self._own_tile(idx)) is not None:
+                            self.update_tile_connection(tile)
+                    if dirty_sheet:
+                        self.update_sheet_tiles(dirty_sheet)
+        finally:
+            self._dirty_connections = None
+            self._dirty_sheet = None
+
     def _flush_batch(self) -> None:
         for event, calls in self._event_buffer.items():
             listeners = self._listeners[event]
+            # the same tile touched several times in a batch only needs to be reported once
+            calls = list(dict.fromkeys(calls))
 
             for listener in listeners:
                 if listener.batch:
@@ -2865,6 +3270,7 @@ class World:
                 listener.batch([args])
 
     def clear(self) -> None:
+        self._own_all_tiles()
         with self.batch():
             for tile in self.tiles.values():
                 if tile.bg_id != 0:
@@ -2872,49 +3278,86 @@ class World:
                 if tile.fg_id != 0:
                     self.place_fg(tile, 0)
 
-    def create_sheet_notes(self) -> list[Note]:
+    def _tile_sheet_notes(self, tile: Tile) -> list[Note]:
         ret: list[Note] = []
 
-        for tile in self.tiles.values():
-            # 4 (60 / 14) staff in one world, the topmost is 0, each staff height is 14 (note)
-            staff_baseline = int(tile.pos.y // 14) * 14
-
-            if tile.extra and isinstance(tile.extra, AudioRackTile):
-                rack = tile.extra.get(AudioRackTile)
-                notes = rack.note.split(b" ")
-
-                for code in notes:
-                    n = Note.from_code(
-                        code,
-                        timestamp=int(staff_baseline // 14) * self.width + tile.pos.x,
-                        volume=rack.volume / 100.0,
-                    )
-                    if not n:
-                        continue
+        # 4 (60 / 14) staff in one world, the topmost is 0, each staff height is 14 (note)
+        staff_baseline = int(tile.pos.y // 14) * 14
+        timestamp = int(staff_baseline // 14) * self.width + tile.pos.x
 
-                    ret.append(n)
+        if tile.extra and isinstance(tile.extra, AudioRackTile):
+            rack = tile.extra.get(AudioRackTile)
+            notes = rack.note.split(b" ")
 
-            if tile.bg_id == 0:
-                continue
+            for code in notes:
+                n = Note.from_code(
+                    code,
+                    timestamp=timestamp,
+                    volume=rack.volume / 100.0,
+                )
+                if not n:
+                    continue
 
-            item = item_database.get(tile.bg_id)
-            if item.item_type == ItemInfoType.MUSICNOTE:
-                accident = Note.SHARP if tile.bg_id in SHEET_SHARP_ID else Note.FLAT if tile.bg_id in SHEET_FLAT_ID else Note.NATURAL
+                ret.append(n)
 
-                pitch, octave = Note.y_pitch(tile.pos.y - staff_baseline)
+        if tile.bg_id == 0:
+            return ret
 
-                ret.append(
-                    Note(
-                        base=pitch,
-                        octave=octave,
-                        accidental=accident,
-                        instrument=ID_TO_INSTRUMENT_SET[tile.bg_id],
-                        timestamp=int(tile.pos.y // 14) * self.width + tile.pos.x,
-                    )
+        item = item_database.get(tile.bg_id)
+        if item.item_type == ItemInfoType.MUSICNOTE:
+            accident = Note.SHARP if tile.bg_id in SHEET_SHARP_ID else Note.FLAT if tile.bg_id in SHEET_FLAT_ID else Note.NATURAL
+
+            pitch, octave = Note.y_pitch(tile.pos.y - staff_baseline)
+
+            ret.append(
+                Note(
+                    base=pitch,
+                    octave=octave,
+                    accidental=accident,
+                    instrument=ID_TO_INSTRUMENT_SET[tile.bg_id],
+                    timestamp=timestamp,
                 )
+            )
 
         return ret
 
+    def create_sheet_notes(self) -> list[Note]:
+        ret: list[Note] = []
+
+        for tile in self.tiles.values():
+            ret.extend(self._tile_sheet_notes(tile))
+
+        return ret
+
+    def sheet_column_notes(self, columns: Iterable[int]) -> dict[int, list[Note]]:
+        """notes of the given sheet columns (timestamps), only reading the 14 tiles of each column"""
+        ret: dict[int, list[Note]] = {}
+        if self.width == 0:
+            return ret
+
+        for col in columns:
+            staff, x = divmod(col, self.width)
+            notes: list[Note] = []
+            for y in range(staff * 14, min(staff * 14 + 14, self.height)):
+                if (tile := self.tiles.get(y * self.width + x)) is not None:
+                    notes.extend(self._tile_sheet_notes(tile))
+            ret[col] = notes
+
+        return ret
+
+    def update_sheet_tiles(self, positions: Iterable[tuple[int, int]]) -> None:
+        """recompile only the sheet columns containing the given tile positions"""
+        if not self.sheet:
+            return
+
+        if self._dirty_sheet is not None:
+            self._dirty_sheet.update(positions)
+            return
+
+        columns = {(y // 14) * self.width + x for x, y in positions}
+        if columns:
+            self.sheet.update_columns(self.sheet_column_notes(columns))
+
     def get_sheet(self, mixer: AudioMixer | None = None) -> Sheet:
         lock = self.get_world_lock()
         if lock is None or lock.extra is None:
@@ -2943,6 +3386,7 @@ class World:
         if self.sheet and clear_notes:
             self.sheet.replace_notes([])
 
+        self._own_all_tiles()
         with self.batch():
             for tile in self.tiles.values():
                 if tile.bg_id in ID_TO_INSTRUMENT_SET:
@@ -2957,7 +3401,7 @@ class World:
             self.sheet = sheet
             self.materialize_sheet(sheet)
         else:
-            self.sheet.add_notes(sheet._notes)
+            self.sheet.add_notes(sheet.all_notes())
             self.materialize_sheet(sheet)
 
     def rebuild_sheet(self) -> None:
@@ -3127,6 +3571,109 @@ class World:
         self.sheet = sheet
         self.materialize_sheet(self.sheet)
 
+    def reindex(self) -> None:
+        """rebuild the spatial indexes, needed if dropped, players or npcs were modified without going through World"""
+        self._dropped_index.clear()
+        self._player_index.clear()
+        self._npc_index.clear()
+
+        for item in self.dropped.items:
+            self._dropped_index.insert(item.uid, item, item.pos)
+        for player in self.players.values():
+            self._player_index.insert(player.net_id, player, player.pos)
+        for npc in self.npcs.values():
+            self._npc_index.insert(npc.id, npc, npc.pos)
+
+        self._spatial_ready = True
+
+    @property
+    def dropped_index(self) -> TileBucketIndex[DroppedItem]:
+        if not self._spatial_ready:
+            self.reindex()
+        return self._dropped_index
+
+    @property
+    def player_index(self) -> TileBucketIndex[Player]:
+        if not self._spatial_ready:
+            self.reindex()
+        return self._player_index
+
+    @property
+    def npc_index(self) -> TileBucketIndex[Npc]:
+        if not self._spatial_ready:
+            self.reindex()
+        return self._npc_index
+
+    def reindex_tiles(self) -> None:
+        """rebuild the tile index, needed if tiles were modified without going through World"""
+        if self._tile_index_shared:
+            self._tile_index = TileIndex()
+            self._tile_index_shared = False
+        else:
+            self._tile_index.clear()
+        for tile in self.tiles.values():
+            self._tile_index.set(tile.index, self._tile_entry(tile))
+        self._tiles_ready = True
+
+    @property
+    def tile_index(self) -> TileIndex:
+        if not self._tiles_ready:
+            self.reindex_tiles()
+        return self._tile_index
+
+    def _tile_entry(self, tile: Tile) -> TileEntry:
+        extra_type = tile.extra_type
+        owner = extra.get(LockTile).owner_uid if extra_type == TileExtraType.LOCK_TILE and (extra := tile.extra) is not None else None
+        lock = tile.lock_index if int(tile.flags) & _LOCKED else None
+        return TileEntry(tile.fg_id, tile.bg_id, extra_type, lock, owner, self.tree_ready_at(tile))
+
+    def _index_tile(self, tile: Tile) -> None:
+        if not self._tiles_ready:
+            return
+        if self._tile_index_shared:
+            self._tile_index = self._tile_index.copy()
+            self._tile_index_shared = False
+        self._tile_index.set(tile.index, self._tile_entry(tile))
+
+    def _tiles_at(self, indices: list[int]) -> list[Tile]:
+        # on a fork these may still be shared with the world it was forked from, anything that changes them goes
+        # through `get_tile` first
+        indices.sort()
+        return [tile for idx in indices if (tile := self.tiles.get(idx)) is not None]
+
+    def tree_ready_at(self, tile: Tile) -> float | None:
+        """wall clock time the tree on `tile` can be harvested, None if there is no tree"""
+        if tile.extra_type != TileExtraType.SEED_TILE:
+            return None
+        if (planted := self._planted_at.get(tile.index)) is None:
+            assert tile.extra
+            planted = self.received_at - tile.extra.get(SeedTile).time_passed
+        return planted + item_database.get(tile.fg_id).grow_time
+
+    def tiles_with_item(self, id: int) -> list[Tile]:
+        """tiles with `id` as their foreground or background"""
+        return self._tiles_at(self.tile_index.with_item(id))
+
+    def tiles_with_extra(self, type: TileExtraType) -> list[Tile]:
+        return self._tiles_at(self.tile_index.with_extra(type))
+
+    def locked_tiles(self, lock: Tile) -> list[Tile]:
+        """tiles `lock` holds, not including itself"""
+        return self._tiles_at(self.tile_index.locked_by(lock.index))
+
+    def locks_owned_by(self, uid: int) -> list[Tile]:
+        return self._tiles_at(self.tile_index.locks_of(uid))
+
+    def ready_trees(self, now: float | None = None) -> list[Tile]:
+        return self._tiles_at(self.tile_index.ready(time.time() if now is None else now))
+
+    def next_ready_tree(self) -> tuple[float, Tile] | None:
+        """the tree that will be ready next and when, trees already ready are left out"""
+        if (entry := self.tile_index.next_ready()) is None:
+            return None
+        ready_at, idx = entry
+        return ready_at, self.tiles[idx]
+
     def get_npc(self, id: int) -> Npc | None:
         npc = self.npcs.get(id)
         if not npc:
@@ -3136,16 +3683,27 @@ class World:
 
     def add_npc(self, npc: Npc) -> None:
         self.npcs[npc.id] = npc
+        if self._spatial_ready:
+            self._npc_index.insert(npc.id, npc, npc.pos)
         self.broadcast(WorldEvent.NPC_UPDATE)
 
     def remove_npc(self, npc: Npc) -> None:
         self.npcs.pop(npc.id, None)
+        if self._spatial_ready:
+            self._npc_index.remove(npc.id)
         self.broadcast(WorldEvent.NPC_UPDATE)
 
     def remove_npc_by_id(self, id: int) -> None:
         self.npcs.pop(id)
+        if self._spatial_ready:
+            self._npc_index.remove(id)
         self.broadcast(WorldEvent.NPC_UPDATE)
 
+    def move_npc(self, npc: Npc, pos: vec2) -> None:
+        npc.pos = pos
+        if self._spatial_ready:
+            self._npc_index.move(npc.id, pos)
+
     def update_npc(self, dt: float) -> None:
         for npc in self.npcs.values():
             delta = npc.target_pos - npc.pos
@@ -3156,10 +3714,10 @@ class World:
 
                 step = npc.param3 * dt
                 if step >= distance:
-                    npc.pos = vec2(npc.target_pos.x, npc.target_pos.y)
+                    self.move_npc(npc, vec2(npc.target_pos.x, npc.target_pos.y))
                 else:
                     direction = delta / distance
-                    npc.pos += direction * step
+                    self.move_npc(npc, npc.pos + direction * step)
 
     def get_player(self, net_id: int) -> Player | None:
         player = self.players.get(net_id)
@@ -3170,16 +3728,27 @@ class World:
 
     def add_player(self, player: Player) -> None:
         self.players[player.net_id] = player
+        if self._spatial_ready:
+            self._player_index.insert(player.net_id, player, player.pos)
         self.broadcast(WorldEvent.PLAYER_UPDATE)
 
     def remove_player(self, player: Player) -> None:
         self.players.pop(player.net_id, None)
+        if self._spatial_ready:
+            self._player_index.remove(player.net_id)
         self.broadcast(WorldEvent.PLAYER_UPDATE)
 
     def remove_player_by_id(self, net_id: int) -> None:
         self.players.pop(net_id, None)
+        if self._spatial_ready:
+            self._player_index.remove(net_id)
         self.broadcast(WorldEvent.PLAYER_UPDATE)
 
+    def move_player(self, player: Player, pos: vec2) -> None:
+        player.pos = pos
+        if self._spatial_ready:
+            self._player_index.move(player.net_id, pos)
+
     @classmethod
     def from_tiles(cls, tiles: list[Tile]) -> "World":
         world = cls()
@@ -3206,6 +3775,7 @@ class World:
         self.fill()
 
     def fill(self) -> None:
+        self._own_all_tiles()
         for y in range(self.height):
             for x in range(self.width):
                 idx = y * self.width + x
@@ -3213,6 +3783,7 @@ class World:
                     tile = Tile(pos=ivec2(x, y))
                     tile.index = idx
                     self.tiles[idx] = tile
+                    self._index_tile(tile)
 
         self.nb_tiles = len(self.tiles)
 
@@ -3220,24 +3791,27 @@ class World:
         if self.width == width and self.height == height:
             return
 
+        self._own_all_tiles()
         new_tiles: dict[int, Tile] = {}
+        planted: dict[int, float] = {}
         for tile in self.tiles.values():
             if tile.pos.x < width and tile.pos.y < height:
                 idx = tile.pos.y * width + tile.pos.x
+                if (t := self._planted_at.get(tile.index)) is not None:
+                    planted[idx] = t
                 tile.index = idx
                 new_tiles[idx] = tile
 
         self.tiles = new_tiles
+        self._planted_at = planted
         self.width = width
         self.height = height
+        self._tiles_ready = False
         self.fill()
 
     def get_world_lock(self) -> Tile | None:
-        for tile in self.tiles.values():
-            if not tile.extra:
-                continue
-
-            if isinstance(tile.extra, LockTile) and not tile.fg_id in (SMALL_LOCK, BIG_LOCK, HUGE_LOCK, BUILDER_S_LOCK):
+        for tile in self.tiles_with_extra(TileExtraType.LOCK_TILE):
+            if not tile.fg_id in (SMALL_LOCK, BIG_LOCK, HUGE_LOCK, BUILDER_S_LOCK):
                 return tile
 
     def tile_exists(self, pos: ivec2 | int) -> bool:
@@ -3264,13 +3838,15 @@ class World:
         else:
             idx = y * self.width + x
 
-        tile = self.tiles.get(idx)
+        tile = self._own_tile(idx)
         if tile is None:
             self.logger.warning(f"tile idx={idx} in {self.name} does not exist")
 
         return tile
 
     def find_tile(self, where: Callable[[Tile], object]) -> Iterator[Tile]:
+        """linear scan calling `where` on every tile, which decodes any extra it reads. lookups by item, extra type,
+        lock or tree ready time have indexed counterparts (`tiles_with_item`, `tiles_with_extra`, ...)"""
         for tile in self.tiles.values():
             if bool(where(tile)):
                 yield tile
@@ -3290,6 +3866,7 @@ class World:
         else:
             tile.bg_id = 0
 
+        self._index_tile(tile)
         self.broadcast(WorldEvent.TILE_UPDATE, pos.x, pos.y)
 
     def place_tile(self, id: int, pos: ivec2) -> None:
@@ -3301,8 +3878,10 @@ class World:
         else:
             tile.fg_id = id
             if id % 2 != 0:
-                tile.extra = SeedTile()
+                tile.extra = SeedTile(type=TileExtraType.SEED_TILE)
+                self._planted_at[tile.index] = time.time()
 
+        self._index_tile(tile)
         self.broadcast(WorldEvent.TILE_UPDATE, pos.x, pos.y)
 
     def replace_whole_tile(self, tile: Tile) -> None:
@@ -3310,6 +3889,14 @@ class World:
         if idx is not None:
             tile.index = idx
             self.tiles[idx] = tile
+            if self._owned_tiles is not None:
+                self._owned_tiles.add(idx)
+            # a tile the server sends has grown for `time_passed` by now
+            if tile.extra_type == TileExtraType.SEED_TILE and (extra := tile.extra) is not None:
+                self._planted_at[idx] = time.time() - extra.get(SeedTile).time_passed
+            else:
+                self._planted_at.pop(idx, None)
+            self._index_tile(tile)
             self.broadcast(WorldEvent.TILE_UPDATE, tile.pos.x, tile.pos.y)
 
     def place_fg(self, tile: Tile, fg: int, connection: int = 0, a5: bool = False, broadcast: bool = True) -> None:
@@ -3446,6 +4033,12 @@ class World:
             tile.extra = TileExtra.new(TileExtraType.from_item_type(item.item_type))
             tile.flags |= TileFlags.HAS_EXTRA_DATA
 
+        if item.item_type == ItemInfoType.SEED:
+            self._planted_at[tile.index] = time.time()
+        else:
+            self._planted_at.pop(tile.index, None)
+        self._index_tile(tile)
+
         if broadcast:
             self.broadcast(WorldEvent.TILE_UPDATE, tile.pos.x, tile.pos.y)
 
@@ -3457,6 +4050,7 @@ class World:
             tile.bg_id = bg
         tile.bg_tex_index = connection
 
+        self._index_tile(tile)
         self.broadcast(WorldEvent.TILE_UPDATE, tile.pos.x, tile.pos.y)
 
     def update_tile_connection(self, tile: Tile) -> None:
@@ -3523,6 +4117,7 @@ class World:
         self.broadcast(WorldEvent.TILE_UPDATE, tile.pos.x, tile.pos.y)
 
     def update_all_connection(self) -> None:
+        self._own_all_tiles()
         for tile in self.tiles.values():
             self.update_tile_connection(tile)
 
@@ -3534,6 +4129,12 @@ class World:
             if not tile:
                 return
 
+        if self._dirty_connections is not None:
+            for y in range(-1, 2):
+                for x in range(-1, 2):
+                    self._dirty_connections.add((tile.pos.y + y) * self.width + tile.pos.x + x)
+            return
+
         for y in range(-1, 2):
             for x in range(-1, 2):
                 if n := self.get_tile(tile.pos + ivec2(x, y)):
@@ -3560,21 +4161,21 @@ class World:
             else:
                 tile.flags &= ~TileFlags.IS_SEEDLING
 
+            self._index_tile(tile)
             self.broadcast(WorldEvent.TILE_UPDATE, tile.pos.x, tile.pos.y)
 
-            # TODO: set current time here
-            # TODO: store somewhere the seed placed time
+    def remove_locked(self, locked: Tile) -> list[Tile]:
+        """unlock the tiles `locked` holds, returns them"""
+        if locked.extra_type != TileExtraType.LOCK_TILE:
+            return []
 
-    def remove_locked(self, locked: Tile) -> Iterator[Tile]:
-        if not locked.extra or locked.extra.type != TileExtraType.LOCK_TILE:
-            return
-
-        for tile in self.tiles.values():
-            if tile.lock_index == locked.index:
-                tile.flags &= ~TileFlags.LOCKED
-                tile.lock_index = 0
-                self.broadcast(WorldEvent.TILE_UPDATE, tile.pos.x, tile.pos.y)
-                yield tile
+        tiles = [tile for idx in sorted(self.tile_index.locked_by(locked.index)) if (tile := self._own_tile(idx)) is not None]
+        for tile in tiles:
+            tile.flags &= ~TileFlags.LOCKED
+            tile.lock_index = 0
+            self._index_tile(tile)
+            self.broadcast(WorldEvent.TILE_UPDATE, tile.pos.x, tile.pos.y)
+        return tiles
 
     def plant(self, tile: Tile, id: int, item_on_tree: int, splice: bool) -> None:
         if splice:
@@ -3608,6 +4209,8 @@ class World:
         if item.is_background():
             self.place_bg(tile, id)
             self.update_3x3_connection(tile)
+            if self.sheet:
+                self.update_sheet_tiles(((tile.pos.x, tile.pos.y),))
             return
         else:
             if item.item_type != ItemInfoType.FIST:
@@ -3635,6 +4238,8 @@ class World:
                 tile.flags &= ~TileFlags.FLIPPED_X
 
         self.update_3x3_connection(tile)
+        if self.sheet:
+            self.update_sheet_tiles(((tile.pos.x, tile.pos.y),))
 
     def update_lock(self, pos: ivec2, lock_owner_id: int, lock_item_id: int, tiles_affected: Iterator[int]) -> None:
         if lock_tile := self.get_tile(pos):
@@ -3643,6 +4248,7 @@ class World:
                 self.place_fg(lock_tile, lock_item_id, broadcast=False)
                 assert lock_tile.extra
                 lock_tile.extra.get(LockTile).owner_uid = lock_owner_id
+                self._index_tile(lock_tile)
                 self.broadcast(WorldEvent.TILE_UPDATE, lock_tile.pos.x, lock_tile.pos.y)
 
             self.remove_locked(lock_tile)
@@ -3654,6 +4260,7 @@ class World:
 
                 target_tile.flags |= TileFlags.LOCKED
                 target_tile.lock_index = lock_tile.index
+                self._index_tile(target_tile)
 
                 # self.update_tile_connection(target_tile)
                 self.broadcast(WorldEvent.TILE_UPDATE, target_tile.pos.x, target_tile.pos.y)
@@ -3669,26 +4276,35 @@ class World:
         self.dropped.last_uid += 1
         self.dropped.items.append(dropped)
         self.dropped.nb_items += 1
+        if self._spatial_ready:
+            self._dropped_index.insert(dropped.uid, dropped, dropped.pos)
 
         self.broadcast(WorldEvent.DROPPED_UPDATE)
 
+    def get_dropped(self, uid: int) -> DroppedItem | None:
+        return self.dropped_index.get(uid)
+
     def remove_dropped(self, uid: int) -> DroppedItem | None:
-        for i, item in enumerate(self.dropped.items):
-            if item.uid != uid:
-                continue
+        item = self.dropped_index.remove(uid)
+        if item is None:
+            return
 
-            self.dropped.items.pop(i)
-            self.dropped.nb_items -= 1
-            self.broadcast(WorldEvent.DROPPED_UPDATE)
-            return item
+        # identity scan, the dataclass __eq__ would compare every field of every item before it
+        for i, other in enumerate(self.dropped.items):
+            if other is item:
+                self.dropped.items.pop(i)
+                break
+
+        self.dropped.nb_items -= 1
+        self.broadcast(WorldEvent.DROPPED_UPDATE)
+        return item
 
     def set_dropped(self, uid: int, amount: int) -> None:
-        for item in self.dropped.items:
-            if item.uid != uid:
-                continue
+        if (item := self.dropped_index.get(uid)) is None:
+            return
 
-            item.amount = amount
-            self.broadcast(WorldEvent.DROPPED_UPDATE)
+        item.amount = amount
+        self.broadcast(WorldEvent.DROPPED_UPDATE)
 
     @classmethod
     def from_tank(cls, tank: TankPacket | bytes) -> "World":
@@ -3705,12 +4321,70 @@ class World:
     def from_file(cls, file: Path | str) -> "World":
         return cls.from_tank(Path(file).read_bytes())
 
+    def _own_tile(self, idx: int) -> Tile | None:
+        """the tile at `idx`, copied first if it is still shared with the world this one was forked from"""
+        tile = self.tiles.get(idx)
+        if tile is None or self._owned_tiles is None or idx in self._owned_tiles:
+            return tile
+
+        tile = self.tiles[idx] = tile.copy()
+        self._owned_tiles.add(idx)
+        return tile
+
+    def _own_all_tiles(self) -> None:
+        if self._owned_tiles is None:
+            return
+
+        for idx, tile in self.tiles.items():
+            if idx not in self._owned_tiles:
+                self.tiles[idx] = tile.copy()
+        self._owned_tiles = None
+
+    def fork(self) -> "World":
+        """copy on write copy, tiles are shared until the fork first touches them through `get_tile` (or one of the
+        methods built on it), players, npcs and dropped items are copied right away as they are few.
+
+        nothing mutates a shared tile, so this world must be left as is from now on, it is the read only snapshot
+        the fork diverges from. listeners and the sheet are shared
+        """
+        world = copy.copy(self)
+        world.tiles = dict(self.tiles)
+        world._owned_tiles = set()
+        world.dropped = Dropped(self.dropped.nb_items, self.dropped.last_uid, [copy.copy(item) for item in self.dropped.items])
+        world.players = {k: copy.copy(v) for k, v in self.players.items()}
+        world.npcs = {k: copy.copy(v) for k, v in self.npcs.items()}
+        world._batching = False
+        world._event_buffer = defaultdict(list)
+        world._dirty_connections = None
+        world._dirty_sheet = None
+        world._spatial_ready = False
+        world._dropped_index = TileBucketIndex()
+        world._player_index = TileBucketIndex()
+        world._npc_index = TileBucketIndex()
+        # the index is copied when the fork first changes a tile, one that isn't built yet is built by each on its own
+        world._tile_index_shared = self._tiles_ready
+        if not self._tiles_ready:
+            world._tile_index = TileIndex()
+        world._planted_at = dict(self._planted_at)
+        return world
+
     def copy(self) -> "World":
-        data = self.serialize()
-        new_world = World.deserialize(data, int_x_id=self.id)
-        new_world.garbage_start = self.garbage_start
+        world = self.snapshot().to_world()
+        world.received_at = self.received_at
+        world._planted_at = dict(self._planted_at)
+        return world
+
+    def snapshot(self) -> "WorldSnapshot":
+        return WorldSnapshot.from_world(self)
 
-        return new_world
+    @classmethod
+    def load(cls, file: Path | str) -> "World":
+        """load a world saved either as a snapshot or as the map data packet"""
+        with open(file, "rb") as f:
+            magic = f.read(len(SNAPSHOT_MAGIC))
+        if magic == SNAPSHOT_MAGIC:
+            return WorldSnapshot.load(file).to_world()
+        return cls.from_file(file)
 
     def serialize(self) -> bytes:
         s = Buffer()
@@ -3750,9 +4424,10 @@ class World:
         return s.getvalue()
 
     @classmethod
-    def deserialize(cls, s: bytes | Buffer, int_x_id: int = 0) -> "World":
+    def deserialize(cls, s: bytes | Buffer, int_x_id: int = 0, lazy: bool | None = None) -> "World":
         # we delegate passing the id to the caller because we don't have the tank packet here
         s = Buffer(s)
+        lazy = setting.world_lazy_extra if lazy is None else lazy
 
         world = cls()
 
@@ -3766,77 +4441,55 @@ class World:
 
         world.unk2 = s.read_bytes(5)
 
-        failed = False
-        for p in range(world.nb_tiles):
+        resync: _TileResync | None = None
+        prev_start = -1
+        p = 0
+        while p < world.nb_tiles:
+            start = s.rpos
             try:
-                tile = Tile.deserialize(s, world.version)
+                tile = Tile.deserialize(s, world.version, lazy=lazy)
             except Exception as e:
-                cls.logger.error(f"failed parsing world at offset={s.rpos}, peek={s.peek(100)}. err={e}")
-                if not failed:
+                resync = resync or _TileResync(s, world.version, world.nb_tiles)
+                if (recovered := world._recover_tile(s, resync, p, start, prev_start, e)) is None:
+                    if resync.spent:
+                        cls.logger.warning(f"resync budget spent at tile {p}, giving up on the tiles left")
                     world.garbage_start = p
-                failed = True
-                # we keep going even though it will yield garbage, we can try to recover, but it can skip multiple tile which will cause weird offset
-                # we can try to sync using bedrock, but its too unreliable
+                    break
+                tile = recovered
 
             tile.index = p
             tile.pos = ivec2(p % world.width, p // world.width)
             world.tiles[p] = tile
+            prev_start = start
+            p += 1
+
+        # no telling where the tiles after one we couldn't get past start, they are left empty
+        for p in range(p, world.nb_tiles):
+            world.tiles[p] = Tile(index=p, pos=ivec2(p % world.width, p // world.width))
 
         world.update_all_connection()
 
-        if failed:
-            # if we fail, then we cannot parse dropped item, but we can take advantage of the fact that it always placed at the end
-            # meaning we can parse it reversed from the end until it failed or found some impossible value
+        if world.garbage_start == -1:
+            start = s.rpos
             try:
-                with s.reversed(keep=False):
-                    world.unk9 = s.read_u32()
-                    world.unk8 = s.read_u16()
-                    world.active_weather = WeatherType(s.read_u16())
-                    world.terraform = TerraformType(s.read_u16())
-                    world.default_weather = WeatherType(s.read_u16())
-
-                    while True:
-                        item = DroppedItem()
-                        item.uid = s.read_u32()
-                        item.flags = s.read_u8()
-                        item.amount = s.read_u8()
-                        item.pos = vec2(s.read_f32(), s.read_f32())
-                        item.id = s.read_u16()
-
-                        if item.id not in item_database.items:
-                            break
-
-                        # i don't know any item that can go past 200
-                        if item.amount > 200:
-                            break
-
-                        # check for out of bound position
-                        margin = 32  # a tile margin
-                        if not (-margin < item.pos.x < world.width * 32 + margin) or not (-margin < item.pos.y < world.height * 32 + margin):
-                            break
-
-                        world.dropped.items.append(item)
-                        world.dropped.nb_items += 1
-
-                        with s.temp():
-                            maybe_last_uid = s.read_u32()
-                            maybe_nb_items = s.read_u32()
-                            if maybe_nb_items == world.dropped.nb_items or item.uid == 1:
-                                world.dropped.last_uid = maybe_last_uid
-                                break
-
-                    world.unk4 = s.read_bytes(12)
-                world.dropped.items.reverse()
+                world._deserialize_tail(s)
+                return world
             except Exception as e:
-                # failed to parse dropped for some reason, whatever
-                cls.logger.warning(f"failed to parse dropped item from the back: {e}")
-
-            return world
+                # a resync can land on something that only looks like a tile boundary
+                if not world.parse_issues:
+                    raise
+                cls.logger.warning(f"failed to parse the end of a resynced world, reading it from the back: {e}")
+                s.rpos = start
+                world.dropped = Dropped()
+
+        world._deserialize_tail_reversed(s)
+        return world
 
-        world.unk4 = s.read_bytes(12)
-        world.dropped.nb_items = s.read_u32()
-        world.dropped.last_uid = s.read_u32()
-        for _ in range(world.dropped.nb_items):
+    def _deserialize_tail(self, s: Buffer) -> None:
+        self.unk4 = s.read_bytes(12)
+        self.dropped.nb_items = s.read_u32()
+        self.dropped.last_uid = s.read_u32()
+        for _ in range(self.dropped.nb_items):
             item = DroppedItem()
             item.id = s.read_u16()
             item.pos = vec2(s.read_f32(), s.read_f32())
@@ -3844,15 +4497,110 @@ class World:
             item.flags = s.read_u8()
             item.uid = s.read_u32()
 
-            world.dropped.items.append(item)
+            self.dropped.items.append(item)
 
-        world.default_weather = WeatherType(s.read_u16())
-        world.terraform = TerraformType(s.read_u16())
-        world.active_weather = WeatherType(s.read_u16())
-        world.unk8 = s.read_u16()
-        world.unk9 = s.read_u32()
+        self.default_weather = WeatherType(s.read_u16())
+        self.terraform = TerraformType(s.read_u16())
+        self.active_weather = WeatherType(s.read_u16())
+        self.unk8 = s.read_u16()
+        self.unk9 = s.read_u32()
 
-        return world
+    def _deserialize_tail_reversed(self, s: Buffer) -> None:
+        # if we fail, then we cannot parse dropped item, but we can take advantage of the fact that it always placed at the end
+        # meaning we can parse it reversed from the end until it failed or found some impossible value
+        try:
+            with s.reversed(keep=False):
+                self.unk9 = s.read_u32()
+                self.unk8 = s.read_u16()
+                self.active_weather = WeatherType(s.read_u16())
+                self.terraform = TerraformType(s.read_u16())
+                self.default_weather = WeatherType(s.read_u16())
+
+                while True:
+                    item = DroppedItem()
+                    item.uid = s.read_u32()
+                    item.flags = s.read_u8()
+                    item.amount = s.read_u8()
+                    # backwards y comes first
+                    y = s.read_f32()
+                    item.pos = vec2(s.read_f32(), y)
+                    item.id = s.read_u16()
+
+                    if item.id not in item_database.items:
+                        break
+
+                    # i don't know any item that can go past 200
+                    if item.amount > 200:
+                        break
+
+                    # check for out of bound position
+                    margin = 32  # a tile margin
+                    if not (-margin < item.pos.x < self.width * 32 + margin) or not (-margin < item.pos.y < self.height * 32 + margin):
+                        break
+
+                    self.dropped.items.append(item)
+                    self.dropped.nb_items += 1
+
+                    with s.temp():
+                        s.read_u32()
+                        maybe_nb_items = s.read_u32()
+                    if maybe_nb_items == self.dropped.nb_items or item.uid == 1:
+                        self.dropped.last_uid = s.read_u32()
+                        s.read_u32()
+                        break
+
+                self.unk4 = s.read_bytes(12)
+            self.dropped.items.reverse()
+        except Exception as e:
+            # failed to parse dropped for some reason, whatever
+            self.logger.warning(f"failed to parse dropped item from the back: {e}")
+
+    def _recover_tile(self, s: Buffer, resync: _TileResync, p: int, start: int, prev_start: int, error: Exception) -> Tile | None:
+        """tile `p` at `start` failed to parse. records a ParseIssue and, if the next tile boundary is found, returns
+        `p` with just its header and leaves `s` at the boundary. the extra is dropped, along with the flag for it, so
+        the world still serializes"""
+        buf = s.buffer
+        plausible = _plausible_tile_header(buf, start, self.nb_tiles)
+        header = None
+        extra_type = None
+        extra_at = start
+        if plausible:
+            fg, bg, parent, flags = _TILE_HEADER.unpack_from(buf, start)
+            header = (fg, bg, flags)
+            extra_at = _extra_offset(buf, start)
+            if flags & _HAS_EXTRA_DATA and extra_at < len(buf):
+                extra_type = buf[extra_at]
+        elif (prev := self.tiles.get(p - 1)) is not None and prev.extra_type:
+            extra_type = prev.extra_type
+
+        boundary = resync.boundary(extra_at + 1, self.nb_tiles - p - 1)
+        resumed, exact = boundary if boundary else (None, False)
+        dump_offset = start if plausible or prev_start < 0 else prev_start
+        issue = ParseIssue(
+            tile=p,
+            offset=start,
+            error=f"{type(error).__name__}: {error}",
+            header=header,
+            extra_type=extra_type,
+            resumed_at=resumed,
+            exact=exact,
+            dump_offset=dump_offset,
+            data=bytes(buf[dump_offset : start + 128]),
+        )
+        self.parse_issues.append(issue)
+        self.logger.error(f"failed parsing tile {p} at offset={start}, suspect extra {issue.suspect}, resumed at {resumed}. err={error}")
+
+        if resumed is None:
+            return None
+
+        s.rpos = resumed
+        if not plausible:
+            return Tile()
+
+        tile = Tile(fg_id=fg, bg_id=bg, parent_index=parent, flags=TileFlags(flags & ~_HAS_EXTRA_DATA))
+        if flags & _LOCKED:
+            tile.lock_index = int.from_bytes(buf[start + _TILE_HEADER.size : extra_at], "little")
+        return tile
 
     @classmethod
     def from_proto(cls, proto: growtopia_pb2.World) -> "World":
@@ -3909,6 +4657,306 @@ class World:
         )
 
 
+SNAPSHOT_MAGIC = b"GTWS"
+SNAPSHOT_VERSION = 1
+
+
+class WorldSnapshot:
+    """internal world format, not the one the game sends. tiles are flat columns, extras their raw bytes (decoded on
+    first access of a tile's `extra` with `setting.world_lazy_extra`), dropped items and npcs fixed size records. everything is read in place out of the buffer, so
+    `load` can map the file instead of reading it"""
+
+    # magic, snapshot version, id, version, f, width, height, nb_tiles, garbage_start, unk2, unk4, dropped
+    # nb_items, dropped last_uid, default_weather, terraform, active_weather, unk8, unk9, then the record counts
+    # of each section and the length of the name that follows
+    HEADER = struct.Struct("<4sHIHIIIIi5s12sIIHHHHIIIIIH")
+    TILE = np.dtype(
+        [
+            ("index", "<u4"),
+            ("x", "<i4"),
+            ("y", "<i4"),
+            ("fg", "<u2"),
+            ("bg", "<u2"),
+            ("parent", "<u2"),
+            ("lock", "<u2"),
+            ("flags", "<u2"),
+            ("fg_tex", "<u2"),
+            ("bg_tex", "<u2"),
+            ("overlay_tex", "<u2"),
+        ]
+    )
+    DROPPED = np.dtype([("id", "<u2"), ("x", "<f4"), ("y", "<f4"), ("amount", "u1"), ("flags", "u1"), ("uid", "<u4")])
+    NPC = np.dtype(
+        [
+            ("type", "u1"),
+            ("id", "u1"),
+            ("x", "<f4"),
+            ("y", "<f4"),
+            ("tx", "<f4"),
+            ("ty", "<f4"),
+            ("param1", "<i4"),
+            ("param2", "<i4"),
+            ("param3", "<f4"),
+            ("facing_left", "u1"),
+        ]
+    )
+
+    def __init__(self, data: bytes | memoryview | mmap.mmap) -> None:
+        self._data = data
+        view = memoryview(data)
+        if len(view) < self.HEADER.size or view[:4] != SNAPSHOT_MAGIC:
+            raise ValueError("not a world snapshot")
+
+        (
+            _,
+            snapshot_version,
+            self.id,
+            self.version,
+            self.f,
+            self.width,
+            self.height,
+            self.nb_tiles,
+            self.garbage_start,
+            self.unk2,
+            self.unk4,
+            self.nb_dropped,
+            self.last_uid,
+            self.default_weather,
+            self.terraform,
+            self.active_weather,
+            self.unk8,
+            self.unk9,
+            nb_rows,
+            nb_items,
+            nb_npcs,
+            nb_players,
+            name_len,
+        ) = self.HEADER.unpack_from(view)
+        if snapshot_version != SNAPSHOT_VERSION:
+            raise ValueError(f"unsupported world snapshot version {snapshot_version}, expected {SNAPSHOT_VERSION}")
+
+        pos = self.HEADER.size
+        self.name = bytes(view[pos : pos + name_len])
+        pos += name_len
+
+        def take(dtype: np.dtype | str, count: int) -> np.ndarray:
+            nonlocal pos
+            arr = np.frombuffer(view, dtype=dtype, count=count, offset=pos)
+            pos += arr.nbytes
+            return arr
+
+        def blob(offsets: np.ndarray) -> memoryview:
+            nonlocal pos
+            out = view[pos : pos + int(offsets[-1])]
+            pos += len(out)
+            return out
+
+        self.tiles = take(self.TILE, nb_rows)
+        self._extra_offsets = take("<u4", nb_rows + 1)
+        self._extra_blob = blob(self._extra_offsets)
+        self._json_offsets = take("<u4", nb_rows + 1)
+        self._json_blob = blob(self._json_offsets)
+        self.dropped = take(self.DROPPED, nb_items)
+        self.npcs = take(self.NPC, nb_npcs)
+
+        self._players: list[memoryview] = []
+        for _ in range(nb_players):
+            (size,) = struct.unpack_from("<I", view, pos)
+            self._players.append(view[pos + 4 : pos + 4 + size])
+            pos += 4 + size
+
+        # row -> decoded extra
+        self._extras: dict[int, TileExtra | None] = {}
+
+    @classmethod
+    def from_world(cls, world: "World") -> "WorldSnapshot":
+        tiles = [world.tiles[idx] for idx in sorted(world.tiles)]
+        rows = np.empty(len(tiles), dtype=cls.TILE)
+        rows[:] = [(t.index, t.pos.x, t.pos.y, t.fg_id, t.bg_id, t.parent_index, t.lock_index, int(t.flags), t.fg_tex_index, t.bg_tex_index, t.overlay_tex_index) for t in tiles]
+
+        extras: list[bytes] = []
+        json: list[bytes] = []
+        for tile in tiles:
+            # what was never decoded can't have changed, its raw bytes are still current
+            if tile.pending("extra"):
+                extras.append(tile._extra_raw)
+            elif tile.extra is None:
+                extras.append(b"")
+            else:
+                s = Buffer()
+                tile.extra.serialize_into(s, tile.fg_id, tile.bg_id, world.version)
+                extras.append(s.getvalue())
+            if tile.pending("json_data"):
+                json.append(tile._json_raw)
+            else:
+                json.append(cbor2.dumps(tile.json_data) if tile.json_data else b"")
+
+        def offsets(blobs: list[bytes]) -> bytes:
+            return np.concatenate(([0], np.cumsum([len(b) for b in blobs], dtype=np.uint64))).astype("<u4").tobytes()
+
+        dropped = np.array([(d.id, d.pos.x, d.pos.y, d.amount, d.flags, d.uid) for d in world.dropped.items], dtype=cls.DROPPED)
+        npcs = np.array(
+            [(n.type, n.id, n.pos.x, n.pos.y, n.target_pos.x, n.target_pos.y, n.param1, n.param2, n.param3, n.facing_left) for n in world.npcs.values()],
+            dtype=cls.NPC,
+        )
+        players = [p.to_proto().SerializeToString() for p in world.players.values()]
+
+        out = [
+            cls.HEADER.pack(
+                SNAPSHOT_MAGIC,
+                SNAPSHOT_VERSION,
+                world.id,
+                world.version,
+                world.f,
+                world.width,
+                world.height,
+                world.nb_tiles,
+                world.garbage_start,
+                world.unk2,
+                world.unk4,
+                world.dropped.nb_items,
+                world.dropped.last_uid,
+                world.default_weather,
+                world.terraform,
+                world.active_weather,
+                world.unk8,
+                world.unk9,
+                len(tiles),
+                len(dropped),
+                len(npcs),
+                len(players),
+                len(world.name),
+            ),
+            world.name,
+            rows.tobytes(),
+            offsets(extras),
+            *extras,
+            offsets(json),
+            *json,
+            dropped.tobytes(),
+            npcs.tobytes(),
+        ]
+        for p in players:
+            out.append(struct.pack("<I", len(p)))
+            out.append(p)
+
+        return cls(b"".join(out))
+
+    @classmethod
+    def load(cls, path: Path | str, mapped: bool = True) -> "WorldSnapshot":
+        with open(path, "rb") as f:
+            if not mapped:
+                return cls(f.read())
+            # the mapping stays valid after the file is closed
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def save(self, path: Path | str) -> None:
+        Path(path).write_bytes(self._data)
+
+    def __bytes__(self) -> bytes:
+        return bytes(self._data)
+
+    def __len__(self) -> int:
+        return len(self.tiles)
+
+    def row_of(self, idx: int) -> int | None:
+        """row of the tile at world index `idx`, rows are sorted by index"""
+        if 0 <= idx < len(self.tiles) and self.tiles["index"][idx] == idx:
+            return idx
+        row = int(np.searchsorted(self.tiles["index"], idx))
+        return row if row < len(self.tiles) and self.tiles["index"][row] == idx else None
+
+    def extra_raw(self, row: int) -> bytes:
+        return bytes(self._extra_blob[self._extra_offsets[row] : self._extra_offsets[row + 1]])
+
+    def extra(self, row: int) -> TileExtra | None:
+        """decoded extra of `row`, decoded once and cached"""
+        try:
+            return self._extras[row]
+        except KeyError:
+            pass
+
+        raw = self.extra_raw(row)
+        t = self.tiles[row]
+        extra = self._extras[row] = TileExtra.deserialize_extra(Buffer(raw), int(t["fg"]), int(t["bg"]), self.version) if raw else None
+        return extra
+
+    def _make_tile(self, row: tuple, flags: TileFlags, raw: bytes, json: bytes, lazy: bool) -> Tile:
+        index, x, y, fg, bg, parent, lock, _, fg_tex, bg_tex, overlay_tex = row
+        tile = Tile(
+            fg_id=fg,
+            bg_id=bg,
+            lock_index=lock,
+            parent_index=parent,
+            flags=flags,
+            extra=TileExtra.deserialize_extra(Buffer(raw), fg, bg, self.version) if raw and not lazy else None,
+            _extra_raw=raw,
+            index=index,
+            pos=ivec2(x, y),
+            fg_tex_index=fg_tex,
+            bg_tex_index=bg_tex,
+            overlay_tex_index=overlay_tex,
+            json_data=cbor2.loads(json) if json and not lazy else {},
+            _extra_args=(fg, bg, self.version),
+            _json_raw=json,
+        )
+        if lazy:
+            if raw:
+                del tile.extra
+            if json:
+                del tile.json_data
+        return tile
+
+    def tile(self, row: int, lazy: bool | None = None) -> Tile:
+        """a new Tile for `row`, owning its extra (not the cached one) so it can be mutated freely"""
+        values = self.tiles[row].tolist()
+        json = bytes(self._json_blob[self._json_offsets[row] : self._json_offsets[row + 1]])
+        return self._make_tile(values, TileFlags(values[7]), self.extra_raw(row), json, setting.world_lazy_extra if lazy is None else lazy)
+
+    def to_world(self, lazy: bool | None = None) -> "World":
+        lazy = setting.world_lazy_extra if lazy is None else lazy
+        ex_off = self._extra_offsets.tolist()
+        js_off = self._json_offsets.tolist()
+        flags: dict[int, TileFlags] = {}
+
+        tiles: dict[int, Tile] = {}
+        for i, row in enumerate(self.tiles.tolist()):
+            if (tile_flags := flags.get(row[7])) is None:
+                tile_flags = flags[row[7]] = TileFlags(row[7])
+            raw = bytes(self._extra_blob[ex_off[i] : ex_off[i + 1]]) if ex_off[i] != ex_off[i + 1] else b""
+            json = bytes(self._json_blob[js_off[i] : js_off[i + 1]]) if js_off[i] != js_off[i + 1] else b""
+            tiles[row[0]] = self._make_tile(row, tile_flags, raw, json, lazy)
+
+        items = [DroppedItem(id=id, pos=vec2(x, y), amount=amount, flags=f, uid=uid) for id, x, y, amount, f, uid in self.dropped.tolist()]
+        npcs = [
+            Npc(type=NpcType(type), id=id, pos=vec2(x, y), target_pos=vec2(tx, ty), param1=p1, param2=p2, param3=p3, facing_left=bool(facing))
+            for type, id, x, y, tx, ty, p1, p2, p3, facing in self.npcs.tolist()
+        ]
+        players = [Player.from_proto(growtopia_pb2.Player.FromString(bytes(p))) for p in self._players]
+
+        return World(
+            id=self.id,
+            version=self.version,
+            f=self.f,
+            name=self.name,
+            width=self.width,
+            height=self.height,
+            nb_tiles=self.nb_tiles,
+            unk2=self.unk2,
+            tiles=tiles,
+            unk4=self.unk4,
+            dropped=Dropped(self.nb_dropped, self.last_uid, items),
+            default_weather=WeatherType(self.default_weather),
+            terraform=TerraformType(self.terraform),
+            active_weather=WeatherType(self.active_weather),
+            unk8=self.unk8,
+            unk9=self.unk9,
+            players={p.net_id: p for p in players},
+            garbage_start=self.garbage_start,
+            npcs={n.id: n for n in npcs},
+        )
+
+
 def steam_can_connect(a1: World, a2: int, a3: int, /) -> bool:
     width: int = 0
     v5: Tile | None = None
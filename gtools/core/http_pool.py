@@ -0,0 +1,131 @@
+from collections import deque
+import http.client
+import logging
+import ssl
+import threading
+import time
+
+logger = logging.getLogger("http-pool")
+
+_RETRYABLE = (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionResetError, BrokenPipeError, ssl.SSLEOFError)
+
+
+def insecure_client_context() -> ssl.SSLContext:
+    """upstream certs aren't checked, same as the proxy always did. build once and share, the context holds the session cache"""
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.VerifyMode.CERT_NONE
+    return context
+
+
+class _Connection(http.client.HTTPSConnection):
+    def __init__(self, pool: "HTTPSPool") -> None:
+        super().__init__(pool.host, pool.port, timeout=pool.timeout, context=pool.context)
+        self._pool = pool
+        self.last_used = time.monotonic()
+
+    def connect(self) -> None:
+        # same as HTTPSConnection.connect but offers the last tls session so the handshake can be resumed
+        http.client.HTTPConnection.connect(self)
+        server_hostname = self.host if self._pool.server_hostname is None else self._pool.server_hostname
+        self.sock = self._pool.context.wrap_socket(self.sock, server_hostname=server_hostname, session=self._pool.session)
+        self._pool.stats.connects += 1
+        if self.sock.session_reused:  # pyright: ignore[reportAttributeAccessIssue]
+            self._pool.stats.resumed += 1
+
+
+class PoolStats:
+    __slots__ = ("requests", "connects", "resumed", "reused", "retries")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.connects = 0
+        self.resumed = 0
+        self.reused = 0
+        self.retries = 0
+
+    def __repr__(self) -> str:
+        return f"PoolStats({', '.join(f'{k}={getattr(self, k)}' for k in self.__slots__)})"
+
+
+class HTTPSPool:
+    """keep-alive https connections to one upstream.
+
+    at most `max_connections` requests run at once, the rest wait. idle connections are reused until
+    `idle_timeout` and new ones resume the last tls session
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 443,
+        context: ssl.SSLContext | None = None,
+        server_hostname: str | None = None,
+        max_connections: int = 4,
+        timeout: float = 10.0,
+        idle_timeout: float = 30.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.context = context or insecure_client_context()
+        self.server_hostname = server_hostname
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.session: ssl.SSLSession | None = None
+        self.stats = PoolStats()
+
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._idle: deque[_Connection] = deque()
+
+    def _checkout(self) -> tuple[_Connection, bool]:
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                conn = self._idle.pop()
+                if now - conn.last_used < self.idle_timeout:
+                    return conn, True
+                conn.close()
+        return _Connection(self), False
+
+    def _checkin(self, conn: _Connection, resp: http.client.HTTPResponse) -> None:
+        if isinstance(conn.sock, ssl.SSLSocket) and conn.sock.session is not None:
+            self.session = conn.sock.session
+
+        if resp.will_close:
+            conn.close()
+            return
+        conn.last_used = time.monotonic()
+        with self._lock:
+            self._idle.append(conn)
+
+    def request(self, method: str, path: str, body: bytes | None = None, headers: dict[str, str] | None = None) -> tuple[int, list[tuple[str, str]], bytes]:
+        """returns (status, headers, body), a request on an idle connection the server already dropped is retried"""
+        with self._slots:
+            self.stats.requests += 1
+            while True:
+                conn, reused = self._checkout()
+                try:
+                    conn.request(method, path, body, headers=headers or {})
+                    resp = conn.getresponse()
+                    data = resp.read()
+                except _RETRYABLE:
+                    conn.close()
+                    if not reused:
+                        raise
+                    self.stats.retries += 1
+                    logger.debug(f"idle connection to {self.host}:{self.port} was closed by the server, retrying")
+                    continue
+                except BaseException:
+                    conn.close()
+                    raise
+
+                if reused:
+                    self.stats.reused += 1
+                self._checkin(conn, resp)
+                return resp.status, resp.getheaders(), data
+
+    def close(self) -> None:
+        with self._lock:
+            while self._idle:
+                self._idle.pop().close()
@@ -0,0 +1,58 @@
+from dataclasses import dataclass
+import re
+import subprocess
+import sys
+from typing import Iterable
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S.*)$")
+
+
+@dataclass(slots=True)
+class ImportTime:
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(lines: Iterable[str]) -> list[ImportTime]:
+    """parse `-X importtime` stderr lines, anything else is skipped"""
+    out: list[ImportTime] = []
+    for line in lines:
+        if m := _LINE.match(line.rstrip("\n")):
+            out.append(ImportTime(m[4], int(m[1]), int(m[2]), len(m[3]) // 2))
+    return out
+
+
+def format_report(entries: list[ImportTime], top: int = 25) -> str:
+    total = sum(e.cumulative_us for e in entries if e.depth == 0)
+    lines = [f"{len(entries)} modules imported in {total / 1000:.1f}ms", "", f"top {top} by cumulative time:"]
+
+    for e in sorted(entries, key=lambda e: e.cumulative_us, reverse=True)[:top]:
+        lines.append(f"  {e.cumulative_us / 1000:>9.1f}ms {e.self_us / 1000:>9.1f}ms  {'  ' * e.depth}{e.name}")
+
+    lines += ["", f"top {top} by self time:"]
+    for e in sorted(entries, key=lambda e: e.self_us, reverse=True)[:top]:
+        lines.append(f"  {e.self_us / 1000:>9.1f}ms  {e.name}")
+
+    return "\n".join(lines)
+
+
+def profile_imports(argv: list[str], top: int = 25) -> int:
+    """re-run `argv` with -X importtime, pass its output through and print the import breakdown when it exits"""
+    proc = subprocess.Popen([sys.executable, "-X", "importtime", *argv], stderr=subprocess.PIPE, text=True, errors="replace")
+    assert proc.stderr
+
+    collected: list[str] = []
+    try:
+        for line in proc.stderr:
+            if line.startswith("import time:"):
+                collected.append(line)
+            else:
+                sys.stderr.write(line)
+    except KeyboardInterrupt:
+        pass
+
+    code = proc.wait()
+    print(format_report(parse_importtime(collected), top), file=sys.stderr)
+    return code
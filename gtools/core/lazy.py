@@ -0,0 +1,27 @@
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+
+_lock = threading.Lock()
+
+
+def lazy_import(name: str) -> ModuleType:
+    """returns `name` as a module whose body only runs on first attribute access"""
+    if (mod := sys.modules.get(name)) is not None:
+        return mod
+
+    with _lock:
+        if (mod := sys.modules.get(name)) is not None:
+            return mod
+
+        spec = importlib.util.find_spec(name)
+        if spec is None or spec.loader is None:
+            raise ModuleNotFoundError(f"no module named {name!r}", name=name)
+
+        spec.loader = importlib.util.LazyLoader(spec.loader)
+        mod = importlib.util.module_from_spec(spec)
+        sys.modules[name] = mod
+        spec.loader.exec_module(mod)
+
+        return mod
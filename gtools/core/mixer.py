@@ -1,9 +1,16 @@
 from collections import deque
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import numpy as np
-import sounddevice as sd
-import soundfile as sf
-import soxr
+
+from gtools.core.lazy import lazy_import
+
+if TYPE_CHECKING:
+    import sounddevice
+
+# audio backends are only needed once something actually plays or loads a sound
+sd = lazy_import("sounddevice")
+sf = lazy_import("soundfile")
+soxr = lazy_import("soxr")
 
 TARGET_SR = 48_000
 CHANNELS = 2
@@ -116,7 +123,7 @@ class AudioMixer:
         outdata: np.ndarray,
         frames: int,
         time,
-        status: sd.CallbackFlags,
+        status: "sounddevice.CallbackFlags",
     ) -> None:
         _ = time, status
 
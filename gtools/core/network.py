@@ -1,21 +1,15 @@
-import json
 import socket
 from urllib.parse import urlparse, urlunparse
-import urllib.request
 
+from gtools.core.resolver import ResolveError, get_resolver
 
-def resolve_doh(hostname: str) -> list[str]:
-    url = f"https://dns.google/resolve?name={hostname}&type=A"
-    req = urllib.request.Request(url, headers={"Accept": "application/dns-json"})
-    with urllib.request.urlopen(req) as r:
-        data = json.loads(r.read().decode())
-
-    ips = []
-    for ans in data.get("Answer", []):
-        if ans.get("type") == 1:
-            ips.append(ans.get("data"))
 
-    return ips
+def resolve_doh(hostname: str) -> list[str]:
+    """A records through the cached DoH resolver, empty when the name can't be resolved"""
+    try:
+        return get_resolver().resolve(hostname)
+    except ResolveError:
+        return []
 
 
 def is_up(host, port=80, timeout=2):
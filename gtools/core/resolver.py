@@ -0,0 +1,262 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+from typing import Callable, Protocol
+import urllib.parse
+import urllib.request
+
+logger = logging.getLogger("resolver")
+
+DEFAULT_DOH_ENDPOINTS = ["https://dns.google/resolve", "https://cloudflare-dns.com/dns-query"]
+
+_DNS_TYPE_A = 1
+
+
+@dataclass(slots=True)
+class Answer:
+    addresses: list[str]
+    ttl: float
+
+
+class ResolverBackend(Protocol):
+    def query(self, hostname: str, timeout: float) -> Answer: ...
+
+
+class ResolveError(Exception):
+    pass
+
+
+class DohBackend:
+    """DNS-over-HTTPS using the json api (dns.google, cloudflare, ...)"""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+
+    def query(self, hostname: str, timeout: float) -> Answer:
+        url = f"{self.url}?{urllib.parse.urlencode({'name': hostname, 'type': 'A'})}"
+        req = urllib.request.Request(url, headers={"Accept": "application/dns-json"})
+        with urllib.request.urlopen(req, timeout=timeout) as r:
+            data = json.loads(r.read().decode())
+
+        answers = [ans for ans in data.get("Answer", []) if ans.get("type") == _DNS_TYPE_A]
+        if not answers:
+            raise ResolveError(f"{self.url}: no A record for {hostname} (status {data.get('Status')})")
+
+        return Answer([ans["data"] for ans in answers], min(float(ans.get("TTL", 0)) for ans in answers))
+
+    def __repr__(self) -> str:
+        return f"DohBackend({self.url!r})"
+
+
+class FakeBackend:
+    """in-memory backend for tests and offline use"""
+
+    def __init__(self, records: dict[str, list[str]], ttl: float = 300.0, delay: float = 0.0) -> None:
+        self.records = records
+        self.ttl = ttl
+        self.delay = delay
+        self.queries = 0
+
+    def query(self, hostname: str, timeout: float) -> Answer:
+        self.queries += 1
+        if self.delay:
+            if self.delay > timeout:
+                time.sleep(timeout)
+                raise TimeoutError(f"fake lookup of {hostname} timed out")
+            time.sleep(self.delay)
+
+        addresses = self.records.get(hostname)
+        if not addresses:
+            raise ResolveError(f"no record for {hostname}")
+        return Answer(list(addresses), self.ttl)
+
+
+class HappyEyeballsBackend:
+    """races several backends, the next one starts after `stagger` seconds unless the previous already failed.
+
+    the first successful answer wins, the rest are left to finish in the background
+    """
+
+    def __init__(self, backends: list[ResolverBackend], stagger: float = 0.25) -> None:
+        if not backends:
+            raise ValueError("at least one backend is required")
+        self.backends = backends
+        self.stagger = stagger
+        self._pool = ThreadPoolExecutor(max_workers=len(backends) * 2, thread_name_prefix="resolver")
+
+    def query(self, hostname: str, timeout: float) -> Answer:
+        deadline = time.monotonic() + timeout
+        remaining = list(self.backends)
+        running: dict[Future[Answer], ResolverBackend] = {}
+        errors: list[str] = []
+
+        while remaining or running:
+            if remaining:
+                backend = remaining.pop(0)
+                running[self._pool.submit(backend.query, hostname, max(0.0, deadline - time.monotonic()))] = backend
+
+            left = deadline - time.monotonic()
+            if left <= 0:
+                break
+            done, _ = wait(running, timeout=min(left, self.stagger) if remaining else left, return_when=FIRST_COMPLETED)
+            for fut in done:
+                backend = running.pop(fut)
+                try:
+                    return fut.result()
+                except Exception as e:
+                    errors.append(f"{backend!r}: {e}")
+
+        raise ResolveError(f"could not resolve {hostname}: " + ("; ".join(errors) or "timed out"))
+
+
+class Resolver:
+    """caching front for a backend.
+
+    entries live for the record TTL clamped to [min_ttl, max_ttl] and are persisted to `cache_path`.
+    concurrent lookups of the same name share one query, and an expired entry is still served when the
+    backend fails
+    """
+
+    def __init__(
+        self,
+        backend: ResolverBackend,
+        cache_path: Path | None = None,
+        timeout: float = 3.0,
+        min_ttl: float = 30.0,
+        max_ttl: float = 3600.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.backend = backend
+        self.cache_path = cache_path
+        self.timeout = timeout
+        self.min_ttl = min_ttl
+        self.max_ttl = max_ttl
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        # hostname -> (addresses, expires at, wall clock so it survives restarts)
+        self._cache: dict[str, tuple[list[str], float]] = {}
+        self._inflight: dict[str, Future[list[str]]] = {}
+        self._load()
+
+    def cached(self, hostname: str) -> list[str] | None:
+        with self._lock:
+            entry = self._cache.get(hostname)
+        if entry is None or entry[1] <= self._clock():
+            return None
+        return list(entry[0])
+
+    def resolve(self, hostname: str) -> list[str]:
+        if (addresses := self.cached(hostname)) is not None:
+            return addresses
+
+        with self._lock:
+            fut = self._inflight.get(hostname)
+            owner = fut is None
+            if fut is None:
+                fut = self._inflight[hostname] = Future()
+
+        if not owner:
+            return list(fut.result())
+
+        try:
+            addresses = self._query(hostname)
+            fut.set_result(addresses)
+        except BaseException as e:
+            fut.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(hostname, None)
+
+        return list(addresses)
+
+    def prefetch(self, hostname: str) -> None:
+        """resolve in the background so the first real lookup is a cache hit"""
+
+        def run() -> None:
+            try:
+                self.resolve(hostname)
+            except Exception as e:
+                logger.debug(f"prefetch of {hostname} failed: {e}")
+
+        threading.Thread(target=run, name=f"resolve-{hostname}", daemon=True).start()
+
+    def _query(self, hostname: str) -> list[str]:
+        start = time.perf_counter()
+        try:
+            answer = self.backend.query(hostname, self.timeout)
+        except Exception as e:
+            with self._lock:
+                stale = self._cache.get(hostname)
+            if stale is None:
+                raise
+            logger.warning(f"resolving {hostname} failed ({e}), using expired cache entry")
+            return list(stale[0])
+
+        ttl = min(self.max_ttl, max(self.min_ttl, answer.ttl))
+        logger.debug(f"resolved {hostname} to {answer.addresses} in {(time.perf_counter() - start) * 1000:.1f}ms (ttl {ttl:.0f}s)")
+        with self._lock:
+            self._cache[hostname] = (list(answer.addresses), self._clock() + ttl)
+        self._save()
+        return list(answer.addresses)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+        self._save()
+
+    def _load(self) -> None:
+        if self.cache_path is None or not self.cache_path.exists():
+            return
+        try:
+            data = json.loads(self.cache_path.read_text())
+            self._cache = {host: (list(entry["addresses"]), float(entry["expires"])) for host, entry in data.items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"ignoring unreadable dns cache {self.cache_path}: {e}")
+
+    def _save(self) -> None:
+        if self.cache_path is None:
+            return
+
+        with self._lock:
+            data = {host: {"addresses": addresses, "expires": expires} for host, (addresses, expires) in self._cache.items()}
+
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp, self.cache_path)
+        except OSError as e:
+            logger.warning(f"failed to write dns cache {self.cache_path}: {e}")
+
+
+_default: Resolver | None = None
+_default_lock = threading.Lock()
+
+
+def get_resolver() -> Resolver:
+    global _default
+
+    with _default_lock:
+        if _default is None:
+            from gtools import setting
+
+            backend = HappyEyeballsBackend([DohBackend(url) for url in setting.doh_endpoints or DEFAULT_DOH_ENDPOINTS])
+            _default = Resolver(backend, cache_path=setting.appdir / "dns_cache.json", timeout=setting.dns_timeout)
+        return _default
+
+
+def set_resolver(resolver: Resolver | None) -> None:
+    """swap the process wide resolver, `None` goes back to the DoH one from settings"""
+    global _default
+
+    with _default_lock:
+        _default = resolver
@@ -0,0 +1,146 @@
+import math
+from typing import Callable, Hashable, Iterator
+
+from pyglm.glm import vec2
+
+
+class TileBucketIndex[T]:
+    """uniform grid of buckets for objects with a pixel position, one bucket per cell (a tile by default)"""
+
+    def __init__(self, cell_size: float = 32.0) -> None:
+        self.cell_size = cell_size
+        self._buckets: dict[tuple[int, int], dict[Hashable, T]] = {}
+        self._entries: dict[Hashable, tuple[tuple[int, int], float, float, T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __iter__(self) -> Iterator[T]:
+        for _, _, _, obj in self._entries.values():
+            yield obj
+
+    def cell_of(self, pos: vec2) -> tuple[int, int]:
+        return math.floor(pos.x / self.cell_size), math.floor(pos.y / self.cell_size)
+
+    def get(self, key: Hashable) -> T | None:
+        entry = self._entries.get(key)
+        return entry[3] if entry else None
+
+    def insert(self, key: Hashable, obj: T, pos: vec2) -> None:
+        """insert or move `key` to pos"""
+        cell = self.cell_of(pos)
+        if (old := self._entries.get(key)) is not None and old[0] != cell:
+            self._discard(key, old[0])
+
+        self._entries[key] = (cell, pos.x, pos.y, obj)
+        self._buckets.setdefault(cell, {})[key] = obj
+
+    def move(self, key: Hashable, pos: vec2) -> None:
+        if (entry := self._entries.get(key)) is not None:
+            self.insert(key, entry[3], pos)
+
+    def remove(self, key: Hashable) -> T | None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+
+        self._discard(key, entry[0])
+        return entry[3]
+
+    def _discard(self, key: Hashable, cell: tuple[int, int]) -> None:
+        bucket = self._buckets.get(cell)
+        if bucket is None:
+            return
+
+        bucket.pop(key, None)
+        if not bucket:
+            del self._buckets[cell]
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._entries.clear()
+
+    def at(self, cx: int, cy: int) -> list[T]:
+        """objects in a single cell"""
+        bucket = self._buckets.get((cx, cy))
+        return list(bucket.values()) if bucket else []
+
+    def in_cells(self, cx0: int, cy0: int, cx1: int, cy1: int) -> Iterator[T]:
+        """objects in the inclusive cell rectangle"""
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._buckets):
+            for (cx, cy), bucket in self._buckets.items():
+                if cx0 <= cx <= cx1 and cy0 <= cy <= cy1:
+                    yield from bucket.values()
+            return
+
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                if bucket := self._buckets.get((cx, cy)):
+                    yield from bucket.values()
+
+    def in_radius(self, pos: vec2, radius: float) -> Iterator[T]:
+        """objects within `radius` pixels of pos"""
+        cx0, cy0 = self.cell_of(vec2(pos.x - radius, pos.y - radius))
+        cx1, cy1 = self.cell_of(vec2(pos.x + radius, pos.y + radius))
+        r2 = radius * radius
+
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._buckets):
+            cells = [cell for cell in self._buckets if cx0 <= cell[0] <= cx1 and cy0 <= cell[1] <= cy1]
+        else:
+            cells = [(cx, cy) for cy in range(cy0, cy1 + 1) for cx in range(cx0, cx1 + 1)]
+
+        for cell in cells:
+            if (bucket := self._buckets.get(cell)) is None:
+                continue
+            for key in bucket:
+                _, x, y, obj = self._entries[key]
+                if (x - pos.x) ** 2 + (y - pos.y) ** 2 <= r2:
+                    yield obj
+
+    def nearest(self, pos: vec2, max_radius: float | None = None, where: Callable[[T], bool] | None = None) -> T | None:
+        """closest object to pos, searching rings of cells outward until nothing closer can exist"""
+        if not self._entries:
+            return None
+
+        ccx, ccy = self.cell_of(pos)
+        best: T | None = None
+        best_d2 = math.inf if max_radius is None else max_radius * max_radius
+
+        def consider(bucket: dict[Hashable, T]) -> None:
+            nonlocal best, best_d2
+            for key, obj in bucket.items():
+                _, x, y, _ = self._entries[key]
+                d2 = (x - pos.x) ** 2 + (y - pos.y) ** 2
+                if d2 <= best_d2 and (where is None or where(obj)):
+                    best, best_d2 = obj, d2
+
+        ring = 0
+        while True:
+            # every cell in this ring is at least (ring - 1) cells away from pos
+            if ring > 0 and ((ring - 1) * self.cell_size) ** 2 > best_d2:
+                return best
+
+            if 8 * ring > len(self._buckets):
+                # the ring is larger than what is left, finish with a scan of the outer buckets
+                for (cx, cy), bucket in self._buckets.items():
+                    if max(abs(cx - ccx), abs(cy - ccy)) >= ring:
+                        consider(bucket)
+                return best
+
+            if ring == 0:
+                cells = [(ccx, ccy)]
+            else:
+                top, bottom = ccy - ring, ccy + ring
+                cells = [(cx, top) for cx in range(ccx - ring, ccx + ring + 1)]
+                cells += [(cx, bottom) for cx in range(ccx - ring, ccx + ring + 1)]
+                cells += [(ccx - ring, cy) for cy in range(top + 1, bottom)]
+                cells += [(ccx + ring, cy) for cy in range(top + 1, bottom)]
+
+            for cell in cells:
+                if bucket := self._buckets.get(cell):
+                    consider(bucket)
+
+            ring += 1
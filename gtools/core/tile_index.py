@@ -0,0 +1,135 @@
+from collections import defaultdict
+import heapq
+from typing import NamedTuple
+
+
+class TileEntry(NamedTuple):
+    fg: int
+    bg: int
+    extra_type: int
+    # index of the lock tile holding this one, None when not locked
+    lock: int | None
+    # owner uid if this is a lock
+    owner: int | None
+    # when the tree on it is ready to harvest, None when there is no tree
+    ready_at: float | None
+
+
+class TileIndex:
+    """secondary indexes over tile indices (item, extra type, lock, tree ready time), updated one tile at a time
+    so every query costs O(result)"""
+
+    def __init__(self) -> None:
+        self._entries: dict[int, TileEntry] = {}
+        # fg and bg ids both land here
+        self._by_item: defaultdict[int, set[int]] = defaultdict(set)
+        self._by_extra: defaultdict[int, set[int]] = defaultdict(set)
+        # lock tile -> tiles it locks
+        self._locked_by: defaultdict[int, set[int]] = defaultdict(set)
+        # owner uid -> lock tiles
+        self._locks_of: defaultdict[int, set[int]] = defaultdict(set)
+        # (ready_at, idx), an entry whose ready time changed since it was pushed is skipped when popped
+        self._trees: list[tuple[float, int]] = []
+        self._ripe: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, idx: int) -> bool:
+        return idx in self._entries
+
+    def get(self, idx: int) -> TileEntry | None:
+        return self._entries.get(idx)
+
+    def set(self, idx: int, entry: TileEntry) -> None:
+        if (old := self._entries.get(idx)) == entry:
+            return
+        same_tree = old is not None and old.ready_at == entry.ready_at
+        if old is not None:
+            self._discard(idx, old, same_tree)
+
+        self._entries[idx] = entry
+        self._by_item[entry.fg].add(idx)
+        self._by_item[entry.bg].add(idx)
+        self._by_extra[entry.extra_type].add(idx)
+        if entry.lock is not None:
+            self._locked_by[entry.lock].add(idx)
+        if entry.owner is not None:
+            self._locks_of[entry.owner].add(idx)
+        if entry.ready_at is not None and not same_tree:
+            heapq.heappush(self._trees, (entry.ready_at, idx))
+
+    def remove(self, idx: int) -> None:
+        if (old := self._entries.pop(idx, None)) is not None:
+            self._discard(idx, old)
+
+    def _discard(self, idx: int, entry: TileEntry, keep_tree: bool = False) -> None:
+        _drop(self._by_item, entry.fg, idx)
+        _drop(self._by_item, entry.bg, idx)
+        _drop(self._by_extra, entry.extra_type, idx)
+        if entry.lock is not None:
+            _drop(self._locked_by, entry.lock, idx)
+        if entry.owner is not None:
+            _drop(self._locks_of, entry.owner, idx)
+        if not keep_tree:
+            self._ripe.discard(idx)
+
+    def copy(self) -> "TileIndex":
+        """copy without recomputing any entry"""
+        index = TileIndex()
+        index._entries = dict(self._entries)
+        index._by_item = defaultdict(set, {k: set(v) for k, v in self._by_item.items()})
+        index._by_extra = defaultdict(set, {k: set(v) for k, v in self._by_extra.items()})
+        index._locked_by = defaultdict(set, {k: set(v) for k, v in self._locked_by.items()})
+        index._locks_of = defaultdict(set, {k: set(v) for k, v in self._locks_of.items()})
+        # queries on the source move trees from the heap to `_ripe`, heap first so one moved in between is in both
+        index._trees = self._trees[:]
+        index._ripe = set(self._ripe)
+        return index
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_item.clear()
+        self._by_extra.clear()
+        self._locked_by.clear()
+        self._locks_of.clear()
+        self._trees.clear()
+        self._ripe.clear()
+
+    def with_item(self, id: int) -> list[int]:
+        return list(self._by_item.get(id, ()))
+
+    def with_extra(self, extra_type: int) -> list[int]:
+        return list(self._by_extra.get(extra_type, ()))
+
+    def locked_by(self, lock: int) -> list[int]:
+        return list(self._locked_by.get(lock, ()))
+
+    def locks_of(self, owner: int) -> list[int]:
+        return list(self._locks_of.get(owner, ()))
+
+    def ready(self, now: float) -> list[int]:
+        """trees ready at `now`, a tree stays ready until its ready time changes"""
+        trees = self._trees
+        while trees and trees[0][0] <= now:
+            ready_at, idx = heapq.heappop(trees)
+            if (entry := self._entries.get(idx)) is not None and entry.ready_at == ready_at:
+                self._ripe.add(idx)
+        return list(self._ripe)
+
+    def next_ready(self) -> tuple[float, int] | None:
+        """(ready_at, idx) of the next tree to become ready that isn't yet"""
+        trees = self._trees
+        while trees:
+            ready_at, idx = trees[0]
+            if (entry := self._entries.get(idx)) is not None and entry.ready_at == ready_at and idx not in self._ripe:
+                return ready_at, idx
+            heapq.heappop(trees)
+        return None
+
+
+def _drop(index: defaultdict[int, set[int]], key: int, idx: int) -> None:
+    if (s := index.get(key)) is not None:
+        s.discard(idx)
+        if not s:
+            del index[key]
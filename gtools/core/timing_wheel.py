@@ -0,0 +1,78 @@
+import math
+import threading
+import time
+from typing import Callable, Hashable
+
+
+class TimingWheel[K: Hashable]:
+    """hashed timing wheel, schedule and cancel are O(1) and `advance` only touches the slots that elapsed.
+
+    deadlines are rounded up to whole ticks, a deadline more than one revolution out stays in its slot and
+    counts down the remaining revolutions each time the cursor passes it
+    """
+
+    def __init__(self, tick: float = 0.05, slots: int = 256, clock: Callable[[], float] = time.monotonic) -> None:
+        self.tick = tick
+        self._clock = clock
+        # slot -> key -> revolutions left before it fires
+        self._slots: list[dict[K, int]] = [{} for _ in range(slots)]
+        self._where: dict[K, int] = {}
+        self._cursor = 0
+        self._origin = clock()
+        # ticks the cursor has moved since _origin
+        self._ticks = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._where
+
+    def _now_ticks(self) -> int:
+        # the epsilon keeps float error from holding a tick back, 0.3 / 0.1 is 2.9999999999999996
+        return math.floor((self._clock() - self._origin) / self.tick + 1e-9)
+
+    def schedule(self, key: K, delay: float) -> None:
+        """(re)schedule `key` to expire `delay` seconds from now"""
+        n = len(self._slots)
+        ticks = max(1, math.ceil(delay / self.tick - 1e-9))
+        with self._lock:
+            self._cancel(key)
+            # deadlines count from the last tick boundary, not from whenever advance() last ran
+            ticks += self._now_ticks() - self._ticks
+            slot = (self._cursor + ticks) % n
+            self._slots[slot][key] = (ticks - 1) // n
+            self._where[key] = slot
+
+    def cancel(self, key: K) -> bool:
+        with self._lock:
+            return self._cancel(key)
+
+    def _cancel(self, key: K) -> bool:
+        if (slot := self._where.pop(key, None)) is None:
+            return False
+        del self._slots[slot][key]
+        return True
+
+    def advance(self) -> list[K]:
+        """move the cursor up to now, returns the keys that expired in deadline order"""
+        expired: list[K] = []
+        with self._lock:
+            ticks = self._now_ticks() - self._ticks
+            if ticks <= 0:
+                return expired
+            self._ticks += ticks
+
+            n = len(self._slots)
+            for _ in range(ticks):
+                self._cursor = (self._cursor + 1) % n
+                slot = self._slots[self._cursor]
+                for key, rounds in list(slot.items()):
+                    if rounds <= 0:
+                        del slot[key]
+                        del self._where[key]
+                        expired.append(key)
+                    else:
+                        slot[key] = rounds - 1
+        return expired
@@ -0,0 +1,169 @@
+from abc import ABC, abstractmethod
+from queue import SimpleQueue
+import logging
+import threading
+from typing import Any, Callable
+
+from gtools.core.transport.protocol import Event, Transport
+
+# in process counterparts of the zmq transports. messages are handed over as python objects, nothing is
+# serialized, so a sender must not touch a message after sending it. endpoints attach to a router by
+# address and, like a zmq connect, may attach before the router exists or survive a router restart
+
+_lock = threading.Lock()
+_routers: dict[str, "InprocRouter[Any, Any]"] = {}
+# endpoints waiting for a router at their address
+_waiting: dict[str, list["_InprocEndpoint[Any, Any]"]] = {}
+
+
+class _InprocTransport[Send, Recv](ABC, Transport[Send, Recv]):
+    def __init__(self, addr: str, logger_name: str) -> None:
+        self._addr = addr
+        # SimpleQueue put/get don't take a python level lock, a hop is one put and one wakeup
+        self._inbound = SimpleQueue[Recv | None]()
+        self._events = SimpleQueue[Event]()
+        self.logger = logging.getLogger(logger_name)
+
+    def _deliver(self, msg: Recv) -> None:
+        self._inbound.put(msg)
+
+    def _event(self, event: Event) -> None:
+        self._events.put(event)
+
+    def recv(self, block: bool = True, timeout: float | None = None) -> Recv | None:
+        return self._inbound.get(block, timeout)
+
+    def recv_nowait(self) -> Recv | None:
+        return self.recv(block=False)
+
+    def recv_event(self, block: bool = True, timeout: float | None = None) -> Event:
+        return self._events.get(block, timeout)
+
+    def recv_event_nowait(self) -> Event:
+        return self.recv_event(block=False)
+
+    @abstractmethod
+    def send(self, payload: Send, block: bool = True) -> None: ...
+
+    def send_nowait(self, payload: Send) -> None:
+        self.send(payload, block=False)
+
+
+class InprocRouter[Send, Recv](_InprocTransport[tuple[bytes, Send], tuple[bytes, Recv]]):
+    """router side, receives (identity, message) from dealers and routes (identity, message) back"""
+
+    def __init__(self, addr: str) -> None:
+        super().__init__(addr, "inproc-router")
+        self._dealers: dict[bytes, InprocDealer[Any, Any]] = {}
+        self._endpoints: list[_InprocEndpoint[Any, Any]] = []
+        # when set, dealer messages are handled right in the sending thread instead of being queued for recv()
+        self.on_message: Callable[[bytes, Recv], None] | None = None
+        # called with every message an InprocPush sends, in the pushing thread
+        self.on_push: Callable[[Any], None] | None = None
+
+    def start(self, block: bool = False) -> None:
+        with _lock:
+            if _routers.get(self._addr) not in (None, self):
+                raise RuntimeError(f"inproc router already bound to {self._addr}")
+            _routers[self._addr] = self
+            waiting = _waiting.pop(self._addr, [])
+        for endpoint in waiting:
+            self._attach(endpoint)
+
+    def stop(self) -> None:
+        with _lock:
+            if _routers.get(self._addr) is self:
+                del _routers[self._addr]
+            endpoints, self._endpoints = self._endpoints, []
+            self._dealers.clear()
+            # reconnect once a router is bound here again
+            _waiting.setdefault(self._addr, []).extend(e for e in endpoints if not e._stopped)
+        for endpoint in endpoints:
+            endpoint._detached()
+        self._inbound.put(None)
+
+    def _attach(self, endpoint: "_InprocEndpoint[Any, Any]") -> None:
+        with _lock:
+            self._endpoints.append(endpoint)
+            if isinstance(endpoint, InprocDealer):
+                if endpoint.id in self._dealers:
+                    self.logger.warning(f"dealer {endpoint.id} already attached, overwriting")
+                self._dealers[endpoint.id] = endpoint
+        endpoint._attached(self)
+
+    def _detach(self, endpoint: "_InprocEndpoint[Any, Any]") -> None:
+        with _lock:
+            if endpoint in self._endpoints:
+                self._endpoints.remove(endpoint)
+            if isinstance(endpoint, InprocDealer) and self._dealers.get(endpoint.id) is endpoint:
+                del self._dealers[endpoint.id]
+
+    def has_peer(self, id: bytes) -> bool:
+        return id in self._dealers
+
+    def send(self, payload: tuple[bytes, Send], block: bool = True) -> None:
+        id, msg = payload
+        if (dealer := self._dealers.get(id)) is not None:
+            dealer._deliver(msg)
+        # unroutable, dropped like a zmq router does
+
+
+class _InprocEndpoint[Send, Recv](_InprocTransport[Send, Recv]):
+    def __init__(self, addr: str, logger_name: str) -> None:
+        super().__init__(addr, logger_name)
+        self._router: InprocRouter[Any, Any] | None = None
+        self._stopped = False
+
+    def start(self, block: bool = False) -> None:
+        self._stopped = False
+        with _lock:
+            router = _routers.get(self._addr)
+            if router is None:
+                _waiting.setdefault(self._addr, []).append(self)
+        if router is not None:
+            router._attach(self)
+
+    def stop(self) -> None:
+        self._stopped = True
+        with _lock:
+            if self in (waiting := _waiting.get(self._addr, [])):
+                waiting.remove(self)
+        if (router := self._router) is not None:
+            router._detach(self)
+            self._detached()
+        self._inbound.put(None)
+
+    def _attached(self, router: "InprocRouter[Any, Any]") -> None:
+        self._router = router
+        self._event(Event.CONNECTED)
+
+    def _detached(self) -> None:
+        self._router = None
+        self._event(Event.DISCONNECTED)
+
+
+class InprocDealer[Send, Recv](_InprocEndpoint[Send, Recv]):
+    def __init__(self, id: bytes, addr: str) -> None:
+        self.id = id
+        super().__init__(addr, "inproc-dealer")
+
+    def send(self, payload: Send, block: bool = True) -> None:
+        if (router := self._router) is None:
+            self.logger.debug("not attached to a router, dropping message")
+            return
+        if router.on_message is not None:
+            router.on_message(self.id, payload)
+        else:
+            router._deliver((self.id, payload))
+
+
+class InprocPush[Send](_InprocEndpoint[Send, None]):
+    def __init__(self, addr: str) -> None:
+        super().__init__(addr, "inproc-push")
+
+    def send(self, payload: Send, block: bool = True) -> None:
+        router = self._router
+        if router is None or router.on_push is None:
+            self.logger.debug("no router to push to, dropping message")
+            return
+        router.on_push(payload)
@@ -194,6 +194,8 @@ class App:
 
             with self._panels_lock:
                 any_dirty = any(p.is_dirty for p in self.panels) or self._cmd.is_dirty() or self.toast_mgr.is_dirty()
+            # textures still decoding will land in a later frame, don't go idle before they do
+            any_dirty = any_dirty or GLTexManager().pending > 0
 
             if Panel.panels_to_add:
                 while Panel.panels_to_add:
@@ -221,6 +223,10 @@ class App:
             for event in self.event_router.poll():
                 self.process_events(event)
 
+            tex_upload_start = time.perf_counter()
+            GLTexManager().flush(budget_ms=setting.texture_upload_budget_ms)
+            tex_upload_ms = (time.perf_counter() - tex_upload_start) * 1000.0
+
             glClearColor(0.1, 0.1, 0.1, 1.0)
             glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)  # pyright: ignore[reportOperatorIssue]
 
@@ -274,6 +280,8 @@ class App:
                 panel_update=self._last_update_ms,
                 panel_render=panel_render_ms,
                 drawlist=drawlist_ms,
+                tex_upload=tex_upload_ms,
+                tex_pending_count=GLTexManager().pending,
                 **panel_perf,
             )
             self.perf_stats.idle = idle
@@ -1,8 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import logging
 from pathlib import Path
+import queue
+import threading
+import time
 
 import freetype
 import numpy as np
+import numpy.typing as npt
 from scipy.ndimage import distance_transform_edt
 from OpenGL.GL import (
     GL_CLAMP_TO_EDGE,
@@ -17,13 +23,26 @@ from OpenGL.GL import (
     GL_UNPACK_ALIGNMENT,
     GL_UNSIGNED_SHORT,
     glBindTexture,
-    glDeleteTextures,
     glGenTextures,
     glPixelStorei,
     glTexImage2D,
     glTexParameteri,
+    glTexSubImage2D,
 )
 
+from gtools import setting
+from gtools.gui.lib.glyph_atlas import GlyphMetrics, SkylinePacker, cache_key, load_atlas, save_atlas, unpack_mono_bitmap
+
+logger = logging.getLogger("gui-font")
+
+_ASCII = [chr(i) for i in range(32, 127)]
+_MIN_PAGE_SIZE = 2048
+_GLYPH_GAP = 1
+
+# one worker, freetype faces are not thread safe and sdf generation is cheap enough to serialize
+_worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="glyph-sdf")
+_worker_faces = threading.local()
+
 
 @dataclass(slots=True)
 class Character:
@@ -32,6 +51,213 @@ class Character:
     advance: float
     tex_offset: tuple[float, float]
     tex_size: tuple[float, float]
+    page: int = 0
+
+
+type _Raster = tuple[str, npt.NDArray[np.uint16], int, int, int]
+
+
+def _to_sdf(alpha: np.ndarray, padding: int, sdf_pixel_range_hi: float) -> npt.NDArray[np.uint16]:
+    source = alpha.astype(np.float32) / 255.0
+    padded = np.pad(source, padding, mode="constant", constant_values=0.0)
+    inside = padded > 0.0
+    dist_inside = distance_transform_edt(inside).astype(np.float32)  # pyright: ignore[reportAttributeAccessIssue]
+    dist_outside = distance_transform_edt(~inside).astype(np.float32)  # pyright: ignore[reportAttributeAccessIssue]
+    signed_distance = dist_inside - dist_outside
+    normalized = np.clip(0.5 + signed_distance / (2.0 * sdf_pixel_range_hi), 0.0, 1.0)
+
+    return (normalized * 65535.0).astype(np.uint16)
+
+
+def _rasterize(face: freetype.Face, chars: list[str], padding: int, sdf_pixel_range_hi: float) -> list[_Raster]:
+    out: list[_Raster] = []
+    for char in chars:
+        face.load_char(char, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_MONOCHROME | freetype.FT_LOAD_TARGET_MONO)  # pyright: ignore[reportAttributeAccessIssue]
+        bitmap = face.glyph.bitmap
+        if bitmap.width > 0 and bitmap.rows > 0:
+            alpha = unpack_mono_bitmap(bitmap.buffer, bitmap.width, bitmap.rows, bitmap.pitch)
+            sdf = _to_sdf(alpha, padding, sdf_pixel_range_hi)
+        else:
+            sdf = np.zeros((0, 0), dtype=np.uint16)
+        out.append((char, sdf, face.glyph.bitmap_left, face.glyph.bitmap_top, face.glyph.advance.x))
+    return out
+
+
+def _worker_face(font_path: Path, pixel_size: int) -> freetype.Face:
+    faces: dict[Path, freetype.Face] = getattr(_worker_faces, "faces", None) or {}
+    _worker_faces.faces = faces
+    face = faces.get(font_path)
+    if face is None:
+        face = faces[font_path] = freetype.Face(str(font_path))
+    face.set_pixel_sizes(0, pixel_size)
+    return face
+
+
+class _Atlas:
+    """paged sdf glyph atlas shared by every FontManager with the same font and raster parameters.
+
+    ascii is rasterized up front (or loaded from the disk cache), anything else is rasterized in batches
+    on the worker and packed + uploaded on the render thread in `poll`
+    """
+
+    _shared: dict[str, "_Atlas"] = {}
+    _shared_lock = threading.Lock()
+    # glyph batches landing within this many seconds of the first unsaved one share one cache write
+    save_delay = 2.0
+
+    def __init__(self, key: str, font_path: Path, pixel_size: int, sdf_pixel_range_hi: float, page_size: int) -> None:
+        self.key = key
+        self.font_path = font_path
+        self.pixel_size = pixel_size
+        self.sdf_pixel_range_hi = sdf_pixel_range_hi
+        self.padding = int(np.ceil(sdf_pixel_range_hi)) + 1
+        self.page_size = page_size
+        self.cache_path = setting.appdir / "cache" / "fonts" / f"{key}.npz"
+
+        self.glyphs: dict[str, GlyphMetrics] = {}
+        self.pages: list[npt.NDArray[np.uint16]] = []
+        self.packers: list[SkylinePacker] = []
+        self.textures: list[int] = []
+        # per page dirty row ranges not uploaded yet
+        self._dirty: dict[int, tuple[int, int]] = {}
+        self._requested: set[str] = set()
+        self._ready: queue.SimpleQueue[list[_Raster]] = queue.SimpleQueue()
+        # glyphs the disk cache is missing, written by `_flush` once `_save_at` passes and no write is in flight
+        self._unsaved = False
+        self._save_at = 0.0
+        self._saving = False
+        self.generation = 0
+
+    @classmethod
+    def get(cls, font_path: Path, pixel_size: int, sdf_pixel_range_hi: float, page_size: int) -> "_Atlas":
+        key = cache_key(font_path, pixel_size, sdf_pixel_range_hi, page_size)
+        with cls._shared_lock:
+            atlas = cls._shared.get(key)
+            if atlas is None:
+                atlas = cls._shared[key] = cls(key, font_path, pixel_size, sdf_pixel_range_hi, page_size)
+                atlas._load(freetype.Face(str(font_path)))
+        return atlas
+
+    def _load(self, face: freetype.Face) -> None:
+        cached = load_atlas(self.cache_path)
+        if cached is not None and all(p.shape == (self.page_size, self.page_size) for p in cached[0]):
+            self.pages, self.glyphs, skylines = cached
+            self.packers = [SkylinePacker(self.page_size, self.page_size, skyline) for skyline in skylines]
+            self._dirty = {i: (0, self.page_size) for i in range(len(self.pages))}
+            return
+
+        face.set_pixel_sizes(0, self.pixel_size)
+        for raster in _rasterize(face, _ASCII, self.padding, self.sdf_pixel_range_hi):
+            self._pack(*raster)
+        self._save(0.0)
+        self._flush()
+
+    def _new_page(self) -> int:
+        self.pages.append(np.zeros((self.page_size, self.page_size), dtype=np.uint16))
+        self.packers.append(SkylinePacker(self.page_size, self.page_size))
+        return len(self.pages) - 1
+
+    def _pack(self, char: str, sdf: npt.NDArray[np.uint16], left: int, top: int, advance: int) -> None:
+        h, w = sdf.shape
+        if w == 0 or h == 0:
+            self.glyphs[char] = GlyphMetrics(0, 0, 0, 0, 0, left, top, advance)
+            return
+
+        for page, packer in enumerate(self.packers):
+            if (pos := packer.insert(w + _GLYPH_GAP, h + _GLYPH_GAP)) is not None:
+                break
+        else:
+            page = self._new_page()
+            pos = self.packers[page].insert(w + _GLYPH_GAP, h + _GLYPH_GAP)
+            if pos is None:
+                logger.warning(f"glyph {char!r} ({w}x{h}) does not fit a {self.page_size} atlas page")
+                self.glyphs[char] = GlyphMetrics(0, 0, 0, 0, 0, left, top, advance)
+                return
+
+        x, y = pos
+        self.pages[page][y : y + h, x : x + w] = sdf
+        lo, hi = self._dirty.get(page, (y, y + h))
+        self._dirty[page] = (min(lo, y), max(hi, y + h))
+        self.glyphs[char] = GlyphMetrics(page, x, y, w, h, left, top, advance)
+
+    def request(self, chars: set[str]) -> None:
+        missing = [c for c in chars if c not in self.glyphs and c not in self._requested]
+        if not missing:
+            return
+        self._requested.update(missing)
+        _worker.submit(self._rasterize_batch, missing)
+
+    def _rasterize_batch(self, chars: list[str]) -> None:
+        try:
+            face = _worker_face(self.font_path, self.pixel_size)
+            self._ready.put(_rasterize(face, chars, self.padding, self.sdf_pixel_range_hi))
+        except Exception:
+            logger.exception(f"failed to rasterize {len(chars)} glyphs from {self.font_path}")
+
+    def poll(self) -> None:
+        """pack whatever the worker finished, render thread only"""
+        packed = False
+        while True:
+            try:
+                batch = self._ready.get_nowait()
+            except queue.Empty:
+                break
+            for raster in batch:
+                self._pack(*raster)
+                self._requested.discard(raster[0])
+            packed = True
+
+        if packed:
+            self.generation += 1
+            self._save()
+        self._flush()
+
+    def texture(self, page: int) -> int:
+        """GL texture for `page`, uploading pending glyph rows first"""
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        while len(self.textures) < len(self.pages):
+            tex = int(glGenTextures(1))
+            glBindTexture(GL_TEXTURE_2D, tex)
+            glTexImage2D(GL_TEXTURE_2D, 0, GL_R16, self.page_size, self.page_size, 0, GL_RED, GL_UNSIGNED_SHORT, None)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+            self.textures.append(tex)
+
+        # only the touched rows go up, full width keeps the source contiguous
+        for i, (lo, hi) in self._dirty.items():
+            glBindTexture(GL_TEXTURE_2D, self.textures[i])
+            glTexSubImage2D(GL_TEXTURE_2D, 0, 0, lo, self.page_size, hi - lo, GL_RED, GL_UNSIGNED_SHORT, self.pages[i][lo:hi].tobytes())
+        self._dirty.clear()
+        glBindTexture(GL_TEXTURE_2D, 0)
+
+        return self.textures[page]
+
+    def _save(self, delay: float | None = None) -> None:
+        """mark the disk cache stale, the write happens in a later `_flush`"""
+        if not self._unsaved:
+            self._unsaved = True
+            self._save_at = time.monotonic() + (self.save_delay if delay is None else delay)
+
+    def _flush(self) -> None:
+        # a write in flight snapshotted the atlas before the newer glyphs, they go out once it is done
+        if not self._unsaved or self._saving or time.monotonic() < self._save_at:
+            return
+        self._unsaved = False
+        self._saving = True
+        pages = [p.copy() for p in self.pages]
+        glyphs = dict(self.glyphs)
+        skylines = [list(p.skyline) for p in self.packers]
+        _worker.submit(self._write_cache, pages, glyphs, skylines)
+
+    def _write_cache(self, pages: list[npt.NDArray[np.uint16]], glyphs: dict[str, GlyphMetrics], skylines: list[list[tuple[int, int, int]]]) -> None:
+        try:
+            save_atlas(self.cache_path, pages, glyphs, skylines)
+        except OSError:
+            logger.warning(f"failed to write glyph atlas cache {self.cache_path}", exc_info=True)
+        finally:
+            self._saving = False
 
 
 class FontManager:
@@ -49,113 +275,29 @@ class FontManager:
         self.atlas_min_size = max(64, int(atlas_min_size))
         self.face = freetype.Face(str(self.font_path))
         self.face.set_pixel_sizes(0, size * self.raster_scale)
-        self.chars: dict[str, Character] = {}
-        self.atlas_tex: int | None = None
         self._sdf_pixel_range_hi = float(sdf_pixel_range)
         self._sdf_pixel_range = self._sdf_pixel_range_hi / self.raster_scale
-        self._load_ascii_sdf()
-
-    def _to_sdf(self, alpha: np.ndarray, padding: int) -> np.ndarray:
-        source = alpha.astype(np.float32) / 255.0
-        padded = np.pad(source, padding, mode="constant", constant_values=0.0)
-        inside = padded > 0.0
-        dist_inside = distance_transform_edt(inside).astype(np.float32)  # pyright: ignore[reportAttributeAccessIssue]
-        dist_outside = distance_transform_edt(~inside).astype(np.float32)  # pyright: ignore[reportAttributeAccessIssue]
-        signed_distance = dist_inside - dist_outside
-        normalized = np.clip(0.5 + signed_distance / (2.0 * self._sdf_pixel_range_hi), 0.0, 1.0)
-
-        return (normalized * 65535.0).astype(np.uint16)
-
-    def _unpack_mono_bitmap(self, buffer: bytes | bytearray | list[int], width: int, rows: int, pitch: int) -> np.ndarray:
-        out = np.zeros((rows, width), dtype=np.uint8)
-        raw = bytes(buffer) if isinstance(buffer, list) else bytes(buffer)
-        byte_pitch = abs(pitch)
-        for y in range(rows):
-            row_start = y * byte_pitch
-            row_end = row_start + byte_pitch
-            row = np.frombuffer(raw[row_start:row_end], dtype=np.uint8)
-            bits = np.unpackbits(row, bitorder="big")
-            out[y, :] = bits[:width] * 255
-        return out
-
-    def _load_ascii_sdf(self) -> None:
-        chars_to_load = [chr(i) for i in range(32, 127)]
-        padding = int(np.ceil(self._sdf_pixel_range_hi)) + 1
-        glyphs = []
-
-        for char in chars_to_load:
-            self.face.load_char(char, freetype.FT_LOAD_RENDER | freetype.FT_LOAD_MONOCHROME | freetype.FT_LOAD_TARGET_MONO)  # pyright: ignore[reportAttributeAccessIssue]
-            bitmap = self.face.glyph.bitmap
-            w = bitmap.width
-            h = bitmap.rows
-            if w > 0 and h > 0:
-                alpha = self._unpack_mono_bitmap(bitmap.buffer, w, h, bitmap.pitch)
-                sdf_bitmap = self._to_sdf(alpha, padding)
-                packed_w = w + padding * 2
-                packed_h = h + padding * 2
-            else:
-                sdf_bitmap = np.zeros((0, 0), dtype=np.uint16)
-                packed_w = 0
-                packed_h = 0
-
-            glyphs.append((char, packed_w, packed_h, sdf_bitmap, self.face.glyph.bitmap_left, self.face.glyph.bitmap_top, self.face.glyph.advance.x))
-
-        atlas_w = self.atlas_min_size
-        max_glyph_w = max((g[1] for g in glyphs), default=1)
-        atlas_w = max(atlas_w, max_glyph_w + 2)
-        x_offset = 0
-        y_offset = 0
-        row_h = 0
-        packed: list[tuple[str, int, int, np.ndarray, int, int, int, int, int]] = []
-        for char, packed_w, packed_h, sdf_bitmap, left, top, advance in glyphs:
-            if packed_w > 0 and x_offset + packed_w > atlas_w:
-                x_offset = 0
-                y_offset += row_h + 1
-                row_h = 0
-            packed.append((char, packed_w, packed_h, sdf_bitmap, left, top, advance, x_offset, y_offset))
-            x_offset += packed_w + 1
-            row_h = max(row_h, packed_h)
-        atlas_h = max(self.atlas_min_size, y_offset + row_h + 1, 1)
-
-        self.atlas_tex = int(glGenTextures(1))
-        glBindTexture(GL_TEXTURE_2D, self.atlas_tex)
-        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
-        atlas = np.zeros((atlas_h, atlas_w), dtype=np.uint16)
-
-        for char, packed_w, packed_h, sdf_bitmap, left, top, advance, x_offset, y_offset in packed:
-            if packed_w > 0 and packed_h > 0:
-                atlas[y_offset : y_offset + packed_h, x_offset : x_offset + packed_w] = sdf_bitmap
-                bearing_x = (left - padding) / self.raster_scale
-                bearing_y = (top + padding) / self.raster_scale
-                glyph_w = packed_w / self.raster_scale
-                glyph_h = packed_h / self.raster_scale
-            else:
-                bearing_x = left / self.raster_scale
-                bearing_y = top / self.raster_scale
-                glyph_w = 0.0
-                glyph_h = 0.0
-
-            tex_offset = (x_offset / atlas_w, y_offset / atlas_h)
-            tex_size = (packed_w / atlas_w, packed_h / atlas_h if atlas_h > 0 else 0.0)
-
-            bearing_y = (top + padding) / self.raster_scale
-            glyph_h = packed_h / self.raster_scale
-
-            self.chars[char] = Character(
-                (glyph_w, glyph_h),
-                (bearing_x, bearing_y),
-                (advance / 64.0) / self.raster_scale,
-                tex_offset,
-                tex_size,
-            )
-
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_R16, atlas_w, atlas_h, 0, GL_RED, GL_UNSIGNED_SHORT, atlas.tobytes())
-
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        glBindTexture(GL_TEXTURE_2D, 0)
+        self._atlas = _Atlas.get(self.font_path, size * self.raster_scale, self._sdf_pixel_range_hi, max(_MIN_PAGE_SIZE, self.atlas_min_size))
+        self.chars: dict[str, Character] = {}
+        self._chars_generation = -1
+
+    def _character(self, m: GlyphMetrics) -> Character:
+        rs = self.raster_scale
+        padding = self._atlas.padding
+        page_size = self._atlas.page_size
+        if m.w > 0 and m.h > 0:
+            bearing_x = (m.left - padding) / rs
+        else:
+            bearing_x = m.left / rs
+
+        return Character(
+            (m.w / rs, m.h / rs),
+            (bearing_x, (m.top + padding) / rs),
+            (m.advance / 64.0) / rs,
+            (m.x / page_size, m.y / page_size),
+            (m.w / page_size, m.h / page_size),
+            m.page,
+        )
 
     @property
     def ascender(self) -> int:
@@ -173,9 +315,39 @@ class FontManager:
     def sdf_pixel_range(self) -> float:
         return self._sdf_pixel_range
 
+    @property
+    def generation(self) -> int:
+        """bumped whenever new glyphs land in the atlas"""
+        return self._atlas.generation
+
+    @property
+    def atlas_tex(self) -> int:
+        return self._atlas.texture(0)
+
+    def page_texture(self, page: int) -> int:
+        return self._atlas.texture(page)
+
+    def has_char(self, char: str) -> bool:
+        return char in self._atlas.glyphs
+
+    def request(self, chars: set[str]) -> None:
+        """queue missing glyphs for rasterization, they show up after a later `poll`"""
+        self._atlas.request(chars)
+
+    def poll(self) -> int:
+        self._atlas.poll()
+        return self._atlas.generation
+
     def get_char(self, char: str) -> Character:
-        return self.chars.get(char, self.chars[" "])
+        if self._chars_generation != self._atlas.generation:
+            self.chars = {c: self._character(m) for c, m in self._atlas.glyphs.items()}
+            self._chars_generation = self._atlas.generation
+
+        if (glyph := self.chars.get(char)) is not None:
+            return glyph
+        self._atlas.request({char})
+        return self.chars[" "]
 
     def delete(self) -> None:
-        if self.atlas_tex:
-            glDeleteTextures(1, [self.atlas_tex])
+        # the atlas is shared per font and lives as long as the process
+        pass
@@ -0,0 +1,151 @@
+from dataclasses import dataclass
+import hashlib
+import logging
+import os
+from pathlib import Path
+import tempfile
+
+import numpy as np
+import numpy.typing as npt
+
+logger = logging.getLogger("gui-glyph-atlas")
+
+_CACHE_VERSION = 1
+
+
+def unpack_mono_bitmap(buffer: bytes | bytearray | list[int], width: int, rows: int, pitch: int) -> npt.NDArray[np.uint8]:
+    """freetype 1bpp bitmap to 0/255 alpha"""
+    byte_pitch = abs(pitch)
+    raw = np.frombuffer(bytes(buffer), dtype=np.uint8, count=rows * byte_pitch).reshape(rows, byte_pitch)
+    return np.unpackbits(raw, axis=1, bitorder="big")[:, :width] * np.uint8(255)
+
+
+class SkylinePacker:
+    """bottom-left skyline rectangle packer, the skyline is a list of (x, y, width) segments"""
+
+    def __init__(self, width: int, height: int, skyline: list[tuple[int, int, int]] | None = None) -> None:
+        self.width = width
+        self.height = height
+        self.skyline = skyline or [(0, 0, width)]
+
+    def _fit(self, index: int, w: int, h: int) -> int | None:
+        x, y, _ = self.skyline[index]
+        if x + w > self.width:
+            return None
+
+        remaining = w
+        i = index
+        while remaining > 0:
+            if i >= len(self.skyline):
+                return None
+            y = max(y, self.skyline[i][1])
+            if y + h > self.height:
+                return None
+            remaining -= self.skyline[i][2]
+            i += 1
+        return y
+
+    def insert(self, w: int, h: int) -> tuple[int, int] | None:
+        best: tuple[int, int, int] | None = None  # (top, segment width, index)
+        best_pos = (0, 0)
+        for i, (x, _, seg_w) in enumerate(self.skyline):
+            y = self._fit(i, w, h)
+            if y is None:
+                continue
+            if best is None or (y + h, seg_w) < best[:2]:
+                best = (y + h, seg_w, i)
+                best_pos = (x, y)
+
+        if best is None:
+            return None
+
+        self._add(best[2], best_pos[0], best_pos[1], w, h)
+        return best_pos
+
+    def _add(self, index: int, x: int, y: int, w: int, h: int) -> None:
+        self.skyline.insert(index, (x, y + h, w))
+
+        # shrink or drop the segments the new one now covers
+        i = index + 1
+        while i < len(self.skyline):
+            sx, sy, sw = self.skyline[i]
+            prev_x, _, prev_w = self.skyline[i - 1]
+            overlap = prev_x + prev_w - sx
+            if overlap <= 0:
+                break
+            if sw - overlap > 0:
+                self.skyline[i] = (sx + overlap, sy, sw - overlap)
+                break
+            del self.skyline[i]
+
+        # merge neighbours at the same height
+        i = 0
+        while i < len(self.skyline) - 1:
+            x0, y0, w0 = self.skyline[i]
+            _, y1, w1 = self.skyline[i + 1]
+            if y0 == y1:
+                self.skyline[i] = (x0, y0, w0 + w1)
+                del self.skyline[i + 1]
+            else:
+                i += 1
+
+
+@dataclass(slots=True)
+class GlyphMetrics:
+    page: int
+    x: int
+    y: int
+    w: int
+    h: int
+    left: int
+    top: int
+    advance: int
+
+
+def cache_key(font_path: str | Path, *params: object) -> str:
+    h = hashlib.sha256(Path(font_path).read_bytes())
+    h.update(repr(params).encode())
+    return h.hexdigest()[:24]
+
+
+def save_atlas(path: Path, pages: list[npt.NDArray[np.uint16]], glyphs: dict[str, GlyphMetrics], skylines: list[list[tuple[int, int, int]]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    codepoints = np.array([ord(c) for c in glyphs], dtype=np.int32)
+    metrics = np.array([[g.page, g.x, g.y, g.w, g.h, g.left, g.top, g.advance] for g in glyphs.values()], dtype=np.int32).reshape(-1, 8)
+
+    arrays: dict[str, npt.NDArray] = {
+        "version": np.array(_CACHE_VERSION),
+        "pages": np.stack(pages) if pages else np.zeros((0, 0, 0), dtype=np.uint16),
+        "codepoints": codepoints,
+        "metrics": metrics,
+    }
+    for i, skyline in enumerate(skylines):
+        arrays[f"skyline_{i}"] = np.array(skyline, dtype=np.int32).reshape(-1, 3)
+
+    # write next to it and swap, another instance may be reading the same file
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **arrays)  # pyright: ignore[reportArgumentType]
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def load_atlas(path: Path) -> tuple[list[npt.NDArray[np.uint16]], dict[str, GlyphMetrics], list[list[tuple[int, int, int]]]] | None:
+    if not path.exists():
+        return None
+
+    try:
+        with np.load(path) as data:
+            if int(data["version"]) != _CACHE_VERSION:
+                return None
+            pages = [np.array(p) for p in data["pages"]]
+            glyphs = {chr(int(cp)): GlyphMetrics(*(int(v) for v in m)) for cp, m in zip(data["codepoints"], data["metrics"])}
+            skylines = [[(int(x), int(y), int(w)) for x, y, w in data[f"skyline_{i}"]] for i in range(len(pages))]
+    except Exception:
+        logger.warning(f"ignoring unreadable glyph atlas cache {path}", exc_info=True)
+        return None
+
+    return pages, glyphs, skylines
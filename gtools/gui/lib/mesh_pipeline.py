@@ -0,0 +1,109 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Callable, Hashable
+
+logger = logging.getLogger("gui-mesh-pipeline")
+
+
+class MeshPipeline[K: Hashable, T]:
+    """builds mesh data in a worker pool and hands it back to the render thread for upload.
+
+    `build` callables must only produce cpu side data (numpy arrays), everything GL happens in `drain`.
+    submitting a key again supersedes whatever is still in flight for it
+    """
+
+    def __init__(self, workers: int | None = None, name: str = "mesh") -> None:
+        self._pool = ThreadPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1), thread_name_prefix=name)
+        self._done: queue.SimpleQueue[tuple[K, int, T | None]] = queue.SimpleQueue()
+        self._ready: deque[tuple[K, T]] = deque()
+        self._lock = threading.Lock()
+        self._gen: dict[K, int] = {}
+        self._in_flight = 0
+        self._closed = False
+
+    @property
+    def pending(self) -> int:
+        """jobs either building or waiting to be uploaded"""
+        with self._lock:
+            return self._in_flight + self._done.qsize() + len(self._ready)
+
+    @property
+    def busy(self) -> bool:
+        return self.pending > 0
+
+    def submit(self, key: K, build: Callable[[], T]) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            gen = self._gen[key] = self._gen.get(key, 0) + 1
+            self._in_flight += 1
+
+        self._pool.submit(self._run, key, gen, build)
+
+    def _run(self, key: K, gen: int, build: Callable[[], T]) -> None:
+        result = None
+        try:
+            with self._lock:
+                stale = self._gen.get(key) != gen
+            if not stale:
+                result = build()
+        except Exception:
+            logger.exception(f"mesh build for {key} failed")
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._done.put((key, gen, result))
+
+    def _collect(self) -> None:
+        while True:
+            try:
+                key, gen, result = self._done.get_nowait()
+            except queue.Empty:
+                return
+
+            with self._lock:
+                current = self._gen.get(key) == gen
+            if not current or result is None:
+                continue
+
+            # a newer result for a key that is still waiting replaces it in place
+            for i, (k, _) in enumerate(self._ready):
+                if k == key:
+                    self._ready[i] = (key, result)
+                    break
+            else:
+                self._ready.append((key, result))
+
+    def drain(self, upload: Callable[[K, T], None], budget_ms: float) -> int:
+        """upload finished results until `budget_ms` is spent, always at least one so a slow upload can't starve the queue"""
+        self._collect()
+
+        start = time.perf_counter()
+        count = 0
+        while self._ready:
+            if count and (time.perf_counter() - start) * 1000.0 >= budget_ms:
+                break
+            key, result = self._ready.popleft()
+            upload(key, result)
+            count += 1
+
+        return count
+
+    def cancel(self) -> None:
+        """drop everything not uploaded yet, in flight builds still run but their results are discarded"""
+        with self._lock:
+            for key in self._gen:
+                self._gen[key] += 1
+        self._ready.clear()
+        self._collect()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+        self.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
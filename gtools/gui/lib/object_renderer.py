@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import IntFlag, auto
-from typing import ClassVar
+from typing import ClassVar, Hashable
 
 from OpenGL.GL import GL_FALSE, GL_TRUE, GL_UNSIGNED_INT, glDepthMask
 from pyglm.glm import ivec2, vec2
@@ -109,8 +109,10 @@ class ObjectRendererBase(Renderer, ABC):
         # will order such that the frontmost object is the highest uid
         ORDER_BY_UID = auto()
 
-    def __init__(self, z_start: float, z_end: float) -> None:
+    def __init__(self, z_start: float, z_end: float, owner: Hashable | None = None) -> None:
         self._tex_mgr = GLTexManager()
+        # textures are referenced by `owner` until it is deleted, renderers nested in another one share its owner
+        self._owner = owner if owner is not None else self
         self._seed_renderer = SeedIconRenderer()
 
         z_mid = (z_start + z_end) / 2.0
@@ -333,7 +335,7 @@ class ObjectRendererBase(Renderer, ABC):
                     else:
                         tex_file = item.get_icon_texture() or item.texture_file.decode()
 
-                    tex = self._tex_mgr.load_texture(setting.gt_path / "game" / tex_file)
+                    tex = self._tex_mgr.load_texture(setting.gt_path / "game" / tex_file, owner=self._owner)
 
                     if item.id == GEMS:
                         tex_index = GEMS_TO_TEX_OFFSET[dropped.amount]
@@ -368,7 +370,7 @@ class ObjectRendererBase(Renderer, ABC):
                         )
 
                 if not no_overlay and item.id not in (GEMS, COMET_DUST, ANTIMATTER_DUST):
-                    overlay_tex = self._tex_mgr.load_texture(setting.gt_path / "game/pickup_box.rttex")
+                    overlay_tex = self._tex_mgr.load_texture(setting.gt_path / "game/pickup_box.rttex", owner=self._owner)
                     tex = PICKUP_BOX_BLUE
                     if item.item_type == ItemInfoType.CONSUMABLE:
                         tex = PICKUP_BOX_PURPLE
@@ -432,7 +434,7 @@ class ObjectRendererBase(Renderer, ABC):
         shadow_data: dict[TextureArray, list[float]] = defaultdict(list)
 
         for info in icons:
-            tex = self._tex_mgr.load_texture(setting.gt_path / "game" / info.texture_path)
+            tex = self._tex_mgr.load_texture(setting.gt_path / "game" / info.texture_path, owner=self._owner)
             uv_x = info.tex_pos.x / tex.width
             uv_y = info.tex_pos.y / tex.height
 
@@ -566,6 +568,7 @@ class ObjectRendererBase(Renderer, ABC):
 
     def delete(self) -> None:
         self._seed_renderer.delete()
+        self._tex_mgr.release(self._owner)
 
 
 class ObjectRenderer(ObjectRendererBase):
@@ -103,21 +103,29 @@ class TextRenderer(Renderer):
         self._softness3d = self.shader3d.get_uniform("u_edgeSoftness")
         self._weight3d = self.shader3d.get_uniform("u_weight")
 
-        self._batch_data: list[float] = []
-        self._shadow_batch_data: list[float] = []
-        self._mesh: Mesh | None = None
-        self._shadow_mesh: Mesh | None = None
+        # per atlas page, glyphs on different pages need different textures bound
+        self._batch_data: dict[int, list[float]] = {}
+        self._shadow_batch_data: dict[int, list[float]] = {}
+        self._meshes: dict[int, Mesh] = {}
+        self._shadow_meshes: dict[int, Mesh] = {}
+
+        # build_text calls since the last build, replayed once glyphs that were still rasterizing land
+        self._calls: list[tuple[str, float, float, float, float, float | None]] = []
+        self._missing = False
+        self._built_calls: list[tuple[str, float, float, float, float, float | None]] = []
+        self._built_generation: int | None = None
 
     def delete(self) -> None:
         self.font.delete()
         self._batch_data.clear()
         self._shadow_batch_data.clear()
-        if self._mesh:
-            self._mesh.delete()
-            self._mesh = None
-        if self._shadow_mesh:
-            self._shadow_mesh.delete()
-            self._shadow_mesh = None
+        self._calls.clear()
+        self._built_calls.clear()
+        self._built_generation = None
+        for mesh in (*self._meshes.values(), *self._shadow_meshes.values()):
+            mesh.delete()
+        self._meshes.clear()
+        self._shadow_meshes.clear()
 
     def get_text_size(self, text: str, scale: float = 1.0) -> tuple[float, float]:
         parsed = _parse_colored_text(text)
@@ -142,8 +150,11 @@ class TextRenderer(Renderer):
         scale: float = 1.0,
         shadow_z: float | None = None,
     ) -> None:
+        self._calls.append((text, x, y, z, scale, shadow_z))
         current_x = x
         for char, color in _parse_colored_text(text):
+            if not self.font.has_char(char):
+                self._missing = True
             glyph = self.font.get_char(char)
             if glyph.size[0] == 0:
                 current_x += glyph.advance * scale
@@ -154,7 +165,7 @@ class TextRenderer(Renderer):
             xpos = current_x + glyph.bearing[0] * scale
             ypos = y - glyph.bearing[1] * scale
 
-            self._batch_data.extend([
+            self._batch_data.setdefault(glyph.page, []).extend([
                 xpos, ypos, w, h,
                 glyph.tex_offset[0], glyph.tex_offset[1],
                 glyph.tex_size[0], glyph.tex_size[1],
@@ -163,7 +174,7 @@ class TextRenderer(Renderer):
             ])
 
             if shadow_z is not None:
-                self._shadow_batch_data.extend([
+                self._shadow_batch_data.setdefault(glyph.page, []).extend([
                     xpos, ypos, w, h,
                     glyph.tex_offset[0], glyph.tex_offset[1],
                     glyph.tex_size[0], glyph.tex_size[1],
@@ -173,31 +184,49 @@ class TextRenderer(Renderer):
 
             current_x += glyph.advance * scale
 
-    def build(self) -> None:
-        if self._batch_data:
-            if self._mesh:
-                self._mesh.delete()
+    def _build_meshes(self, batches: dict[int, list[float]], meshes: dict[int, Mesh]) -> None:
+        if not batches:
+            return
 
-            instance_data = np.array(self._batch_data, dtype=np.float32)
-            self._mesh = Mesh(
+        for mesh in meshes.values():
+            mesh.delete()
+        meshes.clear()
+        for page, data in batches.items():
+            meshes[page] = Mesh(
                 Mesh.RECT_WITH_UV_VERTS, [2, 2], Mesh.RECT_INDICES,
-                instance_data=instance_data,
+                instance_data=np.array(data, dtype=np.float32),
                 instance_layout=self.INSTANCE_LAYOUT,
                 instance_attrib_base=2,
             )
-            self._batch_data.clear()
+        batches.clear()
 
-        if self._shadow_batch_data:
-            if self._shadow_mesh:
-                self._shadow_mesh.delete()
-            shadow_instance_data = np.array(self._shadow_batch_data, dtype=np.float32)
-            self._shadow_mesh = Mesh(
-                Mesh.RECT_WITH_UV_VERTS, [2, 2], Mesh.RECT_INDICES,
-                instance_data=shadow_instance_data,
-                instance_layout=self.INSTANCE_LAYOUT,
-                instance_attrib_base=2,
-            )
-            self._shadow_batch_data.clear()
+    def build(self) -> None:
+        if self._calls:
+            self._built_calls = self._calls
+            self._built_generation = self.font.generation if self._missing else None
+        self._calls = []
+        self._missing = False
+
+        self._build_meshes(self._batch_data, self._meshes)
+        self._build_meshes(self._shadow_batch_data, self._shadow_meshes)
+
+    def _refresh(self) -> None:
+        """rebuild with the real glyphs once the ones that were missing got rasterized"""
+        generation = self.font.poll()
+        if self._built_generation is None or generation == self._built_generation:
+            return
+
+        pending = self._calls, self._batch_data, self._shadow_batch_data, self._missing
+        self._calls, self._batch_data, self._shadow_batch_data, self._missing = [], {}, {}, False
+        for call in self._built_calls:
+            self.build_text(*call)
+        self.build()
+        self._calls, self._batch_data, self._shadow_batch_data, self._missing = pending
+
+    def _draw_pages(self, meshes: dict[int, Mesh]) -> None:
+        for page, mesh in meshes.items():
+            glBindTexture(GL_TEXTURE_2D, self.font.page_texture(page))
+            mesh.draw_instanced()
 
     def draw(
         self,
@@ -206,7 +235,8 @@ class TextRenderer(Renderer):
         offset: tuple[float, float] = (0.0, 0.0),
         shadow_color: tuple[float, float, float] | None = None,
     ) -> None:
-        if not self._mesh:
+        self._refresh()
+        if not self._meshes:
             return
 
         self.shader.use()
@@ -216,17 +246,16 @@ class TextRenderer(Renderer):
         self._weight.set_float(self.weight)
 
         glActiveTexture(GL_TEXTURE0)
-        glBindTexture(GL_TEXTURE_2D, self.font.atlas_tex)
         self._tex.set_int(0)
 
-        if self._shadow_mesh and shadow_color is not None:
+        if self._shadow_meshes and shadow_color is not None:
             self._color.set_vec3(np.array(shadow_color, dtype=np.float32))
             self._offset.set_vec2(np.array(offset, dtype=np.float32))
-            self._shadow_mesh.draw_instanced()
+            self._draw_pages(self._shadow_meshes)
 
         self._color.set_vec3(np.array(color, dtype=np.float32))
         self._offset.set_vec2(np.zeros(2, dtype=np.float32))
-        self._mesh.draw_instanced()
+        self._draw_pages(self._meshes)
 
     def draw_3d(
         self,
@@ -236,7 +265,8 @@ class TextRenderer(Renderer):
         offset: tuple[float, float] = (0.0, 0.0),
         shadow_color: tuple[float, float, float] | None = None,
     ) -> None:
-        if not self._mesh:
+        self._refresh()
+        if not self._meshes:
             return
 
         self.shader3d.use()
@@ -247,14 +277,13 @@ class TextRenderer(Renderer):
         self._weight3d.set_float(self.weight)
 
         glActiveTexture(GL_TEXTURE0)
-        glBindTexture(GL_TEXTURE_2D, self.font.atlas_tex)
         self._tex3d.set_int(0)
 
-        if self._shadow_mesh and shadow_color is not None:
+        if self._shadow_meshes and shadow_color is not None:
             self._color3d.set_vec3(np.array(shadow_color, dtype=np.float32))
             self._offset3d.set_vec2(np.array(offset, dtype=np.float32))
-            self._shadow_mesh.draw_instanced()
+            self._draw_pages(self._shadow_meshes)
 
         self._color3d.set_vec3(np.array(color, dtype=np.float32))
         self._offset3d.set_vec2(np.zeros(2, dtype=np.float32))
-        self._mesh.draw_instanced()
+        self._draw_pages(self._meshes)
@@ -0,0 +1,255 @@
+from collections import defaultdict
+from typing import Callable, Hashable, Protocol, Sequence
+
+import numpy as np
+import numpy.typing as npt
+from pyglm.glm import ivec2
+
+from gtools.baked.items import STEAM_REVOLVER, STEAM_TUBES
+from gtools.core.growtopia.items_dat import ItemFlag, ItemInfoCollisionType, ItemInfoTextureType, ItemInfoType, ItemInfoVisualEffect, get_tex_stride, item_database
+from gtools.core.growtopia.world import COLOR_MASK, COLOR_SHIFT, DisplayBlockTile, SeedTile, Tile, TileFlags, VendingMachineTile
+
+# x, y, u0, v0, u1, v1, texture layer, paint index, tint (raw u32 bits)
+INSTANCE_FLOATS = 9
+TILE_SIZE = 32
+
+_WHITE = 0xFFFFFFFF
+
+
+class TextureSlot(Protocol):
+    """where a texture file lives, GLTex satisfies this"""
+
+    @property
+    def array(self) -> Hashable: ...
+    @property
+    def layer(self) -> int: ...
+    @property
+    def width(self) -> int: ...
+    @property
+    def height(self) -> int: ...
+
+
+type LayerInstances = dict[str, dict[Hashable, npt.NDArray[np.float32]]]
+
+
+class TileMeshBuilder:
+    """builds the tile renderer's per-layer instance buffers from tile arrays and per-item lookup tables.
+
+    doesn't touch GL, textures are resolved through `resolve(texture_file)`
+    """
+
+    LAYERS = ("bg", "fg_before", "fg", "fg_after", "fire", "water")
+
+    def __init__(self, resolve: Callable[[str], TextureSlot]) -> None:
+        self._resolve = resolve
+        self._slots: dict[str, TextureSlot] = {}
+        self._arrays: list[Hashable] = []
+        self._array_index: dict[Hashable, int] = {}
+
+        self._known = np.zeros(0, dtype=np.bool_)
+        self._tex_x = np.zeros(0, dtype=np.int32)
+        self._tex_y = np.zeros(0, dtype=np.int32)
+        self._stride = np.zeros(0, dtype=np.int32)
+        self._flippable = np.zeros(0, dtype=np.bool_)
+        self._horiz = np.zeros(0, dtype=np.bool_)
+        self._alt_if_on = np.zeros(0, dtype=np.bool_)
+        self._alt_if_off = np.zeros(0, dtype=np.bool_)
+        self._steam = np.zeros(0, dtype=np.bool_)
+        self._array_of = np.zeros(0, dtype=np.int32)
+        self._layer = np.zeros(0, dtype=np.float32)
+        self._width = np.zeros(0, dtype=np.float64)
+        self._height = np.zeros(0, dtype=np.float64)
+        self._tint = np.zeros(0, dtype=np.uint32)
+
+    def slot(self, texture_file: str) -> TextureSlot:
+        if (slot := self._slots.get(texture_file)) is None:
+            slot = self._slots[texture_file] = self._resolve(texture_file)
+        return slot
+
+    def _array_id(self, array: Hashable) -> int:
+        if (idx := self._array_index.get(array)) is None:
+            idx = self._array_index[array] = len(self._arrays)
+            self._arrays.append(array)
+        return idx
+
+    def _grow(self, size: int) -> None:
+        for name in ("_known", "_tex_x", "_tex_y", "_stride", "_flippable", "_horiz", "_alt_if_on", "_alt_if_off", "_steam", "_array_of", "_layer", "_width", "_height", "_tint"):
+            old = getattr(self, name)
+            new = np.zeros(size, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+    def _ensure_items(self, ids: npt.NDArray[np.int64]) -> None:
+        if ids.size == 0:
+            return
+
+        top = int(ids.max()) + 1
+        if top > len(self._known):
+            self._grow(max(top, len(self._known) * 2))
+
+        for id in np.unique(ids[~self._known[ids]]).tolist():
+            item = item_database.get(id)
+            slot = self.slot(item.texture_file.decode())
+
+            self._tex_x[id] = item.tex_coord_x
+            self._tex_y[id] = item.tex_coord_y
+            self._stride[id] = item.get_tex_stride()
+            self._flippable[id] = item.flags & ItemFlag.FLIPPABLE != 0
+            self._horiz[id] = item.texture_type == ItemInfoTextureType.SMART_EDGE_HORIZ
+            # mirrors Tile.tex_pos, these items use the next texture (with a stride of 2) depending on IS_ON
+            self._alt_if_on[id] = item.collision_type == ItemInfoCollisionType.COLLIDE_IF_OFF or item.item_type == ItemInfoType.BOOMBOX
+            self._alt_if_off[id] = item.collision_type == ItemInfoCollisionType.COLLIDE_IF_ON
+            self._steam[id] = item.is_steam()
+            self._array_of[id] = self._array_id(slot.array)
+            self._layer[id] = slot.layer
+            self._width[id] = slot.width
+            self._height[id] = slot.height
+            self._tint[id] = _WHITE
+            if item.visual_effect == ItemInfoVisualEffect.DISCOLOR:
+                self._tint[id] = item_database.get(id + 1).seed_overlay_color.to_rgba() & _WHITE
+            self._known[id] = True
+
+    def _instances(
+        self,
+        ids: npt.NDArray[np.int64],
+        tex_index: npt.NDArray[np.int64],
+        flags: npt.NDArray[np.int64],
+        x: npt.NDArray[np.int64],
+        y: npt.NDArray[np.int64],
+    ) -> tuple[npt.NDArray[np.int32], npt.NDArray[np.float32]]:
+        """vectorized Tile.tex_pos + uv computation, returns (array index per instance, instance rows)"""
+        self._ensure_items(ids)
+
+        on = flags & TileFlags.IS_ON != 0
+        flipped = self._flippable[ids] & (flags & TileFlags.FLIPPED_X != 0)
+
+        # flipped couch textures swap their left and right pieces
+        swap = flipped & self._horiz[ids]
+        tex_index = np.where(swap & (tex_index == 0), 2, np.where(swap & (tex_index == 2), 0, tex_index))
+
+        alt = (self._alt_if_on[ids] & on) | (self._alt_if_off[ids] & ~on)
+        tex_index = tex_index + alt
+        stride = np.where(alt, 2, self._stride[ids])
+
+        safe = np.maximum(stride, 1)
+        tx = self._tex_x[ids] + tex_index % safe
+        ty = self._tex_y[ids] + np.where(stride != 0, tex_index // safe, 0)
+
+        width = self._width[ids]
+        height = self._height[ids]
+        u0 = tx * TILE_SIZE / width
+        u1 = (tx + 1) * TILE_SIZE / width
+        v0 = ty * TILE_SIZE / height
+        v1 = (ty + 1) * TILE_SIZE / height
+
+        out = np.empty((len(ids), INSTANCE_FLOATS), dtype=np.float32)
+        out[:, 0] = x * TILE_SIZE
+        out[:, 1] = y * TILE_SIZE
+        out[:, 2] = np.where(flipped, u1, u0)
+        out[:, 3] = v0
+        out[:, 4] = np.where(flipped, u0, u1)
+        out[:, 5] = v1
+        out[:, 6] = self._layer[ids]
+        out[:, 7] = (flags & COLOR_MASK) >> COLOR_SHIFT
+        out.view(np.uint32)[:, 8] = self._tint[ids]
+
+        return self._array_of[ids], out
+
+    def _raw(self, tile: Tile, texture_file: str, tex_pos: ivec2, out: dict[Hashable, list[npt.NDArray[np.float32]]]) -> None:
+        slot = self.slot(texture_file)
+        row = np.array(
+            [
+                tile.pos.x * TILE_SIZE,
+                tile.pos.y * TILE_SIZE,
+                (tex_pos.x * TILE_SIZE) / slot.width,
+                (tex_pos.y * TILE_SIZE) / slot.height,
+                ((tex_pos.x + 1) * TILE_SIZE) / slot.width,
+                ((tex_pos.y + 1) * TILE_SIZE) / slot.height,
+                float(slot.layer),
+                float(tile.get_paint_index()),
+                0.0,
+            ],
+            dtype=np.float32,
+        )
+        row.view(np.uint32)[8] = _WHITE
+        out[slot.array].append(row)
+
+    def build(self, tiles: Sequence[Tile]) -> LayerInstances:
+        """layer -> texture array -> float32 instance rows (INSTANCE_FLOATS wide) for `tiles`"""
+        result: LayerInstances = {key: {} for key in self.LAYERS}
+        if not tiles:
+            return result
+
+        cols = np.array([(t.pos.x, t.pos.y, t.fg_id, t.bg_id, t.fg_tex_index, t.bg_tex_index, int(t.flags)) for t in tiles], dtype=np.int64)
+        x, y, fg, bg, fg_tex, bg_tex, flags = cols.T
+
+        # only extras, steam, and fire/water need per-tile python, everything else goes through the tables
+        sparse: dict[str, dict[Hashable, list[npt.NDArray[np.float32]]]] = {key: defaultdict(list) for key in self.LAYERS}
+        skip_fg = np.zeros(len(tiles), dtype=np.bool_)
+        self._ensure_items(fg[fg != 0])
+
+        for i, tile in enumerate(tiles):
+            if tile.fg_id and tile.extra:
+                item = item_database.get(tile.fg_id)
+                if isinstance(tile.extra, DisplayBlockTile):
+                    self._raw(tile, item.texture_file.decode(), ivec2(item.tex_coord_x, item.tex_coord_y + 1), sparse["fg_before"])
+                elif isinstance(tile.extra, VendingMachineTile):
+                    tex = 1 if tile.extra.price == 0 else 0
+                    self._raw(tile, item.texture_file.decode(), ivec2(item.tex_coord_x + tex, item.tex_coord_y), sparse["fg"])
+                    if tile.flags & TileFlags.FG_ALT_MODE:
+                        # has wl inside
+                        self._raw(tile, item.texture_file.decode(), ivec2(item.tex_coord_x + 3, item.tex_coord_y), sparse["fg_after"])
+                    if tile.extra.price == 0 or tile.extra.item_id == 0:
+                        # warning sign
+                        self._raw(tile, item.texture_file.decode(), ivec2(item.tex_coord_x + 2, item.tex_coord_y), sparse["fg_after"])
+                    skip_fg[i] = True
+                elif isinstance(tile.extra, SeedTile):
+                    skip_fg[i] = True
+
+        steam = (fg != 0) & self._steam[fg]
+        for i in np.flatnonzero(steam).tolist():
+            tile = tiles[i]
+            anchor = item_database.get(STEAM_TUBES)
+            stride = get_tex_stride(ItemInfoTextureType.SMART_EDGE)
+            off = ivec2(tile.fg_tex_index % max(stride, 1), tile.fg_tex_index // stride if stride else 0)
+            self._raw(tile, anchor.texture_file.decode(), ivec2(anchor.tex_coord_x + 1, anchor.tex_coord_y) + off, sparse["fg_after"])
+
+        for i in np.flatnonzero((fg == STEAM_REVOLVER) & ~steam).tolist():
+            tile = tiles[i]
+            item = item_database.get(tile.fg_id)
+            self._raw(tile, item.texture_file.decode(), ivec2(item.tex_coord_x, item.tex_coord_y + 1), sparse["fg_after"])
+
+        stride = get_tex_stride(ItemInfoTextureType.SMART_EDGE)
+        for i in np.flatnonzero(flags & (TileFlags.ON_FIRE | TileFlags.IS_WET)).tolist():
+            tile = tiles[i]
+            tex_index = tile.overlay_tex_index
+            tex_pos = ivec2(tex_index % max(stride, 1), tex_index // stride if stride else 0)
+            if tile.flags & TileFlags.ON_FIRE:
+                self._raw(tile, "fire.rttex", tex_pos, sparse["fire"])
+            else:
+                self._raw(tile, "water.rttex", tex_pos, sparse["water"])
+
+        has_bg = bg != 0
+        self._split(result["bg"], *self._instances(bg[has_bg], bg_tex[has_bg], flags[has_bg], x[has_bg], y[has_bg]))
+        has_fg = (fg != 0) & ~skip_fg
+        self._split(result["fg"], *self._instances(fg[has_fg], fg_tex[has_fg], flags[has_fg], x[has_fg], y[has_fg]))
+
+        for key, per_array in sparse.items():
+            for array, rows in per_array.items():
+                data = np.stack(rows)
+                if (prev := result[key].get(array)) is not None:
+                    data = np.concatenate([prev, data])
+                result[key][array] = data
+
+        return result
+
+    def _split(self, out: dict[Hashable, npt.NDArray[np.float32]], array_of: npt.NDArray[np.int32], rows: npt.NDArray[np.float32]) -> None:
+        if not len(rows):
+            return
+
+        # stable so instances keep tile order inside each texture array
+        order = np.argsort(array_of, kind="stable")
+        array_of, rows = array_of[order], rows[order]
+        bounds = np.flatnonzero(np.diff(array_of)) + 1
+        for start, end in zip(np.concatenate([[0], bounds]).tolist(), np.concatenate([bounds, [len(rows)]]).tolist()):
+            out[self._arrays[array_of[start]]] = rows[start:end]
@@ -1,4 +1,5 @@
-from typing import Iterator
+from typing import Iterable
+from OpenGL.GL import GL_DYNAMIC_DRAW
 import numpy as np
 from pyglm import glm
 from gtools.core.growtopia.items_dat import ItemInfoCollisionType, item_database
@@ -11,7 +12,14 @@ from gtools.core.growtopia.world import FriendsEntranceTile, LockTile, Tile, Til
 
 
 class TileOverlayRenderer(Renderer):
-    def __init__(self) -> None:
+    TILE_SIZE = 32
+
+    def __init__(self, chunk_size: int = 8) -> None:
+        self.chunk_size = chunk_size
+        # (cx, cy) -> (bounds, mesh), chunks without any collision tile have no entry
+        self._chunks: dict[tuple[int, int], tuple[tuple[float, float, float, float], Mesh]] = {}
+        self.loaded = False
+
         self.shader = ShaderProgram.get("shaders/solid")
         self.u_proj = self.shader.get_uniform("u_proj")
         self.u_model = self.shader.get_uniform("u_model")
@@ -22,7 +30,10 @@ class TileOverlayRenderer(Renderer):
         self.u_z3d = self.shader3d.get_uniform("u_z")
         self.u_spread3d = self.shader3d.get_uniform("u_layer_spread")
 
-    def draw(self, camera: Camera2D, mesh: Mesh) -> None:
+    def draw(self, camera: Camera2D, culling_camera: Camera2D | None = None) -> None:
+        if not self._chunks:
+            return
+
         self.shader.use()
 
         model = glm.mat4x4(1.0)
@@ -30,9 +41,15 @@ class TileOverlayRenderer(Renderer):
         self.u_model.set_mat4x4(glm.value_ptr(model))
         self.u_proj.set_mat4x4(camera.proj_as_numpy())
 
-        mesh.draw_instanced()
+        cull = culling_camera or camera
+        for bounds, mesh in self._chunks.values():
+            if cull.is_visible(*bounds):
+                mesh.draw_instanced()
+
+    def draw_3d(self, camera3d: Camera3D, layer_spread: float) -> None:
+        if not self._chunks:
+            return
 
-    def draw_3d(self, camera3d: Camera3D, layer_spread: float, mesh: Mesh) -> None:
         self.shader3d.use()
 
         model = glm.mat4x4(1.0)
@@ -41,51 +58,109 @@ class TileOverlayRenderer(Renderer):
         self.u_vp3d.set_mat4x4(camera3d.view_proj_as_numpy())
         self.u_spread3d.set_float(layer_spread)
 
-        mesh.draw_instanced()
-
-    def build(self, world: World, tiles: Iterator[Tile], uid: int = 0) -> Mesh | None:
+        for _, mesh in self._chunks.values():
+            mesh.draw_instanced()
+
+    def load(self, world: World, uid: int = 0) -> None:
+        self.delete()
+        self.update(world, {(tile.pos.x // self.chunk_size, tile.pos.y // self.chunk_size) for tile in world.tiles.values()}, uid)
+        self.loaded = True
+
+    def update(self, world: World, chunks: Iterable[tuple[int, int]], uid: int = 0) -> int:
+        """rebuild the given chunks, reusing their instance buffers. returns the number of chunks rebuilt"""
+        count = 0
+        for key in chunks:
+            count += 1
+            data = np.array(self._build_chunk(world, *key, uid), dtype=np.float32)
+            entry = self._chunks.get(key)
+
+            if not data.size:
+                if entry:
+                    entry[1].delete()
+                    del self._chunks[key]
+                continue
+
+            if entry:
+                entry[1].update_instances(data)
+                continue
+
+            cx, cy = key
+            bounds = (
+                cx * self.chunk_size * self.TILE_SIZE - 16,
+                cy * self.chunk_size * self.TILE_SIZE - 16,
+                self.chunk_size * self.TILE_SIZE,
+                self.chunk_size * self.TILE_SIZE,
+            )
+            mesh = Mesh(
+                Mesh.RECT_VERTS,
+                [2],
+                Mesh.RECT_INDICES,
+                usage=GL_DYNAMIC_DRAW,
+                instance_data=data,
+                instance_layout=[4, 3],
+                instance_attrib_base=1,
+            )
+            self._chunks[key] = (bounds, mesh)
+
+        return count
+
+    def _build_chunk(self, world: World, chunk_x: int, chunk_y: int, uid: int) -> list[float]:
         instances: list[float] = []
 
-        for tile in tiles:
-            item = item_database.get(tile.fg_id)
-
-            while True:
-                match item.collision_type:
-                    case ItemInfoCollisionType.FULL:
-                        instances.extend([1.0, 0.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
-                    case ItemInfoCollisionType.JUMP_THROUGH:
-                        instances.extend([0.5, 0.5, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
-                    case ItemInfoCollisionType.GATEWAY:
-                        if tile.lock_index != 0:
-                            lock = world.get_tile(tile.lock_index)
-                            if lock and lock.extra and isinstance(lock.extra, LockTile):
-                                if uid in lock.extra.access_uids:
-                                    instances.extend([0.0, 1.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
-                                    break
-
-                        instances.extend([1.0, 0.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
-                    case ItemInfoCollisionType.COLLIDE_IF_OFF:
-                        if tile.flags & TileFlags.IS_ON != 0:
-                            instances.extend([0.0, 1.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
-                        else:
-                            instances.extend([1.0, 0.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
-                    case ItemInfoCollisionType.COLLIDE_IF_ON:
-                        if tile.flags & TileFlags.IS_ON == 0:
-                            instances.extend([0.0, 1.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
-                        else:
-                            instances.extend([1.0, 0.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
-                    case ItemInfoCollisionType.VIP_DOOR:
-                        if tile and tile.extra and isinstance(tile.extra, VipEntranceTile):
-                            if uid == tile.extra.owner_uid or uid in tile.extra.access_uids:
+        start_x = chunk_x * self.chunk_size
+        start_y = chunk_y * self.chunk_size
+        end_x = min(start_x + self.chunk_size, world.width)
+        end_y = min(start_y + self.chunk_size, world.height)
+
+        for y in range(start_y, end_y):
+            for x in range(start_x, end_x):
+                tile = world.get_tile(x, y)
+                if tile:
+                    self._tile_instances(world, tile, uid, instances)
+
+        return instances
+
+    def _tile_instances(self, world: World, tile: Tile, uid: int, instances: list[float]) -> None:
+        item = item_database.get(tile.fg_id)
+
+        while True:
+            match item.collision_type:
+                case ItemInfoCollisionType.FULL:
+                    instances.extend([1.0, 0.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
+                case ItemInfoCollisionType.JUMP_THROUGH:
+                    instances.extend([0.5, 0.5, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
+                case ItemInfoCollisionType.GATEWAY:
+                    if tile.lock_index != 0:
+                        lock = world.get_tile(tile.lock_index)
+                        if lock and lock.extra and isinstance(lock.extra, LockTile):
+                            if uid in lock.extra.access_uids:
                                 instances.extend([0.0, 1.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
                                 break
 
+                    instances.extend([1.0, 0.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
+                case ItemInfoCollisionType.COLLIDE_IF_OFF:
+                    if tile.flags & TileFlags.IS_ON != 0:
+                        instances.extend([0.0, 1.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
+                    else:
                         instances.extend([1.0, 0.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
-                    case ItemInfoCollisionType.FRIEND_ENTRANCE:
+                case ItemInfoCollisionType.COLLIDE_IF_ON:
+                    if tile.flags & TileFlags.IS_ON == 0:
+                        instances.extend([0.0, 1.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
+                    else:
                         instances.extend([1.0, 0.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
-                break
+                case ItemInfoCollisionType.VIP_DOOR:
+                    if tile and tile.extra and isinstance(tile.extra, VipEntranceTile):
+                        if uid == tile.extra.owner_uid or uid in tile.extra.access_uids:
+                            instances.extend([0.0, 1.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
+                            break
 
-        return Mesh(Mesh.RECT_VERTS, [2], Mesh.RECT_INDICES, instance_data=np.array(instances, dtype=np.float32), instance_layout=[4, 3], instance_attrib_base=1)
+                    instances.extend([1.0, 0.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
+                case ItemInfoCollisionType.FRIEND_ENTRANCE:
+                    instances.extend([1.0, 0.0, 0.0, 0.5, tile.pos.x, tile.pos.y, WORLD_TILE_OVERLAY])
+            break
 
     def delete(self) -> None:
-        pass
+        for _, mesh in self._chunks.values():
+            mesh.delete()
+        self._chunks.clear()
+        self.loaded = False
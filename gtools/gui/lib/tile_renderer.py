@@ -1,21 +1,19 @@
-from collections import defaultdict
 from dataclasses import dataclass, field
 from enum import IntFlag, auto
 import logging
+import threading
+from typing import cast
 from OpenGL.GL import GL_FALSE, GL_TRUE, GL_UNSIGNED_INT, glDepthMask
-import numpy as np
-from pyglm.glm import ivec2
 
 from gtools import setting
-from gtools.baked.items import COPPER_PLUMBING, STEAM_PIPE, STEAM_REVOLVER, STEAM_TUBES
-from gtools.core.color import pack_color
-from gtools.core.growtopia.items_dat import ItemInfoTextureType, ItemInfoVisualEffect, get_tex_stride, item_database
-from gtools.core.growtopia.world import DisplayBlockTile, SeedTile, Tile, TileFlags, VendingMachineTile, World
+from gtools.baked.items import COPPER_PLUMBING, STEAM_PIPE
+from gtools.core.growtopia.world import SeedTile, World
 
 from gtools.gui.camera import Camera2D
 from gtools.gui.camera3d import Camera3D
 from gtools.gui.lib import layer
 from gtools.gui.lib.renderer import Renderer
+from gtools.gui.lib.tile_mesh_builder import LayerInstances, TileMeshBuilder
 from gtools.gui.lib.tree_renderer import TreeMesh, TreeRenderer
 from gtools.gui.opengl import Mesh, ShaderProgram, Uniform
 from gtools.gui.texture import GLTexManager, TextureArray
@@ -33,7 +31,12 @@ class _RenderLayer:
     opacity: float = 1.0
 
 
-_WHITE_TINT = pack_color(0xFFFFFFFF)
+@dataclass(slots=True)
+class ChunkData:
+    key: tuple[int, int]
+    bounds: tuple[float, float, float, float]
+    instances: LayerInstances
+    has_trees: bool
 
 
 class TileRenderer(Renderer):
@@ -73,10 +76,13 @@ class TileRenderer(Renderer):
         self._spread3d = self._shader3d.get_uniform("u_layer_spread")
         self._opacity3d = self._shader3d.get_uniform("u_opacity")
 
-        self._tree_renderer = TreeRenderer()
+        self._tree_renderer = TreeRenderer(owner=self)
         self.tree_mesh: TreeMesh | None = None
         self._chunk_meshes: dict[tuple[int, int], list[tuple[str, TextureArray, Mesh]]] = {}
+        self._tree_chunks: set[tuple[int, int]] = set()
         self.CHUNK_SIZE = 8
+        # the lookup tables are filled lazily, so each worker thread gets its own builder
+        self._builders = threading.local()
 
     def load(self, world: World) -> None:
         self.delete()
@@ -126,10 +132,13 @@ class TileRenderer(Renderer):
             for _, _, mesh in chunk_list:
                 mesh.delete()
         self._chunk_meshes.clear()
+        self._tree_chunks.clear()
 
         for rl in self._layers.values():
             rl.chunks.clear()
 
+        self._tex_mgr.release(self)
+
     def _draw_layers(self, camera: Camera2D | None, tex_uniform: Uniform, layer_uniform: Uniform, opacity: Uniform, culling_camera: Camera2D | None = None) -> None:
         for rl in self._layers.values():
             if not (self.flags & rl.render_flag) or not rl.chunks:
@@ -179,127 +188,43 @@ class TileRenderer(Renderer):
             return
 
         for layer_name, tex_array, mesh in self._chunk_meshes[chunk_key]:
-            rl = self._layers[layer_name]
-            if tex_array in rl.chunks:
-                rl.chunks[tex_array] = [x for x in rl.chunks[tex_array] if x[1] != mesh]
+            self._detach(layer_name, tex_array, mesh)
             mesh.delete()
 
         del self._chunk_meshes[chunk_key]
+        self._tree_chunks.discard(chunk_key)
+
+    def _detach(self, layer_name: str, tex_array: TextureArray, mesh: Mesh) -> None:
+        rl = self._layers[layer_name]
+        if tex_array in rl.chunks:
+            rl.chunks[tex_array] = [x for x in rl.chunks[tex_array] if x[1] != mesh]
 
     def _build_meshes(self, world: World) -> None:
         self.delete()
 
-        chunk_coords = set()
-        for tile in world.tiles.values():
-            chunk_coords.add((tile.pos.x // self.CHUNK_SIZE, tile.pos.y // self.CHUNK_SIZE))
-
-        for cx, cy in chunk_coords:
+        for cx, cy in self.chunk_keys(world):
             self._build_chunk(world, cx, cy)
 
-        trees = [t for t in world.tiles.values() if t.fg_id and t.extra and isinstance(t.extra, SeedTile)]
-        self.tree_mesh = self._tree_renderer.build(trees)
+        self.rebuild_trees(world)
+
+    def chunk_keys(self, world: World) -> set[tuple[int, int]]:
+        return {(tile.pos.x // self.CHUNK_SIZE, tile.pos.y // self.CHUNK_SIZE) for tile in world.tiles.values()}
 
     def _build_chunk(self, world: World, chunk_x: int, chunk_y: int) -> None:
-        # layer -> tex_array -> list[float]
-        instances: dict[str, dict[TextureArray, list[float]]] = {key: defaultdict(list) for key in self._layers}
+        self.upload_chunk(self.build_chunk_data(world, chunk_x, chunk_y))
+
+    def build_chunk_data(self, world: World, chunk_x: int, chunk_y: int) -> ChunkData:
+        """cpu side of a chunk rebuild, safe to call from a worker thread"""
+        builder: TileMeshBuilder | None = getattr(self._builders, "builder", None)
+        if builder is None:
+            builder = self._builders.builder = TileMeshBuilder(lambda file: self._tex_mgr.load_texture(setting.gt_path / "game" / file, owner=self))
 
         start_x = chunk_x * self.CHUNK_SIZE
         start_y = chunk_y * self.CHUNK_SIZE
         end_x = min(start_x + self.CHUNK_SIZE, world.width)
         end_y = min(start_y + self.CHUNK_SIZE, world.height)
 
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                tile = world.get_tile(x, y)
-                if not tile:
-                    continue
-
-                item = item_database.get(tile.fg_id)
-
-                if tile.bg_id:
-                    tex_array, data = self._tile_instance_data(tile, tile.bg_id, tile.bg_tex_index)
-                    instances["bg"][tex_array].extend(data)
-
-                if tile.fg_id:
-                    handled = False
-
-                    if tile.extra:
-                        if isinstance(tile.extra, DisplayBlockTile):
-                            tex_array, data = self._tile_instance_data_raw(
-                                tile,
-                                item.texture_file.decode(),
-                                ivec2(item.tex_coord_x, item.tex_coord_y + 1),
-                            )
-                            instances["fg_before"][tex_array].extend(data)
-
-                        elif isinstance(tile.extra, VendingMachineTile):
-                            tex = 0
-                            if tile.extra.price == 0:
-                                tex = 1
-
-                            tex_array, data = self._tile_instance_data_raw(
-                                tile,
-                                item.texture_file.decode(),
-                                ivec2(item.tex_coord_x + tex, item.tex_coord_y),
-                            )
-                            instances["fg"][tex_array].extend(data)
-
-                            if tile.flags & TileFlags.FG_ALT_MODE:
-                                # has wl inside
-                                tex_array, data = self._tile_instance_data_raw(
-                                    tile,
-                                    item.texture_file.decode(),
-                                    ivec2(item.tex_coord_x + 3, item.tex_coord_y),
-                                )
-                                instances["fg_after"][tex_array].extend(data)
-
-                            if tile.extra.price == 0 or tile.extra.item_id == 0:
-                                # warning sign
-                                tex_array, data = self._tile_instance_data_raw(
-                                    tile,
-                                    item.texture_file.decode(),
-                                    ivec2(item.tex_coord_x + 2, item.tex_coord_y),
-                                )
-                                instances["fg_after"][tex_array].extend(data)
-
-                            handled = True
-                        elif isinstance(tile.extra, SeedTile):
-                            handled = True
-
-                    if item.is_steam():
-                        anchor = item_database.get(STEAM_TUBES)
-                        tex_pos = ivec2(anchor.tex_coord_x + 1, anchor.tex_coord_y)
-                        stride = get_tex_stride(ItemInfoTextureType.SMART_EDGE)
-                        off = ivec2(tile.fg_tex_index % max(stride, 1), tile.fg_tex_index // stride if stride else 0)
-
-                        tex_array, data = self._tile_instance_data_raw(tile, anchor.texture_file.decode(), tex_pos + off)
-                        instances["fg_after"][tex_array].extend(data)
-                    elif tile.fg_id == STEAM_REVOLVER:
-                        tex_array, data = self._tile_instance_data_raw(
-                            tile,
-                            item.texture_file.decode(),
-                            ivec2(item.tex_coord_x, item.tex_coord_y + 1),
-                        )
-                        instances["fg_after"][tex_array].extend(data)
-
-                    if not handled:
-                        tex_array, data = self._tile_instance_data(tile, tile.fg_id, tile.fg_tex_index)
-                        instances["fg"][tex_array].extend(data)
-
-                if tile.flags & TileFlags.ON_FIRE:
-                    stride = get_tex_stride(ItemInfoTextureType.SMART_EDGE)
-                    tex_index = tile.overlay_tex_index
-                    tex_pos = ivec2(tex_index % max(stride, 1), tex_index // stride if stride else 0)
-
-                    tex_array, data = self._tile_instance_data_raw(tile, "fire.rttex", tex_pos)
-                    instances["fire"][tex_array].extend(data)
-                elif tile.flags & TileFlags.IS_WET:
-                    stride = get_tex_stride(ItemInfoTextureType.SMART_EDGE)
-                    tex_index = tile.overlay_tex_index
-                    tex_pos = ivec2(tex_index % max(stride, 1), tex_index // stride if stride else 0)
-
-                    tex_array, data = self._tile_instance_data_raw(tile, "water.rttex", tex_pos)
-                    instances["water"][tex_array].extend(data)
+        tiles = [tile for y in range(start_y, end_y) for x in range(start_x, end_x) if (tile := world.get_tile(x, y))]
 
         bounds = (
             chunk_x * self.CHUNK_SIZE * self.TILE_SIZE - 16,
@@ -308,72 +233,63 @@ class TileRenderer(Renderer):
             self.CHUNK_SIZE * self.TILE_SIZE,
         )
 
-        chunk_key = (chunk_x, chunk_y)
-        self._chunk_meshes[chunk_key] = []
+        return ChunkData(
+            key=(chunk_x, chunk_y),
+            bounds=bounds,
+            instances=builder.build(tiles),
+            has_trees=any(t.fg_id and isinstance(t.extra, SeedTile) for t in tiles),
+        )
+
+    def upload_chunk(self, data: ChunkData) -> bool:
+        """swap a chunk's meshes for `data`, returns whether the tree mesh needs a rebuild.
+
+        meshes that still have a (layer, texture array) slot are refilled in place, so the old
+        contents keep drawing until the new buffer replaces them
+        """
+        old = {(layer_key, tex_array): mesh for layer_key, tex_array, mesh in self._chunk_meshes.pop(data.key, [])}
+        meshes: list[tuple[str, TextureArray, Mesh]] = []
 
-        for layer_key, per_tex in instances.items():
+        for layer_key, per_tex in data.instances.items():
             rl = self._layers[layer_key]
-            for tex_array, inst_list in per_tex.items():
-                if not inst_list:
+            for tex_array, inst in per_tex.items():
+                if not len(inst):
+                    continue
+                tex_array = cast(TextureArray, tex_array)
+                if (mesh := old.pop((layer_key, tex_array), None)) is not None:
+                    mesh.update_instances(inst)
+                    meshes.append((layer_key, tex_array, mesh))
                     continue
+
                 mesh = Mesh(
                     Mesh.RECT_WITH_UV_VERTS,
                     TileRenderer.LAYOUT,
                     Mesh.RECT_INDICES,
-                    instance_data=np.array(inst_list, dtype=np.float32),
+                    instance_data=inst,
                     instance_layout=TileRenderer.INSTANCE_LAYOUT,
                     instance_attrib_base=3,
                 )
                 if tex_array not in rl.chunks:
                     rl.chunks[tex_array] = []
-                rl.chunks[tex_array].append((bounds, mesh))
-                self._chunk_meshes[chunk_key].append((layer_key, tex_array, mesh))
-
-    def _tile_instance_data(self, tile: Tile, item_id: int, tex_index: int) -> tuple[TextureArray, list[float]]:
-        item = item_database.get(item_id)
-        tex = self._tex_mgr.load_texture(setting.gt_path / "game" / item.texture_file.decode())
-        tex_pos, is_flipped = tile.tex_pos(item_id, tex_index)
-
-        u0 = (tex_pos.x * self.TILE_SIZE) / tex.width
-        v0 = (tex_pos.y * self.TILE_SIZE) / tex.height
-        u1 = ((tex_pos.x + 1) * self.TILE_SIZE) / tex.width
-        v1 = ((tex_pos.y + 1) * self.TILE_SIZE) / tex.height
-        if is_flipped:
-            u0, u1 = u1, u0
-
-        tint = _WHITE_TINT
-
-        if item.visual_effect == ItemInfoVisualEffect.DISCOLOR:
-            seed = item_database.get(item_id + 1)
-            tint = pack_color(seed.seed_overlay_color.to_rgba())
-
-        return tex.array, [
-            tile.pos.x * self.TILE_SIZE,
-            tile.pos.y * self.TILE_SIZE,
-            u0,
-            v0,
-            u1,
-            v1,
-            float(tex.layer),
-            float(tile.get_paint_index()),
-            tint,
-        ]
-
-    def _tile_instance_data_raw(self, tile: Tile, texture_file: str, tex_pos: ivec2) -> tuple[TextureArray, list[float]]:
-        tex = self._tex_mgr.load_texture(setting.gt_path / "game" / texture_file)
-        u0 = (tex_pos.x * self.TILE_SIZE) / tex.width
-        v0 = (tex_pos.y * self.TILE_SIZE) / tex.height
-        u1 = ((tex_pos.x + 1) * self.TILE_SIZE) / tex.width
-        v1 = ((tex_pos.y + 1) * self.TILE_SIZE) / tex.height
-
-        return tex.array, [
-            tile.pos.x * self.TILE_SIZE,
-            tile.pos.y * self.TILE_SIZE,
-            u0,
-            v0,
-            u1,
-            v1,
-            float(tex.layer),
-            float(tile.get_paint_index()),
-            _WHITE_TINT,
-        ]
+                rl.chunks[tex_array].append((data.bounds, mesh))
+                meshes.append((layer_key, tex_array, mesh))
+
+        for (layer_key, tex_array), mesh in old.items():
+            self._detach(layer_key, tex_array, mesh)
+            mesh.delete()
+
+        self._chunk_meshes[data.key] = meshes
+
+        trees_changed = data.has_trees or data.key in self._tree_chunks
+        if data.has_trees:
+            self._tree_chunks.add(data.key)
+        else:
+            self._tree_chunks.discard(data.key)
+        return trees_changed
+
+    def rebuild_trees(self, world: World) -> None:
+        if self.tree_mesh:
+            self.tree_mesh.delete()
+            self.tree_mesh = None
+
+        trees = [t for t in world.tiles.values() if t.fg_id and t.extra and isinstance(t.extra, SeedTile)]
+        self.tree_mesh = self._tree_renderer.build(trees)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Hashable
 from OpenGL.raw.GL._types import GL_UNSIGNED_INT
 from pyglm.glm import vec2
 from gtools import setting
@@ -49,8 +50,9 @@ r = cbrt(t/2 + sqrt(t^2/4 + 1000)) + cbrt(t/2 - sqrt(t^2/4 + 1000))
 """
 
 class TreeRenderer(Renderer):
-    def __init__(self) -> None:
+    def __init__(self, owner: Hashable | None = None) -> None:
         self.tex_mgr = GLTexManager()
+        self._owner = owner if owner is not None else self
         self.shader = ShaderProgram.get("shaders/seed")
         self.texture = self.shader.get_uniform("u_texture")
         self.mvp = self.shader.get_uniform("u_mvp")
@@ -62,11 +64,11 @@ class TreeRenderer(Renderer):
         self.spread3d = self.shader3d.get_uniform("u_layer_spread")
         self.tile_size3d = self.shader3d.get_uniform("u_tileSize")
 
-        self._obj_renderer = ObjectRenderer(OBJECT_POST_FOREGROUND_START, OBJECT_POST_FOREGROUND_END)
+        self._obj_renderer = ObjectRenderer(OBJECT_POST_FOREGROUND_START, OBJECT_POST_FOREGROUND_END, owner=self._owner)
         self._obj_mesh: ObjectRenderMesh | None = None
 
     def build(self, tiles: list[Tile]) -> TreeMesh:
-        self.tex = self.tex_mgr.load_texture(setting.gt_path / "game/tiles_page1.rttex")
+        self.tex = self.tex_mgr.load_texture(setting.gt_path / "game/tiles_page1.rttex", owner=self._owner)
 
         data_dtype = np.dtype(
             [
@@ -159,3 +161,4 @@ class TreeRenderer(Renderer):
 
     def delete(self) -> None:
         self._obj_renderer.delete()
+        self.tex_mgr.release(self._owner)
@@ -1,5 +1,5 @@
 from collections import defaultdict, deque
-from functools import cache
+from functools import cache, partial
 import math
 from dataclasses import dataclass
 import threading
@@ -38,8 +38,8 @@ from gtools.core.growtopia.world import (
     DroppedItem,
     HeartOfGaiaTile,
     ItemSuckerTile,
+    LockTile,
     PaintingEaselTile,
-    SeedTile,
     ShelfTile,
     TechnoOrganicEngineTile,
     TesseractManipulatorTile,
@@ -52,11 +52,13 @@ from gtools.core.mixer import AudioMixer
 from gtools.gui.camera import Camera2D
 from gtools.gui.camera3d import Camera3D
 from gtools.gui.lib.layer import OBJECT_PRE_FOREGROUND_END, OBJECT_PRE_FOREGROUND_START, OBJECT_DROPPED_END, OBJECT_POST_FOREGROUND_START, WORLD_POST_FOREGROUND
+from gtools.gui.lib.mesh_pipeline import MeshPipeline
 from gtools.gui.lib.object_renderer import ObjectRenderMesh, ObjectRenderer
 from gtools.gui.lib.tile_overlay_renderer import TileOverlayRenderer
-from gtools.gui.opengl import Framebuffer, Mesh
+from gtools.gui.opengl import Framebuffer
+from gtools.gui.texture import GLTexManager
 from gtools.gui.event import Event, ScrollEvent, MouseButtonEvent, CursorMoveEvent, KeyEvent, TouchEvent
-from gtools.gui.lib.tile_renderer import TileRenderer
+from gtools.gui.lib.tile_renderer import ChunkData, TileRenderer
 from gtools.gui.lib.highlight_renderer import HighlightRenderer
 from gtools.gui.lib.gui_menu_renderer import GuiMenuRenderer
 from gtools.gui.lib.player_renderer import PlayerRenderer
@@ -64,6 +66,9 @@ from gtools.gui.lib.npc_renderer import NpcRenderer
 import gtools.gui.lib.perf_stats as perf_stats
 from gtools.gui.panels.panel import Panel
 
+_OBJ_REBUILD_INTERVAL = 0.1
+_TREE_REBUILD_INTERVAL = 0.5
+
 
 @dataclass(slots=True)
 class ObjectRenderable:
@@ -171,8 +176,6 @@ class WorldRenderer:
         self._player_renderer = PlayerRenderer()
         self._npc_renderer = NpcRenderer()
 
-        self._tile_overlay_renderer = TileOverlayRenderer()
-        self._tile_overlay_mesh: Mesh | None = None
         self._render_tile_overlay = False
 
         self._playing = True
@@ -181,6 +184,7 @@ class WorldRenderer:
         self._seek_last_count = 0
         self._seek_interval = 0.0
         self._hovered_tile: Tile | None = None
+        self._hovered_dropped: list[DroppedItem] = []
 
         self._mode_3d = False
         self._camera3d = Camera3D(800, 600)
@@ -191,7 +195,19 @@ class WorldRenderer:
         self._wireframe = False
 
         self._tile_renderer = TileRenderer()
-        self._tile_renderer.load(self._world)
+        self._tile_overlay_renderer = TileOverlayRenderer(self._tile_renderer.CHUNK_SIZE)
+        # chunks are built in the background and uploaded a few per frame, the world fills in as they land
+        self._mesh_pipeline: MeshPipeline[tuple[int, int], ChunkData] = MeshPipeline(name="tile-mesh")
+        self._uploaded_chunks: set[tuple[int, int]] = set()
+        self._trees_dirty = False
+        self._last_tree_rebuild = 0.0
+        self._last_obj_rebuild = 0.0
+        self._chunk_rebuilds = 0
+        self._chunk_rebuild_ms = 0.0
+        self._overlay_rebuild_ms = 0.0
+        self._obj_rebuild_ms = 0.0
+        self._mesh_pending = 0
+        self._tex_generation = GLTexManager().generation
 
         self._renderer_pre_fg = ObjectRenderer(OBJECT_PRE_FOREGROUND_START, OBJECT_PRE_FOREGROUND_END)
         self._renderer_post_fg = ObjectRenderer(OBJECT_POST_FOREGROUND_START, OBJECT_DROPPED_END)
@@ -232,7 +248,7 @@ class WorldRenderer:
         self._init_render_order()
 
         self._needs_obj_rebuild = False
-        self._tile_updates: set[tuple[int, int]] = set()
+        self._dirty_chunks: set[tuple[int, int]] = self._tile_renderer.chunk_keys(self._world)
         self._tile_update_lock = threading.Lock()
         self._entity_update: bool = False
         self._entity_update_lock = threading.Lock()
@@ -351,6 +367,12 @@ class WorldRenderer:
         else:
             out["render_layer"] = self._render_order.last_overall_times.get("draw_2d", 0)
 
+        out["chunk_rebuild"] = self._chunk_rebuild_ms
+        out["overlay_rebuild"] = self._overlay_rebuild_ms
+        out["obj_rebuild"] = self._obj_rebuild_ms
+        out["chunk_rebuild_count"] = self._chunk_rebuilds
+        out["mesh_queue_count"] = self._mesh_pending
+
     def _build_object_renderable(self) -> list[ObjectRenderable]:
         self.tile_objects = 0
         icons: defaultdict[str, list[DroppedItem]] = defaultdict(list)
@@ -543,13 +565,10 @@ class WorldRenderer:
             lambda camera3d, layer_spread: self._highlight_renderer.draw_playhead_3d(camera3d, self._sheet, self._world.width, layer_spread),
         )
 
-        self._tile_overlay_mesh = None
         self._render_order.add(
             "Tile Overlay",
-            lambda camera, cull: self._render_tile_overlay and self._tile_overlay_mesh and self._tile_overlay_renderer.draw(camera, self._tile_overlay_mesh),
-            lambda camera3d, layer_spread: self._render_tile_overlay
-            and self._tile_overlay_mesh
-            and self._tile_overlay_renderer.draw_3d(camera3d, layer_spread, self._tile_overlay_mesh),
+            lambda camera, cull: self._render_tile_overlay and self._tile_overlay_renderer.draw(camera, culling_camera=cull),
+            lambda camera3d, layer_spread: self._render_tile_overlay and self._tile_overlay_renderer.draw_3d(camera3d, layer_spread),
         )
 
     def _draw_obj_group_shadows_2d(self, camera: Camera2D, tasks: list[ObjectRenderable]) -> None:
@@ -573,18 +592,20 @@ class WorldRenderer:
             task.renderer.draw_3d(camera3d, task.mesh, layer_spread, rotation=task.rotation, pixel_scale=task.pixel_scale, z_offset=task.z_offset)
 
     def _on_tile_update(self, x: int, y: int) -> None:
-        with self._tile_update_lock:
-            self._tile_updates.add((x, y))
-
-        # TODO: also build in chunks
-        self._tile_overlay_mesh = self._tile_overlay_renderer.build(self._world, (x for x in self._world.tiles.values()))
+        self._on_tile_update_batch([(x, y)])
 
     def _on_tile_update_batch(self, tiles: list[tuple[int, int]]) -> None:
-        with self._tile_update_lock:
-            self._tile_updates |= set(tiles)
+        # dirty chunks, so a coalesced burst rebuilds each chunk once on the next frame
+        size = self._tile_renderer.CHUNK_SIZE
+        chunks = {(x // size, y // size) for x, y in tiles}
+
+        # gateways are colored by the access list of their lock, which can live in another chunk
+        locks = {y * self._world.width + x for x, y in tiles if (tile := self._world.get_tile(x, y)) and isinstance(tile.extra, LockTile)}
+        if locks:
+            chunks |= {(t.pos.x // size, t.pos.y // size) for t in self._world.tiles.values() if t.lock_index in locks}
 
-        # TODO: also build in chunks
-        self._tile_overlay_mesh = self._tile_overlay_renderer.build(self._world, (x for x in self._world.tiles.values()))
+        with self._tile_update_lock:
+            self._dirty_chunks |= chunks
 
     def _on_dropped_update(self) -> None:
         self._needs_obj_rebuild = True
@@ -599,6 +620,7 @@ class WorldRenderer:
             self._entity_update = True
 
     def delete(self) -> None:
+        self._mesh_pipeline.shutdown()
         self._world.unsubscribe(WorldEvent.TILE_UPDATE, batch=self._on_tile_update_batch)
         self._world.unsubscribe(WorldEvent.DROPPED_UPDATE, single=self._on_dropped_update)
         self._world.unsubscribe(WorldEvent.PLAYER_UPDATE, single=self._on_player_update)
@@ -622,8 +644,6 @@ class WorldRenderer:
         self._player_renderer.delete()
         self._npc_renderer.delete()
         self._tile_overlay_renderer.delete()
-        if self._tile_overlay_mesh:
-            self._tile_overlay_mesh.delete()
 
     def _render_settings(self) -> None:
         imgui.text("World Settings")
@@ -742,17 +762,22 @@ class WorldRenderer:
     def is_dirty(self) -> bool:
         return self._dirty
 
+    def _load_tile_overlay(self) -> None:
+        start = time.perf_counter()
+        self._tile_overlay_renderer.load(self._world)
+        self._overlay_rebuild_ms += (time.perf_counter() - start) * 1000.0
+
     def rebuild_mesh(self) -> None:
-        self._tile_renderer.load(self._world)
+        # the current meshes keep drawing until their replacements are uploaded
+        with self._tile_update_lock:
+            self._dirty_chunks |= self._tile_renderer.chunk_keys(self._world)
+        self._trees_dirty = True
 
         self._needs_obj_rebuild = True
 
-        if self._tile_overlay_mesh:
-            self._tile_overlay_mesh.delete()
-            self._tile_overlay_mesh = None
-
+        self._tile_overlay_renderer.delete()
         if self._render_tile_overlay:
-            self._tile_overlay_mesh = self._tile_overlay_renderer.build(self._world, (x for x in self._world.tiles.values()))
+            self._load_tile_overlay()
 
         self._dirty = True
 
@@ -864,6 +889,53 @@ class WorldRenderer:
 
         self._world.update_npc(dt)
 
+    def _upload_chunk(self, key: tuple[int, int], data: ChunkData) -> None:
+        if self._tile_renderer.upload_chunk(data):
+            self._trees_dirty = True
+        self._uploaded_chunks.add(key)
+
+    def _process_mesh_updates(self) -> None:
+        with self._tile_update_lock:
+            dirty, self._dirty_chunks = self._dirty_chunks, set()
+
+        for key in dirty:
+            self._mesh_pipeline.submit(key, partial(self._tile_renderer.build_chunk_data, self._world, *key))
+
+        start = time.perf_counter()
+        self._chunk_rebuilds = self._mesh_pipeline.drain(self._upload_chunk, setting.mesh_upload_budget_ms)
+        self._chunk_rebuild_ms = (time.perf_counter() - start) * 1000.0
+        self._overlay_rebuild_ms = 0.0
+        self._obj_rebuild_ms = 0.0
+
+        if self._uploaded_chunks:
+            if self._render_tile_overlay and self._tile_overlay_renderer.loaded:
+                start = time.perf_counter()
+                self._tile_overlay_renderer.update(self._world, self._uploaded_chunks)
+                self._overlay_rebuild_ms = (time.perf_counter() - start) * 1000.0
+            else:
+                # stale now, loaded again when the overlay is shown
+                self._tile_overlay_renderer.delete()
+
+            self._uploaded_chunks.clear()
+            self._dirty = True
+
+        # trees span the whole world, wait for the queue to settle instead of rebuilding per upload
+        busy = self._mesh_pipeline.busy
+        if self._trees_dirty and (not busy or time.monotonic() - self._last_tree_rebuild >= _TREE_REBUILD_INTERVAL):
+            self._tile_renderer.rebuild_trees(self._world)
+            self._last_tree_rebuild = time.monotonic()
+            self._trees_dirty = False
+            self._dirty = True
+
+        self._mesh_pending = self._mesh_pipeline.pending
+        if busy:
+            self._dirty = True
+
+        # textures finished uploading since the last frame, the cached frame still shows empty layers
+        if (generation := GLTexManager().generation) != self._tex_generation:
+            self._tex_generation = generation
+            self._dirty = True
+
     def center(self) -> None:
         if self._mode_3d:
             self._camera3d.fit_to_rect(0, 0, self._world.width * 32, self._world.height * 32)
@@ -883,25 +955,11 @@ class WorldRenderer:
         if self._show_settings:
             main_w = total_w - self._settings_width - spacing
 
-        with self._tile_update_lock:
-            if self._tile_updates:
-                affected_chunks = set()
-                for x, y in self._tile_updates:
-                    affected_chunks.add((x // self._tile_renderer.CHUNK_SIZE, y // self._tile_renderer.CHUNK_SIZE))
-
-                for cx, cy in affected_chunks:
-                    self._tile_renderer.delete_chunk((cx, cy))
-                    self._tile_renderer._build_chunk(self._world, cx, cy)
-
-                trees = [t for t in self._world.tiles.values() if t.fg_id and t.extra and isinstance(t.extra, SeedTile)]
-                if self._tile_renderer.tree_mesh:
-                    self._tile_renderer.tree_mesh.delete()
+        self._chunk_rebuilds = 0
+        self._chunk_rebuild_ms = 0.0
+        self._overlay_rebuild_ms = 0.0
 
-                self._tile_renderer.tree_mesh = self._tile_renderer._tree_renderer.build(trees)
-                self._tile_renderer._tex_mgr.flush()
-
-                self._tile_updates.clear()
-                self._dirty = True
+        self._process_mesh_updates()
 
         with self._entity_update_lock:
             if self._entity_update:
@@ -922,11 +980,17 @@ class WorldRenderer:
                 self._dirty = True
 
             if self._needs_obj_rebuild:
-                self._init_render_order()
-                self._needs_obj_rebuild = False
+                # dropped item storms fire every packet, rebuilding at a fixed rate keeps the frame time flat
+                if time.monotonic() - self._last_obj_rebuild >= _OBJ_REBUILD_INTERVAL:
+                    start = time.perf_counter()
+                    self._init_render_order()
+                    self._obj_rebuild_ms = (time.perf_counter() - start) * 1000.0
+                    self._last_obj_rebuild = time.monotonic()
+                    self._needs_obj_rebuild = False
+                self._dirty = True
 
-            if self._render_tile_overlay and (self._tile_overlay_mesh is None or self._dirty):
-                self._tile_overlay_mesh = self._tile_overlay_renderer.build(self._world, (x for x in self._world.tiles.values()))
+            if self._render_tile_overlay and not self._tile_overlay_renderer.loaded:
+                self._load_tile_overlay()
 
             self._update_hover()
 
@@ -950,6 +1014,8 @@ class WorldRenderer:
 
                     imgui.text(f"FG: {fg_item.name.decode()} ({fg_item.id})")
                     imgui.text(f"BG: {bg_item.name.decode()} ({bg_item.id})")
+                    for dropped in self._hovered_dropped:
+                        imgui.text(f"Dropped: {item_database.get(dropped.id).name.decode()} x{dropped.amount} (uid {dropped.uid})")
 
                     imgui.separator()
                     if imgui.begin_menu("Copy"):
@@ -1236,7 +1302,11 @@ class WorldRenderer:
         imgui.text(f"Display: {int(vw)}x{int(vh)}")
 
         imgui.spacing()
-        imgui.text(f"Textures: {self._tile_renderer.texture_count}")
+        tex_stats = GLTexManager().stats
+        imgui.text(f"Textures: {self._tile_renderer.texture_count} ({tex_stats.resident} resident, {tex_stats.pending} pending)")
+        imgui.text(f"Texture VRAM: {tex_stats.bytes / (1024 * 1024):.1f}MB in {tex_stats.layers} layers")
+        lookups = tex_stats.hits + tex_stats.misses
+        imgui.text(f"Texture Hits: {tex_stats.hits}/{lookups} ({tex_stats.hits / lookups if lookups else 0:.0%}), {tex_stats.evictions} evicted")
         imgui.text(f"Objects: {len(self._world.dropped.items)}")
         imgui.text(f"Tile Objects: {self.tile_objects}")
         imgui.end_group()
@@ -1685,6 +1755,7 @@ class WorldRenderer:
         if not self._hovered:
             if self._hovered_tile is not None:
                 self._hovered_tile = None
+                self._hovered_dropped = []
                 self._dirty = True
             return
 
@@ -1703,8 +1774,10 @@ class WorldRenderer:
 
         if 0 <= tile_x < self._world.width and 0 <= tile_y < self._world.height:
             self._hovered_tile = self._world.get_tile(tile_x, tile_y)
+            self._hovered_dropped = self._world.dropped_index.at(tile_x, tile_y)
         else:
             self._hovered_tile = None
+            self._hovered_dropped = []
 
         if self._hovered_tile != old_hovered_tile:
             self._dirty = True
@@ -357,8 +357,11 @@ class Mesh:
         vertex_stride = self._setup_attribs(layout, 0)
         self._vertex_count = int(vertices.nbytes // vertex_stride)
 
+        self._usage = usage
         self._instance_vbo = None
         self._instance_count = 0
+        self._instance_stride = 0
+        self._instance_capacity = 0
         if instance_data is not None and instance_layout is not None:
             if instance_attrib_base is None:
                 raise ValueError("please supply instance_attrib_base (where the instance data begins)")
@@ -367,8 +370,9 @@ class Mesh:
             glBindBuffer(GL_ARRAY_BUFFER, self._instance_vbo)
             glBufferData(GL_ARRAY_BUFFER, instance_data.nbytes, instance_data.tobytes(), usage)
 
-            instance_stride = self._setup_attribs(instance_layout, instance_attrib_base, is_instance=True)
-            self._instance_count = int(instance_data.nbytes // instance_stride)
+            self._instance_stride = self._setup_attribs(instance_layout, instance_attrib_base, is_instance=True)
+            self._instance_count = int(instance_data.nbytes // self._instance_stride)
+            self._instance_capacity = instance_data.nbytes
 
         glBindVertexArray(0)
         glBindBuffer(GL_ARRAY_BUFFER, 0)
@@ -392,6 +396,27 @@ class Mesh:
             glDrawArraysInstanced(mode, 0, self._vertex_count, self._instance_count)
         glBindVertexArray(0)
 
+    @property
+    def instance_count(self) -> int:
+        return self._instance_count
+
+    def update_instances(self, instance_data: npt.NDArray) -> None:
+        """replace the instance data, keeps the buffer size unless it has to grow"""
+        if self._instance_vbo is None:
+            raise ValueError("mesh has no instance buffer")
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._instance_vbo)
+        if instance_data.nbytes > self._instance_capacity:
+            # grow with headroom so a chunk that keeps gaining tiles doesn't reallocate every time
+            self._instance_capacity = max(instance_data.nbytes, self._instance_capacity * 2)
+        # orphan the old storage, draws still reading it keep their copy and the write doesn't wait on them
+        glBufferData(GL_ARRAY_BUFFER, self._instance_capacity, None, self._usage)
+        if instance_data.nbytes:
+            glBufferSubData(GL_ARRAY_BUFFER, 0, instance_data.nbytes, instance_data.tobytes())
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        self._instance_count = int(instance_data.nbytes // self._instance_stride)
+
     def delete(self) -> None:
         glDeleteBuffers(1, [self._vbo])
         glDeleteVertexArrays(1, [self._vao])
@@ -5,6 +5,7 @@ from collections.abc import Iterable
 
 from imgui_bundle import ImVec2, imgui
 
+from gtools import setting
 import gtools.gui.lib.perf_stats as perf_stats
 from gtools.gui.lib.perf_stats import PerfStats
 from gtools.gui.panels.panel import Panel
@@ -45,6 +46,7 @@ def _draw_time_graph(
     label: str,
     t_good: float | None = None,
     t_warn: float | None = None,
+    unit: str = "ms",
 ) -> None:
     avg_val = sum(times_list) / len(times_list)
     max_val = max(times_list)
@@ -91,7 +93,7 @@ def _draw_time_graph(
     draw_list.add_text(
         ImVec2(gx + 4, gy + 4),
         imgui.get_color_u32((1.0, 1.0, 1.0, 0.85)),
-        f"{label}  avg {avg_val:.2f}ms  max {max_val:.2f}ms",
+        f"{label}  avg {avg_val:.2f}{unit}  max {max_val:.2f}{unit}",
     )
     draw_list.add_rect(
         ImVec2(gx, gy),
@@ -156,4 +158,8 @@ class PerfOverlayPanel(Panel):
             gx = graphs_x0 + col * (graph_w + graph_gap)
             gy = graphs_y0 + row * (graph_h + graph_gap)
 
-            _draw_time_graph(draw_list, gx, gy, graph_w, graph_h, tlist, _maxlen, glabel, None, None)
+            # uploads are held to a per-frame budget, color against that instead of the frame rate
+            budget = {"chunk_rebuild": setting.mesh_upload_budget_ms, "tex_upload": setting.texture_upload_budget_ms}.get(glabel)
+            t_good, t_warn = (budget, budget * 2) if budget is not None else (None, None)
+            # *_count stats are plain counters (chunks rebuilt per frame etc.), not timings
+            _draw_time_graph(draw_list, gx, gy, graph_w, graph_h, tlist, _maxlen, glabel, t_good, t_warn, "" if glabel.endswith("_count") else "ms")
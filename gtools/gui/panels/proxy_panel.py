@@ -224,10 +224,10 @@ class ProxyPanel(Panel):
         if Panel.dev_mode:
             if self.proxy:
                 if imgui.button("set proc"):
-                    self.proxy._worker_should_process.set()
+                    self.proxy.set_processing(True)
                 imgui.same_line()
                 if imgui.button("clear proc"):
-                    self.proxy._worker_should_process.clear()
+                    self.proxy.set_processing(False)
 
         origin_x, origin_y = imgui.get_cursor_screen_pos()
         avail_w, avail_h = imgui.get_content_region_avail()
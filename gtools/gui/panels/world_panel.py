@@ -4,7 +4,6 @@ from pathlib import Path
 
 from imgui_bundle import imgui
 
-from gtools.core.growtopia.packet import NetPacket
 from gtools.core.growtopia.world import World
 from gtools.gui.event import Event
 from gtools.gui.lib.world_renderer import WorldRenderer
@@ -28,10 +27,7 @@ class WorldPanel(Panel):
 
     @classmethod
     def load(cls, file: Path | str, dock_id: int) -> "WorldPanel":
-        pkt = NetPacket.deserialize(Path(file).read_bytes())
-        world = World.from_tank(pkt.tank)
-
-        return cls(world, dock_id)
+        return cls(World.load(file), dock_id)
 
     def delete(self) -> None:
         logger.info(f"deleting panel {self._name}")
@@ -0,0 +1,184 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import logging
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger("gui-residency")
+
+_PAGE_BYTES = 32 * 1024 * 1024
+_MAX_PAGE_LAYERS = 16
+
+
+@dataclass(slots=True)
+class ResidencyStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    uploads: int = 0
+    resident: int = 0
+    layers: int = 0
+    bytes: int = 0
+    pending: int = 0
+
+
+@dataclass(slots=True, eq=False)
+class Page:
+    size: tuple[int, int]
+    capacity: int
+    free: list[int]
+    handle: Any = None
+
+    @property
+    def bytes(self) -> int:
+        return self.size[0] * self.size[1] * 4 * self.capacity
+
+
+@dataclass(slots=True, eq=False)
+class Slot:
+    key: str
+    page: Page
+    layer: int
+    owners: set[Hashable] = field(default_factory=set)
+    pinned: bool = False
+
+    @property
+    def referenced(self) -> bool:
+        return self.pinned or bool(self.owners)
+
+
+class LayerResidency:
+    """layer bookkeeping for texture arrays, GL free.
+
+    textures of one size share fixed-capacity pages, a page never grows. when no layer is free the
+    least recently released texture nobody references is evicted, a new page is only added after that.
+    `owner=None` pins a texture for the lifetime of the process, like before residency existed
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int,
+        new_page: Callable[[tuple[int, int], int], Any] = lambda size, capacity: None,
+        free_page: Callable[[Any], None] = lambda handle: None,
+    ) -> None:
+        self.budget_bytes = budget_bytes
+        self._new_page = new_page
+        self._free_page = free_page
+
+        self._pages: dict[tuple[int, int], list[Page]] = {}
+        self._slots: dict[str, Slot] = {}
+        self._owned: dict[Hashable, set[str]] = {}
+        # unreferenced resident textures, least recently released first
+        self._lru: OrderedDict[str, Slot] = OrderedDict()
+        self.stats = ResidencyStats()
+
+    @staticmethod
+    def page_capacity(size: tuple[int, int]) -> int:
+        return max(1, min(_MAX_PAGE_LAYERS, _PAGE_BYTES // (size[0] * size[1] * 4)))
+
+    @property
+    def allocated_bytes(self) -> int:
+        return sum(page.bytes for pages in self._pages.values() for page in pages)
+
+    def get(self, key: str) -> Slot | None:
+        return self._slots.get(key)
+
+    def acquire(self, key: str, size: tuple[int, int], owner: Hashable | None = None) -> tuple[Slot, bool]:
+        """returns the slot for `key` and whether it was just placed and still needs its pixels"""
+        slot = self._slots.get(key)
+        miss = slot is None
+        if slot is None:
+            self.stats.misses += 1
+            page, layer = self._place(size)
+            slot = self._slots[key] = Slot(key, page, layer)
+        else:
+            self.stats.hits += 1
+            self._lru.pop(key, None)
+
+        if owner is None:
+            slot.pinned = True
+        else:
+            slot.owners.add(owner)
+            self._owned.setdefault(owner, set()).add(key)
+
+        self._update_stats()
+        return slot, miss
+
+    def release(self, owner: Hashable) -> None:
+        for key in self._owned.pop(owner, ()):
+            slot = self._slots.get(key)
+            if slot is None:
+                continue
+            slot.owners.discard(owner)
+            if not slot.referenced:
+                self._lru[key] = slot
+
+        self.trim()
+
+    def drop(self, key: str) -> None:
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+        self._lru.pop(key, None)
+        for owner in slot.owners:
+            self._owned.get(owner, set()).discard(key)
+        slot.page.free.append(slot.layer)
+        self._maybe_free_page(slot.page)
+        self._update_stats()
+
+    def trim(self) -> None:
+        """evict unreferenced textures while over budget, pages that end up empty are freed"""
+        while self._lru and self.allocated_bytes > self.budget_bytes:
+            _, slot = self._lru.popitem(last=False)
+            self._evict(slot)
+        self._update_stats()
+
+    def clear(self) -> None:
+        for pages in self._pages.values():
+            for page in pages:
+                self._free_page(page.handle)
+        self._pages.clear()
+        self._slots.clear()
+        self._owned.clear()
+        self._lru.clear()
+        self._update_stats()
+
+    def _place(self, size: tuple[int, int]) -> tuple[Page, int]:
+        pages = self._pages.setdefault(size, [])
+        for page in pages:
+            if page.free:
+                return page, page.free.pop()
+
+        capacity = self.page_capacity(size)
+        page_bytes = size[0] * size[1] * 4 * capacity
+        if self.allocated_bytes + page_bytes > self.budget_bytes:
+            for key, slot in self._lru.items():
+                if slot.page.size == size:
+                    del self._lru[key]
+                    self._evict(slot, keep_page=True)
+                    return slot.page, slot.page.free.pop()
+
+        if self.allocated_bytes + page_bytes > self.budget_bytes:
+            logger.warning(f"texture budget exceeded, adding a {size[0]}x{size[1]} page with every resident texture in use")
+
+        page = Page(size, capacity, list(range(capacity - 1, -1, -1)))
+        page.handle = self._new_page(size, capacity)
+        pages.append(page)
+        return page, page.free.pop()
+
+    def _evict(self, slot: Slot, keep_page: bool = False) -> None:
+        self.stats.evictions += 1
+        del self._slots[slot.key]
+        slot.page.free.append(slot.layer)
+        if not keep_page:
+            self._maybe_free_page(slot.page)
+
+    def _maybe_free_page(self, page: Page) -> None:
+        if len(page.free) != page.capacity or self.allocated_bytes <= self.budget_bytes:
+            return
+        self._pages[page.size].remove(page)
+        self._free_page(page.handle)
+
+    def _update_stats(self) -> None:
+        self.stats.resident = len(self._slots)
+        self.stats.layers = sum(page.capacity for pages in self._pages.values() for page in pages)
+        self.stats.bytes = self.allocated_bytes
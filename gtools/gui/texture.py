@@ -1,5 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from pathlib import Path
+import queue
+import threading
+import time
+from typing import Hashable
 from OpenGL.GL import (
     GL_CLAMP_TO_EDGE,
     GL_NEAREST,
@@ -17,20 +22,26 @@ from OpenGL.GL import (
     glBindTexture,
     glDeleteTextures,
     glGenTextures,
-    glIsTexture,
     glPixelStorei,
     glTexImage3D,
     glTexParameteri,
     glTexSubImage3D,
 )
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+import numpy as np
+import numpy.typing as npt
+
+from gtools import setting
 from gtools.core.growtopia.rttex import RTTex
+from gtools.gui.residency import LayerResidency, ResidencyStats
 
 logger = logging.getLogger("gui-textures")
 
 _DEFAULT_TEXTURE_KEY = "<__default_texture__>"
 _DEFAULT_PIXEL_CACHE: dict[tuple[int, int], bytes] = {}
 _DEFAULT_FALLBACK_SIZE = (1024, 1024)
+# decoded textures waiting for upload, decoders block once it is full
+_STAGING_SLOTS = 16
 
 
 def _make_default_pixels(width: int, height: int):
@@ -76,17 +87,17 @@ class GLTex:
 
 
 class TextureArray:
-    def __init__(self, width: int, height: int) -> None:
+    """one fixed-capacity page of same sized textures, layers are handed out by `LayerResidency`"""
+
+    def __init__(self, width: int, height: int, capacity: int) -> None:
         self.width = width
         self.height = height
-        self.tex_id = int(glGenTextures(1))
-
-        self._resident: list[GLTex] = []
-        self._staging: list[GLTex] = []
-
-        self._allocated_layers = 0
+        self.capacity = capacity
+        # generated on the first upload, pages can be created off the GL thread by mesh workers
+        self.tex_id = 0
 
-    def _allocate(self, total_layers: int) -> None:
+    def _allocate(self) -> None:
+        self.tex_id = int(glGenTextures(1))
         glBindTexture(GL_TEXTURE_2D_ARRAY, self.tex_id)
 
         glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
@@ -101,94 +112,35 @@ class TextureArray:
             GL_RGBA8,
             self.width,
             self.height,
-            total_layers,
+            self.capacity,
             0,
             GL_RGBA,
             GL_UNSIGNED_BYTE,
             None,
         )
 
-        self._allocated_layers = total_layers
+        logger.debug(f"allocated TextureArray {self.width}x{self.height} with {self.capacity} layers (tex_id={self.tex_id})")
         glBindTexture(GL_TEXTURE_2D_ARRAY, 0)
 
-    def stage(self, key: str) -> GLTex:
-        layer = len(self._resident) + len(self._staging)
-        tex = GLTex(key, self.width, self.height, layer, self)
-        self._staging.append(tex)
-        return tex
-
-    def flush(self) -> None:
-        if not self._staging:
-            return
-
-        total_layers = len(self._resident) + len(self._staging)
-
-        if total_layers > self._allocated_layers:
-            new_capacity = max(
-                4,
-                self._allocated_layers * 2 if self._allocated_layers else 4,
-                total_layers,
-            )
-
-            logger.debug(f"growing TextureArray {self.width}x{self.height} from {self._allocated_layers} to {new_capacity} layers (used: {total_layers})")
-
-            from OpenGL.GL import glCopyImageSubData
-
-            new_tex_id = int(glGenTextures(1))
-            old_tex_id = self.tex_id
-            old_allocated = self._allocated_layers
-
-            self.tex_id = new_tex_id
-            self._allocate(new_capacity)
-
-            if old_tex_id != 0 and old_allocated > 0:
-                glCopyImageSubData(
-                    old_tex_id,
-                    GL_TEXTURE_2D_ARRAY,
-                    0,
-                    0,
-                    0,
-                    0,
-                    new_tex_id,
-                    GL_TEXTURE_2D_ARRAY,
-                    0,
-                    0,
-                    0,
-                    0,
-                    self.width,
-                    self.height,
-                    old_allocated,
-                )
-                glDeleteTextures(1, [old_tex_id])
+    def upload(self, layer: int, pixels: bytes | npt.NDArray[np.uint8]) -> None:
+        if not self.tex_id:
+            self._allocate()
 
         glBindTexture(GL_TEXTURE_2D_ARRAY, self.tex_id)
-
-        for tex in self._staging:
-            try:
-                data = RTTex.from_file(tex.key)
-                mip = data.get_mip(0)
-                pixels = mip.pixels
-            except Exception:
-                logger.warning("failed to read staged texture '%s', fallback to default texture", tex.key)
-                pixels = _get_default_pixels(self.width, self.height)
-
-            glTexSubImage3D(
-                GL_TEXTURE_2D_ARRAY,
-                0,
-                0,
-                0,
-                tex.layer,
-                self.width,
-                self.height,
-                1,
-                GL_RGBA,
-                GL_UNSIGNED_BYTE,
-                pixels,
-            )
-
-        self._resident.extend(self._staging)
-        self._staging.clear()
-
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexSubImage3D(
+            GL_TEXTURE_2D_ARRAY,
+            0,
+            0,
+            0,
+            layer,
+            self.width,
+            self.height,
+            1,
+            GL_RGBA,
+            GL_UNSIGNED_BYTE,
+            pixels,
+        )
         glBindTexture(GL_TEXTURE_2D_ARRAY, 0)
 
     def bind(self, unit: int = 0) -> None:
@@ -197,15 +149,27 @@ class TextureArray:
 
     def delete(self) -> None:
         try:
-            glDeleteTextures(1, [self.tex_id])
+            if self.tex_id:
+                glDeleteTextures(1, [self.tex_id])
         except Exception:
             pass
-        self._resident.clear()
-        self._staging.clear()
-        self._allocated_layers = 0
+        self.tex_id = 0
+
+
+def _decode(key: str, width: int, height: int) -> bytes | npt.NDArray[np.uint8]:
+    try:
+        return RTTex.from_file(key).get_mip(0).pixels
+    except Exception:
+        logger.warning("failed to read texture '%s', fallback to default texture", key)
+        return _get_default_pixels(width, height)
 
 
 class GLTexManager:
+    """texture residency, owners acquire textures through `load_texture` and give them back with `release`.
+
+    rttex files are decoded on a small thread pool, `flush` uploads whatever has been decoded so far
+    """
+
     _instance: "GLTexManager | None" = None
 
     def __new__(cls) -> "GLTexManager":
@@ -218,157 +182,198 @@ class GLTexManager:
         if self._initialized:
             return
         self._textures: dict[str, GLTex] = {}
-        self._arrays: dict[tuple[int, int], TextureArray] = {}
+        self._residency = LayerResidency(
+            setting.texture_vram_budget_mb * 1024 * 1024,
+            new_page=lambda size, capacity: TextureArray(size[0], size[1], capacity),
+            free_page=lambda array: array.delete(),
+        )
         self._default_array: TextureArray | None = None
         self._default_tex: GLTex | None = None
+        self._default_pending = False
+
+        self._decoder = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rttex-decode")
+        self._staging: queue.Queue[tuple[GLTex, int, bytes | npt.NDArray[np.uint8]]] = queue.Queue(maxsize=_STAGING_SLOTS)
+        self._decoding = 0
+        # bumped by delete_all, decodes started before it are thrown away
+        self._epoch = 0
+        # bumped whenever pixels land, renderers that cache a frame redraw when it changes
+        self.generation = 0
+
+        # load_texture runs on mesh workers too, only flush and deletion touch GL
+        self._lock = threading.RLock()
         self._initialized = True
 
     @property
     def texture_count(self) -> int:
         return len(self._textures)
 
-    def _get_or_create_array(self, width: int, height: int) -> TextureArray:
-        key = (width, height)
-
-        if key not in self._arrays:
-            self._arrays[key] = TextureArray(width, height)
+    @property
+    def pending(self) -> int:
+        """textures decoding or decoded but not uploaded yet"""
+        return self._decoding + self._staging.qsize()
 
-        return self._arrays[key]
+    @property
+    def stats(self) -> ResidencyStats:
+        with self._lock:
+            return replace(self._residency.stats, pending=self.pending)
 
     def _ensure_default_texture(self) -> GLTex:
-        if self._default_tex is not None:
-            return self._default_tex
+        with self._lock:
+            if self._default_tex is not None:
+                return self._default_tex
 
-        dw, dh = _DEFAULT_FALLBACK_SIZE
-        self._default_array = TextureArray(dw, dh)
-
-        default_tex = self._default_array.stage(_DEFAULT_TEXTURE_KEY)
-        self._textures[_DEFAULT_TEXTURE_KEY] = default_tex
+            dw, dh = _DEFAULT_FALLBACK_SIZE
+            self._default_array = TextureArray(dw, dh, 1)
+            self._default_tex = GLTex(_DEFAULT_TEXTURE_KEY, dw, dh, 0, self._default_array)
+            self._textures[_DEFAULT_TEXTURE_KEY] = self._default_tex
+            self._default_pending = True
 
-        self._default_array._allocate(1)
-        glBindTexture(GL_TEXTURE_2D_ARRAY, self._default_array.tex_id)
-        pixels = _get_default_pixels(dw, dh)
-        glTexSubImage3D(
-            GL_TEXTURE_2D_ARRAY,
-            0,
-            0,
-            0,
-            default_tex.layer,
-            dw,
-            dh,
-            1,
-            GL_RGBA,
-            GL_UNSIGNED_BYTE,
-            pixels,
-        )
-        glBindTexture(GL_TEXTURE_2D_ARRAY, 0)
+            return self._default_tex
 
-        self._default_tex = self._textures[_DEFAULT_TEXTURE_KEY]
-        return self._default_tex
+    def load_texture(self, file: str | Path, owner: Hashable | None = None) -> GLTex:
+        """the returned layer is reserved right away, its pixels arrive with a later `flush`.
 
-    def load_texture(self, file: str | Path) -> GLTex:
+        `owner` holds a reference until `release(owner)`, without one the texture is never evicted
+        """
         key = str(file)
 
-        if key in self._textures:
-            return self._textures[key]
+        with self._lock:
+            tex = self._textures.get(key)
+            if tex is not None:
+                if tex is not self._default_tex:
+                    self._residency.acquire(key, (tex.width, tex.height), owner)
+                return tex
 
+            try:
+                header = RTTex.header_from_file(key)
+            except Exception:
+                logger.warning("failed to read header for '%s', fallback to default texture", key)
+                default = self._ensure_default_texture()
+                self._textures[key] = default
+                return default
+
+            slot, _ = self._residency.acquire(key, (header.width, header.height), owner)
+            tex = GLTex(key, header.width, header.height, slot.layer, slot.page.handle)
+            self._textures[key] = tex
+            # placing it may have evicted something
+            self._drop_evicted()
+
+            self._decoding += 1
+            self._decoder.submit(self._decode_job, tex, self._epoch)
+
+            return tex
+
+    def release(self, owner: Hashable) -> None:
+        """drop every reference `owner` holds, unreferenced textures stay resident until their layer is needed"""
+        with self._lock:
+            self._residency.release(owner)
+            self._drop_evicted()
+
+    def _drop_evicted(self) -> None:
+        for key in [k for k, tex in self._textures.items() if tex is not self._default_tex and self._residency.get(k) is None]:
+            del self._textures[key]
+
+    def _decode_job(self, tex: GLTex, epoch: int) -> None:
+        pixels = None
         try:
-            header = RTTex.header_from_file(key)
-        except Exception:
-            logger.warning("failed to read header for '%s', fallback to default texture", key)
-            default = self._ensure_default_texture()
-            self._textures[key] = default
-            return default
-
-        array = self._get_or_create_array(header.width, header.height)
-
-        tex = array.stage(key)
-        self._textures[key] = tex
-
-        return tex
-
-    def flush(self) -> None:
-        for array in self._arrays.values():
-            array.flush()
+            # skip textures evicted before their turn came
+            if epoch == self._epoch and self._textures.get(tex.key) is tex:
+                pixels = _decode(tex.key, tex.width, tex.height)
+        finally:
+            while pixels is not None and epoch == self._epoch:
+                try:
+                    self._staging.put((tex, epoch, pixels), timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            with self._lock:
+                self._decoding -= 1
+
+    def flush(self, budget_ms: float | None = None, wait: bool = False) -> int:
+        """upload decoded textures until `budget_ms` is spent (always at least one), `wait` also waits for in flight decodes"""
+        with self._lock:
+            if self._default_pending:
+                self._upload_default_texture()
+
+        start = time.perf_counter()
+        count = 0
+        while True:
+            if budget_ms is not None and count and (time.perf_counter() - start) * 1000.0 >= budget_ms:
+                break
+            try:
+                tex, epoch, pixels = self._staging.get(timeout=0.01) if wait and self.pending else self._staging.get_nowait()
+            except queue.Empty:
+                if wait and self.pending:
+                    continue
+                break
+
+            with self._lock:
+                # evicted or reloaded while it was decoding, the layer may belong to something else now
+                if epoch != self._epoch or self._textures.get(tex.key) is not tex:
+                    continue
+                tex.array.upload(tex.layer, pixels)
+                self._residency.stats.uploads += 1
+            count += 1
+
+        if count:
+            self.generation += 1
+        return count
+
+    def _upload_default_texture(self) -> None:
+        assert self._default_array is not None
+        dw, dh = _DEFAULT_FALLBACK_SIZE
+        self._default_array.upload(0, _get_default_pixels(dw, dh))
+        self._default_pending = False
+        self.generation += 1
 
     def bind(self, tex: GLTex, unit: int = 0) -> None:
         tex.array.bind(unit)
 
     def delete_texture(self, key: str) -> None:
-        if key not in self._textures:
-            logger.debug(f"delete texture '{key}' not found, skipping")
-            return
-
-        tex = self._textures.pop(key)
-        array = tex.array
-
-        if tex.key == _DEFAULT_TEXTURE_KEY or (self._default_tex and tex is self._default_tex):
-            return
+        with self._lock:
+            if key not in self._textures:
+                logger.debug(f"delete texture '{key}' not found, skipping")
+                return
 
-        if self._default_array is not None and array is self._default_array:
-            logger.debug(f"texture '{key}' belongs to the default array, skipping deletion")
-            return
-
-        logger.debug(f"deleting texture '{key}' (layer={tex.layer}, array={array.width}x{array.height})")
-
-        keys_referencing = [k for k, t in self._textures.items() if t.array is array]
-        for k in keys_referencing:
-            logger.debug(f"evicting co-resident texture '{k}' from array {array.width}x{array.height}")
-            self._textures.pop(k, None)
+            tex = self._textures.pop(key)
+            if tex is self._default_tex:
+                return
 
-        if len(keys_referencing) <= 1:
-            logger.debug(f"delete_texture: destroying TextureArray {array.width}x{array.height} (tex_id={array.tex_id})")
-            array.delete()
-            self._arrays.pop((array.width, array.height), None)
+            logger.debug(f"deleting texture '{key}' (layer={tex.layer}, array={tex.array.width}x{tex.array.height})")
+            self._residency.drop(key)
 
     def delete_all(self) -> None:
-        texture_count = len(self._textures)
-        array_count = len(self._arrays)
-        logger.debug(f"releasing {texture_count} texture(s) across {array_count} array(s)")
+        with self._lock:
+            logger.debug(f"releasing {len(self._textures)} texture(s), {self._residency.stats.bytes / (1024 * 1024):.1f}MB")
+            self._epoch += 1
+            while True:
+                try:
+                    self._staging.get_nowait()
+                except queue.Empty:
+                    break
+
+            self._residency.clear()
+            self._textures.clear()
+
+            if self._default_array:
+                logger.debug(f"destroying default TextureArray (tex_id={self._default_array.tex_id})")
+                try:
+                    self._default_array.delete()
+                except Exception:
+                    logger.warning("failed to delete default TextureArray", exc_info=True)
+            self._default_array = None
+            self._default_tex = None
+            self._default_pending = False
 
-        for (w, h), array in self._arrays.items():
-            logger.debug(f"destroying TextureArray {w}x{h} (tex_id={array.tex_id})")
-            array.delete()
 
-        self._arrays.clear()
-        self._textures.clear()
-
-        if self._default_array:
-            logger.debug(f"destroying default TextureArray (tex_id={self._default_array.tex_id})")
-            try:
-                self._default_array.delete()
-            except Exception:
-                logger.warning("failed to delete default TextureArray", exc_info=True)
-        self._default_array = None
-        self._default_tex = None
 def get_texture(file: str | Path, unit: int = 0, bind: bool = False) -> GLTex:
     key = str(file)
     manager = GLTexManager()
 
     try:
-        tex = manager._textures.get(key)
-        if tex is None:
-            tex = manager.load_texture(file)
-        else:
-            tex_id_valid = bool(glIsTexture(int(tex.tex_id)))
-            layer_in_range = tex.layer < tex.array._allocated_layers if tex.array else False
-
-            if not tex_id_valid or not layer_in_range:
-                logger.debug(f"recreating texture array for {key}: tex_id_valid={tex_id_valid}, layer_ok={layer_in_range}")
-                if key in manager._textures:
-                    manager.delete_texture(key)
-                tex = manager.load_texture(file)
-
+        tex = manager.load_texture(file)
         manager.flush()
 
-        tex = manager._textures.get(key)
-        if tex is None:
-            logger.error(f"failed to obtain texture for {key} after flush, fallback to default texture")
-            manager._ensure_default_texture()
-            tex = manager._textures.get(_DEFAULT_TEXTURE_KEY)
-            if tex is None:
-                raise RuntimeError(f"failed to obtain default texture for {key}")
-
         if bind:
             manager.bind(tex, unit)
 
@@ -376,12 +381,8 @@ def get_texture(file: str | Path, unit: int = 0, bind: bool = False) -> GLTex:
 
     except Exception as exc:
         logger.exception(f"get_texture failed for {key}: {exc}")
-        default = manager._textures.get(_DEFAULT_TEXTURE_KEY)
-        if default is None:
-            manager._ensure_default_texture()
-            default = manager._textures.get(_DEFAULT_TEXTURE_KEY)
-        if default is None:
-            raise RuntimeError(f"could not load texture '{key}' and could not create default: {exc}") from exc
+        default = manager._ensure_default_texture()
+        manager.flush()
         if bind:
             manager.bind(default, unit)
 
@@ -27,167 +27,175 @@ from . import growtopia_pb2 as growtopia__pb2
 from . import state_pb2 as state__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0f\x65xtension.proto\x12\x16gtools.proxy.extension\x1a\x08op.proto\x1a\x0fgrowtopia.proto\x1a\x0bstate.proto\"\xc2\t\n\x06Packet\x12\x31\n\x04type\x18\x01 \x01(\x0e\x32#.gtools.proxy.extension.Packet.Type\x12\x36\n\thandshake\x18\x02 \x01(\x0b\x32!.gtools.proxy.extension.HandshakeH\x00\x12=\n\rhandshake_ack\x18\x03 \x01(\x0b\x32$.gtools.proxy.extension.HandshakeAckH\x00\x12G\n\x12\x63\x61pability_request\x18\x04 \x01(\x0b\x32).gtools.proxy.extension.CapabilityRequestH\x00\x12I\n\x13\x63\x61pability_response\x18\x05 \x01(\x0b\x32*.gtools.proxy.extension.CapabilityResponseH\x00\x12\x38\n\ndisconnect\x18\x06 \x01(\x0b\x32\".gtools.proxy.extension.DisconnectH\x00\x12?\n\x0e\x64isconnect_ack\x18\r \x01(\x0b\x32%.gtools.proxy.extension.DisconnectAckH\x00\x12\x36\n\tconnected\x18\x07 \x01(\x0b\x32!.gtools.proxy.extension.ConnectedH\x00\x12?\n\x0epending_packet\x18\x08 \x01(\x0b\x32%.gtools.proxy.extension.PendingPacketH\x00\x12=\n\rstate_request\x18\t \x01(\x0b\x32$.gtools.proxy.extension.StateRequestH\x00\x12?\n\x0estate_response\x18\n \x01(\x0b\x32%.gtools.proxy.extension.StateResponseH\x00\x12\x31\n\x0cstate_update\x18\x0b \x01(\x0b\x32\x19.gtools.state.StateUpdateH\x00\x12<\n\x0bpush_packet\x18\x0c \x01(\x0b\x32%.gtools.proxy.extension.PendingPacketH\x00\x12\x37\n\nheart_beat\x18\x0e \x01(\x0b\x32!.gtools.proxy.extension.HeartBeatH\x00\"\xd0\x02\n\x04Type\x12\x14\n\x10TYPE_UNSPECIFIED\x10\x00\x12\x12\n\x0eTYPE_HANDSHAKE\x10\x01\x12\x16\n\x12TYPE_HANDSHAKE_ACK\x10\x02\x12\x1b\n\x17TYPE_CAPABILITY_REQUEST\x10\x03\x12\x1c\n\x18TYPE_CAPABILITY_RESPONSE\x10\x04\x12\x13\n\x0fTYPE_DISCONNECT\x10\x05\x12\x17\n\x13TYPE_DISCONNECT_ACK\x10\x0c\x12\x12\n\x0eTYPE_CONNECTED\x10\x06\x12\x17\n\x13TYPE_PENDING_PACKET\x10\x07\x12\x16\n\x12TYPE_STATE_REQUEST\x10\x08\x12\x17\n\x13TYPE_STATE_RESPONSE\x10\t\x12\x15\n\x11TYPE_STATE_UPDATE\x10\n\x12\x14\n\x10TYPE_PUSH_PACKET\x10\x0b\x12\x12\n\x0eTYPE_HEARTBEAT\x10\rB\t\n\x07payload\"\x0b\n\tHeartBeat\"\x0f\n\rDisconnectAck\"\x19\n\tHandshake\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x0e\n\x0cHandshakeAck\"\x13\n\x11\x43\x61pabilityRequest\"H\n\x12\x43\x61pabilityResponse\x12\x32\n\x08interest\x18\x01 \x03(\x0b\x32 .gtools.proxy.extension.Interest\"\x0c\n\nDisconnect\"\x0b\n\tConnected\"\xc2\x02\n\rPendingPacket\x12\x0b\n\x03\x62uf\x18\x03 \x01(\x0c\x12\x14\n\x0cpacket_flags\x18\x04 \x01(\r\x12\x13\n\x0binterest_id\x18\x08 \x01(\r\x12\x34\n\tdirection\x18\x05 \x01(\x0e\x32!.gtools.proxy.extension.Direction\x12\x35\n\x03_op\x18\x01 \x01(\x0e\x32(.gtools.proxy.extension.PendingPacket.Op\x12\x12\n\n_packet_id\x18\x02 \x01(\x0c\x12\x12\n\n_hit_count\x18\x06 \x01(\r\x12\x0f\n\x07_rtt_ns\x18\x07 \x01(\x04\"S\n\x02Op\x12\x12\n\x0eOP_UNSPECIFIED\x10\x00\x12\r\n\tOP_FINISH\x10\x01\x12\r\n\tOP_CANCEL\x10\x02\x12\x0e\n\nOP_FORWARD\x10\x03\x12\x0b\n\x07OP_PASS\x10\x04\"\x0e\n\x0cStateRequest\"7\n\rStateResponse\x12&\n\x05state\x18\x01 \x01(\x0b\x32\x17.gtools.growtopia.State\"\xbe#\n\x08Interest\x12\x36\n\x08interest\x18\x01 \x01(\x0e\x32$.gtools.proxy.extension.InterestType\x12\x15\n\x08priority\x18\x02 \x01(\x05H\x01\x88\x01\x01\x12;\n\rblocking_mode\x18\x03 \x01(\x0e\x32$.gtools.proxy.extension.BlockingMode\x12\x39\n\tdirection\x18\x04 \x01(\x0e\x32!.gtools.proxy.extension.DirectionH\x02\x88\x01\x01\x12\x0f\n\x02id\x18\x05 \x01(\x05H\x03\x88\x01\x01\x12\x43\n\x0cpeer_connect\x18\x06 \x01(\x0b\x32+.gtools.proxy.extension.InterestPeerConnectH\x00\x12I\n\x0fpeer_disconnect\x18\x07 \x01(\x0b\x32..gtools.proxy.extension.InterestPeerDisconnectH\x00\x12\x43\n\x0cserver_hello\x18\x08 \x01(\x0b\x32+.gtools.proxy.extension.InterestServerHelloH\x00\x12\x43\n\x0cgeneric_text\x18\t \x01(\x0b\x32+.gtools.proxy.extension.InterestGenericTextH\x00\x12\x43\n\x0cgame_message\x18\n \x01(\x0b\x32+.gtools.proxy.extension.InterestGameMessageH\x00\x12\x41\n\x0btank_packet\x18\x0b \x01(\x0b\x32*.gtools.proxy.extension.InterestTankPacketH\x00\x12\x36\n\x05\x65rror\x18\x0c \x01(\x0b\x32%.gtools.proxy.extension.InterestErrorH\x00\x12\x36\n\x05track\x18\r \x01(\x0b\x32%.gtools.proxy.extension.InterestTrackH\x00\x12N\n\x12\x63lient_log_request\x18\x0e \x01(\x0b\x32\x30.gtools.proxy.extension.InterestClientLogRequestH\x00\x12P\n\x13\x63lient_log_response\x18\x0f \x01(\x0b\x32\x31.gtools.proxy.extension.InterestClientLogResponseH\x00\x12\x36\n\x05state\x18\x10 \x01(\x0b\x32%.gtools.proxy.extension.InterestStateH\x00\x12\x45\n\rcall_function\x18\x11 \x01(\x0b\x32,.gtools.proxy.extension.InterestCallFunctionH\x00\x12\x45\n\rupdate_status\x18\x12 \x01(\x0b\x32,.gtools.proxy.extension.InterestUpdateStatusH\x00\x12P\n\x13tile_change_request\x18\x13 \x01(\x0b\x32\x31.gtools.proxy.extension.InterestTileChangeRequestH\x00\x12\x44\n\rsend_map_data\x18\x14 \x01(\x0b\x32+.gtools.proxy.extension.InterestSendMapDataH\x00\x12S\n\x15send_tile_update_data\x18\x15 \x01(\x0b\x32\x32.gtools.proxy.extension.InterestSendTileUpdateDataH\x00\x12\x64\n\x1esend_tile_update_data_multiple\x18\x16 \x01(\x0b\x32:.gtools.proxy.extension.InterestSendTileUpdateDataMultipleH\x00\x12T\n\x15tile_activate_request\x18\x17 \x01(\x0b\x32\x33.gtools.proxy.extension.InterestTileActivateRequestH\x00\x12L\n\x11tile_apply_damage\x18\x18 \x01(\x0b\x32/.gtools.proxy.extension.InterestTileApplyDamageH\x00\x12R\n\x14send_inventory_state\x18\x19 \x01(\x0b\x32\x32.gtools.proxy.extension.InterestSendInventoryStateH\x00\x12T\n\x15item_activate_request\x18\x1a \x01(\x0b\x32\x33.gtools.proxy.extension.InterestItemActivateRequestH\x00\x12\x61\n\x1citem_activate_object_request\x18\x1b \x01(\x0b\x32\x39.gtools.proxy.extension.InterestItemActivateObjectRequestH\x00\x12Q\n\x14send_tile_tree_state\x18\x1c \x01(\x0b\x32\x31.gtools.proxy.extension.InterestSendTileTreeStateH\x00\x12T\n\x15modify_item_inventory\x18\x1d \x01(\x0b\x32\x33.gtools.proxy.extension.InterestModifyItemInventoryH\x00\x12N\n\x12item_change_object\x18\x1e \x01(\x0b\x32\x30.gtools.proxy.extension.InterestItemChangeObjectH\x00\x12=\n\tsend_lock\x18\x1f \x01(\x0b\x32(.gtools.proxy.extension.InterestSendLockH\x00\x12W\n\x17send_item_database_data\x18  \x01(\x0b\x32\x34.gtools.proxy.extension.InterestSendItemDatabaseDataH\x00\x12R\n\x14send_particle_effect\x18! \x01(\x0b\x32\x32.gtools.proxy.extension.InterestSendParticleEffectH\x00\x12\x46\n\x0eset_icon_state\x18\" \x01(\x0b\x32,.gtools.proxy.extension.InterestSetIconStateH\x00\x12\x41\n\x0bitem_effect\x18# \x01(\x0b\x32*.gtools.proxy.extension.InterestItemEffectH\x00\x12P\n\x13set_character_state\x18$ \x01(\x0b\x32\x31.gtools.proxy.extension.InterestSetCharacterStateH\x00\x12?\n\nping_reply\x18% \x01(\x0b\x32).gtools.proxy.extension.InterestPingReplyH\x00\x12\x43\n\x0cping_request\x18& \x01(\x0b\x32+.gtools.proxy.extension.InterestPingRequestH\x00\x12\x41\n\x0bgot_punched\x18\' \x01(\x0b\x32*.gtools.proxy.extension.InterestGotPunchedH\x00\x12N\n\x12\x61pp_check_response\x18( \x01(\x0b\x32\x30.gtools.proxy.extension.InterestAppCheckResponseH\x00\x12N\n\x12\x61pp_integrity_fail\x18) \x01(\x0b\x32\x30.gtools.proxy.extension.InterestAppIntegrityFailH\x00\x12@\n\ndisconnect\x18* \x01(\x0b\x32*.gtools.proxy.extension.InterestDisconnectH\x00\x12\x41\n\x0b\x62\x61ttle_join\x18+ \x01(\x0b\x32*.gtools.proxy.extension.InterestBattleJoinH\x00\x12\x43\n\x0c\x62\x61ttle_event\x18, \x01(\x0b\x32+.gtools.proxy.extension.InterestBattleEventH\x00\x12;\n\x08use_door\x18- \x01(\x0b\x32\'.gtools.proxy.extension.InterestUseDoorH\x00\x12\x45\n\rsend_parental\x18. \x01(\x0b\x32,.gtools.proxy.extension.InterestSendParentalH\x00\x12\x41\n\x0bgone_fishin\x18/ \x01(\x0b\x32*.gtools.proxy.extension.InterestGoneFishinH\x00\x12\x36\n\x05steam\x18\x30 \x01(\x0b\x32%.gtools.proxy.extension.InterestSteamH\x00\x12?\n\npet_battle\x18\x31 \x01(\x0b\x32).gtools.proxy.extension.InterestPetBattleH\x00\x12\x32\n\x03npc\x18\x32 \x01(\x0b\x32#.gtools.proxy.extension.InterestNpcH\x00\x12:\n\x07special\x18\x33 \x01(\x0b\x32\'.gtools.proxy.extension.InterestSpecialH\x00\x12W\n\x17send_particle_effect_v2\x18\x34 \x01(\x0b\x32\x34.gtools.proxy.extension.InterestSendParticleEffectV2H\x00\x12U\n\x16\x61\x63tivate_arrow_to_item\x18\x35 \x01(\x0b\x32\x33.gtools.proxy.extension.InterestActivateArrowToItemH\x00\x12L\n\x11select_tile_index\x18\x36 \x01(\x0b\x32/.gtools.proxy.extension.InterestSelectTileIndexH\x00\x12Y\n\x18send_player_tribute_data\x18\x37 \x01(\x0b\x32\x35.gtools.proxy.extension.InterestSendPlayerTributeDataH\x00\x12g\n ftue_set_item_to_quick_inventory\x18\x38 \x01(\x0b\x32;.gtools.proxy.extension.InterestFtueSetItemToQuickInventoryH\x00\x12\x39\n\x07pve_npc\x18\x39 \x01(\x0b\x32&.gtools.proxy.extension.InterestPveNpcH\x00\x12H\n\x0fpvp_card_battle\x18: \x01(\x0b\x32-.gtools.proxy.extension.InterestPvpCardBattleH\x00\x12W\n\x17pve_apply_player_damage\x18; \x01(\x0b\x32\x34.gtools.proxy.extension.InterestPveApplyPlayerDamageH\x00\x12W\n\x17pve_npc_position_update\x18< \x01(\x0b\x32\x34.gtools.proxy.extension.InterestPveNpcPositionUpdateH\x00\x12\x46\n\x0eset_extra_mods\x18= \x01(\x0b\x32,.gtools.proxy.extension.InterestSetExtraModsH\x00\x12I\n\x10on_step_tile_mod\x18> \x01(\x0b\x32-.gtools.proxy.extension.InterestOnStepTileModH\x00\x42\t\n\x07payloadB\x0b\n\t_priorityB\x0c\n\n_directionB\x05\n\x03_id\"\x15\n\x13InterestPeerConnect\"\x18\n\x16InterestPeerDisconnect\"\x15\n\x13InterestServerHello\"6\n\x13InterestGenericText\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"6\n\x13InterestGameMessage\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"5\n\x12InterestTankPacket\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"\x0f\n\rInterestError\"0\n\rInterestTrack\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"\x1a\n\x18InterestClientLogRequest\"\x1b\n\x19InterestClientLogResponse\"0\n\rInterestState\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"Z\n\x14InterestCallFunction\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\x12!\n\x07variant\x18\x02 \x03(\x0b\x32\x10.gtools.op.BinOp\"7\n\x14InterestUpdateStatus\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"<\n\x19InterestTileChangeRequest\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"6\n\x13InterestSendMapData\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"=\n\x1aInterestSendTileUpdateData\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"E\n\"InterestSendTileUpdateDataMultiple\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\">\n\x1bInterestTileActivateRequest\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\":\n\x17InterestTileApplyDamage\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"=\n\x1aInterestSendInventoryState\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\">\n\x1bInterestItemActivateRequest\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"D\n!InterestItemActivateObjectRequest\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"<\n\x19InterestSendTileTreeState\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\">\n\x1bInterestModifyItemInventory\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\";\n\x18InterestItemChangeObject\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"3\n\x10InterestSendLock\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"?\n\x1cInterestSendItemDatabaseData\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"=\n\x1aInterestSendParticleEffect\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"7\n\x14InterestSetIconState\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"5\n\x12InterestItemEffect\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"<\n\x19InterestSetCharacterState\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"4\n\x11InterestPingReply\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"6\n\x13InterestPingRequest\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"5\n\x12InterestGotPunched\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\";\n\x18InterestAppCheckResponse\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\";\n\x18InterestAppIntegrityFail\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"5\n\x12InterestDisconnect\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"5\n\x12InterestBattleJoin\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"6\n\x13InterestBattleEvent\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"2\n\x0fInterestUseDoor\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"7\n\x14InterestSendParental\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"5\n\x12InterestGoneFishin\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"0\n\rInterestSteam\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"4\n\x11InterestPetBattle\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\".\n\x0bInterestNpc\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"2\n\x0fInterestSpecial\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"?\n\x1cInterestSendParticleEffectV2\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\">\n\x1bInterestActivateArrowToItem\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\":\n\x17InterestSelectTileIndex\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"@\n\x1dInterestSendPlayerTributeData\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"F\n#InterestFtueSetItemToQuickInventory\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"1\n\x0eInterestPveNpc\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"8\n\x15InterestPvpCardBattle\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"?\n\x1cInterestPveApplyPlayerDamage\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"?\n\x1cInterestPveNpcPositionUpdate\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"7\n\x14InterestSetExtraMods\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"8\n\x15InterestOnStepTileMod\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"\x0c\n\nInterestMy\"\x0f\n\rInterestWorld\"\x15\n\x13InterestOtherPlayer*\x82\x0e\n\x0cInterestType\x12\x18\n\x14INTEREST_UNSPECIFIED\x10\x00\x12\x19\n\x15INTEREST_PEER_CONNECT\x10\x01\x12\x1c\n\x18INTEREST_PEER_DISCONNECT\x10\x02\x12\x19\n\x15INTEREST_SERVER_HELLO\x10\x03\x12\x19\n\x15INTEREST_GENERIC_TEXT\x10\x04\x12\x19\n\x15INTEREST_GAME_MESSAGE\x10\x05\x12\x18\n\x14INTEREST_TANK_PACKET\x10\x06\x12\x12\n\x0eINTEREST_ERROR\x10\x07\x12\x12\n\x0eINTEREST_TRACK\x10\x08\x12\x1f\n\x1bINTEREST_CLIENT_LOG_REQUEST\x10\t\x12 \n\x1cINTEREST_CLIENT_LOG_RESPONSE\x10\n\x12\x12\n\x0eINTEREST_STATE\x10\x0b\x12\x1a\n\x16INTEREST_CALL_FUNCTION\x10\x0c\x12\x1a\n\x16INTEREST_UPDATE_STATUS\x10\r\x12 \n\x1cINTEREST_TILE_CHANGE_REQUEST\x10\x0e\x12\x1a\n\x16INTEREST_SEND_MAP_DATA\x10\x0f\x12\"\n\x1eINTEREST_SEND_TILE_UPDATE_DATA\x10\x10\x12+\n\'INTEREST_SEND_TILE_UPDATE_DATA_MULTIPLE\x10\x11\x12\"\n\x1eINTEREST_TILE_ACTIVATE_REQUEST\x10\x12\x12\x1e\n\x1aINTEREST_TILE_APPLY_DAMAGE\x10\x13\x12!\n\x1dINTEREST_SEND_INVENTORY_STATE\x10\x14\x12\"\n\x1eINTEREST_ITEM_ACTIVATE_REQUEST\x10\x15\x12)\n%INTEREST_ITEM_ACTIVATE_OBJECT_REQUEST\x10\x16\x12!\n\x1dINTEREST_SEND_TILE_TREE_STATE\x10\x17\x12\"\n\x1eINTEREST_MODIFY_ITEM_INVENTORY\x10\x18\x12\x1f\n\x1bINTEREST_ITEM_CHANGE_OBJECT\x10\x19\x12\x16\n\x12INTEREST_SEND_LOCK\x10\x1a\x12$\n INTEREST_SEND_ITEM_DATABASE_DATA\x10\x1b\x12!\n\x1dINTEREST_SEND_PARTICLE_EFFECT\x10\x1c\x12\x1b\n\x17INTEREST_SET_ICON_STATE\x10\x1d\x12\x18\n\x14INTEREST_ITEM_EFFECT\x10\x1e\x12 \n\x1cINTEREST_SET_CHARACTER_STATE\x10\x1f\x12\x17\n\x13INTEREST_PING_REPLY\x10 \x12\x19\n\x15INTEREST_PING_REQUEST\x10!\x12\x18\n\x14INTEREST_GOT_PUNCHED\x10\"\x12\x1f\n\x1bINTEREST_APP_CHECK_RESPONSE\x10#\x12\x1f\n\x1bINTEREST_APP_INTEGRITY_FAIL\x10$\x12\x17\n\x13INTEREST_DISCONNECT\x10%\x12\x18\n\x14INTEREST_BATTLE_JOIN\x10&\x12\x19\n\x15INTEREST_BATTLE_EVENT\x10\'\x12\x15\n\x11INTEREST_USE_DOOR\x10(\x12\x1a\n\x16INTEREST_SEND_PARENTAL\x10)\x12\x18\n\x14INTEREST_GONE_FISHIN\x10*\x12\x12\n\x0eINTEREST_STEAM\x10+\x12\x17\n\x13INTEREST_PET_BATTLE\x10,\x12\x10\n\x0cINTEREST_NPC\x10-\x12\x14\n\x10INTEREST_SPECIAL\x10.\x12$\n INTEREST_SEND_PARTICLE_EFFECT_V2\x10/\x12#\n\x1fINTEREST_ACTIVATE_ARROW_TO_ITEM\x10\x30\x12\x1e\n\x1aINTEREST_SELECT_TILE_INDEX\x10\x31\x12%\n!INTEREST_SEND_PLAYER_TRIBUTE_DATA\x10\x32\x12-\n)INTEREST_FTUE_SET_ITEM_TO_QUICK_INVENTORY\x10\x33\x12\x14\n\x10INTEREST_PVE_NPC\x10\x34\x12\x1c\n\x18INTEREST_PVP_CARD_BATTLE\x10\x35\x12$\n INTEREST_PVE_APPLY_PLAYER_DAMAGE\x10\x36\x12$\n INTEREST_PVE_NPC_POSITION_UPDATE\x10\x37\x12\x1b\n\x17INTEREST_SET_EXTRA_MODS\x10\x38\x12\x1d\n\x19INTEREST_ON_STEP_TILE_MOD\x10\x39\x12\x19\n\x15INTEREST_STATE_UPDATE\x10=*f\n\tDirection\x12\x19\n\x15\x44IRECTION_UNSPECIFIED\x10\x00\x12\x1e\n\x1a\x44IRECTION_CLIENT_TO_SERVER\x10\x01\x12\x1e\n\x1a\x44IRECTION_SERVER_TO_CLIENT\x10\x02*\xcd\x01\n\x0c\x42lockingMode\x12\x1d\n\x19\x42LOCKING_MODE_UNSPECIFIED\x10\x00\x12\x17\n\x13\x42LOCKING_MODE_BLOCK\x10\x01\x12!\n\x1d\x42LOCKING_MODE_SEND_AND_FORGET\x10\x02\x12!\n\x1d\x42LOCKING_MODE_SEND_AND_CANCEL\x10\x04\x12\x19\n\x15\x42LOCKING_MODE_ONESHOT\x10\x03\x12$\n BLOCKING_MODE_ONESHOT_AND_CANCEL\x10\x05\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0f\x65xtension.proto\x12\x16gtools.proxy.extension\x1a\x08op.proto\x1a\x0fgrowtopia.proto\x1a\x0bstate.proto\"\x96\x0b\n\x06Packet\x12\x31\n\x04type\x18\x01 \x01(\x0e\x32#.gtools.proxy.extension.Packet.Type\x12\x36\n\thandshake\x18\x02 \x01(\x0b\x32!.gtools.proxy.extension.HandshakeH\x00\x12=\n\rhandshake_ack\x18\x03 \x01(\x0b\x32$.gtools.proxy.extension.HandshakeAckH\x00\x12G\n\x12\x63\x61pability_request\x18\x04 \x01(\x0b\x32).gtools.proxy.extension.CapabilityRequestH\x00\x12I\n\x13\x63\x61pability_response\x18\x05 \x01(\x0b\x32*.gtools.proxy.extension.CapabilityResponseH\x00\x12\x38\n\ndisconnect\x18\x06 \x01(\x0b\x32\".gtools.proxy.extension.DisconnectH\x00\x12?\n\x0e\x64isconnect_ack\x18\r \x01(\x0b\x32%.gtools.proxy.extension.DisconnectAckH\x00\x12\x36\n\tconnected\x18\x07 \x01(\x0b\x32!.gtools.proxy.extension.ConnectedH\x00\x12?\n\x0epending_packet\x18\x08 \x01(\x0b\x32%.gtools.proxy.extension.PendingPacketH\x00\x12=\n\rstate_request\x18\t \x01(\x0b\x32$.gtools.proxy.extension.StateRequestH\x00\x12?\n\x0estate_response\x18\n \x01(\x0b\x32%.gtools.proxy.extension.StateResponseH\x00\x12\x31\n\x0cstate_update\x18\x0b \x01(\x0b\x32\x19.gtools.state.StateUpdateH\x00\x12<\n\x0bpush_packet\x18\x0c \x01(\x0b\x32%.gtools.proxy.extension.PendingPacketH\x00\x12\x37\n\nheart_beat\x18\x0e \x01(\x0b\x32!.gtools.proxy.extension.HeartBeatH\x00\x12=\n\rhandler_stats\x18\x10 \x01(\x0b\x32$.gtools.proxy.extension.HandlerStatsH\x00\x12<\n\x12state_update_batch\x18\x11 \x01(\x0b\x32\x1e.gtools.state.StateUpdateBatchH\x00\x12\x14\n\x07session\x18\x0f \x01(\rH\x01\x88\x01\x01\"\x85\x03\n\x04Type\x12\x14\n\x10TYPE_UNSPECIFIED\x10\x00\x12\x12\n\x0eTYPE_HANDSHAKE\x10\x01\x12\x16\n\x12TYPE_HANDSHAKE_ACK\x10\x02\x12\x1b\n\x17TYPE_CAPABILITY_REQUEST\x10\x03\x12\x1c\n\x18TYPE_CAPABILITY_RESPONSE\x10\x04\x12\x13\n\x0fTYPE_DISCONNECT\x10\x05\x12\x17\n\x13TYPE_DISCONNECT_ACK\x10\x0c\x12\x12\n\x0eTYPE_CONNECTED\x10\x06\x12\x17\n\x13TYPE_PENDING_PACKET\x10\x07\x12\x16\n\x12TYPE_STATE_REQUEST\x10\x08\x12\x17\n\x13TYPE_STATE_RESPONSE\x10\t\x12\x15\n\x11TYPE_STATE_UPDATE\x10\n\x12\x14\n\x10TYPE_PUSH_PACKET\x10\x0b\x12\x12\n\x0eTYPE_HEARTBEAT\x10\r\x12\x16\n\x12TYPE_HANDLER_STATS\x10\x0e\x12\x1b\n\x17TYPE_STATE_UPDATE_BATCH\x10\x0f\x42\t\n\x07payloadB\n\n\x08_session\"\x0b\n\tHeartBeat\"\x83\x01\n\x0bHandlerStat\x12\x13\n\x0binterest_id\x18\x01 \x01(\x05\x12\r\n\x05\x63ount\x18\x02 \x01(\x04\x12\x10\n\x08total_ns\x18\x03 \x01(\x04\x12\x0e\n\x06max_ns\x18\x04 \x01(\x04\x12\x17\n\x0fqueued_total_ns\x18\x05 \x01(\x04\x12\x15\n\rqueued_max_ns\x18\x06 \x01(\x04\"A\n\x0cHandlerStats\x12\x31\n\x04stat\x18\x01 \x03(\x0b\x32#.gtools.proxy.extension.HandlerStat\"\x0f\n\rDisconnectAck\"\x19\n\tHandshake\x12\x0c\n\x04name\x18\x01 \x01(\t\"\x0e\n\x0cHandshakeAck\"\x13\n\x11\x43\x61pabilityRequest\"H\n\x12\x43\x61pabilityResponse\x12\x32\n\x08interest\x18\x01 \x03(\x0b\x32 .gtools.proxy.extension.Interest\"\x0c\n\nDisconnect\"\x0b\n\tConnected\"\xe4\x02\n\rPendingPacket\x12\x0b\n\x03\x62uf\x18\x03 \x01(\x0c\x12\x14\n\x0cpacket_flags\x18\x04 \x01(\r\x12\x13\n\x0binterest_id\x18\x08 \x01(\r\x12\x34\n\tdirection\x18\x05 \x01(\x0e\x32!.gtools.proxy.extension.Direction\x12\x35\n\x03_op\x18\x01 \x01(\x0e\x32(.gtools.proxy.extension.PendingPacket.Op\x12\x12\n\n_packet_id\x18\x02 \x01(\x0c\x12\x12\n\n_hit_count\x18\x06 \x01(\r\x12\x0f\n\x07_rtt_ns\x18\x07 \x01(\x04\x12\x14\n\x07session\x18\t \x01(\rH\x00\x88\x01\x01\"S\n\x02Op\x12\x12\n\x0eOP_UNSPECIFIED\x10\x00\x12\r\n\tOP_FINISH\x10\x01\x12\r\n\tOP_CANCEL\x10\x02\x12\x0e\n\nOP_FORWARD\x10\x03\x12\x0b\n\x07OP_PASS\x10\x04\x42\n\n\x08_session\"0\n\x0cStateRequest\x12\x14\n\x07session\x18\x01 \x01(\rH\x00\x88\x01\x01\x42\n\n\x08_session\"7\n\rStateResponse\x12&\n\x05state\x18\x01 \x01(\x0b\x32\x17.gtools.growtopia.State\"\xa5$\n\x08Interest\x12\x36\n\x08interest\x18\x01 \x01(\x0e\x32$.gtools.proxy.extension.InterestType\x12\x15\n\x08priority\x18\x02 \x01(\x05H\x01\x88\x01\x01\x12;\n\rblocking_mode\x18\x03 \x01(\x0e\x32$.gtools.proxy.extension.BlockingMode\x12\x39\n\tdirection\x18\x04 \x01(\x0e\x32!.gtools.proxy.extension.DirectionH\x02\x88\x01\x01\x12\x0f\n\x02id\x18\x05 \x01(\x05H\x03\x88\x01\x01\x12\x43\n\x0cpeer_connect\x18\x06 \x01(\x0b\x32+.gtools.proxy.extension.InterestPeerConnectH\x00\x12I\n\x0fpeer_disconnect\x18\x07 \x01(\x0b\x32..gtools.proxy.extension.InterestPeerDisconnectH\x00\x12\x43\n\x0cserver_hello\x18\x08 \x01(\x0b\x32+.gtools.proxy.extension.InterestServerHelloH\x00\x12\x43\n\x0cgeneric_text\x18\t \x01(\x0b\x32+.gtools.proxy.extension.InterestGenericTextH\x00\x12\x43\n\x0cgame_message\x18\n \x01(\x0b\x32+.gtools.proxy.extension.InterestGameMessageH\x00\x12\x41\n\x0btank_packet\x18\x0b \x01(\x0b\x32*.gtools.proxy.extension.InterestTankPacketH\x00\x12\x36\n\x05\x65rror\x18\x0c \x01(\x0b\x32%.gtools.proxy.extension.InterestErrorH\x00\x12\x36\n\x05track\x18\r \x01(\x0b\x32%.gtools.proxy.extension.InterestTrackH\x00\x12N\n\x12\x63lient_log_request\x18\x0e \x01(\x0b\x32\x30.gtools.proxy.extension.InterestClientLogRequestH\x00\x12P\n\x13\x63lient_log_response\x18\x0f \x01(\x0b\x32\x31.gtools.proxy.extension.InterestClientLogResponseH\x00\x12\x36\n\x05state\x18\x10 \x01(\x0b\x32%.gtools.proxy.extension.InterestStateH\x00\x12\x45\n\rcall_function\x18\x11 \x01(\x0b\x32,.gtools.proxy.extension.InterestCallFunctionH\x00\x12\x45\n\rupdate_status\x18\x12 \x01(\x0b\x32,.gtools.proxy.extension.InterestUpdateStatusH\x00\x12P\n\x13tile_change_request\x18\x13 \x01(\x0b\x32\x31.gtools.proxy.extension.InterestTileChangeRequestH\x00\x12\x44\n\rsend_map_data\x18\x14 \x01(\x0b\x32+.gtools.proxy.extension.InterestSendMapDataH\x00\x12S\n\x15send_tile_update_data\x18\x15 \x01(\x0b\x32\x32.gtools.proxy.extension.InterestSendTileUpdateDataH\x00\x12\x64\n\x1esend_tile_update_data_multiple\x18\x16 \x01(\x0b\x32:.gtools.proxy.extension.InterestSendTileUpdateDataMultipleH\x00\x12T\n\x15tile_activate_request\x18\x17 \x01(\x0b\x32\x33.gtools.proxy.extension.InterestTileActivateRequestH\x00\x12L\n\x11tile_apply_damage\x18\x18 \x01(\x0b\x32/.gtools.proxy.extension.InterestTileApplyDamageH\x00\x12R\n\x14send_inventory_state\x18\x19 \x01(\x0b\x32\x32.gtools.proxy.extension.InterestSendInventoryStateH\x00\x12T\n\x15item_activate_request\x18\x1a \x01(\x0b\x32\x33.gtools.proxy.extension.InterestItemActivateRequestH\x00\x12\x61\n\x1citem_activate_object_request\x18\x1b \x01(\x0b\x32\x39.gtools.proxy.extension.InterestItemActivateObjectRequestH\x00\x12Q\n\x14send_tile_tree_state\x18\x1c \x01(\x0b\x32\x31.gtools.proxy.extension.InterestSendTileTreeStateH\x00\x12T\n\x15modify_item_inventory\x18\x1d \x01(\x0b\x32\x33.gtools.proxy.extension.InterestModifyItemInventoryH\x00\x12N\n\x12item_change_object\x18\x1e \x01(\x0b\x32\x30.gtools.proxy.extension.InterestItemChangeObjectH\x00\x12=\n\tsend_lock\x18\x1f \x01(\x0b\x32(.gtools.proxy.extension.InterestSendLockH\x00\x12W\n\x17send_item_database_data\x18  \x01(\x0b\x32\x34.gtools.proxy.extension.InterestSendItemDatabaseDataH\x00\x12R\n\x14send_particle_effect\x18! \x01(\x0b\x32\x32.gtools.proxy.extension.InterestSendParticleEffectH\x00\x12\x46\n\x0eset_icon_state\x18\" \x01(\x0b\x32,.gtools.proxy.extension.InterestSetIconStateH\x00\x12\x41\n\x0bitem_effect\x18# \x01(\x0b\x32*.gtools.proxy.extension.InterestItemEffectH\x00\x12P\n\x13set_character_state\x18$ \x01(\x0b\x32\x31.gtools.proxy.extension.InterestSetCharacterStateH\x00\x12?\n\nping_reply\x18% \x01(\x0b\x32).gtools.proxy.extension.InterestPingReplyH\x00\x12\x43\n\x0cping_request\x18& \x01(\x0b\x32+.gtools.proxy.extension.InterestPingRequestH\x00\x12\x41\n\x0bgot_punched\x18\' \x01(\x0b\x32*.gtools.proxy.extension.InterestGotPunchedH\x00\x12N\n\x12\x61pp_check_response\x18( \x01(\x0b\x32\x30.gtools.proxy.extension.InterestAppCheckResponseH\x00\x12N\n\x12\x61pp_integrity_fail\x18) \x01(\x0b\x32\x30.gtools.proxy.extension.InterestAppIntegrityFailH\x00\x12@\n\ndisconnect\x18* \x01(\x0b\x32*.gtools.proxy.extension.InterestDisconnectH\x00\x12\x41\n\x0b\x62\x61ttle_join\x18+ \x01(\x0b\x32*.gtools.proxy.extension.InterestBattleJoinH\x00\x12\x43\n\x0c\x62\x61ttle_event\x18, \x01(\x0b\x32+.gtools.proxy.extension.InterestBattleEventH\x00\x12;\n\x08use_door\x18- \x01(\x0b\x32\'.gtools.proxy.extension.InterestUseDoorH\x00\x12\x45\n\rsend_parental\x18. \x01(\x0b\x32,.gtools.proxy.extension.InterestSendParentalH\x00\x12\x41\n\x0bgone_fishin\x18/ \x01(\x0b\x32*.gtools.proxy.extension.InterestGoneFishinH\x00\x12\x36\n\x05steam\x18\x30 \x01(\x0b\x32%.gtools.proxy.extension.InterestSteamH\x00\x12?\n\npet_battle\x18\x31 \x01(\x0b\x32).gtools.proxy.extension.InterestPetBattleH\x00\x12\x32\n\x03npc\x18\x32 \x01(\x0b\x32#.gtools.proxy.extension.InterestNpcH\x00\x12:\n\x07special\x18\x33 \x01(\x0b\x32\'.gtools.proxy.extension.InterestSpecialH\x00\x12W\n\x17send_particle_effect_v2\x18\x34 \x01(\x0b\x32\x34.gtools.proxy.extension.InterestSendParticleEffectV2H\x00\x12U\n\x16\x61\x63tivate_arrow_to_item\x18\x35 \x01(\x0b\x32\x33.gtools.proxy.extension.InterestActivateArrowToItemH\x00\x12L\n\x11select_tile_index\x18\x36 \x01(\x0b\x32/.gtools.proxy.extension.InterestSelectTileIndexH\x00\x12Y\n\x18send_player_tribute_data\x18\x37 \x01(\x0b\x32\x35.gtools.proxy.extension.InterestSendPlayerTributeDataH\x00\x12g\n ftue_set_item_to_quick_inventory\x18\x38 \x01(\x0b\x32;.gtools.proxy.extension.InterestFtueSetItemToQuickInventoryH\x00\x12\x39\n\x07pve_npc\x18\x39 \x01(\x0b\x32&.gtools.proxy.extension.InterestPveNpcH\x00\x12H\n\x0fpvp_card_battle\x18: \x01(\x0b\x32-.gtools.proxy.extension.InterestPvpCardBattleH\x00\x12W\n\x17pve_apply_player_damage\x18; \x01(\x0b\x32\x34.gtools.proxy.extension.InterestPveApplyPlayerDamageH\x00\x12W\n\x17pve_npc_position_update\x18< \x01(\x0b\x32\x34.gtools.proxy.extension.InterestPveNpcPositionUpdateH\x00\x12\x46\n\x0eset_extra_mods\x18= \x01(\x0b\x32,.gtools.proxy.extension.InterestSetExtraModsH\x00\x12I\n\x10on_step_tile_mod\x18> \x01(\x0b\x32-.gtools.proxy.extension.InterestOnStepTileModH\x00\x12\x43\n\x0cstate_update\x18@ \x01(\x0b\x32+.gtools.proxy.extension.InterestStateUpdateH\x00\x12\x14\n\x07session\x18? \x01(\rH\x04\x88\x01\x01\x42\t\n\x07payloadB\x0b\n\t_priorityB\x0c\n\n_directionB\x05\n\x03_idB\n\n\x08_session\"\x15\n\x13InterestPeerConnect\"\x18\n\x16InterestPeerDisconnect\"\x15\n\x13InterestServerHello\"6\n\x13InterestGenericText\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"6\n\x13InterestGameMessage\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"5\n\x12InterestTankPacket\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"\x0f\n\rInterestError\"0\n\rInterestTrack\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"\x1a\n\x18InterestClientLogRequest\"\x1b\n\x19InterestClientLogResponse\"0\n\rInterestState\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"Z\n\x14InterestCallFunction\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\x12!\n\x07variant\x18\x02 \x03(\x0b\x32\x10.gtools.op.BinOp\"7\n\x14InterestUpdateStatus\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"<\n\x19InterestTileChangeRequest\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"6\n\x13InterestSendMapData\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"=\n\x1aInterestSendTileUpdateData\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"E\n\"InterestSendTileUpdateDataMultiple\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\">\n\x1bInterestTileActivateRequest\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\":\n\x17InterestTileApplyDamage\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"=\n\x1aInterestSendInventoryState\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\">\n\x1bInterestItemActivateRequest\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"D\n!InterestItemActivateObjectRequest\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"<\n\x19InterestSendTileTreeState\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\">\n\x1bInterestModifyItemInventory\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\";\n\x18InterestItemChangeObject\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"3\n\x10InterestSendLock\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"?\n\x1cInterestSendItemDatabaseData\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"=\n\x1aInterestSendParticleEffect\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"7\n\x14InterestSetIconState\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"5\n\x12InterestItemEffect\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"<\n\x19InterestSetCharacterState\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"4\n\x11InterestPingReply\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"6\n\x13InterestPingRequest\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"5\n\x12InterestGotPunched\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\";\n\x18InterestAppCheckResponse\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\";\n\x18InterestAppIntegrityFail\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"5\n\x12InterestDisconnect\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"5\n\x12InterestBattleJoin\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"6\n\x13InterestBattleEvent\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"2\n\x0fInterestUseDoor\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"7\n\x14InterestSendParental\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"5\n\x12InterestGoneFishin\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"0\n\rInterestSteam\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"4\n\x11InterestPetBattle\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\".\n\x0bInterestNpc\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"2\n\x0fInterestSpecial\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"?\n\x1cInterestSendParticleEffectV2\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\">\n\x1bInterestActivateArrowToItem\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\":\n\x17InterestSelectTileIndex\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"@\n\x1dInterestSendPlayerTributeData\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"F\n#InterestFtueSetItemToQuickInventory\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"1\n\x0eInterestPveNpc\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"8\n\x15InterestPvpCardBattle\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"?\n\x1cInterestPveApplyPlayerDamage\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"?\n\x1cInterestPveNpcPositionUpdate\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"7\n\x14InterestSetExtraMods\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"8\n\x15InterestOnStepTileMod\x12\x1f\n\x05where\x18\x01 \x03(\x0b\x32\x10.gtools.op.BinOp\"\xd0\x01\n\x13InterestStateUpdate\x12+\n\x04what\x18\x01 \x03(\x0e\x32\x1d.gtools.state.StateUpdateWhat\x12\x0e\n\x06net_id\x18\x02 \x03(\x05\x12\n\n\x02me\x18\x03 \x01(\x08\x12\x37\n\x06region\x18\x04 \x01(\x0b\x32\".gtools.proxy.extension.TileRegionH\x00\x88\x01\x01\x12\x1a\n\rposition_rate\x18\x05 \x01(\x02H\x01\x88\x01\x01\x42\t\n\x07_regionB\x10\n\x0e_position_rate\"8\n\nTileRegion\x12\t\n\x01x\x18\x01 \x01(\x05\x12\t\n\x01y\x18\x02 \x01(\x05\x12\t\n\x01w\x18\x03 \x01(\x05\x12\t\n\x01h\x18\x04 \x01(\x05\"\x0c\n\nInterestMy\"\x0f\n\rInterestWorld\"\x15\n\x13InterestOtherPlayer*\x82\x0e\n\x0cInterestType\x12\x18\n\x14INTEREST_UNSPECIFIED\x10\x00\x12\x19\n\x15INTEREST_PEER_CONNECT\x10\x01\x12\x1c\n\x18INTEREST_PEER_DISCONNECT\x10\x02\x12\x19\n\x15INTEREST_SERVER_HELLO\x10\x03\x12\x19\n\x15INTEREST_GENERIC_TEXT\x10\x04\x12\x19\n\x15INTEREST_GAME_MESSAGE\x10\x05\x12\x18\n\x14INTEREST_TANK_PACKET\x10\x06\x12\x12\n\x0eINTEREST_ERROR\x10\x07\x12\x12\n\x0eINTEREST_TRACK\x10\x08\x12\x1f\n\x1bINTEREST_CLIENT_LOG_REQUEST\x10\t\x12 \n\x1cINTEREST_CLIENT_LOG_RESPONSE\x10\n\x12\x12\n\x0eINTEREST_STATE\x10\x0b\x12\x1a\n\x16INTEREST_CALL_FUNCTION\x10\x0c\x12\x1a\n\x16INTEREST_UPDATE_STATUS\x10\r\x12 \n\x1cINTEREST_TILE_CHANGE_REQUEST\x10\x0e\x12\x1a\n\x16INTEREST_SEND_MAP_DATA\x10\x0f\x12\"\n\x1eINTEREST_SEND_TILE_UPDATE_DATA\x10\x10\x12+\n\'INTEREST_SEND_TILE_UPDATE_DATA_MULTIPLE\x10\x11\x12\"\n\x1eINTEREST_TILE_ACTIVATE_REQUEST\x10\x12\x12\x1e\n\x1aINTEREST_TILE_APPLY_DAMAGE\x10\x13\x12!\n\x1dINTEREST_SEND_INVENTORY_STATE\x10\x14\x12\"\n\x1eINTEREST_ITEM_ACTIVATE_REQUEST\x10\x15\x12)\n%INTEREST_ITEM_ACTIVATE_OBJECT_REQUEST\x10\x16\x12!\n\x1dINTEREST_SEND_TILE_TREE_STATE\x10\x17\x12\"\n\x1eINTEREST_MODIFY_ITEM_INVENTORY\x10\x18\x12\x1f\n\x1bINTEREST_ITEM_CHANGE_OBJECT\x10\x19\x12\x16\n\x12INTEREST_SEND_LOCK\x10\x1a\x12$\n INTEREST_SEND_ITEM_DATABASE_DATA\x10\x1b\x12!\n\x1dINTEREST_SEND_PARTICLE_EFFECT\x10\x1c\x12\x1b\n\x17INTEREST_SET_ICON_STATE\x10\x1d\x12\x18\n\x14INTEREST_ITEM_EFFECT\x10\x1e\x12 \n\x1cINTEREST_SET_CHARACTER_STATE\x10\x1f\x12\x17\n\x13INTEREST_PING_REPLY\x10 \x12\x19\n\x15INTEREST_PING_REQUEST\x10!\x12\x18\n\x14INTEREST_GOT_PUNCHED\x10\"\x12\x1f\n\x1bINTEREST_APP_CHECK_RESPONSE\x10#\x12\x1f\n\x1bINTEREST_APP_INTEGRITY_FAIL\x10$\x12\x17\n\x13INTEREST_DISCONNECT\x10%\x12\x18\n\x14INTEREST_BATTLE_JOIN\x10&\x12\x19\n\x15INTEREST_BATTLE_EVENT\x10\'\x12\x15\n\x11INTEREST_USE_DOOR\x10(\x12\x1a\n\x16INTEREST_SEND_PARENTAL\x10)\x12\x18\n\x14INTEREST_GONE_FISHIN\x10*\x12\x12\n\x0eINTEREST_STEAM\x10+\x12\x17\n\x13INTEREST_PET_BATTLE\x10,\x12\x10\n\x0cINTEREST_NPC\x10-\x12\x14\n\x10INTEREST_SPECIAL\x10.\x12$\n INTEREST_SEND_PARTICLE_EFFECT_V2\x10/\x12#\n\x1fINTEREST_ACTIVATE_ARROW_TO_ITEM\x10\x30\x12\x1e\n\x1aINTEREST_SELECT_TILE_INDEX\x10\x31\x12%\n!INTEREST_SEND_PLAYER_TRIBUTE_DATA\x10\x32\x12-\n)INTEREST_FTUE_SET_ITEM_TO_QUICK_INVENTORY\x10\x33\x12\x14\n\x10INTEREST_PVE_NPC\x10\x34\x12\x1c\n\x18INTEREST_PVP_CARD_BATTLE\x10\x35\x12$\n INTEREST_PVE_APPLY_PLAYER_DAMAGE\x10\x36\x12$\n INTEREST_PVE_NPC_POSITION_UPDATE\x10\x37\x12\x1b\n\x17INTEREST_SET_EXTRA_MODS\x10\x38\x12\x1d\n\x19INTEREST_ON_STEP_TILE_MOD\x10\x39\x12\x19\n\x15INTEREST_STATE_UPDATE\x10=*f\n\tDirection\x12\x19\n\x15\x44IRECTION_UNSPECIFIED\x10\x00\x12\x1e\n\x1a\x44IRECTION_CLIENT_TO_SERVER\x10\x01\x12\x1e\n\x1a\x44IRECTION_SERVER_TO_CLIENT\x10\x02*\xcd\x01\n\x0c\x42lockingMode\x12\x1d\n\x19\x42LOCKING_MODE_UNSPECIFIED\x10\x00\x12\x17\n\x13\x42LOCKING_MODE_BLOCK\x10\x01\x12!\n\x1d\x42LOCKING_MODE_SEND_AND_FORGET\x10\x02\x12!\n\x1d\x42LOCKING_MODE_SEND_AND_CANCEL\x10\x04\x12\x19\n\x15\x42LOCKING_MODE_ONESHOT\x10\x03\x12$\n BLOCKING_MODE_ONESHOT_AND_CANCEL\x10\x05\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'extension_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
-  _globals['_INTERESTTYPE']._serialized_start=9676
-  _globals['_INTERESTTYPE']._serialized_end=11470
-  _globals['_DIRECTION']._serialized_start=11472
-  _globals['_DIRECTION']._serialized_end=11574
-  _globals['_BLOCKINGMODE']._serialized_start=11577
-  _globals['_BLOCKINGMODE']._serialized_end=11782
+  _globals['_INTERESTTYPE']._serialized_start=10529
+  _globals['_INTERESTTYPE']._serialized_end=12323
+  _globals['_DIRECTION']._serialized_start=12325
+  _globals['_DIRECTION']._serialized_end=12427
+  _globals['_BLOCKINGMODE']._serialized_start=12430
+  _globals['_BLOCKINGMODE']._serialized_end=12635
   _globals['_PACKET']._serialized_start=84
-  _globals['_PACKET']._serialized_end=1302
-  _globals['_PACKET_TYPE']._serialized_start=955
-  _globals['_PACKET_TYPE']._serialized_end=1291
-  _globals['_HEARTBEAT']._serialized_start=1304
-  _globals['_HEARTBEAT']._serialized_end=1315
-  _globals['_DISCONNECTACK']._serialized_start=1317
-  _globals['_DISCONNECTACK']._serialized_end=1332
-  _globals['_HANDSHAKE']._serialized_start=1334
-  _globals['_HANDSHAKE']._serialized_end=1359
-  _globals['_HANDSHAKEACK']._serialized_start=1361
-  _globals['_HANDSHAKEACK']._serialized_end=1375
-  _globals['_CAPABILITYREQUEST']._serialized_start=1377
-  _globals['_CAPABILITYREQUEST']._serialized_end=1396
-  _globals['_CAPABILITYRESPONSE']._serialized_start=1398
-  _globals['_CAPABILITYRESPONSE']._serialized_end=1470
-  _globals['_DISCONNECT']._serialized_start=1472
-  _globals['_DISCONNECT']._serialized_end=1484
-  _globals['_CONNECTED']._serialized_start=1486
-  _globals['_CONNECTED']._serialized_end=1497
-  _globals['_PENDINGPACKET']._serialized_start=1500
-  _globals['_PENDINGPACKET']._serialized_end=1822
-  _globals['_PENDINGPACKET_OP']._serialized_start=1739
-  _globals['_PENDINGPACKET_OP']._serialized_end=1822
-  _globals['_STATEREQUEST']._serialized_start=1824
-  _globals['_STATEREQUEST']._serialized_end=1838
-  _globals['_STATERESPONSE']._serialized_start=1840
-  _globals['_STATERESPONSE']._serialized_end=1895
-  _globals['_INTEREST']._serialized_start=1898
-  _globals['_INTEREST']._serialized_end=6440
-  _globals['_INTERESTPEERCONNECT']._serialized_start=6442
-  _globals['_INTERESTPEERCONNECT']._serialized_end=6463
-  _globals['_INTERESTPEERDISCONNECT']._serialized_start=6465
-  _globals['_INTERESTPEERDISCONNECT']._serialized_end=6489
-  _globals['_INTERESTSERVERHELLO']._serialized_start=6491
-  _globals['_INTERESTSERVERHELLO']._serialized_end=6512
-  _globals['_INTERESTGENERICTEXT']._serialized_start=6514
-  _globals['_INTERESTGENERICTEXT']._serialized_end=6568
-  _globals['_INTERESTGAMEMESSAGE']._serialized_start=6570
-  _globals['_INTERESTGAMEMESSAGE']._serialized_end=6624
-  _globals['_INTERESTTANKPACKET']._serialized_start=6626
-  _globals['_INTERESTTANKPACKET']._serialized_end=6679
-  _globals['_INTERESTERROR']._serialized_start=6681
-  _globals['_INTERESTERROR']._serialized_end=6696
-  _globals['_INTERESTTRACK']._serialized_start=6698
-  _globals['_INTERESTTRACK']._serialized_end=6746
-  _globals['_INTERESTCLIENTLOGREQUEST']._serialized_start=6748
-  _globals['_INTERESTCLIENTLOGREQUEST']._serialized_end=6774
-  _globals['_INTERESTCLIENTLOGRESPONSE']._serialized_start=6776
-  _globals['_INTERESTCLIENTLOGRESPONSE']._serialized_end=6803
-  _globals['_INTERESTSTATE']._serialized_start=6805
-  _globals['_INTERESTSTATE']._serialized_end=6853
-  _globals['_INTERESTCALLFUNCTION']._serialized_start=6855
-  _globals['_INTERESTCALLFUNCTION']._serialized_end=6945
-  _globals['_INTERESTUPDATESTATUS']._serialized_start=6947
-  _globals['_INTERESTUPDATESTATUS']._serialized_end=7002
-  _globals['_INTERESTTILECHANGEREQUEST']._serialized_start=7004
-  _globals['_INTERESTTILECHANGEREQUEST']._serialized_end=7064
-  _globals['_INTERESTSENDMAPDATA']._serialized_start=7066
-  _globals['_INTERESTSENDMAPDATA']._serialized_end=7120
-  _globals['_INTERESTSENDTILEUPDATEDATA']._serialized_start=7122
-  _globals['_INTERESTSENDTILEUPDATEDATA']._serialized_end=7183
-  _globals['_INTERESTSENDTILEUPDATEDATAMULTIPLE']._serialized_start=7185
-  _globals['_INTERESTSENDTILEUPDATEDATAMULTIPLE']._serialized_end=7254
-  _globals['_INTERESTTILEACTIVATEREQUEST']._serialized_start=7256
-  _globals['_INTERESTTILEACTIVATEREQUEST']._serialized_end=7318
-  _globals['_INTERESTTILEAPPLYDAMAGE']._serialized_start=7320
-  _globals['_INTERESTTILEAPPLYDAMAGE']._serialized_end=7378
-  _globals['_INTERESTSENDINVENTORYSTATE']._serialized_start=7380
-  _globals['_INTERESTSENDINVENTORYSTATE']._serialized_end=7441
-  _globals['_INTERESTITEMACTIVATEREQUEST']._serialized_start=7443
-  _globals['_INTERESTITEMACTIVATEREQUEST']._serialized_end=7505
-  _globals['_INTERESTITEMACTIVATEOBJECTREQUEST']._serialized_start=7507
-  _globals['_INTERESTITEMACTIVATEOBJECTREQUEST']._serialized_end=7575
-  _globals['_INTERESTSENDTILETREESTATE']._serialized_start=7577
-  _globals['_INTERESTSENDTILETREESTATE']._serialized_end=7637
-  _globals['_INTERESTMODIFYITEMINVENTORY']._serialized_start=7639
-  _globals['_INTERESTMODIFYITEMINVENTORY']._serialized_end=7701
-  _globals['_INTERESTITEMCHANGEOBJECT']._serialized_start=7703
-  _globals['_INTERESTITEMCHANGEOBJECT']._serialized_end=7762
-  _globals['_INTERESTSENDLOCK']._serialized_start=7764
-  _globals['_INTERESTSENDLOCK']._serialized_end=7815
-  _globals['_INTERESTSENDITEMDATABASEDATA']._serialized_start=7817
-  _globals['_INTERESTSENDITEMDATABASEDATA']._serialized_end=7880
-  _globals['_INTERESTSENDPARTICLEEFFECT']._serialized_start=7882
-  _globals['_INTERESTSENDPARTICLEEFFECT']._serialized_end=7943
-  _globals['_INTERESTSETICONSTATE']._serialized_start=7945
-  _globals['_INTERESTSETICONSTATE']._serialized_end=8000
-  _globals['_INTERESTITEMEFFECT']._serialized_start=8002
-  _globals['_INTERESTITEMEFFECT']._serialized_end=8055
-  _globals['_INTERESTSETCHARACTERSTATE']._serialized_start=8057
-  _globals['_INTERESTSETCHARACTERSTATE']._serialized_end=8117
-  _globals['_INTERESTPINGREPLY']._serialized_start=8119
-  _globals['_INTERESTPINGREPLY']._serialized_end=8171
-  _globals['_INTERESTPINGREQUEST']._serialized_start=8173
-  _globals['_INTERESTPINGREQUEST']._serialized_end=8227
-  _globals['_INTERESTGOTPUNCHED']._serialized_start=8229
-  _globals['_INTERESTGOTPUNCHED']._serialized_end=8282
-  _globals['_INTERESTAPPCHECKRESPONSE']._serialized_start=8284
-  _globals['_INTERESTAPPCHECKRESPONSE']._serialized_end=8343
-  _globals['_INTERESTAPPINTEGRITYFAIL']._serialized_start=8345
-  _globals['_INTERESTAPPINTEGRITYFAIL']._serialized_end=8404
-  _globals['_INTERESTDISCONNECT']._serialized_start=8406
-  _globals['_INTERESTDISCONNECT']._serialized_end=8459
-  _globals['_INTERESTBATTLEJOIN']._serialized_start=8461
-  _globals['_INTERESTBATTLEJOIN']._serialized_end=8514
-  _globals['_INTERESTBATTLEEVENT']._serialized_start=8516
-  _globals['_INTERESTBATTLEEVENT']._serialized_end=8570
-  _globals['_INTERESTUSEDOOR']._serialized_start=8572
-  _globals['_INTERESTUSEDOOR']._serialized_end=8622
-  _globals['_INTERESTSENDPARENTAL']._serialized_start=8624
-  _globals['_INTERESTSENDPARENTAL']._serialized_end=8679
-  _globals['_INTERESTGONEFISHIN']._serialized_start=8681
-  _globals['_INTERESTGONEFISHIN']._serialized_end=8734
-  _globals['_INTERESTSTEAM']._serialized_start=8736
-  _globals['_INTERESTSTEAM']._serialized_end=8784
-  _globals['_INTERESTPETBATTLE']._serialized_start=8786
-  _globals['_INTERESTPETBATTLE']._serialized_end=8838
-  _globals['_INTERESTNPC']._serialized_start=8840
-  _globals['_INTERESTNPC']._serialized_end=8886
-  _globals['_INTERESTSPECIAL']._serialized_start=8888
-  _globals['_INTERESTSPECIAL']._serialized_end=8938
-  _globals['_INTERESTSENDPARTICLEEFFECTV2']._serialized_start=8940
-  _globals['_INTERESTSENDPARTICLEEFFECTV2']._serialized_end=9003
-  _globals['_INTERESTACTIVATEARROWTOITEM']._serialized_start=9005
-  _globals['_INTERESTACTIVATEARROWTOITEM']._serialized_end=9067
-  _globals['_INTERESTSELECTTILEINDEX']._serialized_start=9069
-  _globals['_INTERESTSELECTTILEINDEX']._serialized_end=9127
-  _globals['_INTERESTSENDPLAYERTRIBUTEDATA']._serialized_start=9129
-  _globals['_INTERESTSENDPLAYERTRIBUTEDATA']._serialized_end=9193
-  _globals['_INTERESTFTUESETITEMTOQUICKINVENTORY']._serialized_start=9195
-  _globals['_INTERESTFTUESETITEMTOQUICKINVENTORY']._serialized_end=9265
-  _globals['_INTERESTPVENPC']._serialized_start=9267
-  _globals['_INTERESTPVENPC']._serialized_end=9316
-  _globals['_INTERESTPVPCARDBATTLE']._serialized_start=9318
-  _globals['_INTERESTPVPCARDBATTLE']._serialized_end=9374
-  _globals['_INTERESTPVEAPPLYPLAYERDAMAGE']._serialized_start=9376
-  _globals['_INTERESTPVEAPPLYPLAYERDAMAGE']._serialized_end=9439
-  _globals['_INTERESTPVENPCPOSITIONUPDATE']._serialized_start=9441
-  _globals['_INTERESTPVENPCPOSITIONUPDATE']._serialized_end=9504
-  _globals['_INTERESTSETEXTRAMODS']._serialized_start=9506
-  _globals['_INTERESTSETEXTRAMODS']._serialized_end=9561
-  _globals['_INTERESTONSTEPTILEMOD']._serialized_start=9563
-  _globals['_INTERESTONSTEPTILEMOD']._serialized_end=9619
-  _globals['_INTERESTMY']._serialized_start=9621
-  _globals['_INTERESTMY']._serialized_end=9633
-  _globals['_INTERESTWORLD']._serialized_start=9635
-  _globals['_INTERESTWORLD']._serialized_end=9650
-  _globals['_INTERESTOTHERPLAYER']._serialized_start=9652
-  _globals['_INTERESTOTHERPLAYER']._serialized_end=9673
+  _globals['_PACKET']._serialized_end=1514
+  _globals['_PACKET_TYPE']._serialized_start=1102
+  _globals['_PACKET_TYPE']._serialized_end=1491
+  _globals['_HEARTBEAT']._serialized_start=1516
+  _globals['_HEARTBEAT']._serialized_end=1527
+  _globals['_HANDLERSTAT']._serialized_start=1530
+  _globals['_HANDLERSTAT']._serialized_end=1661
+  _globals['_HANDLERSTATS']._serialized_start=1663
+  _globals['_HANDLERSTATS']._serialized_end=1728
+  _globals['_DISCONNECTACK']._serialized_start=1730
+  _globals['_DISCONNECTACK']._serialized_end=1745
+  _globals['_HANDSHAKE']._serialized_start=1747
+  _globals['_HANDSHAKE']._serialized_end=1772
+  _globals['_HANDSHAKEACK']._serialized_start=1774
+  _globals['_HANDSHAKEACK']._serialized_end=1788
+  _globals['_CAPABILITYREQUEST']._serialized_start=1790
+  _globals['_CAPABILITYREQUEST']._serialized_end=1809
+  _globals['_CAPABILITYRESPONSE']._serialized_start=1811
+  _globals['_CAPABILITYRESPONSE']._serialized_end=1883
+  _globals['_DISCONNECT']._serialized_start=1885
+  _globals['_DISCONNECT']._serialized_end=1897
+  _globals['_CONNECTED']._serialized_start=1899
+  _globals['_CONNECTED']._serialized_end=1910
+  _globals['_PENDINGPACKET']._serialized_start=1913
+  _globals['_PENDINGPACKET']._serialized_end=2269
+  _globals['_PENDINGPACKET_OP']._serialized_start=2174
+  _globals['_PENDINGPACKET_OP']._serialized_end=2257
+  _globals['_STATEREQUEST']._serialized_start=2271
+  _globals['_STATEREQUEST']._serialized_end=2319
+  _globals['_STATERESPONSE']._serialized_start=2321
+  _globals['_STATERESPONSE']._serialized_end=2376
+  _globals['_INTEREST']._serialized_start=2379
+  _globals['_INTEREST']._serialized_end=7024
+  _globals['_INTERESTPEERCONNECT']._serialized_start=7026
+  _globals['_INTERESTPEERCONNECT']._serialized_end=7047
+  _globals['_INTERESTPEERDISCONNECT']._serialized_start=7049
+  _globals['_INTERESTPEERDISCONNECT']._serialized_end=7073
+  _globals['_INTERESTSERVERHELLO']._serialized_start=7075
+  _globals['_INTERESTSERVERHELLO']._serialized_end=7096
+  _globals['_INTERESTGENERICTEXT']._serialized_start=7098
+  _globals['_INTERESTGENERICTEXT']._serialized_end=7152
+  _globals['_INTERESTGAMEMESSAGE']._serialized_start=7154
+  _globals['_INTERESTGAMEMESSAGE']._serialized_end=7208
+  _globals['_INTERESTTANKPACKET']._serialized_start=7210
+  _globals['_INTERESTTANKPACKET']._serialized_end=7263
+  _globals['_INTERESTERROR']._serialized_start=7265
+  _globals['_INTERESTERROR']._serialized_end=7280
+  _globals['_INTERESTTRACK']._serialized_start=7282
+  _globals['_INTERESTTRACK']._serialized_end=7330
+  _globals['_INTERESTCLIENTLOGREQUEST']._serialized_start=7332
+  _globals['_INTERESTCLIENTLOGREQUEST']._serialized_end=7358
+  _globals['_INTERESTCLIENTLOGRESPONSE']._serialized_start=7360
+  _globals['_INTERESTCLIENTLOGRESPONSE']._serialized_end=7387
+  _globals['_INTERESTSTATE']._serialized_start=7389
+  _globals['_INTERESTSTATE']._serialized_end=7437
+  _globals['_INTERESTCALLFUNCTION']._serialized_start=7439
+  _globals['_INTERESTCALLFUNCTION']._serialized_end=7529
+  _globals['_INTERESTUPDATESTATUS']._serialized_start=7531
+  _globals['_INTERESTUPDATESTATUS']._serialized_end=7586
+  _globals['_INTERESTTILECHANGEREQUEST']._serialized_start=7588
+  _globals['_INTERESTTILECHANGEREQUEST']._serialized_end=7648
+  _globals['_INTERESTSENDMAPDATA']._serialized_start=7650
+  _globals['_INTERESTSENDMAPDATA']._serialized_end=7704
+  _globals['_INTERESTSENDTILEUPDATEDATA']._serialized_start=7706
+  _globals['_INTERESTSENDTILEUPDATEDATA']._serialized_end=7767
+  _globals['_INTERESTSENDTILEUPDATEDATAMULTIPLE']._serialized_start=7769
+  _globals['_INTERESTSENDTILEUPDATEDATAMULTIPLE']._serialized_end=7838
+  _globals['_INTERESTTILEACTIVATEREQUEST']._serialized_start=7840
+  _globals['_INTERESTTILEACTIVATEREQUEST']._serialized_end=7902
+  _globals['_INTERESTTILEAPPLYDAMAGE']._serialized_start=7904
+  _globals['_INTERESTTILEAPPLYDAMAGE']._serialized_end=7962
+  _globals['_INTERESTSENDINVENTORYSTATE']._serialized_start=7964
+  _globals['_INTERESTSENDINVENTORYSTATE']._serialized_end=8025
+  _globals['_INTERESTITEMACTIVATEREQUEST']._serialized_start=8027
+  _globals['_INTERESTITEMACTIVATEREQUEST']._serialized_end=8089
+  _globals['_INTERESTITEMACTIVATEOBJECTREQUEST']._serialized_start=8091
+  _globals['_INTERESTITEMACTIVATEOBJECTREQUEST']._serialized_end=8159
+  _globals['_INTERESTSENDTILETREESTATE']._serialized_start=8161
+  _globals['_INTERESTSENDTILETREESTATE']._serialized_end=8221
+  _globals['_INTERESTMODIFYITEMINVENTORY']._serialized_start=8223
+  _globals['_INTERESTMODIFYITEMINVENTORY']._serialized_end=8285
+  _globals['_INTERESTITEMCHANGEOBJECT']._serialized_start=8287
+  _globals['_INTERESTITEMCHANGEOBJECT']._serialized_end=8346
+  _globals['_INTERESTSENDLOCK']._serialized_start=8348
+  _globals['_INTERESTSENDLOCK']._serialized_end=8399
+  _globals['_INTERESTSENDITEMDATABASEDATA']._serialized_start=8401
+  _globals['_INTERESTSENDITEMDATABASEDATA']._serialized_end=8464
+  _globals['_INTERESTSENDPARTICLEEFFECT']._serialized_start=8466
+  _globals['_INTERESTSENDPARTICLEEFFECT']._serialized_end=8527
+  _globals['_INTERESTSETICONSTATE']._serialized_start=8529
+  _globals['_INTERESTSETICONSTATE']._serialized_end=8584
+  _globals['_INTERESTITEMEFFECT']._serialized_start=8586
+  _globals['_INTERESTITEMEFFECT']._serialized_end=8639
+  _globals['_INTERESTSETCHARACTERSTATE']._serialized_start=8641
+  _globals['_INTERESTSETCHARACTERSTATE']._serialized_end=8701
+  _globals['_INTERESTPINGREPLY']._serialized_start=8703
+  _globals['_INTERESTPINGREPLY']._serialized_end=8755
+  _globals['_INTERESTPINGREQUEST']._serialized_start=8757
+  _globals['_INTERESTPINGREQUEST']._serialized_end=8811
+  _globals['_INTERESTGOTPUNCHED']._serialized_start=8813
+  _globals['_INTERESTGOTPUNCHED']._serialized_end=8866
+  _globals['_INTERESTAPPCHECKRESPONSE']._serialized_start=8868
+  _globals['_INTERESTAPPCHECKRESPONSE']._serialized_end=8927
+  _globals['_INTERESTAPPINTEGRITYFAIL']._serialized_start=8929
+  _globals['_INTERESTAPPINTEGRITYFAIL']._serialized_end=8988
+  _globals['_INTERESTDISCONNECT']._serialized_start=8990
+  _globals['_INTERESTDISCONNECT']._serialized_end=9043
+  _globals['_INTERESTBATTLEJOIN']._serialized_start=9045
+  _globals['_INTERESTBATTLEJOIN']._serialized_end=9098
+  _globals['_INTERESTBATTLEEVENT']._serialized_start=9100
+  _globals['_INTERESTBATTLEEVENT']._serialized_end=9154
+  _globals['_INTERESTUSEDOOR']._serialized_start=9156
+  _globals['_INTERESTUSEDOOR']._serialized_end=9206
+  _globals['_INTERESTSENDPARENTAL']._serialized_start=9208
+  _globals['_INTERESTSENDPARENTAL']._serialized_end=9263
+  _globals['_INTERESTGONEFISHIN']._serialized_start=9265
+  _globals['_INTERESTGONEFISHIN']._serialized_end=9318
+  _globals['_INTERESTSTEAM']._serialized_start=9320
+  _globals['_INTERESTSTEAM']._serialized_end=9368
+  _globals['_INTERESTPETBATTLE']._serialized_start=9370
+  _globals['_INTERESTPETBATTLE']._serialized_end=9422
+  _globals['_INTERESTNPC']._serialized_start=9424
+  _globals['_INTERESTNPC']._serialized_end=9470
+  _globals['_INTERESTSPECIAL']._serialized_start=9472
+  _globals['_INTERESTSPECIAL']._serialized_end=9522
+  _globals['_INTERESTSENDPARTICLEEFFECTV2']._serialized_start=9524
+  _globals['_INTERESTSENDPARTICLEEFFECTV2']._serialized_end=9587
+  _globals['_INTERESTACTIVATEARROWTOITEM']._serialized_start=9589
+  _globals['_INTERESTACTIVATEARROWTOITEM']._serialized_end=9651
+  _globals['_INTERESTSELECTTILEINDEX']._serialized_start=9653
+  _globals['_INTERESTSELECTTILEINDEX']._serialized_end=9711
+  _globals['_INTERESTSENDPLAYERTRIBUTEDATA']._serialized_start=9713
+  _globals['_INTERESTSENDPLAYERTRIBUTEDATA']._serialized_end=9777
+  _globals['_INTERESTFTUESETITEMTOQUICKINVENTORY']._serialized_start=9779
+  _globals['_INTERESTFTUESETITEMTOQUICKINVENTORY']._serialized_end=9849
+  _globals['_INTERESTPVENPC']._serialized_start=9851
+  _globals['_INTERESTPVENPC']._serialized_end=9900
+  _globals['_INTERESTPVPCARDBATTLE']._serialized_start=9902
+  _globals['_INTERESTPVPCARDBATTLE']._serialized_end=9958
+  _globals['_INTERESTPVEAPPLYPLAYERDAMAGE']._serialized_start=9960
+  _globals['_INTERESTPVEAPPLYPLAYERDAMAGE']._serialized_end=10023
+  _globals['_INTERESTPVENPCPOSITIONUPDATE']._serialized_start=10025
+  _globals['_INTERESTPVENPCPOSITIONUPDATE']._serialized_end=10088
+  _globals['_INTERESTSETEXTRAMODS']._serialized_start=10090
+  _globals['_INTERESTSETEXTRAMODS']._serialized_end=10145
+  _globals['_INTERESTONSTEPTILEMOD']._serialized_start=10147
+  _globals['_INTERESTONSTEPTILEMOD']._serialized_end=10203
+  _globals['_INTERESTSTATEUPDATE']._serialized_start=10206
+  _globals['_INTERESTSTATEUPDATE']._serialized_end=10414
+  _globals['_TILEREGION']._serialized_start=10416
+  _globals['_TILEREGION']._serialized_end=10472
+  _globals['_INTERESTMY']._serialized_start=10474
+  _globals['_INTERESTMY']._serialized_end=10486
+  _globals['_INTERESTWORLD']._serialized_start=10488
+  _globals['_INTERESTWORLD']._serialized_end=10503
+  _globals['_INTERESTOTHERPLAYER']._serialized_start=10505
+  _globals['_INTERESTOTHERPLAYER']._serialized_end=10526
 # @@protoc_insertion_point(module_scope)
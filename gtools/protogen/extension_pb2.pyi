@@ -156,7 +156,7 @@ BLOCKING_MODE_ONESHOT: BlockingMode
 BLOCKING_MODE_ONESHOT_AND_CANCEL: BlockingMode
 
 class Packet(_message.Message):
-    __slots__ = ("type", "handshake", "handshake_ack", "capability_request", "capability_response", "disconnect", "disconnect_ack", "connected", "pending_packet", "state_request", "state_response", "state_update", "push_packet", "heart_beat")
+    __slots__ = ("type", "handshake", "handshake_ack", "capability_request", "capability_response", "disconnect", "disconnect_ack", "connected", "pending_packet", "state_request", "state_response", "state_update", "push_packet", "heart_beat", "handler_stats", "state_update_batch", "session")
     class Type(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
         __slots__ = ()
         TYPE_UNSPECIFIED: _ClassVar[Packet.Type]
@@ -173,6 +173,8 @@ class Packet(_message.Message):
         TYPE_STATE_UPDATE: _ClassVar[Packet.Type]
         TYPE_PUSH_PACKET: _ClassVar[Packet.Type]
         TYPE_HEARTBEAT: _ClassVar[Packet.Type]
+        TYPE_HANDLER_STATS: _ClassVar[Packet.Type]
+        TYPE_STATE_UPDATE_BATCH: _ClassVar[Packet.Type]
     TYPE_UNSPECIFIED: Packet.Type
     TYPE_HANDSHAKE: Packet.Type
     TYPE_HANDSHAKE_ACK: Packet.Type
@@ -187,6 +189,8 @@ class Packet(_message.Message):
     TYPE_STATE_UPDATE: Packet.Type
     TYPE_PUSH_PACKET: Packet.Type
     TYPE_HEARTBEAT: Packet.Type
+    TYPE_HANDLER_STATS: Packet.Type
+    TYPE_STATE_UPDATE_BATCH: Packet.Type
     TYPE_FIELD_NUMBER: _ClassVar[int]
     HANDSHAKE_FIELD_NUMBER: _ClassVar[int]
     HANDSHAKE_ACK_FIELD_NUMBER: _ClassVar[int]
@@ -201,6 +205,9 @@ class Packet(_message.Message):
     STATE_UPDATE_FIELD_NUMBER: _ClassVar[int]
     PUSH_PACKET_FIELD_NUMBER: _ClassVar[int]
     HEART_BEAT_FIELD_NUMBER: _ClassVar[int]
+    HANDLER_STATS_FIELD_NUMBER: _ClassVar[int]
+    STATE_UPDATE_BATCH_FIELD_NUMBER: _ClassVar[int]
+    SESSION_FIELD_NUMBER: _ClassVar[int]
     type: Packet.Type
     handshake: Handshake
     handshake_ack: HandshakeAck
@@ -215,12 +222,37 @@ class Packet(_message.Message):
     state_update: _state_pb2.StateUpdate
     push_packet: PendingPacket
     heart_beat: HeartBeat
-    def __init__(self, type: _Optional[_Union[Packet.Type, str]] = ..., handshake: _Optional[_Union[Handshake, _Mapping]] = ..., handshake_ack: _Optional[_Union[HandshakeAck, _Mapping]] = ..., capability_request: _Optional[_Union[CapabilityRequest, _Mapping]] = ..., capability_response: _Optional[_Union[CapabilityResponse, _Mapping]] = ..., disconnect: _Optional[_Union[Disconnect, _Mapping]] = ..., disconnect_ack: _Optional[_Union[DisconnectAck, _Mapping]] = ..., connected: _Optional[_Union[Connected, _Mapping]] = ..., pending_packet: _Optional[_Union[PendingPacket, _Mapping]] = ..., state_request: _Optional[_Union[StateRequest, _Mapping]] = ..., state_response: _Optional[_Union[StateResponse, _Mapping]] = ..., state_update: _Optional[_Union[_state_pb2.StateUpdate, _Mapping]] = ..., push_packet: _Optional[_Union[PendingPacket, _Mapping]] = ..., heart_beat: _Optional[_Union[HeartBeat, _Mapping]] = ...) -> None: ...
+    handler_stats: HandlerStats
+    state_update_batch: _state_pb2.StateUpdateBatch
+    session: int
+    def __init__(self, type: _Optional[_Union[Packet.Type, str]] = ..., handshake: _Optional[_Union[Handshake, _Mapping]] = ..., handshake_ack: _Optional[_Union[HandshakeAck, _Mapping]] = ..., capability_request: _Optional[_Union[CapabilityRequest, _Mapping]] = ..., capability_response: _Optional[_Union[CapabilityResponse, _Mapping]] = ..., disconnect: _Optional[_Union[Disconnect, _Mapping]] = ..., disconnect_ack: _Optional[_Union[DisconnectAck, _Mapping]] = ..., connected: _Optional[_Union[Connected, _Mapping]] = ..., pending_packet: _Optional[_Union[PendingPacket, _Mapping]] = ..., state_request: _Optional[_Union[StateRequest, _Mapping]] = ..., state_response: _Optional[_Union[StateResponse, _Mapping]] = ..., state_update: _Optional[_Union[_state_pb2.StateUpdate, _Mapping]] = ..., push_packet: _Optional[_Union[PendingPacket, _Mapping]] = ..., heart_beat: _Optional[_Union[HeartBeat, _Mapping]] = ..., handler_stats: _Optional[_Union[HandlerStats, _Mapping]] = ..., state_update_batch: _Optional[_Union[_state_pb2.StateUpdateBatch, _Mapping]] = ..., session: _Optional[int] = ...) -> None: ...
 
 class HeartBeat(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
 
+class HandlerStat(_message.Message):
+    __slots__ = ("interest_id", "count", "total_ns", "max_ns", "queued_total_ns", "queued_max_ns")
+    INTEREST_ID_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    TOTAL_NS_FIELD_NUMBER: _ClassVar[int]
+    MAX_NS_FIELD_NUMBER: _ClassVar[int]
+    QUEUED_TOTAL_NS_FIELD_NUMBER: _ClassVar[int]
+    QUEUED_MAX_NS_FIELD_NUMBER: _ClassVar[int]
+    interest_id: int
+    count: int
+    total_ns: int
+    max_ns: int
+    queued_total_ns: int
+    queued_max_ns: int
+    def __init__(self, interest_id: _Optional[int] = ..., count: _Optional[int] = ..., total_ns: _Optional[int] = ..., max_ns: _Optional[int] = ..., queued_total_ns: _Optional[int] = ..., queued_max_ns: _Optional[int] = ...) -> None: ...
+
+class HandlerStats(_message.Message):
+    __slots__ = ("stat",)
+    STAT_FIELD_NUMBER: _ClassVar[int]
+    stat: _containers.RepeatedCompositeFieldContainer[HandlerStat]
+    def __init__(self, stat: _Optional[_Iterable[_Union[HandlerStat, _Mapping]]] = ...) -> None: ...
+
 class DisconnectAck(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
@@ -254,7 +286,7 @@ class Connected(_message.Message):
     def __init__(self) -> None: ...
 
 class PendingPacket(_message.Message):
-    __slots__ = ("buf", "packet_flags", "interest_id", "direction", "_op", "_packet_id", "_hit_count", "_rtt_ns")
+    __slots__ = ("buf", "packet_flags", "interest_id", "direction", "_op", "_packet_id", "_hit_count", "_rtt_ns", "session")
     class Op(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
         __slots__ = ()
         OP_UNSPECIFIED: _ClassVar[PendingPacket.Op]
@@ -275,6 +307,7 @@ class PendingPacket(_message.Message):
     _PACKET_ID_FIELD_NUMBER: _ClassVar[int]
     _HIT_COUNT_FIELD_NUMBER: _ClassVar[int]
     _RTT_NS_FIELD_NUMBER: _ClassVar[int]
+    SESSION_FIELD_NUMBER: _ClassVar[int]
     buf: bytes
     packet_flags: int
     interest_id: int
@@ -283,11 +316,14 @@ class PendingPacket(_message.Message):
     _packet_id: bytes
     _hit_count: int
     _rtt_ns: int
-    def __init__(self, buf: _Optional[bytes] = ..., packet_flags: _Optional[int] = ..., interest_id: _Optional[int] = ..., direction: _Optional[_Union[Direction, str]] = ..., _op: _Optional[_Union[PendingPacket.Op, str]] = ..., _packet_id: _Optional[bytes] = ..., _hit_count: _Optional[int] = ..., _rtt_ns: _Optional[int] = ...) -> None: ...
+    session: int
+    def __init__(self, buf: _Optional[bytes] = ..., packet_flags: _Optional[int] = ..., interest_id: _Optional[int] = ..., direction: _Optional[_Union[Direction, str]] = ..., _op: _Optional[_Union[PendingPacket.Op, str]] = ..., _packet_id: _Optional[bytes] = ..., _hit_count: _Optional[int] = ..., _rtt_ns: _Optional[int] = ..., session: _Optional[int] = ...) -> None: ...
 
 class StateRequest(_message.Message):
-    __slots__ = ()
-    def __init__(self) -> None: ...
+    __slots__ = ("session",)
+    SESSION_FIELD_NUMBER: _ClassVar[int]
+    session: int
+    def __init__(self, session: _Optional[int] = ...) -> None: ...
 
 class StateResponse(_message.Message):
     __slots__ = ("state",)
@@ -296,7 +332,7 @@ class StateResponse(_message.Message):
     def __init__(self, state: _Optional[_Union[_growtopia_pb2.State, _Mapping]] = ...) -> None: ...
 
 class Interest(_message.Message):
-    __slots__ = ("interest", "priority", "blocking_mode", "direction", "id", "peer_connect", "peer_disconnect", "server_hello", "generic_text", "game_message", "tank_packet", "error", "track", "client_log_request", "client_log_response", "state", "call_function", "update_status", "tile_change_request", "send_map_data", "send_tile_update_data", "send_tile_update_data_multiple", "tile_activate_request", "tile_apply_damage", "send_inventory_state", "item_activate_request", "item_activate_object_request", "send_tile_tree_state", "modify_item_inventory", "item_change_object", "send_lock", "send_item_database_data", "send_particle_effect", "set_icon_state", "item_effect", "set_character_state", "ping_reply", "ping_request", "got_punched", "app_check_response", "app_integrity_fail", "disconnect", "battle_join", "battle_event", "use_door", "send_parental", "gone_fishin", "steam", "pet_battle", "npc", "special", "send_particle_effect_v2", "activate_arrow_to_item", "select_tile_index", "send_player_tribute_data", "ftue_set_item_to_quick_inventory", "pve_npc", "pvp_card_battle", "pve_apply_player_damage", "pve_npc_position_update", "set_extra_mods", "on_step_tile_mod")
+    __slots__ = ("interest", "priority", "blocking_mode", "direction", "id", "peer_connect", "peer_disconnect", "server_hello", "generic_text", "game_message", "tank_packet", "error", "track", "client_log_request", "client_log_response", "state", "call_function", "update_status", "tile_change_request", "send_map_data", "send_tile_update_data", "send_tile_update_data_multiple", "tile_activate_request", "tile_apply_damage", "send_inventory_state", "item_activate_request", "item_activate_object_request", "send_tile_tree_state", "modify_item_inventory", "item_change_object", "send_lock", "send_item_database_data", "send_particle_effect", "set_icon_state", "item_effect", "set_character_state", "ping_reply", "ping_request", "got_punched", "app_check_response", "app_integrity_fail", "disconnect", "battle_join", "battle_event", "use_door", "send_parental", "gone_fishin", "steam", "pet_battle", "npc", "special", "send_particle_effect_v2", "activate_arrow_to_item", "select_tile_index", "send_player_tribute_data", "ftue_set_item_to_quick_inventory", "pve_npc", "pvp_card_battle", "pve_apply_player_damage", "pve_npc_position_update", "set_extra_mods", "on_step_tile_mod", "state_update", "session")
     INTEREST_FIELD_NUMBER: _ClassVar[int]
     PRIORITY_FIELD_NUMBER: _ClassVar[int]
     BLOCKING_MODE_FIELD_NUMBER: _ClassVar[int]
@@ -359,6 +395,8 @@ class Interest(_message.Message):
     PVE_NPC_POSITION_UPDATE_FIELD_NUMBER: _ClassVar[int]
     SET_EXTRA_MODS_FIELD_NUMBER: _ClassVar[int]
     ON_STEP_TILE_MOD_FIELD_NUMBER: _ClassVar[int]
+    STATE_UPDATE_FIELD_NUMBER: _ClassVar[int]
+    SESSION_FIELD_NUMBER: _ClassVar[int]
     interest: InterestType
     priority: int
     blocking_mode: BlockingMode
@@ -421,7 +459,9 @@ class Interest(_message.Message):
     pve_npc_position_update: InterestPveNpcPositionUpdate
     set_extra_mods: InterestSetExtraMods
     on_step_tile_mod: InterestOnStepTileMod
-    def __init__(self, interest: _Optional[_Union[InterestType, str]] = ..., priority: _Optional[int] = ..., blocking_mode: _Optional[_Union[BlockingMode, str]] = ..., direction: _Optional[_Union[Direction, str]] = ..., id: _Optional[int] = ..., peer_connect: _Optional[_Union[InterestPeerConnect, _Mapping]] = ..., peer_disconnect: _Optional[_Union[InterestPeerDisconnect, _Mapping]] = ..., server_hello: _Optional[_Union[InterestServerHello, _Mapping]] = ..., generic_text: _Optional[_Union[InterestGenericText, _Mapping]] = ..., game_message: _Optional[_Union[InterestGameMessage, _Mapping]] = ..., tank_packet: _Optional[_Union[InterestTankPacket, _Mapping]] = ..., error: _Optional[_Union[InterestError, _Mapping]] = ..., track: _Optional[_Union[InterestTrack, _Mapping]] = ..., client_log_request: _Optional[_Union[InterestClientLogRequest, _Mapping]] = ..., client_log_response: _Optional[_Union[InterestClientLogResponse, _Mapping]] = ..., state: _Optional[_Union[InterestState, _Mapping]] = ..., call_function: _Optional[_Union[InterestCallFunction, _Mapping]] = ..., update_status: _Optional[_Union[InterestUpdateStatus, _Mapping]] = ..., tile_change_request: _Optional[_Union[InterestTileChangeRequest, _Mapping]] = ..., send_map_data: _Optional[_Union[InterestSendMapData, _Mapping]] = ..., send_tile_update_data: _Optional[_Union[InterestSendTileUpdateData, _Mapping]] = ..., send_tile_update_data_multiple: _Optional[_Union[InterestSendTileUpdateDataMultiple, _Mapping]] = ..., tile_activate_request: _Optional[_Union[InterestTileActivateRequest, _Mapping]] = ..., tile_apply_damage: _Optional[_Union[InterestTileApplyDamage, _Mapping]] = ..., send_inventory_state: _Optional[_Union[InterestSendInventoryState, _Mapping]] = ..., item_activate_request: _Optional[_Union[InterestItemActivateRequest, _Mapping]] = ..., item_activate_object_request: _Optional[_Union[InterestItemActivateObjectRequest, _Mapping]] = ..., send_tile_tree_state: _Optional[_Union[InterestSendTileTreeState, _Mapping]] = ..., modify_item_inventory: _Optional[_Union[InterestModifyItemInventory, _Mapping]] = ..., item_change_object: _Optional[_Union[InterestItemChangeObject, _Mapping]] = ..., send_lock: _Optional[_Union[InterestSendLock, _Mapping]] = ..., send_item_database_data: _Optional[_Union[InterestSendItemDatabaseData, _Mapping]] = ..., send_particle_effect: _Optional[_Union[InterestSendParticleEffect, _Mapping]] = ..., set_icon_state: _Optional[_Union[InterestSetIconState, _Mapping]] = ..., item_effect: _Optional[_Union[InterestItemEffect, _Mapping]] = ..., set_character_state: _Optional[_Union[InterestSetCharacterState, _Mapping]] = ..., ping_reply: _Optional[_Union[InterestPingReply, _Mapping]] = ..., ping_request: _Optional[_Union[InterestPingRequest, _Mapping]] = ..., got_punched: _Optional[_Union[InterestGotPunched, _Mapping]] = ..., app_check_response: _Optional[_Union[InterestAppCheckResponse, _Mapping]] = ..., app_integrity_fail: _Optional[_Union[InterestAppIntegrityFail, _Mapping]] = ..., disconnect: _Optional[_Union[InterestDisconnect, _Mapping]] = ..., battle_join: _Optional[_Union[InterestBattleJoin, _Mapping]] = ..., battle_event: _Optional[_Union[InterestBattleEvent, _Mapping]] = ..., use_door: _Optional[_Union[InterestUseDoor, _Mapping]] = ..., send_parental: _Optional[_Union[InterestSendParental, _Mapping]] = ..., gone_fishin: _Optional[_Union[InterestGoneFishin, _Mapping]] = ..., steam: _Optional[_Union[InterestSteam, _Mapping]] = ..., pet_battle: _Optional[_Union[InterestPetBattle, _Mapping]] = ..., npc: _Optional[_Union[InterestNpc, _Mapping]] = ..., special: _Optional[_Union[InterestSpecial, _Mapping]] = ..., send_particle_effect_v2: _Optional[_Union[InterestSendParticleEffectV2, _Mapping]] = ..., activate_arrow_to_item: _Optional[_Union[InterestActivateArrowToItem, _Mapping]] = ..., select_tile_index: _Optional[_Union[InterestSelectTileIndex, _Mapping]] = ..., send_player_tribute_data: _Optional[_Union[InterestSendPlayerTributeData, _Mapping]] = ..., ftue_set_item_to_quick_inventory: _Optional[_Union[InterestFtueSetItemToQuickInventory, _Mapping]] = ..., pve_npc: _Optional[_Union[InterestPveNpc, _Mapping]] = ..., pvp_card_battle: _Optional[_Union[InterestPvpCardBattle, _Mapping]] = ..., pve_apply_player_damage: _Optional[_Union[InterestPveApplyPlayerDamage, _Mapping]] = ..., pve_npc_position_update: _Optional[_Union[InterestPveNpcPositionUpdate, _Mapping]] = ..., set_extra_mods: _Optional[_Union[InterestSetExtraMods, _Mapping]] = ..., on_step_tile_mod: _Optional[_Union[InterestOnStepTileMod, _Mapping]] = ...) -> None: ...
+    state_update: InterestStateUpdate
+    session: int
+    def __init__(self, interest: _Optional[_Union[InterestType, str]] = ..., priority: _Optional[int] = ..., blocking_mode: _Optional[_Union[BlockingMode, str]] = ..., direction: _Optional[_Union[Direction, str]] = ..., id: _Optional[int] = ..., peer_connect: _Optional[_Union[InterestPeerConnect, _Mapping]] = ..., peer_disconnect: _Optional[_Union[InterestPeerDisconnect, _Mapping]] = ..., server_hello: _Optional[_Union[InterestServerHello, _Mapping]] = ..., generic_text: _Optional[_Union[InterestGenericText, _Mapping]] = ..., game_message: _Optional[_Union[InterestGameMessage, _Mapping]] = ..., tank_packet: _Optional[_Union[InterestTankPacket, _Mapping]] = ..., error: _Optional[_Union[InterestError, _Mapping]] = ..., track: _Optional[_Union[InterestTrack, _Mapping]] = ..., client_log_request: _Optional[_Union[InterestClientLogRequest, _Mapping]] = ..., client_log_response: _Optional[_Union[InterestClientLogResponse, _Mapping]] = ..., state: _Optional[_Union[InterestState, _Mapping]] = ..., call_function: _Optional[_Union[InterestCallFunction, _Mapping]] = ..., update_status: _Optional[_Union[InterestUpdateStatus, _Mapping]] = ..., tile_change_request: _Optional[_Union[InterestTileChangeRequest, _Mapping]] = ..., send_map_data: _Optional[_Union[InterestSendMapData, _Mapping]] = ..., send_tile_update_data: _Optional[_Union[InterestSendTileUpdateData, _Mapping]] = ..., send_tile_update_data_multiple: _Optional[_Union[InterestSendTileUpdateDataMultiple, _Mapping]] = ..., tile_activate_request: _Optional[_Union[InterestTileActivateRequest, _Mapping]] = ..., tile_apply_damage: _Optional[_Union[InterestTileApplyDamage, _Mapping]] = ..., send_inventory_state: _Optional[_Union[InterestSendInventoryState, _Mapping]] = ..., item_activate_request: _Optional[_Union[InterestItemActivateRequest, _Mapping]] = ..., item_activate_object_request: _Optional[_Union[InterestItemActivateObjectRequest, _Mapping]] = ..., send_tile_tree_state: _Optional[_Union[InterestSendTileTreeState, _Mapping]] = ..., modify_item_inventory: _Optional[_Union[InterestModifyItemInventory, _Mapping]] = ..., item_change_object: _Optional[_Union[InterestItemChangeObject, _Mapping]] = ..., send_lock: _Optional[_Union[InterestSendLock, _Mapping]] = ..., send_item_database_data: _Optional[_Union[InterestSendItemDatabaseData, _Mapping]] = ..., send_particle_effect: _Optional[_Union[InterestSendParticleEffect, _Mapping]] = ..., set_icon_state: _Optional[_Union[InterestSetIconState, _Mapping]] = ..., item_effect: _Optional[_Union[InterestItemEffect, _Mapping]] = ..., set_character_state: _Optional[_Union[InterestSetCharacterState, _Mapping]] = ..., ping_reply: _Optional[_Union[InterestPingReply, _Mapping]] = ..., ping_request: _Optional[_Union[InterestPingRequest, _Mapping]] = ..., got_punched: _Optional[_Union[InterestGotPunched, _Mapping]] = ..., app_check_response: _Optional[_Union[InterestAppCheckResponse, _Mapping]] = ..., app_integrity_fail: _Optional[_Union[InterestAppIntegrityFail, _Mapping]] = ..., disconnect: _Optional[_Union[InterestDisconnect, _Mapping]] = ..., battle_join: _Optional[_Union[InterestBattleJoin, _Mapping]] = ..., battle_event: _Optional[_Union[InterestBattleEvent, _Mapping]] = ..., use_door: _Optional[_Union[InterestUseDoor, _Mapping]] = ..., send_parental: _Optional[_Union[InterestSendParental, _Mapping]] = ..., gone_fishin: _Optional[_Union[InterestGoneFishin, _Mapping]] = ..., steam: _Optional[_Union[InterestSteam, _Mapping]] = ..., pet_battle: _Optional[_Union[InterestPetBattle, _Mapping]] = ..., npc: _Optional[_Union[InterestNpc, _Mapping]] = ..., special: _Optional[_Union[InterestSpecial, _Mapping]] = ..., send_particle_effect_v2: _Optional[_Union[InterestSendParticleEffectV2, _Mapping]] = ..., activate_arrow_to_item: _Optional[_Union[InterestActivateArrowToItem, _Mapping]] = ..., select_tile_index: _Optional[_Union[InterestSelectTileIndex, _Mapping]] = ..., send_player_tribute_data: _Optional[_Union[InterestSendPlayerTributeData, _Mapping]] = ..., ftue_set_item_to_quick_inventory: _Optional[_Union[InterestFtueSetItemToQuickInventory, _Mapping]] = ..., pve_npc: _Optional[_Union[InterestPveNpc, _Mapping]] = ..., pvp_card_battle: _Optional[_Union[InterestPvpCardBattle, _Mapping]] = ..., pve_apply_player_damage: _Optional[_Union[InterestPveApplyPlayerDamage, _Mapping]] = ..., pve_npc_position_update: _Optional[_Union[InterestPveNpcPositionUpdate, _Mapping]] = ..., set_extra_mods: _Optional[_Union[InterestSetExtraMods, _Mapping]] = ..., on_step_tile_mod: _Optional[_Union[InterestOnStepTileMod, _Mapping]] = ..., state_update: _Optional[_Union[InterestStateUpdate, _Mapping]] = ..., session: _Optional[int] = ...) -> None: ...
 
 class InterestPeerConnect(_message.Message):
     __slots__ = ()
@@ -755,6 +795,32 @@ class InterestOnStepTileMod(_message.Message):
     where: _containers.RepeatedCompositeFieldContainer[_op_pb2.BinOp]
     def __init__(self, where: _Optional[_Iterable[_Union[_op_pb2.BinOp, _Mapping]]] = ...) -> None: ...
 
+class InterestStateUpdate(_message.Message):
+    __slots__ = ("what", "net_id", "me", "region", "position_rate")
+    WHAT_FIELD_NUMBER: _ClassVar[int]
+    NET_ID_FIELD_NUMBER: _ClassVar[int]
+    ME_FIELD_NUMBER: _ClassVar[int]
+    REGION_FIELD_NUMBER: _ClassVar[int]
+    POSITION_RATE_FIELD_NUMBER: _ClassVar[int]
+    what: _containers.RepeatedScalarFieldContainer[_state_pb2.StateUpdateWhat]
+    net_id: _containers.RepeatedScalarFieldContainer[int]
+    me: bool
+    region: TileRegion
+    position_rate: float
+    def __init__(self, what: _Optional[_Iterable[_Union[_state_pb2.StateUpdateWhat, str]]] = ..., net_id: _Optional[_Iterable[int]] = ..., me: _Optional[bool] = ..., region: _Optional[_Union[TileRegion, _Mapping]] = ..., position_rate: _Optional[float] = ...) -> None: ...
+
+class TileRegion(_message.Message):
+    __slots__ = ("x", "y", "w", "h")
+    X_FIELD_NUMBER: _ClassVar[int]
+    Y_FIELD_NUMBER: _ClassVar[int]
+    W_FIELD_NUMBER: _ClassVar[int]
+    H_FIELD_NUMBER: _ClassVar[int]
+    x: int
+    y: int
+    w: int
+    h: int
+    def __init__(self, x: _Optional[int] = ..., y: _Optional[int] = ..., w: _Optional[int] = ..., h: _Optional[int] = ...) -> None: ...
+
 class InterestMy(_message.Message):
     __slots__ = ()
     def __init__(self) -> None: ...
@@ -97,6 +97,28 @@ class StateUpdate(_message.Message):
     reload_items_database: ReloadItemsDatabase
     def __init__(self, what: _Optional[_Union[StateUpdateWhat, str]] = ..., player_update: _Optional[_Union[PlayerUpdate, _Mapping]] = ..., set_my_player: _Optional[int] = ..., send_inventory: _Optional[_Union[_growtopia_pb2.Inventory, _Mapping]] = ..., modify_inventory: _Optional[_Union[ModifyInventory, _Mapping]] = ..., enter_world: _Optional[_Union[EnterWorld, _Mapping]] = ..., player_join: _Optional[_Union[_growtopia_pb2.Player, _Mapping]] = ..., player_leave: _Optional[int] = ..., modify_world: _Optional[_Union[ModifyWorld, _Mapping]] = ..., modify_world_batched: _Optional[_Union[ModifyWorldBatched, _Mapping]] = ..., modify_item: _Optional[_Union[ModifyItem, _Mapping]] = ..., update_status: _Optional[int] = ..., character_state: _Optional[_Union[_growtopia_pb2.CharacterState, _Mapping]] = ..., set_my_telemetry: _Optional[_Union[SetMyTelemetry, _Mapping]] = ..., send_lock: _Optional[_Union[SendLock, _Mapping]] = ..., update_tree_state: _Optional[_Union[UpdateTreeState, _Mapping]] = ..., tile_change_req: _Optional[_Union[TileChangeRequest, _Mapping]] = ..., npc_update: _Optional[_Union[NpcUpdate, _Mapping]] = ..., update_clothing: _Optional[_Union[UpdateClothing, _Mapping]] = ..., reload_items_database: _Optional[_Union[ReloadItemsDatabase, _Mapping]] = ...) -> None: ...
 
+class StateUpdateBatch(_message.Message):
+    __slots__ = ("updates", "positions")
+    UPDATES_FIELD_NUMBER: _ClassVar[int]
+    POSITIONS_FIELD_NUMBER: _ClassVar[int]
+    updates: _containers.RepeatedCompositeFieldContainer[StateUpdate]
+    positions: PositionDeltas
+    def __init__(self, updates: _Optional[_Iterable[_Union[StateUpdate, _Mapping]]] = ..., positions: _Optional[_Union[PositionDeltas, _Mapping]] = ...) -> None: ...
+
+class PositionDeltas(_message.Message):
+    __slots__ = ("at", "net_id", "dx", "dy", "flags")
+    AT_FIELD_NUMBER: _ClassVar[int]
+    NET_ID_FIELD_NUMBER: _ClassVar[int]
+    DX_FIELD_NUMBER: _ClassVar[int]
+    DY_FIELD_NUMBER: _ClassVar[int]
+    FLAGS_FIELD_NUMBER: _ClassVar[int]
+    at: _containers.RepeatedScalarFieldContainer[int]
+    net_id: _containers.RepeatedScalarFieldContainer[int]
+    dx: _containers.RepeatedScalarFieldContainer[int]
+    dy: _containers.RepeatedScalarFieldContainer[int]
+    flags: _containers.RepeatedScalarFieldContainer[int]
+    def __init__(self, at: _Optional[_Iterable[int]] = ..., net_id: _Optional[_Iterable[int]] = ..., dx: _Optional[_Iterable[int]] = ..., dy: _Optional[_Iterable[int]] = ..., flags: _Optional[_Iterable[int]] = ...) -> None: ...
+
 class ReloadItemsDatabase(_message.Message):
     __slots__ = ("data",)
     DATA_FIELD_NUMBER: _ClassVar[int]
@@ -242,16 +264,40 @@ class ModifyWorldBatched(_message.Message):
     def __init__(self, events: _Optional[_Iterable[_Union[ModifyWorld, _Mapping]]] = ...) -> None: ...
 
 class SetMyTelemetry(_message.Message):
-    __slots__ = ("server_ping", "client_ping", "time_since_login", "time_in_world")
+    __slots__ = ("server_ping", "client_ping", "time_since_login", "time_in_world", "broker")
     SERVER_PING_FIELD_NUMBER: _ClassVar[int]
     CLIENT_PING_FIELD_NUMBER: _ClassVar[int]
     TIME_SINCE_LOGIN_FIELD_NUMBER: _ClassVar[int]
     TIME_IN_WORLD_FIELD_NUMBER: _ClassVar[int]
+    BROKER_FIELD_NUMBER: _ClassVar[int]
     server_ping: int
     client_ping: int
     time_since_login: float
     time_in_world: float
-    def __init__(self, server_ping: _Optional[int] = ..., client_ping: _Optional[int] = ..., time_since_login: _Optional[float] = ..., time_in_world: _Optional[float] = ...) -> None: ...
+    broker: BrokerTelemetry
+    def __init__(self, server_ping: _Optional[int] = ..., client_ping: _Optional[int] = ..., time_since_login: _Optional[float] = ..., time_in_world: _Optional[float] = ..., broker: _Optional[_Union[BrokerTelemetry, _Mapping]] = ...) -> None: ...
+
+class ExtensionInFlight(_message.Message):
+    __slots__ = ("id", "count")
+    ID_FIELD_NUMBER: _ClassVar[int]
+    COUNT_FIELD_NUMBER: _ClassVar[int]
+    id: bytes
+    count: int
+    def __init__(self, id: _Optional[bytes] = ..., count: _Optional[int] = ...) -> None: ...
+
+class BrokerTelemetry(_message.Message):
+    __slots__ = ("pending_chains", "pending_packets", "expired", "shed", "in_flight")
+    PENDING_CHAINS_FIELD_NUMBER: _ClassVar[int]
+    PENDING_PACKETS_FIELD_NUMBER: _ClassVar[int]
+    EXPIRED_FIELD_NUMBER: _ClassVar[int]
+    SHED_FIELD_NUMBER: _ClassVar[int]
+    IN_FLIGHT_FIELD_NUMBER: _ClassVar[int]
+    pending_chains: int
+    pending_packets: int
+    expired: int
+    shed: int
+    in_flight: _containers.RepeatedCompositeFieldContainer[ExtensionInFlight]
+    def __init__(self, pending_chains: _Optional[int] = ..., pending_packets: _Optional[int] = ..., expired: _Optional[int] = ..., shed: _Optional[int] = ..., in_flight: _Optional[_Iterable[_Union[ExtensionInFlight, _Mapping]]] = ...) -> None: ...
 
 class ModifyItem(_message.Message):
     __slots__ = ("op", "item_id", "uid", "amount", "x", "y", "flags")
@@ -25,6 +25,14 @@ from thirdparty.enet.bindings import (
 )
 
 
+def peer_key(peer: Pointer[ENetPeer] | None) -> int:
+    """stable identity of a peer, ctypes pointer objects themselves don't compare by address"""
+    if not peer:
+        return 0
+
+    return ctypes.cast(peer, ctypes.c_void_p).value or 0
+
+
 @dataclass
 class PyENetPacket:
     data: bytes | None
@@ -0,0 +1,98 @@
+from collections import deque
+from enum import Enum, auto
+import heapq
+import itertools
+import logging
+import threading
+from typing import Any, Callable, Hashable
+
+logger = logging.getLogger("ext-executor")
+
+type Job = Callable[[], Any]
+
+
+class Ordering(Enum):
+    """how packets for one concurrently dispatched interest are ordered"""
+
+    # one at a time, in the order they arrived
+    INTEREST = auto()
+    # one at a time per proxy session, sessions run in parallel
+    SESSION = auto()
+    # no ordering, the handler may run concurrently with itself
+    NONE = auto()
+
+
+class StrandPool:
+    """fixed size thread pool. jobs that share a key form a strand and run one at a time in submit order, among
+    the jobs ready to run the lowest rank goes first. `submit` blocks while `capacity` jobs are queued"""
+
+    def __init__(self, name: str, threads: int, capacity: int = 4096) -> None:
+        self._capacity = capacity
+        self._lock = threading.Lock()
+        self._work = threading.Condition(self._lock)
+        self._space = threading.Condition(self._lock)
+        self._ready: list[tuple[int, int, Hashable | None, Job]] = []
+        # key of a strand with a job queued or running -> jobs waiting behind it
+        self._strands: dict[Hashable, deque[tuple[int, Job]]] = {}
+        self._queued = 0
+        self._seq = itertools.count()
+        self._stopped = False
+
+        self._threads = [threading.Thread(target=self._run, name=f"{name}-{i}", daemon=True) for i in range(max(1, threads))]
+        for t in self._threads:
+            t.start()
+
+    def __len__(self) -> int:
+        return self._queued
+
+    def submit(self, key: Hashable | None, rank: int, job: Job) -> None:
+        with self._lock:
+            while self._queued >= self._capacity and not self._stopped:
+                self._space.wait()
+            if self._stopped:
+                return
+
+            self._queued += 1
+            if key is not None:
+                if (strand := self._strands.get(key)) is not None:
+                    strand.append((rank, job))
+                    return
+                self._strands[key] = deque()
+            heapq.heappush(self._ready, (rank, next(self._seq), key, job))
+            self._work.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while not self._ready and not self._stopped:
+                    self._work.wait()
+                if self._stopped:
+                    return
+                _, _, key, job = heapq.heappop(self._ready)
+
+            try:
+                job()
+            except Exception:
+                logger.exception("job failed")
+
+            with self._lock:
+                self._queued -= 1
+                self._space.notify()
+                if key is not None:
+                    strand = self._strands[key]
+                    if strand:
+                        rank, job = strand.popleft()
+                        heapq.heappush(self._ready, (rank, next(self._seq), key, job))
+                        self._work.notify()
+                    else:
+                        del self._strands[key]
+
+    def stop(self, timeout: float = 2.0) -> None:
+        with self._lock:
+            self._stopped = True
+            self._work.notify_all()
+            self._space.notify_all()
+
+        for t in self._threads:
+            if t is not threading.current_thread():
+                t.join(timeout=timeout)
@@ -1,8 +1,10 @@
 from abc import abstractmethod
+from collections import deque
 from argparse import ArgumentParser
 from contextlib import contextmanager
 from queue import Empty
-from typing import Callable, Iterator, cast
+from typing import Callable, Hashable, Iterator, cast
+import itertools
 import os
 import threading
 import traceback
@@ -15,18 +17,25 @@ from gtools.core.growtopia.packet import PreparedPacket
 from gtools.core.log import setup_logger
 from gtools.core.network import increment_port
 from gtools.core.signal import Signal
+from gtools.core.transport.inproc import InprocDealer, InprocPush
 from gtools.core.transport.protocol import Event
 from gtools.core.transport.zmq_transport import Push, Dealer
 from gtools.flags import PERF
 from gtools.protogen.extension_pb2 import (
+    BLOCKING_MODE_BLOCK,
     BLOCKING_MODE_UNSPECIFIED,
     CapabilityResponse,
+    HandlerStat,
+    HandlerStats,
     Packet,
     Interest,
     PendingPacket,
+    StateRequest,
 )
-from gtools.protogen.state_pb2 import STATE_SET_MY_TELEMETRY
+from gtools.protogen.state_pb2 import STATE_SET_MY_TELEMETRY, StateUpdate
+from gtools.proxy.extension.client.executor import Ordering, StrandPool
 from gtools.proxy.extension.client.sdk_utils import ExtensionUtility
+from gtools.proxy.extension.server.state_stream import unpack_state_updates
 from gtools.proxy.state import State, Status
 from gtools import setting
 
@@ -36,11 +45,17 @@ def register_thread(fn: Callable) -> Callable:
     return fn
 
 
+# upper bound on queued state updates applied in one coalesced pass
+STATE_UPDATE_BURST = 4096
+
+
 type DispatchHandle = Callable[[PendingPacket], PendingPacket | None]
 type UnboundDispatchHandle[S: Extension] = Callable[[S, PendingPacket], PendingPacket | None]
 
 
-def dispatch(interest: Interest) -> Callable[[UnboundDispatchHandle], UnboundDispatchHandle]:
+def dispatch(interest: Interest, ordering: Ordering = Ordering.INTEREST) -> Callable[[UnboundDispatchHandle], UnboundDispatchHandle]:
+    """`ordering` only matters for extensions started with `workers`, without them every handler runs in order"""
+
     def wrapper(fn: UnboundDispatchHandle) -> UnboundDispatchHandle:
         if interest.blocking_mode == BLOCKING_MODE_UNSPECIFIED:
             raise ValueError(f"in {fn.__name__} interest blocking mode is unspecified")
@@ -50,6 +65,9 @@ def dispatch(interest: Interest) -> Callable[[UnboundDispatchHandle], UnboundDis
             interests.append(interest)
         else:
             setattr(fn, "__dispatch_interest_list", [interest])
+        orderings: dict[int, Ordering] = getattr(fn, "__dispatch_ordering", {})
+        orderings[interest.id] = ordering
+        setattr(fn, "__dispatch_ordering", orderings)
 
         return fn
 
@@ -61,18 +79,60 @@ def dispatch_fallback(fn: UnboundDispatchHandle) -> UnboundDispatchHandle:
     return fn
 
 
+class _HandlerStat:
+    __slots__ = ("count", "total_ns", "max_ns", "queued_total_ns", "queued_max_ns")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.queued_total_ns = 0
+        self.queued_max_ns = 0
+
+    def add(self, elapsed_ns: int, queued_ns: int) -> None:
+        self.count += 1
+        self.total_ns += elapsed_ns
+        self.max_ns = max(self.max_ns, elapsed_ns)
+        self.queued_total_ns += queued_ns
+        self.queued_max_ns = max(self.queued_max_ns, queued_ns)
+
+
+def _state_updates(pkt: Packet) -> list[StateUpdate]:
+    if pkt.type == Packet.TYPE_STATE_UPDATE_BATCH:
+        return unpack_state_updates(pkt.state_update_batch)
+    return [pkt.state_update]
+
+
 @auto_call("stop")
 class Extension(ExtensionUtility):
+    """`workers` opts into concurrent handling: send-and-forget and oneshot handlers run on a pool of that many
+    threads, blocking handlers on a lane of their own where higher priority interests go first, and state updates
+    on a state thread. with the default of 0 everything runs on the worker thread, one packet at a time.
+
+    `state` read from anywhere but the thread applying state updates (handlers on the pool, `register_thread` jobs)
+    is a snapshot that updates never mutate, the next update forks it (`State.fork`) instead. each read may return a
+    newer snapshot, hold on to one for as long as it has to stay consistent"""
+
     logger = logging.getLogger("extension")
 
-    def __init__(self, name: str | bytes, interest: list[Interest], broker_addr: str | None = None) -> None:
+    def __init__(
+        self,
+        name: str | bytes,
+        interest: list[Interest],
+        broker_addr: str | None = None,
+        session: int | None = None,
+        workers: int = 0,
+    ) -> None:
         self._name = name.encode() if isinstance(name, str) else name
         self._interest = interest
+        # proxy session this extension is bound to, None subscribes to every session
+        self._session = session
         self._broker_addr = broker_addr if broker_addr else f"tcp://127.0.0.1:{os.getenv("PORT", 6712)}"
 
         self._context = zmq.Context()
-        self._dealer = Dealer(self._context, self._name, self._broker_addr)
-        self._push = Push(self._context, increment_port(self._broker_addr))
+        self._inproc = False
+        self._dealer: Dealer | InprocDealer[Packet, Packet] = Dealer(self._context, self._name, self._broker_addr)
+        self._push: Push | InprocPush[PendingPacket] = Push(self._context, increment_port(self._broker_addr))
 
         self._worker_thread_id: threading.Thread | None = None
         self._monitor_thread_id: threading.Thread | None = None
@@ -86,19 +146,64 @@ class Extension(ExtensionUtility):
         self._job_threads: dict[str, threading.Thread] = {}
         self._dispatch_routes: dict[int, DispatchHandle] = {}
         self._dispatch_fallback: DispatchHandle | None = None
-        self.state = State()
+        self._dispatch_ordering: dict[int, Ordering] = {}
+        self._interest_by_id: dict[int, Interest] = {}
+
+        self._workers = workers
+        self._pool: StrandPool | None = None
+        self._block_lane: StrandPool | None = None
+        self._state_thread: StrandPool | None = None
+        # the snapshot a handler is running against, see `state`
+        self._local = threading.local()
+        self._state_lock = threading.Lock()
+        # a reader holds the current `state`, the next update forks it instead of mutating it
+        self._state_shared = False
+        # ident of the thread applying state updates, None until the first one
+        self._writer: int | None = None
+
+        self._stats: dict[int, _HandlerStat] = {}
+        self._stats_lock = threading.Lock()
+        self._stats_dirty = False
+
+        self.state = State(session=session)
+        # state of every session we hear about, `state` is the one of the bound (or default) session
+        self.states: dict[int, State] = {}
         self._last_heartbeat = 0
+        # packets read ahead while draining a burst of state updates
+        self._backlog: deque[Packet] = deque()
 
         self._suppress_log = False
         self.__push_fallback_called = 0
         self.__push_fallback_warned = False
         self._running = False
 
+    @property
+    def state(self) -> State:
+        snapshot: State | None = getattr(self._local, "state", None)
+        if snapshot is not None:
+            return snapshot
+        if self._writer is None or self._writer == threading.get_ident():
+            return self._state
+        return self._snapshot()
+
+    @state.setter
+    def state(self, state: State) -> None:
+        with self._state_lock:
+            self._state = state
+            self._state_shared = False
+
+    def _snapshot(self) -> State:
+        with self._state_lock:
+            self._state_shared = True
+            return self._state
+
     def push(self, pkt: PreparedPacket) -> None:
         self.push_connected.wait_true(timeout=5.0)
         # self.logger.debug(f"   push \x1b[35m-->>\x1b[0m \x1b[35m>>\x1b[0m{pkt!r}\x1b[35m>>\x1b[0m")
         pending = pkt.to_pending()
         pending._rtt_ns = time.monotonic_ns()
+        if self._session is not None and not pending.HasField("session"):
+            pending.session = self._session
 
         if not self.push_connected:
             if not self.__push_fallback_warned and self.__push_fallback_called > 10:
@@ -107,6 +212,8 @@ class Extension(ExtensionUtility):
             self.__push_fallback_called += 1
 
             self._send(Packet(type=Packet.TYPE_PUSH_PACKET, push_packet=pending))
+        elif isinstance(self._push, InprocPush):
+            self._push.send(pending)
         else:
             self._push.send(pending.SerializeToString())
 
@@ -114,9 +221,12 @@ class Extension(ExtensionUtility):
         if self._stop_event.get():
             return
 
-        if not self._suppress_log:
+        if not self._suppress_log and self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"   send \x1b[31m-->>\x1b[0m \x1b[31m>>\x1b[0m{pkt!r}\x1b[31m>>\x1b[0m")
-        self._dealer.send(pkt.SerializeToString())
+        if isinstance(self._dealer, InprocDealer):
+            self._dealer.send(pkt)
+        else:
+            self._dealer.send(pkt.SerializeToString())
 
     def _recv(self, expected: Packet.Type | None = None, timeout: float | None = None) -> Packet | None:
         if self._stop_event.get():
@@ -126,8 +236,14 @@ class Extension(ExtensionUtility):
         if payload is None:
             return
 
-        pkt = Packet()
-        pkt.ParseFromString(payload)
+        return self._parse(payload, expected)
+
+    def _parse(self, payload: bytes | Packet, expected: Packet.Type | None = None) -> Packet:
+        if isinstance(payload, Packet):
+            pkt = payload
+        else:
+            pkt = Packet()
+            pkt.ParseFromString(payload)
 
         if expected and pkt.type != expected:
             raise TypeError(f"expected type {expected!r} got {pkt.type!r}")
@@ -157,6 +273,7 @@ class Extension(ExtensionUtility):
                     seen_id[interest.id] = name
 
                     self._dispatch_routes[interest.id] = cast(DispatchHandle, getattr(self, name))
+                    self._dispatch_ordering[interest.id] = getattr(obj, "__dispatch_ordering", {}).get(interest.id, Ordering.INTEREST)
                     self._interest.append(interest)
             elif getattr(obj, "__dispatch_interest_fallback", False):
                 self._dispatch_fallback = cast(DispatchHandle, getattr(self, name))
@@ -169,10 +286,26 @@ class Extension(ExtensionUtility):
                 t.start()
                 self._job_threads[name] = t
 
-    def start(self, block: bool = False) -> Signal[bool]:
+    def start(self, block: bool = False, inproc: bool = False) -> Signal[bool]:
+        """`inproc` attaches to a broker running in this process, packets are handed over as objects instead of
+        going through zmq and protobuf"""
+        if inproc and not self._inproc:
+            self._dealer.stop()
+            self._push.stop()
+            self._dealer = InprocDealer[Packet, Packet](self._name, self._broker_addr)
+            self._push = InprocPush[PendingPacket](self._broker_addr)
+            self._inproc = True
+
         self._monitor_thread_id = threading.Thread(target=self._monitor_thread, daemon=True)
         self._monitor_thread_id.start()
         self._resolve_decorator()
+        self._interest_by_id = {interest.id: interest for interest in self._interest}
+
+        if self._workers > 0:
+            name = self._name.decode(errors="backslashreplace")
+            self._pool = StrandPool(f"{name}-pool", self._workers)
+            self._block_lane = StrandPool(f"{name}-block", self._workers)
+            self._state_thread = StrandPool(f"{name}-state", 1)
 
         self._dealer.start()
         self._push.start()
@@ -243,6 +376,10 @@ class Extension(ExtensionUtility):
             if self._worker_thread_id.is_alive():
                 self.logger.warning("main thread did not stop in time")
 
+        for pool in (self._pool, self._block_lane, self._state_thread):
+            if pool:
+                pool.stop()
+
         self.logger.debug("stopping monitor thread")
         if self._monitor_thread_id and self._monitor_thread_id.is_alive():
             self._monitor_thread_id.join(timeout=0.5)
@@ -294,6 +431,8 @@ class Extension(ExtensionUtility):
                 if now - last_heartbeat > setting.heartbeat_interval:
                     with self.suppressed_log():
                         self._send(Packet(type=Packet.TYPE_HEARTBEAT))
+                        if self._stats_dirty and self.broker_connected.get():
+                            self._send(Packet(type=Packet.TYPE_HANDLER_STATS, handler_stats=self.handler_stats()))
                     last_heartbeat = now
 
                 time.sleep(0.1)
@@ -327,12 +466,37 @@ class Extension(ExtensionUtility):
         dst._packet_id = src._packet_id
         dst._hit_count = src._hit_count
         dst._rtt_ns = src._rtt_ns
+        if src.HasField("session"):
+            dst.session = src.session
+
+    def _session_interest(self) -> list[Interest]:
+        if self._session is None:
+            return self._interest
+
+        ret: list[Interest] = []
+        for interest in self._interest:
+            # interests may be shared class attributes (from @dispatch), never tag them in place
+            tagged = Interest()
+            tagged.CopyFrom(interest)
+            if not tagged.HasField("session"):
+                tagged.session = self._session
+            ret.append(tagged)
+
+        return ret
+
+    def _session_state(self, session: int | None) -> State:
+        if session is None or session == (self._session or 0):
+            return self._state
+
+        if (state := self.states.get(session)) is None:
+            state = self.states[session] = State(session=session)
+        return state
 
     def _worker_thread(self) -> None:
         self._running = True
         try:
             while not self._stop_event.get():
-                pkt = self._recv()
+                pkt = self._backlog.popleft() if self._backlog else self._recv()
                 if pkt is None:
                     break
 
@@ -340,43 +504,11 @@ class Extension(ExtensionUtility):
                     case Packet.TYPE_HEARTBEAT:
                         self._last_heartbeat = time.time()
                     case Packet.TYPE_PENDING_PACKET:
-                        start = time.monotonic_ns()
-                        response: PendingPacket | None = None
-
-                        id = pkt.pending_packet.interest_id
-                        response = None
-
-                        if not id in self._dispatch_routes:
-                            if self._dispatch_fallback:
-                                try:
-                                    response = self._dispatch_fallback(pkt.pending_packet)
-                                except:
-                                    traceback.print_exc()
-                            else:
-                                self.logger.warning(f"unhandled interest id: {id}, available {self._dispatch_routes.keys()}")
-                        else:
-                            try:
-                                response = self._dispatch_routes[id](pkt.pending_packet)
-                            except:
-                                traceback.print_exc()
-
-                        if PERF:
-                            self.logger.debug(f"extension processing time: {(time.monotonic_ns() - start) / 1e6}us")
-
-                        # oneshot packet
-                        if not pkt.pending_packet._packet_id:
-                            continue
-
-                        if not response:
-                            response = self.pass_to_next()
-
-                        self._copy_meta_fields(response, pkt.pending_packet)
-                        response._hit_count += 1
-                        self._send(Packet(type=Packet.TYPE_PENDING_PACKET, pending_packet=response))
+                        self._on_pending(pkt.pending_packet)
                     case Packet.TYPE_CONNECTED:
                         self.logger.info("connected to broker")
                         self.broker_connected.set(True)
-                        self._send(Packet(type=Packet.TYPE_STATE_REQUEST))
+                        self._send(Packet(type=Packet.TYPE_STATE_REQUEST, state_request=StateRequest(session=self._session)))
                     case Packet.TYPE_DISCONNECT:
                         self.broker_connected.set(False)
                         self.push_connected.set(False)
@@ -391,18 +523,22 @@ class Extension(ExtensionUtility):
                             Packet(
                                 type=Packet.TYPE_CAPABILITY_RESPONSE,
                                 capability_response=CapabilityResponse(
-                                    interest=self._interest,
+                                    interest=self._session_interest(),
                                 ),
                             )
                         )
                     case Packet.TYPE_STATE_RESPONSE:
-                        self.state = State.from_proto(pkt.state_response.state)
-                        if self.state.status == Status.CONNECTED or self.state.status == Status.IN_WORLD:
-                            self.console_log(f"extension {self._name.decode(errors='backslashreplace')} connected")
-                            self.play_sound("audio/hit.wav")
-                        self.on_connect()
-                    case Packet.TYPE_STATE_UPDATE:
-                        self.state.update(pkt.state_update)
+                        if self._state_thread:
+                            self._state_thread.submit(None, 0, lambda pkt=pkt: self._on_state_response(pkt))
+                        else:
+                            self._on_state_response(pkt)
+                    case Packet.TYPE_STATE_UPDATE | Packet.TYPE_STATE_UPDATE_BATCH:
+                        for session, burst in itertools.groupby(self._drain_state_updates(pkt), key=lambda x: x.session if x.HasField("session") else None):
+                            updates = [upd for x in burst for upd in _state_updates(x)]
+                            if self._state_thread:
+                                self._state_thread.submit(None, 0, lambda session=session, updates=updates: self._apply_state_updates(session, updates))
+                            else:
+                                self._apply_state_updates(session, updates)
         except zmq.error.ZMQError as e:
             if not self._stop_event.get():
                 self.logger.debug(f"ZMQ error in main loop: {e}")
@@ -410,6 +546,137 @@ class Extension(ExtensionUtility):
             self.logger.debug("worker thread exiting")
             self._running = False
 
+    def _on_pending(self, pending: PendingPacket) -> None:
+        received_ns = time.monotonic_ns()
+        if self._pool is None or self._block_lane is None:
+            self._process(pending, received_ns)
+            return
+
+        match self._dispatch_ordering.get(pending.interest_id, Ordering.INTEREST):
+            case Ordering.INTEREST:
+                key: Hashable | None = pending.interest_id
+            case Ordering.SESSION:
+                key = (pending.interest_id, pending.session if pending.HasField("session") else None)
+            case Ordering.NONE:
+                key = None
+
+        interest = self._interest_by_id.get(pending.interest_id)
+        # the proxy is waiting on this one, it never queues behind fire-and-forget work
+        if pending._packet_id and interest is not None and interest.blocking_mode == BLOCKING_MODE_BLOCK:
+            self._block_lane.submit(key, -interest.priority, lambda: self._process(pending, received_ns))
+        else:
+            self._pool.submit(key, 0, lambda: self._process(pending, received_ns))
+
+    def _process(self, pending: PendingPacket, received_ns: int) -> None:
+        start = time.monotonic_ns()
+        response: PendingPacket | None = None
+
+        id = pending.interest_id
+        handler = self._dispatch_routes.get(id, self._dispatch_fallback)
+        if handler is None:
+            self.logger.warning(f"unhandled interest id: {id}, available {self._dispatch_routes.keys()}")
+        else:
+            if self._pool is not None:
+                self._local.state = self._snapshot()
+            try:
+                response = handler(pending)
+            except:
+                traceback.print_exc()
+            finally:
+                self._local.state = None
+
+        elapsed_ns = time.monotonic_ns() - start
+        with self._stats_lock:
+            if (stat := self._stats.get(id)) is None:
+                stat = self._stats[id] = _HandlerStat()
+            stat.add(elapsed_ns, start - received_ns)
+            self._stats_dirty = True
+
+        if PERF:
+            self.logger.debug(f"extension processing time: {elapsed_ns / 1e3}us")
+
+        # oneshot packet
+        if not pending._packet_id:
+            return
+
+        if not response:
+            response = self.pass_to_next()
+
+        self._copy_meta_fields(response, pending)
+        response._hit_count += 1
+        self._send(Packet(type=Packet.TYPE_PENDING_PACKET, pending_packet=response))
+
+    def handler_stats(self) -> HandlerStats:
+        with self._stats_lock:
+            self._stats_dirty = False
+            return HandlerStats(
+                stat=[
+                    HandlerStat(
+                        interest_id=id,
+                        count=stat.count,
+                        total_ns=stat.total_ns,
+                        max_ns=stat.max_ns,
+                        queued_total_ns=stat.queued_total_ns,
+                        queued_max_ns=stat.queued_max_ns,
+                    )
+                    for id, stat in self._stats.items()
+                ]
+            )
+
+    def _on_state_response(self, pkt: Packet) -> None:
+        self._writer = threading.get_ident()
+        session = pkt.session if pkt.HasField("session") else None
+        state = State.from_proto(pkt.state_response.state, session)
+        if session is not None:
+            self.states[session] = state
+
+        if session is None or session == (self._session or 0):
+            self.state = state
+            if self.state.status == Status.CONNECTED or self.state.status == Status.IN_WORLD:
+                self.console_log(f"extension {self._name.decode(errors='backslashreplace')} connected")
+                self.play_sound("audio/hit.wav")
+            self.on_connect()
+
+    def _apply_state_updates(self, session: int | None, updates: list[StateUpdate]) -> None:
+        self._writer = threading.get_ident()
+        state = self._session_state(session)
+        if state is not self._state:
+            state.update_many(updates)
+            return
+
+        with self._state_lock:
+            if not self._state_shared:
+                state.update_many(updates)
+                return
+
+        # a reader still holds `state`, it keeps that one and everyone after gets the updated fork
+        updated = state.fork()
+        updated.update_many(updates)
+        self.state = updated
+        # the bound session is in `states` too once a state response tagged it
+        key = (self._session or 0) if session is None else session
+        if self.states.get(key) is state:
+            self.states[key] = updated
+
+    def _drain_state_updates(self, first: Packet) -> Iterator[Packet]:
+        """yield `first` and every state update already queued behind it, so a burst is applied as one"""
+        yield first
+
+        for _ in range(STATE_UPDATE_BURST):
+            try:
+                payload = self._dealer.recv(block=False)
+            except Empty:
+                return
+            if payload is None:
+                return
+
+            pkt = self._parse(payload)
+            if pkt.type != Packet.TYPE_STATE_UPDATE and pkt.type != Packet.TYPE_STATE_UPDATE_BATCH:
+                self._backlog.append(pkt)
+                return
+
+            yield pkt
+
     def on_connect(self) -> None:
         """called AFTER syncing the state"""
 
@@ -8,6 +8,7 @@ from gtools.core.convertible import ConvertibleToBytes, ConvertibleToFloat, Conv
 from gtools.core.growtopia.create import console_message, particle, play_sfx
 from gtools.core.growtopia.packet import NetPacket, PreparedPacket, TankFlags
 from gtools.core.growtopia.strkv import KeyType
+from gtools.core.growtopia.world import DroppedItem
 from gtools.core.limits import INT32_MAX
 from gtools.protogen.extension_pb2 import (
     BLOCKING_MODE_BLOCK,
@@ -397,3 +398,11 @@ class ExtensionUtility(ABC):
         range = self.state.me.state.punch_range if punch else self.state.me.state.build_range
         d = abs(ivec2(self.state.me.pos // 32) - p2)
         return d.x <= range and d.y <= range
+
+    def dropped_in_range(self, radius: float, *, abs: vec2 | None = None) -> list[DroppedItem]:
+        """dropped items within radius (in tiles) of abs, defaults to our position"""
+        if not self.state.world:
+            return []
+
+        center = abs if abs else self.state.me.pos
+        return list(self.state.world.dropped_index.in_radius(center, radius * 32))
@@ -2,6 +2,7 @@ from bisect import insort
 from collections import defaultdict, deque
 from contextlib import contextmanager
 from dataclasses import dataclass
+from enum import Enum
 import heapq
 import itertools
 import logging
@@ -10,19 +11,25 @@ import random
 import threading
 import time
 from traceback import print_exc
-from typing import Any, Callable, Iterator
+from typing import Any, Callable, Iterable, Iterator
 import zmq
 
 from gtools.core.auto_call import auto_call
 from gtools.core.growtopia.packet import NetType, PreparedPacket
+from gtools.core.highres_sleep import nanosleep
 from gtools.core.network import increment_port
 from gtools.core.signal import Signal
+from gtools.core.timing_wheel import TimingWheel
+from gtools.core.transport.inproc import InprocRouter
 from gtools.core.transport.zmq_transport import Pull, Router
 from gtools.flags import BENCHMARK, PERF, TRACE
 from gtools.protogen.extension_pb2 import (
     BLOCKING_MODE_BLOCK,
+    BLOCKING_MODE_SEND_AND_CANCEL,
     BlockingMode,
     CapabilityRequest,
+    INTEREST_STATE_UPDATE,
+    HandlerStat,
     Packet,
     Interest,
     InterestType,
@@ -30,8 +37,10 @@ from gtools.protogen.extension_pb2 import (
     DIRECTION_CLIENT_TO_SERVER,
     DIRECTION_SERVER_TO_CLIENT,
 )
+from gtools.protogen.state_pb2 import BrokerTelemetry, ExtensionInFlight, StateUpdate
 from gtools import setting
 from gtools.proxy.extension.server.handler import NETPACKET_TO_INTEREST_TYPE, TANKPACKET_TO_INTEREST_TYPE, ExtensionHandler, Extension, hash_interest
+from gtools.proxy.extension.server.state_stream import StateStream
 
 
 class ExtensionManager:
@@ -48,15 +57,17 @@ class ExtensionManager:
 
         self._extensions[id].last_heartbeat = time.time()
 
-    def sweep(self) -> None:
+    def sweep(self) -> set[bytes]:
+        """removes extensions whose heartbeat stopped, returns their ids"""
         to_remove: set[bytes] = set()
-        for id, ext in self._extensions.items():
+        for id, ext in list(self._extensions.items()):
             if ext.last_heartbeat != 0.0 and time.time() - ext.last_heartbeat > setting.heartbeat_threshold:
                 to_remove.add(id)
 
         for ext in to_remove:
             self.logger.info(f"extension {ext} flatline, removing...")
             self.remove_extension(ext)
+        return to_remove
 
     def add_extension(self, ext: Extension) -> None:
         self.logger.info(f"extension {ext.id} connected")
@@ -82,9 +93,10 @@ class ExtensionManager:
 
             del self._extensions[id]
 
-    def get_interested_extension_any(self, interest_type: InterestType) -> Iterator[ExtensionHandler]:
+    def get_interested_extension_any(self, interest_type: InterestType, session: int | None = None) -> Iterator[ExtensionHandler]:
         for client in self._interest_map[interest_type]:
-            yield client
+            if client.wants_session(session):
+                yield client
 
     def get_interested_extension(self, interest_type: InterestType, pkt: PreparedPacket) -> Iterator[ExtensionHandler]:
         for client in self._interest_map[interest_type]:
@@ -97,6 +109,11 @@ class ExtensionManager:
     def get_all_extension(self) -> list[Extension]:
         return list(self._extensions.values())
 
+    def set_stats(self, id: bytes, stats: Iterable[HandlerStat]) -> None:
+        if (ext := self._extensions.get(id)) is None:
+            return
+        ext.stats = {stat.interest_id: stat for stat in stats}
+
 
 class PacketCallback:
     def __init__(
@@ -118,22 +135,63 @@ class PendingChain:
         self.finished_event = threading.Event()
         self.current = current
         self.cancelled = False
+        # extension the chain is waiting on, replies from anyone else are late
+        self.waiting_on: bytes | None = None
 
     def __repr__(self) -> str:
         return f"PendingChain(size={len(self.chain)}, chain={self.chain}, processed={self.processed_chain}, pkt={self.current!r}), finished={self.finished_event.is_set()}"
 
 
 class _PendingPacket:
-    def __init__(self, callback: PacketCallback | None, current: PendingPacket) -> None:
+    def __init__(self, callback: PacketCallback | None, current: PendingPacket, ext_id: bytes = b"", mode: BlockingMode = BLOCKING_MODE_BLOCK) -> None:
         self.current = current
         self.callback = callback
+        self.ext_id = ext_id
+        self.mode = mode
+
+
+class ExpirePolicy(Enum):
+    """what happens to a packet an extension did not answer in time"""
+
+    # as if the extension passed: a chain moves on to the next extension, a held packet is sent unchanged
+    PASS = "pass"
+    # as if it cancelled: the packet is dropped
+    CANCEL = "cancel"
+    # forget about it: a chain ends with the packet as it stands, a held packet is discarded
+    DROP = "drop"
+
+    @classmethod
+    def parse(cls, value: str) -> "ExpirePolicy":
+        try:
+            return cls(value)
+        except ValueError:
+            return cls.PASS
+
+
+@dataclass
+class JitterStats:
+    """how late the scheduler delivered packets relative to their target, over the last `window` packets"""
+
+    count: int = 0
+    mean_ns: float = 0.0
+    p50_ns: int = 0
+    p99_ns: int = 0
+    max_ns: int = 0
 
 
 class PacketScheduler:
+    """replays pushed packets with the spacing of their `_rtt_ns` timestamps. the wait is coarse on the condition
+    until `spin_ns` before the deadline and then a high resolution sleep, every packet that is due by then goes
+    out in one batch"""
+
+    # condition timeouts overshoot by up to a scheduler tick, the last stretch is slept with clock_nanosleep
+    spin_ns = 2_000_000
+    window = 4096
+
     def __init__(self, out_queue: Queue[PreparedPacket | None] | Callable[[PreparedPacket | None], Any]) -> None:
         self._out_queue = out_queue
 
-        self._heap: list[tuple[int, int, PendingPacket]] = []
+        self._heap: list[tuple[int, int, PreparedPacket]] = []
         self._lock = threading.Lock()
         self._cond = threading.Condition(self._lock)
         self._seq = itertools.count()
@@ -141,6 +199,12 @@ class PacketScheduler:
         self._first_src_ts_ns: int | None = None
         self._playback_start_wall_ns: int | None = None
 
+        # lateness of the last `window` deliveries, plus totals over the scheduler's lifetime
+        self._lateness: deque[int] = deque(maxlen=self.window)
+        self._late_count = 0
+        self._late_total_ns = 0
+        self._late_max_ns = 0
+
         self._stopped = False
         self._thread = threading.Thread(target=self._run, daemon=True)
         self._thread.start()
@@ -150,25 +214,49 @@ class PacketScheduler:
             self._stopped = True
             self._cond.notify_all()
 
-        if self._thread.is_alive():
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
             self._thread.join()
 
-    def _put(self, pending: PendingPacket) -> None:
-        prepared = PreparedPacket.from_pending(pending)
+    def _put(self, prepared: PreparedPacket) -> None:
         if callable(self._out_queue):
             self._out_queue(prepared)
         else:
             self._out_queue.put(prepared)
 
     def push(self, pkt: PendingPacket) -> None:
+        # decoded here, on the pushing thread, so the timed loop only hands packets over
+        prepared = PreparedPacket.from_pending(pkt)
         if pkt._rtt_ns == 0:
-            self._put(pkt)
+            self._put(prepared)
             return
 
         seq = next(self._seq)
         with self._cond:
-            heapq.heappush(self._heap, (pkt._rtt_ns, seq, pkt))
-            self._cond.notify()
+            heapq.heappush(self._heap, (pkt._rtt_ns, seq, prepared))
+            # only a new earliest deadline changes what the loop is waiting for
+            if self._heap[0][1] == seq:
+                self._cond.notify()
+
+    def jitter(self) -> JitterStats:
+        with self._lock:
+            samples = sorted(self._lateness)
+            count, total, max_ns = self._late_count, self._late_total_ns, self._late_max_ns
+        if not samples:
+            return JitterStats()
+        return JitterStats(
+            count=count,
+            mean_ns=total / count,
+            p50_ns=samples[len(samples) // 2],
+            p99_ns=samples[min(len(samples) - 1, len(samples) * 99 // 100)],
+            max_ns=max_ns,
+        )
+
+    def _target(self, send_ts_ns: int) -> int:
+        if self._first_src_ts_ns is None or self._playback_start_wall_ns is None:
+            # the first packet starts the playback clock
+            self._first_src_ts_ns = send_ts_ns
+            self._playback_start_wall_ns = time.monotonic_ns()
+        return self._playback_start_wall_ns + (send_ts_ns - self._first_src_ts_ns)
 
     def _run(self) -> None:
         while True:
@@ -180,30 +268,34 @@ class PacketScheduler:
                     self._cond.wait()
                     continue
 
-                send_ts_ns, _, pkt = self._heap[0]
-
-                if self._first_src_ts_ns is None:
-                    heapq.heappop(self._heap)
-                    self._first_src_ts_ns = send_ts_ns
-                    self._playback_start_wall_ns = time.monotonic_ns()
-                    packet_to_send = pkt
-                else:
-                    assert self._playback_start_wall_ns is not None and self._first_src_ts_ns is not None
-                    target_wall_ns = self._playback_start_wall_ns + (send_ts_ns - self._first_src_ts_ns)
-                    now_ns = time.monotonic_ns()
-                    wait_ns = target_wall_ns - now_ns
-
-                    if wait_ns > 0:
-                        self._cond.wait(timeout=wait_ns / 1e9)
-                        continue
+                wait_ns = self._target(self._heap[0][0]) - time.monotonic_ns()
+                if wait_ns > self.spin_ns:
+                    self._cond.wait(timeout=(wait_ns - self.spin_ns) / 1e9)
+                    continue
 
-                    heapq.heappop(self._heap)
-                    packet_to_send = pkt
+            if wait_ns > 0:
+                nanosleep(wait_ns)
 
-            try:
-                self._put(packet_to_send)
-            except Exception:
-                pass
+            batch: list[tuple[int, PreparedPacket]] = []
+            with self._cond:
+                now_ns = time.monotonic_ns()
+                while self._heap and (target := self._target(self._heap[0][0])) <= now_ns:
+                    batch.append((target, heapq.heappop(self._heap)[2]))
+
+            for target, prepared in batch:
+                late_ns = time.monotonic_ns() - target
+                try:
+                    self._put(prepared)
+                except Exception:
+                    pass
+                self._record(late_ns)
+
+    def _record(self, late_ns: int) -> None:
+        with self._lock:
+            self._lateness.append(late_ns)
+            self._late_count += 1
+            self._late_total_ns += late_ns
+            self._late_max_ns = max(self._late_max_ns, late_ns)
 
 
 @dataclass
@@ -225,10 +317,24 @@ class Broker:
 
         self._context = zmq.Context()
         self._router = Router(self._context, addr)
+        # extensions started with `inproc=True` in this process attach here and skip zmq and protobuf entirely,
+        # what they send is handled in their own thread so a chain hop is one queue handoff
+        self._inproc = InprocRouter[Packet, Packet](addr)
+        self._inproc.on_message = self._recv_inproc
+        self._inproc.on_push = self._push_pending
 
         self._extension_mgr = ExtensionManager()
         self._pending_chain: dict[bytes, PendingChain] = {}
         self._pending_packet: dict[bytes, _PendingPacket] = {}
+        # replies and expiry both resolve pending entries, one at a time
+        self._pending_lock = threading.RLock()
+        self._expiry = TimingWheel[bytes](tick=0.05)
+        # extension id -> packets sent to it that still await a reply
+        self._in_flight: defaultdict[bytes, int] = defaultdict(int)
+        self._in_flight_cond = threading.Condition()
+        self._expired = 0
+        self._shed = 0
+        self._state_stream = StateStream(self._fanout)
 
         self._stop_event = threading.Event()
         self._worker_thread_id: threading.Thread | None = None
@@ -252,11 +358,86 @@ class Broker:
     def _monitor_thread(self) -> None:
         try:
             while not self._stop_event.is_set():
-                self._extension_mgr.sweep()
-                time.sleep(0.1)
+                for key in self._expiry.advance():
+                    self._expire(key)
+                self._state_stream.flush_due()
+                for id in self._extension_mgr.sweep():
+                    self._abandon(id)
+                    self._state_stream.forget(id)
+                    self.extension_len.update(lambda x: x - 1)
+                time.sleep(self._expiry.tick)
         except Exception as e:
             self.logger.debug(f"monitor thread error: {e}")
 
+    def _admit(self, id: bytes, wait: float = 0.0) -> bool:
+        """whether `id` has room for one more packet in flight, waiting up to `wait` seconds for it"""
+        with self._in_flight_cond:
+            limit = setting.broker_max_in_flight
+            if wait > 0 and self._in_flight[id] >= limit:
+                self._in_flight_cond.wait_for(lambda: self._in_flight[id] < limit, timeout=wait)
+            if self._in_flight[id] >= limit:
+                self._shed += 1
+                self.logger.warning(f"extension {id} has {self._in_flight[id]} packets in flight, shedding")
+                return False
+            self._in_flight[id] += 1
+            return True
+
+    def _release(self, id: bytes) -> None:
+        with self._in_flight_cond:
+            if self._in_flight[id] <= 1:
+                self._in_flight.pop(id, None)
+            else:
+                self._in_flight[id] -= 1
+            self._in_flight_cond.notify_all()
+
+    def _expire(self, key: bytes) -> None:
+        with self._pending_lock:
+            if (chain := self._pending_chain.get(key)) is not None:
+                if chain.finished_event.is_set() or chain.waiting_on is None:
+                    return
+                ext, chain.waiting_on = chain.waiting_on, None
+                self._release(ext)
+                self._expired += 1
+
+                policy = ExpirePolicy.parse(setting.broker_expire_block)
+                self.logger.warning(f"extension {ext} did not answer in {setting.broker_pending_timeout}s, chain policy: {policy.value}")
+                match policy:
+                    case ExpirePolicy.PASS:
+                        self._forward(chain, chain.current)
+                    case ExpirePolicy.CANCEL:
+                        chain.cancelled = True
+                        chain.finished_event.set()
+                    case ExpirePolicy.DROP:
+                        chain.finished_event.set()
+            elif (pending := self._pending_packet.pop(key, None)) is not None:
+                self._release(pending.ext_id)
+                self._expired += 1
+
+                # send-and-forget already let the packet through, only a held one has anything left to do
+                if pending.mode == BLOCKING_MODE_SEND_AND_CANCEL and ExpirePolicy.parse(setting.broker_expire_send_and_cancel) == ExpirePolicy.PASS:
+                    self._finish(pending, pending.current)
+                self.logger.debug(f"extension {pending.ext_id} did not answer packet {key.hex()} in {setting.broker_pending_timeout}s")
+
+    def _abandon(self, id: bytes) -> None:
+        """expire everything in flight to `id` right away"""
+        with self._pending_lock:
+            keys = [key for key, chain in self._pending_chain.items() if chain.waiting_on == id]
+            keys.extend(key for key, pending in self._pending_packet.items() if pending.ext_id == id)
+            for key in keys:
+                self._expiry.cancel(key)
+                self._expire(key)
+
+    def telemetry(self) -> BrokerTelemetry:
+        with self._in_flight_cond:
+            in_flight = [ExtensionInFlight(id=id, count=count) for id, count in self._in_flight.items()]
+        return BrokerTelemetry(
+            pending_chains=len(self._pending_chain),
+            pending_packets=len(self._pending_packet),
+            expired=self._expired,
+            shed=self._shed,
+            in_flight=in_flight,
+        )
+
     @contextmanager
     def suppressed_log(self) -> Iterator["Broker"]:
         orig = self._suppress_log
@@ -276,11 +457,7 @@ class Broker:
 
         pkt = PendingPacket()
         pkt.ParseFromString(payload)
-
-        if self._scheduler:
-            self._scheduler.push(pkt)
-        else:
-            self.logger.warning(f"pull unhandled: {pkt}")
+        self._push_pending(pkt)
 
         # TODO: this thing gets in the middle of normal logging, same with push on sdk
         # if not self._suppress_log and self.logger.isEnabledFor(logging.DEBUG):
@@ -289,6 +466,12 @@ class Broker:
 
         return True
 
+    def _push_pending(self, pkt: PendingPacket) -> None:
+        if self._scheduler:
+            self._scheduler.push(pkt)
+        else:
+            self.logger.warning(f"pull unhandled: {pkt}")
+
     def _pull_thread(self) -> None:
         if BENCHMARK:
             _last = time.monotonic_ns()
@@ -331,19 +514,57 @@ class Broker:
 
         return id, pkt
 
+    def _recv_inproc(self, id: bytes, pkt: Packet) -> None:
+        if self._stop_event.is_set():
+            return
+
+        if not self._suppress_log and not pkt.type == Packet.TYPE_HEARTBEAT and self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"\x1b[31m<<--\x1b[0m recv    \x1b[31m<<\x1b[0m{pkt!r}\x1b[31m<<\x1b[0m")
+
+        try:
+            self._handle(id, pkt)
+        except Exception as e:
+            self.logger.error(f"error handling inproc packet from {id}: {e}")
+            print_exc()
+
     def _send(self, extension: bytes, pkt: Packet) -> None:
         if self._stop_event.is_set():
             return
 
-        self._router.send((extension, pkt.SerializeToString()))
+        if self._inproc.has_peer(extension):
+            self._inproc.send((extension, pkt))
+        else:
+            self._router.send((extension, pkt.SerializeToString()))
 
-    def broadcast(self, pkt: Packet) -> None:
-        for ext in self._extension_mgr.get_all_extension():
+    def _fanout(self, extensions: Iterable[bytes], pkt: Packet) -> None:
+        """send one packet to many extensions, serialized at most once. like a zmq peer with its own parse, an in
+        process peer may mutate what it gets, so each one but the last gets a copy and `pkt` is handed off last"""
+        if self._stop_event.is_set():
+            return
+
+        inproc: list[bytes] = []
+        raw: bytes | None = None
+        for extension in extensions:
+            if self._inproc.has_peer(extension):
+                inproc.append(extension)
+                continue
+            if raw is None:
+                raw = pkt.SerializeToString()
             try:
-                self._send(ext.id, pkt)
+                self._router.send((extension, raw))
             except Exception as e:
-                self.logger.error(f"failed to send packet to {ext.id}: {e}")
-                continue
+                self.logger.error(f"failed to send packet to {extension}: {e}")
+
+        for i, extension in enumerate(inproc):
+            if i == len(inproc) - 1:
+                self._inproc.send((extension, pkt))
+            else:
+                copy = Packet()
+                copy.CopyFrom(pkt)
+                self._inproc.send((extension, copy))
+
+    def broadcast(self, pkt: Packet) -> None:
+        self._fanout([ext.id for ext in self._extension_mgr.get_all_extension()], pkt)
 
     def _get_interested_extension(self, pkt: PreparedPacket) -> Iterator[ExtensionHandler]:
         interest_type = NETPACKET_TO_INTEREST_TYPE[pkt.as_net.type]
@@ -392,47 +613,11 @@ class Broker:
                 case BlockingMode.BLOCKING_MODE_BLOCK:
                     chain.append(client)
                 case BlockingMode.BLOCKING_MODE_SEND_AND_FORGET:
-                    pkt_id = random.randbytes(16)
-                    pending_pkt = PendingPacket(
-                        _op=PendingPacket.OP_FORWARD,
-                        _packet_id=pkt_id,
-                        buf=pkt.as_raw,
-                        direction=pkt.direction,
-                        packet_flags=pkt.flags,
-                        _rtt_ns=time.monotonic_ns(),
-                        interest_id=client.interest.id,
-                    )
-                    self._send(
-                        client.ext.id,
-                        Packet(type=Packet.TYPE_PENDING_PACKET, pending_packet=pending_pkt),
-                    )
-                    self._pending_packet[pkt_id] = _PendingPacket(
-                        callback,
-                        pending_pkt,
-                    )
-                    if not callback:
-                        self.logger.warning(f"no callback defined for {pkt}")
+                    self._send_pending(client, pkt, callback)
                 case BlockingMode.BLOCKING_MODE_SEND_AND_CANCEL:
-                    pkt_id = random.randbytes(16)
-                    pending_pkt = PendingPacket(
-                        _op=PendingPacket.OP_FORWARD,
-                        _packet_id=pkt_id,
-                        buf=pkt.as_raw,
-                        direction=pkt.direction,
-                        packet_flags=pkt.flags,
-                        _rtt_ns=time.monotonic_ns(),
-                        interest_id=client.interest.id,
-                    )
-                    self._send(
-                        client.ext.id,
-                        Packet(type=Packet.TYPE_PENDING_PACKET, pending_packet=pending_pkt),
-                    )
-                    self._pending_packet[pkt_id] = _PendingPacket(
-                        callback,
-                        pending_pkt,
-                    )
-                    if not callback:
-                        self.logger.warning(f"no callback defined for {pkt}")
+                    # an extension that is already behind doesn't get to hold the packet, it goes through untouched
+                    if not self._send_pending(client, pkt, callback):
+                        continue
 
                     # since we dont use the packet if cancelled is true, this should be safe
                     return PendingPacket(), True
@@ -444,6 +629,7 @@ class Broker:
                         direction=pkt.direction,
                         packet_flags=pkt.flags,
                         interest_id=client.interest.id,
+                        session=pkt.session,
                     )
                     self._send(
                         client.ext.id,
@@ -457,6 +643,7 @@ class Broker:
                         direction=pkt.direction,
                         packet_flags=pkt.flags,
                         interest_id=client.interest.id,
+                        session=pkt.session,
                     )
                     self._send(
                         client.ext.id,
@@ -481,15 +668,17 @@ class Broker:
                 packet_flags=pkt.flags,
                 _rtt_ns=time.monotonic_ns(),
                 interest_id=chain[0].interest.id,
+                session=pkt.session,
             )
 
             pending = PendingChain(chain_id, chain, pending_pkt)
-            pending.processed_chain[chain[0].ext.id] = hash_interest(chain[0].interest)
-            self._pending_chain[chain_id] = pending
-            self._send(
-                chain[0].ext.id,
-                Packet(type=Packet.TYPE_PENDING_PACKET, pending_packet=pending_pkt),
-            )
+            with self._pending_lock:
+                self._pending_chain[chain_id] = pending
+            if not self._hop(pending, wait=setting.broker_in_flight_wait):
+                # every extension in the chain was shed
+                with self._pending_lock:
+                    self._pending_chain.pop(chain_id)
+                return None
 
             if TRACE:
                 print(
@@ -500,20 +689,26 @@ class Broker:
 
             if PERF:
                 self.logger.debug(f"broker processing: {(time.monotonic_ns() - start) / 1e6}us")
-            self._pending_chain[chain_id].finished_event.wait()
-            finished = self._pending_chain.pop(chain_id)
+            pending.finished_event.wait()
+            with self._pending_lock:
+                finished = self._pending_chain.pop(chain_id)
             finished.current._rtt_ns = time.monotonic_ns() - finished.current._rtt_ns
             return finished.current, finished.cancelled
 
     # this version of process_event doesn't work with prepared packet, but with arbitrary packet, thus
     # it can only send block and doesn't chain
     def process_event_any(self, interest: InterestType, pkt: Packet) -> None:
-        for client in self._extension_mgr.get_interested_extension_any(interest):
-            self._send(client.ext.id, pkt)
+        session = pkt.session if pkt.HasField("session") else None
+        self._fanout([client.ext.id for client in self._extension_mgr.get_interested_extension_any(interest, session)], pkt)
+
+    def publish_state(self, session: int | None, updates: list[StateUpdate], me_net_id: int = 0) -> None:
+        """send state updates to every INTEREST_STATE_UPDATE extension, filtered by its subscription"""
+        self._state_stream.publish(self._extension_mgr.get_interested_extension_any(INTEREST_STATE_UPDATE, session), session, updates, me_net_id)
 
     def start(self, block: bool = False) -> None:
         self._router.start(block=False)
         self._pull.start(block=False)
+        self._inproc.start()
         if block:
             self._worker_thread()
         else:
@@ -535,6 +730,9 @@ class Broker:
         except Exception as e:
             self.logger.debug(f"router error: {e}")
 
+        self.logger.debug("stopping inproc router")
+        self._inproc.stop()
+
         try:
             self.logger.debug("stopping pull")
             self._pull.stop()
@@ -565,7 +763,58 @@ class Broker:
 
         self.logger.debug("broker has stopped")
 
+    def _send_pending(self, client: ExtensionHandler, pkt: PreparedPacket, callback: PacketCallback | None) -> bool:
+        """sends a packet that expects a reply but isn't chained, false if the extension was shed"""
+        if not self._admit(client.ext.id):
+            return False
+
+        pkt_id = random.randbytes(16)
+        pending_pkt = PendingPacket(
+            _op=PendingPacket.OP_FORWARD,
+            _packet_id=pkt_id,
+            buf=pkt.as_raw,
+            direction=pkt.direction,
+            packet_flags=pkt.flags,
+            _rtt_ns=time.monotonic_ns(),
+            interest_id=client.interest.id,
+            session=pkt.session,
+        )
+        with self._pending_lock:
+            # registered before sending, an in process extension may reply before _send returns
+            self._pending_packet[pkt_id] = _PendingPacket(callback, pending_pkt, client.ext.id, client.interest.blocking_mode)
+            self._expiry.schedule(pkt_id, setting.broker_pending_timeout)
+            self._send(
+                client.ext.id,
+                Packet(type=Packet.TYPE_PENDING_PACKET, pending_packet=pending_pkt),
+            )
+        if not callback:
+            self.logger.warning(f"no callback defined for {pkt}")
+        return True
+
+    def _hop(self, chain: PendingChain, wait: float = 0.0) -> bool:
+        """sends the chain's packet to the next extension that has room for it, false if none is left"""
+        while chain.chain:
+            client = chain.chain.popleft()
+            # a shed extension counts as processed so a rebuilt chain doesn't pick it up again
+            chain.processed_chain[client.ext.id] = hash_interest(client.interest)
+            if not self._admit(client.ext.id, wait):
+                continue
+
+            with self._pending_lock:
+                chain.current.interest_id = client.interest.id
+                chain.waiting_on = client.ext.id
+                self._expiry.schedule(chain.id, setting.broker_pending_timeout)
+                self._send(
+                    client.ext.id,
+                    Packet(type=Packet.TYPE_PENDING_PACKET, pending_packet=chain.current),
+                )
+            return True
+        return False
+
     def _forward(self, chain: PendingChain, new_packet: PendingPacket) -> None:
+        # the packet stays in the session it came from, whatever the extension sent back
+        if chain.current.HasField("session"):
+            new_packet.session = chain.current.session
         chain.current = new_packet
         chain.chain.clear()
         self._build_chain(
@@ -573,19 +822,8 @@ class Broker:
             chain.chain,
             pred=lambda ext, interest: not bool(chain and (ext.id in chain.processed_chain and chain.processed_chain[ext.id] == hash_interest(interest))),
         )
-        if len(chain.chain) == 0:
+        if not self._hop(chain):
             chain.finished_event.set()
-        else:
-            next_client = chain.chain.popleft()
-            new_packet.interest_id = next_client.interest.id
-            chain.processed_chain[next_client.ext.id] = hash_interest(next_client.interest)
-            self._send(
-                next_client.ext.id,
-                Packet(
-                    type=Packet.TYPE_PENDING_PACKET,
-                    pending_packet=new_packet,
-                ),
-            )
 
     def _finish(self, pending: _PendingPacket, new_packet: PendingPacket) -> None:
         if not pending.callback:
@@ -604,9 +842,16 @@ class Broker:
 
     # TODO: don't have these if TRACE, create utils
 
-    def _handle_packet(self, pkt: PendingPacket) -> None:
+    def _handle_packet(self, pkt: PendingPacket, ext_id: bytes) -> None:
         assert pkt._packet_id, "invalid packet id"
-        if (chain := self._pending_chain.get(pkt._packet_id)) is not None:
+        with self._pending_lock:
+            self._resolve(pkt, ext_id)
+
+    def _resolve(self, pkt: PendingPacket, ext_id: bytes) -> None:
+        if (chain := self._pending_chain.get(pkt._packet_id)) is not None and chain.waiting_on == ext_id:
+            self._expiry.cancel(chain.id)
+            self._release(ext_id)
+            chain.waiting_on = None
             if TRACE:
                 print(f"\t\t\tPACKET {PendingPacket.Op.Name(pkt._op)} IS {chain.current}")
             match pkt._op:
@@ -625,7 +870,10 @@ class Broker:
                     pass
                 case _:
                     raise ValueError(f"invalid op: {pkt._op}")
-        elif (pending := self._pending_packet.pop(pkt._packet_id, None)) is not None:
+        elif (pending := self._pending_packet.get(pkt._packet_id)) is not None and pending.ext_id == ext_id:
+            del self._pending_packet[pkt._packet_id]
+            self._expiry.cancel(pkt._packet_id)
+            self._release(ext_id)
             if TRACE:
                 print(f"\t\t\tPACKET {PendingPacket.Op.Name(pkt._op)} IS {pending.current}")
             match pkt._op:
@@ -640,7 +888,63 @@ class Broker:
                 case _:
                     raise ValueError(f"invalid op: {pkt._op}")
         else:
-            raise ValueError(f"packet is not in any pending state: {pkt}")
+            # the packet expired (or its extension was dropped) before the reply made it back
+            self.logger.debug(f"late reply from {ext_id} for packet {pkt._packet_id.hex()}, ignoring")
+
+    def _handle(self, id: bytes, pkt: Packet) -> None:
+        match pkt.type:
+            case Packet.TYPE_HEARTBEAT:
+                self._extension_mgr.beat(id)
+            case Packet.TYPE_HANDLER_STATS:
+                self._extension_mgr.set_stats(id, pkt.handler_stats.stat)
+            case Packet.TYPE_PUSH_PACKET:
+                if self._scheduler:
+                    self._scheduler.push(pkt.push_packet)
+            case Packet.TYPE_HANDSHAKE:
+                self._send(id, Packet(type=Packet.TYPE_HANDSHAKE_ACK))
+                self._send(id, Packet(type=Packet.TYPE_CAPABILITY_REQUEST, capability_request=CapabilityRequest()))
+            case Packet.TYPE_CAPABILITY_RESPONSE:
+                self._extension_mgr.add_extension(
+                    Extension(
+                        id=id,
+                        interest=list(pkt.capability_response.interest),
+                    ),
+                )
+                self._send(id, Packet(type=Packet.TYPE_CONNECTED))
+                self.extension_len.update(lambda x: x + 1)
+            case Packet.TYPE_DISCONNECT:
+                self._extension_mgr.remove_extension(id)
+                self._abandon(id)
+                self._state_stream.forget(id)
+                self.extension_len.update(lambda x: x - 1)
+                self._send(id, Packet(type=Packet.TYPE_DISCONNECT_ACK))
+            case Packet.TYPE_PENDING_PACKET:
+                if TRACE:
+                    print(f"\t\trecv from {id}: {pkt}")
+                    print(
+                        f"\t\tSTATE (ext={len(self._extension_mgr._extensions)}, pending_chain={len(self._pending_chain)}, pending_packet={len(self._pending_packet)}):\n"
+                        f"\tchain={self._pending_chain}\n",
+                        f"\tpacket={self._pending_packet}\n",
+                    )
+                self._handle_packet(pkt.pending_packet, id)
+            case _:
+                if handler := self._handler.get(pkt.type):
+                    if TRACE:
+                        print(f"\t\t{Packet.Type.Name(pkt.type)} handled by external handler")
+
+                    try:
+                        handler(
+                            id,
+                            pkt,
+                            BrokerFunction(
+                                lambda pkt, id=id: self._send(id, pkt),
+                                self._send,
+                                self.process_event_any,
+                            ),
+                        )
+                    except Exception as e:
+                        self.logger.error(f"error in handler: {e}")
+                        print_exc()
 
     def _worker_thread(self) -> None:
         try:
@@ -649,55 +953,7 @@ class Broker:
                 if pkt is None:
                     break
 
-                match pkt.type:
-                    case Packet.TYPE_HEARTBEAT:
-                        self._extension_mgr.beat(id)
-                    case Packet.TYPE_PUSH_PACKET:
-                        if self._scheduler:
-                            self._scheduler.push(pkt.push_packet)
-                    case Packet.TYPE_HANDSHAKE:
-                        self._send(id, Packet(type=Packet.TYPE_HANDSHAKE_ACK))
-                        self._send(id, Packet(type=Packet.TYPE_CAPABILITY_REQUEST, capability_request=CapabilityRequest()))
-                    case Packet.TYPE_CAPABILITY_RESPONSE:
-                        self._extension_mgr.add_extension(
-                            Extension(
-                                id=id,
-                                interest=list(pkt.capability_response.interest),
-                            ),
-                        )
-                        self._send(id, Packet(type=Packet.TYPE_CONNECTED))
-                        self.extension_len.update(lambda x: x + 1)
-                    case Packet.TYPE_DISCONNECT:
-                        self._extension_mgr.remove_extension(id)
-                        self.extension_len.update(lambda x: x - 1)
-                        self._send(id, Packet(type=Packet.TYPE_DISCONNECT_ACK))
-                    case Packet.TYPE_PENDING_PACKET:
-                        if TRACE:
-                            print(f"\t\trecv from {id}: {pkt}")
-                            print(
-                                f"\t\tSTATE (ext={len(self._extension_mgr._extensions)}, pending_chain={len(self._pending_chain)}, pending_packet={len(self._pending_packet)}):\n"
-                                f"\tchain={self._pending_chain}\n",
-                                f"\tpacket={self._pending_packet}\n",
-                            )
-                        self._handle_packet(pkt.pending_packet)
-                    case _:
-                        if handler := self._handler.get(pkt.type):
-                            if TRACE:
-                                print(f"\t\t{Packet.Type.Name(pkt.type)} handled by external handler")
-
-                            try:
-                                handler(
-                                    id,
-                                    pkt,
-                                    BrokerFunction(
-                                        lambda pkt, id=id: self._send(id, pkt),
-                                        self._send,
-                                        self.process_event_any,
-                                    ),
-                                )
-                            except Exception as e:
-                                self.logger.error(f"error in handler: {e}")
-                                print_exc()
+                self._handle(id, pkt)
         except (KeyboardInterrupt, InterruptedError):
             pass
         except zmq.error.ZMQError as e:
@@ -706,5 +962,9 @@ class Broker:
         finally:
             self.logger.debug("worker thread exiting")
 
+    def handler_stats(self) -> dict[bytes, dict[int, HandlerStat]]:
+        """extension id -> interest id -> the handler timings it last reported"""
+        return {ext.id: dict(ext.stats) for ext in self._extension_mgr.get_all_extension()}
+
     def set_handler(self, type: Packet.Type, handler: HandleFunction) -> None:
         self._handler[type] = handler
@@ -3,7 +3,7 @@ from google.protobuf.message import Message
 import xxhash
 from gtools.core.growtopia.packet import NetType, PreparedPacket, TankPacket, TankType
 from gtools.core.growtopia.variant import Variant
-from gtools.protogen.extension_pb2 import DIRECTION_UNSPECIFIED, Interest, InterestType
+from gtools.protogen.extension_pb2 import DIRECTION_UNSPECIFIED, HandlerStat, Interest, InterestType
 from gtools.proxy.extension.server.binop_eval import TANK_INTEREST, eval_strkv, eval_tank, eval_variant
 
 NETPACKET_TO_INTEREST_TYPE: dict[NetType, InterestType] = {
@@ -78,6 +78,8 @@ def hash_interest(interest: Interest) -> int:
         h.update(interest.direction.to_bytes())
     if interest.id:
         h.update(interest.id.to_bytes())
+    if interest.HasField("session"):
+        h.update(b"s" + interest.session.to_bytes(4))
     if payload := interest.WhichOneof("payload"):
         h.update(getattr(interest, payload).SerializeToString())
 
@@ -89,6 +91,8 @@ class Extension:
         self.id = id
         self.interest = interest
         self.last_heartbeat = 0.0
+        # interest id -> latest handler timings the extension reported
+        self.stats: dict[int, HandlerStat] = {}
 
     def __repr__(self) -> str:
         return f"Extension(id={self.id}, interest({len(self.interest)})={list(map(hash_interest, self.interest))})"
@@ -218,7 +222,14 @@ class ExtensionHandler:
 
         return True
 
+    def wants_session(self, session: int | None) -> bool:
+        # an interest without session matches every session, an untagged packet matches every interest
+        return session is None or not self.interest.HasField("session") or self.interest.session == session
+
     def interested(self, pkt: PreparedPacket) -> bool:
+        if not self.wants_session(pkt.session):
+            return False
+
         # if the interest direction is unspecified, means it doesn't care about direction (match all)
         # if the prepared packet direction is unspecified, we only match extension with unspecified direction
         if self.interest.direction != DIRECTION_UNSPECIFIED:
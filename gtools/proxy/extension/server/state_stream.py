@@ -0,0 +1,232 @@
+from collections import defaultdict
+from dataclasses import dataclass
+import threading
+import time
+from typing import Callable, Iterable
+
+from gtools import setting
+from gtools.protogen.extension_pb2 import Interest, Packet
+from gtools.protogen.state_pb2 import (
+    STATE_MODIFY_WORLD_BATCHED,
+    STATE_PLAYER_UPDATE,
+    ModifyWorldBatched,
+    PlayerUpdate,
+    StateUpdate,
+    StateUpdateBatch,
+    StateUpdateWhat,
+)
+from gtools.proxy.extension.server.handler import ExtensionHandler
+
+# positions travel as integers in 1/POSITION_SCALE pixel
+POSITION_SCALE = 64
+
+
+def pack_state_updates(updates: Iterable[StateUpdate]) -> StateUpdateBatch:
+    batch = StateUpdateBatch()
+    positions = batch.positions
+    last_x = last_y = 0
+    for upd in updates:
+        if upd.what != STATE_PLAYER_UPDATE:
+            batch.updates.append(upd)
+            continue
+
+        p = upd.player_update
+        x, y = round(p.x * POSITION_SCALE), round(p.y * POSITION_SCALE)
+        positions.at.append(len(batch.updates))
+        positions.net_id.append(p.net_id)
+        positions.dx.append(x - last_x)
+        positions.dy.append(y - last_y)
+        positions.flags.append(p.flags)
+        last_x, last_y = x, y
+    return batch
+
+
+def unpack_state_updates(batch: StateUpdateBatch) -> list[StateUpdate]:
+    out: list[StateUpdate] = []
+    positions = batch.positions
+    i = x = y = 0
+    for at, net_id, dx, dy, flags in zip(positions.at, positions.net_id, positions.dx, positions.dy, positions.flags):
+        if at > i:
+            out.extend(batch.updates[i:at])
+            i = at
+        x += dx
+        y += dy
+        out.append(StateUpdate(what=STATE_PLAYER_UPDATE, player_update=PlayerUpdate(net_id=net_id, x=x / POSITION_SCALE, y=y / POSITION_SCALE, flags=flags)))
+    out.extend(batch.updates[i:])
+    return out
+
+
+def state_update_packet(session: int | None, updates: list[StateUpdate]) -> Packet:
+    if len(updates) == 1:
+        return Packet(type=Packet.TYPE_STATE_UPDATE, state_update=updates[0], session=session)
+    return Packet(type=Packet.TYPE_STATE_UPDATE_BATCH, state_update_batch=pack_state_updates(updates), session=session)
+
+
+@dataclass(slots=True, frozen=True)
+class StateFilter:
+    """compiled InterestStateUpdate"""
+
+    what: frozenset[int] | None = None
+    net_ids: frozenset[int] | None = None
+    me: bool = False
+    # x0, y0, x1, y1 with x1 and y1 exclusive
+    region: tuple[int, int, int, int] | None = None
+    interval_ns: int = 0
+
+    @classmethod
+    def from_interest(cls, interest: Interest) -> "StateFilter":
+        f = interest.state_update
+        rate = f.position_rate if f.HasField("position_rate") else setting.state_position_rate
+        return cls(
+            what=frozenset(f.what) or None,
+            net_ids=frozenset(f.net_id) or None,
+            me=f.me,
+            region=(f.region.x, f.region.y, f.region.x + f.region.w, f.region.y + f.region.h) if f.HasField("region") else None,
+            interval_ns=int(1e9 / rate) if rate > 0 else 0,
+        )
+
+    @property
+    def passthrough(self) -> bool:
+        return self.what is None and self.net_ids is None and not self.me and self.region is None and self.interval_ns == 0
+
+    def _player(self, net_id: int, me_net_id: int) -> bool:
+        if self.net_ids is None and not self.me:
+            return True
+        # net id 0 is the local player in position updates
+        return (self.net_ids is not None and net_id in self.net_ids) or (self.me and net_id in (0, me_net_id))
+
+    def _inside(self, x: int, y: int) -> bool:
+        if self.region is None:
+            return True
+        x0, y0, x1, y1 = self.region
+        return x0 <= x < x1 and y0 <= y < y1
+
+    def apply(self, upd: StateUpdate, me_net_id: int) -> StateUpdate | None:
+        """`upd` as this filter lets it through, None if it doesn't"""
+        if self.what is not None and upd.what not in self.what:
+            return None
+
+        if self.net_ids is None and not self.me and self.region is None:
+            return upd
+
+        match upd.what:
+            case StateUpdateWhat.STATE_PLAYER_UPDATE:
+                return upd if self._player(upd.player_update.net_id, me_net_id) else None
+            case StateUpdateWhat.STATE_PLAYER_JOIN:
+                return upd if self._player(upd.player_join.netID, me_net_id) else None
+            case StateUpdateWhat.STATE_PLAYER_LEAVE:
+                return upd if self._player(upd.player_leave, me_net_id) else None
+            case StateUpdateWhat.STATE_UPDATE_CLOTHING:
+                return upd if self._player(upd.update_clothing.net_id, me_net_id) else None
+            case StateUpdateWhat.STATE_SET_CHARACTER_STATE:
+                return upd if self._player(upd.character_state.net_id, me_net_id) else None
+            case StateUpdateWhat.STATE_MODIFY_WORLD:
+                if upd.modify_world.HasField("tile") and not self._inside(upd.modify_world.tile.x, upd.modify_world.tile.y):
+                    return None
+            case StateUpdateWhat.STATE_MODIFY_WORLD_BATCHED:
+                if self.region is None:
+                    return upd
+                events = [e for e in upd.modify_world_batched.events if not e.HasField("tile") or self._inside(e.tile.x, e.tile.y)]
+                if not events:
+                    return None
+                if len(events) != len(upd.modify_world_batched.events):
+                    return StateUpdate(what=STATE_MODIFY_WORLD_BATCHED, modify_world_batched=ModifyWorldBatched(events=events))
+            case StateUpdateWhat.STATE_UPDATE_TREE_STATE:
+                if not self._inside(upd.update_tree_state.x, upd.update_tree_state.y):
+                    return None
+            case StateUpdateWhat.STATE_SEND_LOCK:
+                if not self._inside(upd.send_lock.x, upd.send_lock.y):
+                    return None
+            case StateUpdateWhat.STATE_TILE_CHANGE_REQUEST:
+                # one that takes an item changes the inventory too, that has to go through wherever it happened
+                if not upd.tile_change_req.should_take_item and not self._inside(upd.tile_change_req.x, upd.tile_change_req.y):
+                    return None
+        return upd
+
+
+class _Subscriber:
+    __slots__ = ("client", "ext_id", "filter", "last_sent", "held")
+
+    def __init__(self, client: ExtensionHandler) -> None:
+        self.client = client
+        self.ext_id = client.ext.id
+        self.filter = StateFilter.from_interest(client.interest)
+        # (session, net id) -> when its last position went out
+        self.last_sent: dict[tuple[int | None, int], int] = {}
+        # (session, net id) -> latest position held back by the rate limit
+        self.held: dict[tuple[int | None, int], StateUpdate] = {}
+
+
+class StateStream:
+    """fans state updates out to INTEREST_STATE_UPDATE extensions, each filtered by its subscription. extensions
+    without one share a single packet, everyone else gets their own"""
+
+    def __init__(self, fanout: Callable[[Iterable[bytes], Packet], None], clock: Callable[[], int] = time.monotonic_ns) -> None:
+        self._fanout = fanout
+        self._clock = clock
+        self._lock = threading.Lock()
+        # handlers compare by priority, so they are keyed by identity
+        self._subscribers: dict[int, _Subscriber] = {}
+
+    def _subscriber(self, client: ExtensionHandler) -> _Subscriber:
+        if (sub := self._subscribers.get(id(client))) is None or sub.client is not client:
+            sub = self._subscribers[id(client)] = _Subscriber(client)
+        return sub
+
+    def forget(self, ext_id: bytes) -> None:
+        with self._lock:
+            for key in [k for k, sub in self._subscribers.items() if sub.ext_id == ext_id]:
+                del self._subscribers[key]
+
+    def publish(self, clients: Iterable[ExtensionHandler], session: int | None, updates: list[StateUpdate], me_net_id: int = 0) -> None:
+        if not updates:
+            return
+
+        shared: list[bytes] = []
+        own: list[tuple[bytes, list[StateUpdate]]] = []
+        with self._lock:
+            now = self._clock()
+            for client in clients:
+                sub = self._subscriber(client)
+                if sub.filter.passthrough:
+                    shared.append(sub.ext_id)
+                elif kept := self._filter(sub, session, updates, me_net_id, now):
+                    own.append((sub.ext_id, kept))
+
+        if shared:
+            self._fanout(shared, state_update_packet(session, updates))
+        for ext_id, kept in own:
+            self._fanout((ext_id,), state_update_packet(session, kept))
+
+    def _filter(self, sub: _Subscriber, session: int | None, updates: list[StateUpdate], me_net_id: int, now: int) -> list[StateUpdate]:
+        f = sub.filter
+        kept: list[StateUpdate] = []
+        for upd in updates:
+            if (upd := f.apply(upd, me_net_id)) is None:
+                continue
+            if f.interval_ns and upd.what == STATE_PLAYER_UPDATE:
+                key = (session, upd.player_update.net_id)
+                if (last := sub.last_sent.get(key)) is not None and now - last < f.interval_ns:
+                    sub.held[key] = upd
+                    continue
+                sub.last_sent[key] = now
+                sub.held.pop(key, None)
+            kept.append(upd)
+        return kept
+
+    def flush_due(self) -> None:
+        """send the held positions whose rate limit interval is over"""
+        out: list[tuple[bytes, int | None, list[StateUpdate]]] = []
+        with self._lock:
+            now = self._clock()
+            for sub in self._subscribers.values():
+                if not sub.held:
+                    continue
+                by_session: defaultdict[int | None, list[StateUpdate]] = defaultdict(list)
+                for key in [k for k in sub.held if now - sub.last_sent[k] >= sub.filter.interval_ns]:
+                    by_session[key[0]].append(sub.held.pop(key))
+                    sub.last_sent[key] = now
+                out.extend((sub.ext_id, session, updates) for session, updates in by_session.items())
+
+        for ext_id, session, updates in out:
+            self._fanout((ext_id,), state_update_packet(session, updates))
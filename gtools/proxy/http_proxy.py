@@ -1,83 +1,100 @@
-from contextlib import closing
+from dataclasses import dataclass
 from http.server import BaseHTTPRequestHandler
 import http.client
 
 import logging
-import socket
 import socketserver
 import ssl
+import threading
+import time
 import urllib.parse
 
 from gtools.core.growtopia.strkv import StrKV
+from gtools.core.http_pool import HTTPSPool, insecure_client_context
 from gtools.core.network import resolve_doh
+from gtools.core.resolver import get_resolver
 from gtools.proxy.event import UpdateClientVersion, UpdateServerData
 from gtools import setting
 
+_HOP_BY_HOP = frozenset(("connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailers", "transfer-encoding", "upgrade"))
 
-class ProxyHandler(BaseHTTPRequestHandler):
-    logger = logging.getLogger("http_proxy")
-
-    def do_POST(self):
-        if not self.path.startswith("/growtopia/server_data.php"):
-            return
 
-        parsed = urllib.parse.urlsplit(self.path)
-        target_path = parsed.path
-        if parsed.query:
-            target_path += "?" + parsed.query
+@dataclass(slots=True)
+class _Response:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    # the real server/port we swapped for the proxy, None when the server is in maintenance
+    server: tuple[str, int] | None
+    expires: float = 0.0
 
-        length = int(self.headers.get("Content-Length", 0))
-        body = self.rfile.read(length) if length > 0 else b""
 
-        headers = {k: v for k, v in self.headers.items()}
-        self.logger.info(f"from: {self.client_address}")
-        self.logger.info(f"\t{self.path=}")
-        self.logger.info(f"\t{headers=}")
-        self.logger.info(f"\t{body=}")
-
-        body_dict = urllib.parse.parse_qs(body.decode())
-        UpdateClientVersion(version=body_dict["version"][0], protocol=int(body_dict["protocol"][0])).send()
-
-        context = ssl.create_default_context()
-        context.check_hostname = False
-        context.verify_mode = ssl.VerifyMode.CERT_NONE
+class ProxyHandler(BaseHTTPRequestHandler):
+    logger = logging.getLogger("http_proxy")
 
+    _context: ssl.SSLContext | None = None
+    _pools: dict[str, HTTPSPool] = {}
+    _lock = threading.Lock()
+    # (path, request body) -> rewritten response, client retries within the ttl don't hit upstream again
+    _cache: dict[tuple[str, bytes], _Response] = {}
+
+    @classmethod
+    def _pool(cls, ip: str) -> HTTPSPool:
+        with cls._lock:
+            pool = cls._pools.get(ip)
+            if pool is None:
+                if cls._context is None:
+                    cls._context = insecure_client_context()
+                pool = cls._pools[ip] = HTTPSPool(ip, context=cls._context, max_connections=setting.server_data_max_connections)
+            return pool
+
+    @classmethod
+    def _cached(cls, key: tuple[str, bytes]) -> _Response | None:
+        now = time.monotonic()
+        with cls._lock:
+            for k in [k for k, v in cls._cache.items() if v.expires <= now]:
+                del cls._cache[k]
+            return cls._cache.get(key)
+
+    @classmethod
+    def _store(cls, key: tuple[str, bytes], response: _Response) -> None:
+        if setting.server_data_cache_ttl <= 0:
+            return
+        response.expires = time.monotonic() + setting.server_data_cache_ttl
+        with cls._lock:
+            cls._cache[key] = response
+
+    @classmethod
+    def close_pools(cls) -> None:
+        with cls._lock:
+            for pool in cls._pools.values():
+                pool.close()
+            cls._pools.clear()
+            cls._cache.clear()
+
+    def _fetch(self, target_path: str, body: bytes, headers: dict[str, str]) -> _Response:
         ip = resolve_doh(setting.server_data_url)
         ip = ip[0] if ip else setting.server_data_url
         if ip != setting.server_data_url:
             self.logger.debug(f"resolved {setting.server_data_url} to {ip}")
+
+        headers = {k: v for k, v in headers.items() if k.lower() not in _HOP_BY_HOP}
         headers["Host"] = setting.server_data_url
         headers["Remote-Addr"] = ip
 
-        try:
-            with closing(http.client.HTTPSConnection(ip, timeout=10, context=context)) as conn:
-                conn.request("POST", target_path, body, headers=headers)
-                resp = conn.getresponse()
-                body = resp.read()
-        except socket.timeout:
-            self.logger.error("upstream server timed out")
-            self.send_response(502)
-            return
-
-        out_headers = dict(resp.getheaders())
+        start = time.perf_counter()
+        status, resp_headers, body = self._pool(ip).request("POST", target_path, body, headers=headers)
+        out_headers = dict(resp_headers)
 
-        self.logger.info(f"from {ip} ({setting.server_data_url})")
-        self.logger.info(f"\t{self.path=}")
-        self.logger.info(f"\t{out_headers=}")
-        self.logger.info(f"\t{body=}")
+        self.logger.info(f"server_data.php from {ip} ({setting.server_data_url}): {status} in {(time.perf_counter() - start) * 1000:.0f}ms")
+        self.logger.debug(f"\t{out_headers=}")
+        self.logger.debug(f"\t{body=}")
 
         kv = StrKV.deserialize(body)
         self.logger.debug(f"server_data.php: {kv}")
         if "maint" in kv:
             self.logger.info("server is in maintenance")
-
-            self.send_response(resp.status)
-            for k, v in out_headers.items():
-                self.send_header(k, v)
-            self.end_headers()
-            self.wfile.write(body)
-
-            return
+            return _Response(status, out_headers, body, None)
 
         orig_server = kv["server", 1].decode()
         orig_port = int(kv["port", 1].decode())
@@ -89,29 +106,73 @@ class ProxyHandler(BaseHTTPRequestHandler):
         body = kv.serialize()
 
         out_headers.pop("Transfer-Encoding", None)
-        if "Content-Encoding" in out_headers:
-            out_headers.pop("Content-Encoding", None)
+        out_headers.pop("Content-Encoding", None)
         out_headers["Content-Length"] = str(len(body))
 
-        self.send_response(resp.status)
-        for k, v in out_headers.items():
-            if k.lower() in ("connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "te", "trailers", "transfer-encoding", "upgrade"):
+        return _Response(status, out_headers, body, (orig_server, orig_port))
+
+    def do_POST(self):
+        if not self.path.startswith("/growtopia/server_data.php"):
+            return
+
+        parsed = urllib.parse.urlsplit(self.path)
+        target_path = parsed.path
+        if parsed.query:
+            target_path += "?" + parsed.query
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length > 0 else b""
+
+        headers = {k: v for k, v in self.headers.items()}
+        self.logger.info(f"server_data.php request from {self.client_address[0]}")
+        self.logger.debug(f"\t{self.path=}")
+        self.logger.debug(f"\t{headers=}")
+        self.logger.debug(f"\t{body=}")
+
+        body_dict = urllib.parse.parse_qs(body.decode())
+        UpdateClientVersion(version=body_dict["version"][0], protocol=int(body_dict["protocol"][0])).send()
+
+        key = (target_path, body)
+        response = self._cached(key)
+        if response is not None:
+            self.logger.info("server_data.php served from cache")
+        else:
+            try:
+                response = self._fetch(target_path, body, headers)
+            except (OSError, http.client.HTTPException) as e:
+                self.logger.error(f"upstream server_data.php request failed: {e!r}")
+                self.send_response(502)
+                self.end_headers()
+                return
+            if response.status == 200:
+                self._store(key, response)
+
+        self.send_response(response.status)
+        for k, v in response.headers.items():
+            if k.lower() in _HOP_BY_HOP:
                 continue
             self.send_header(k, v)
         self.end_headers()
-        self.wfile.write(body)
+        self.wfile.write(response.body)
 
-        UpdateServerData(server=orig_server, port=orig_port).send()
+        if response.server is not None:
+            UpdateServerData(server=response.server[0], port=response.server[1]).send()
 
 
 class ThreadedHTTPServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
     allow_reuse_address = True
     daemon_threads = True
 
+    def server_close(self) -> None:
+        super().server_close()
+        ProxyHandler.close_pools()
+
 
 def setup_server() -> ThreadedHTTPServer:
     logging.info(f"running http proxy server on {setting.http_server_host}:{setting.http_server_port}")
     httpd = ThreadedHTTPServer((setting.http_server_host, setting.http_server_port), ProxyHandler)
+    # warm the dns cache so the first login doesn't pay for the DoH round trip
+    get_resolver().prefetch(setting.server_data_url)
 
     context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
     context.load_cert_chain("resources/cert.pem", "resources/key.pem")
@@ -15,14 +15,14 @@ from gtools.core.growtopia.variant import Variant
 from gtools.core.block_sigint import block_sigint
 from gtools.protogen.extension_pb2 import DIRECTION_CLIENT_TO_SERVER, DIRECTION_SERVER_TO_CLIENT, Direction, Packet, StateResponse
 from gtools.proxy.accountmgr import AccountManager
-from gtools.proxy.enet import PyENetEvent
+from gtools.proxy.enet import PyENetEvent, peer_key
 from gtools.proxy.event import UpdateClientVersion, UpdateServerData
 from gtools.proxy.extension.server.broker import Broker, BrokerFunction, PacketCallback
 from gtools.proxy.proxy_client import ProxyClient
-from gtools.proxy.proxy_server import ProxyServer
+from gtools.proxy.proxy_server import ProxyServer, ProxyServerPeer
 from gtools import setting
 from gtools.proxy.state import State, Status
-from thirdparty.enet.bindings import ENetEventType, ENetPeer, enet_host_flush
+from thirdparty.enet.bindings import ENetEventType, ENetPeer, Pointer, enet_host_flush, enet_peer_disconnect_now
 from thirdparty.hexdump import hexdump
 
 
@@ -31,46 +31,38 @@ class ProxyEvent(NamedTuple):
     direction: Direction
 
 
-class Proxy:
-    logger = logging.getLogger("proxy")
+class Session:
+    """one game client and its upstream connection, with its own state and workers"""
 
-    def __init__(self) -> None:
-        self.proxy_server = ProxyServer(setting.proxy_server, setting.proxy_port)
-        self.logger.info(f"proxy server listening on {setting.proxy_server}:{setting.proxy_port}")
-        self.proxy_client = ProxyClient()
-        self.logger.debug("proxy client initialized")
+    def __init__(self, proxy: "Proxy", id: int) -> None:
+        self.proxy = proxy
+        self.id = id
+        self.logger = logging.getLogger(f"proxy[{id}]") if id else Proxy.logger
 
-        self.server_data: UpdateServerData | None = None
-        self.client_version: UpdateClientVersion | None = None
-        self._unsubs = [
-            subscribe(UpdateServerData, self._on_server_data),
-            subscribe(UpdateClientVersion, self._on_client_version),
-        ]
+        self.broker = proxy.broker
+        self.proxy_server = ProxyServerPeer(proxy.proxy_server.host)
+        self.proxy_client = ProxyClient()
 
+        # where OnSendToServer sent this session, used by the next upstream connect only. any other connect
+        # goes to the proxy wide server_data, which is refreshed on every login
+        self.redirect_to: UpdateServerData | None = None
         self.redirecting: bool = False
-        self.running = True
+        self.upstream_connected = False
 
         self._event_queue: Queue[tuple[ProxyEvent | None, int]] = Queue()
+        self._channel_queue: Queue[tuple[PreparedPacket | None, int]] = Queue()
         self._worker_thread_id: threading.Thread | None = None
         self._channel_thread_id: threading.Thread | None = None
-        self._main_loop_thread_id: threading.Thread | None = None
         self._worker_lock = threading.Lock()
         self._stop_event = threading.Event()
         self._should_reconnect = threading.Event()
         self._worker_should_process = threading.Event()
         self._packet_version = 0  # this is used to invalidate old packets that is left behind when restarting application
 
-        self._channel_queue: Queue[tuple[PreparedPacket | None, int]] = Queue()
-        addr = f"tcp://127.0.0.1:{os.getenv('PORT', 6712)}"
-        self.broker = Broker(lambda pkt: self._channel_queue.put((pkt, self._packet_version)), addr)
-        self.logger.debug(f"starting broker on {addr}")
-        self.broker.start()
-        self.broker.set_handler(Packet.TYPE_STATE_REQUEST, self._state_request)
-
         self._last_event_time = -1
         self._event_elapsed = -1.0
 
-        self.state = State()
+        self.state = State(session=id)
         self._last_telemetry_update: float = 0.0
         self._telemetry_update_interval: float = 0.1
         self._in_dialog = False
@@ -79,21 +71,85 @@ class Proxy:
 
         self.account_name: bytes | None = None
 
-    def _state_request(self, _id: bytes, _pkt: Packet, fn: BrokerFunction) -> None:
-        fn.reply(
-            Packet(
-                type=Packet.TYPE_STATE_RESPONSE,
-                state_response=StateResponse(state=self.state.to_proto()),
-            )
-        )
+    @property
+    def client_version(self) -> UpdateClientVersion | None:
+        return self.proxy.client_version
 
-    def _on_server_data(self, _channel: str, event: UpdateServerData) -> None:
-        self.logger.info(f"server_data: {event.server}:{event.port}")
-        self.server_data = event
+    @property
+    def client_connected(self) -> bool:
+        return bool(self.proxy_server.peer)
 
-    def _on_client_version(self, _channel: str, event: UpdateClientVersion) -> None:
-        self.logger.info(f"client version: version={event.version} protocol={event.protocol}")
-        self.client_version = event
+    def put_channel(self, pkt: PreparedPacket) -> None:
+        self._channel_queue.put((pkt, self._packet_version))
+
+    def put_client_event(self, event: PyENetEvent) -> None:
+        if event.type == ENetEventType.DISCONNECT:
+            self.proxy_server.peer = None
+        self._event_queue.put((ProxyEvent(event, DIRECTION_CLIENT_TO_SERVER), self._packet_version))
+
+    def attach(self, peer: Pointer[ENetPeer]) -> None:
+        """bind a freshly connected game client to this session"""
+        self.proxy_server.peer = peer
+        self.proxy_client.disconnect_now()
+        self.proxy_client = ProxyClient()
+        self.upstream_connected = False
+        if not self.redirect_to and not self.proxy.server_data:
+            self.logger.info("waiting for server_data...")
+        self._connect_upstream()
+
+    def _connect_upstream(self) -> None:
+        server_data = self.redirect_to or self.proxy.server_data
+        if not server_data:
+            return
+
+        self.redirect_to = None
+        self.logger.info(f"proxy_client connecting to {server_data.server}:{server_data.port}")
+        self.proxy_client.connect(server_data.server, server_data.port)
+        self.upstream_connected = True
+        self.logger.info("all connected! now polling for events")
+        self.state.update_status(self.broker, Status.CONNECTED)
+        self._worker_should_process.set()
+
+    def _detach(self) -> None:
+        self._worker_should_process.clear()
+        self._packet_version += 1
+        self.upstream_connected = False
+
+        self.state.update_status(self.broker, Status.WAITING_FOR_SERVER_DATA)
+        if self.redirect_to or self.proxy.server_data:
+            self.state.update_status(self.broker, Status.CONNECTING)
+            self.logger.info("waiting for growtopia to connect...")
+
+    def poll(self) -> bool:
+        """poll the upstream connection, returns whether anything was handled"""
+        if self.client_connected and not self.upstream_connected:
+            self._connect_upstream()
+
+        if not self.upstream_connected:
+            if self.state.status == Status.WAITING_FOR_SERVER_DATA and self.proxy.server_data:
+                self.state.update_status(self.broker, Status.CONNECTING)
+                self.logger.info("waiting for growtopia to connect...")
+            return False
+
+        handled = False
+        if event := self.proxy_client.poll():
+            self._event_queue.put((ProxyEvent(event, DIRECTION_SERVER_TO_CLIENT), self._packet_version))
+            handled = True
+
+        if time.time() - self._last_telemetry_update > self._telemetry_update_interval:
+            self.state.telemetry.server_ping = ctypes.cast(self.proxy_client.peer, ctypes.POINTER(ENetPeer)).contents.roundTripTime if self.proxy_client.peer else 0
+            self.state.telemetry.client_ping = ctypes.cast(self.proxy_server.peer, ctypes.POINTER(ENetPeer)).contents.roundTripTime if self.proxy_server.peer else 0
+            with self.broker.suppressed_log():
+                self.state.emit_telemetry(self.broker)
+
+        if self._should_reconnect.is_set():
+            self.disconnect_all()
+            self._should_reconnect.clear()
+            with self.broker.suppressed_log():
+                self.state.emit_telemetry(self.broker)
+            self._detach()
+
+        return handled
 
     def _dump_packet(self, data: bytes) -> None:
         if self.logger.isEnabledFor(logging.DEBUG):
@@ -118,11 +174,11 @@ class Proxy:
                         if len(v) > 6:
                             self.account_name = v.as_string[6]
 
-                        self.server_data = UpdateServerData(
+                        self.redirect_to = UpdateServerData(
                             server=server_data[0, 0].decode(),
                             port=port,
                         )
-                        self.logger.info(f"redirecting to {self.server_data.server}:{self.server_data.port}")
+                        self.logger.info(f"redirecting to {self.redirect_to.server}:{self.redirect_to.port}")
 
                         server_data[0, 0] = setting.proxy_server
                         v[1] = Variant.vint(setting.proxy_port)
@@ -160,6 +216,8 @@ class Proxy:
         self.proxy_server.send(pkt.as_raw, pkt.flags)
 
     def _handle(self, pkt: PreparedPacket, *, fabricated: bool) -> None:
+        # fabricated and channel packets too, an untagged packet reaches every session pinned interest
+        pkt.session = self.id
         modified = False
         if not fabricated:
             try:
@@ -309,6 +367,7 @@ class Proxy:
                             packet=event.packet.data,
                             direction=proxy_event.direction,
                             flags=event.packet.flags,
+                            session=self.id,
                         ),
                         fabricated=False,
                     )
@@ -346,10 +405,7 @@ class Proxy:
 
         self.logger.debug("channel worker thread exited")
 
-    def start(self, block: bool = False) -> None:
-        self.running = True
-        self.logger.info("proxy running")
-
+    def start(self) -> None:
         if self._worker_thread_id is None:
             self._worker_thread_id = threading.Thread(target=self._worker)
             self._worker_thread_id.start()
@@ -358,6 +414,173 @@ class Proxy:
             self._channel_thread_id = threading.Thread(target=self._channel_worker)
             self._channel_thread_id.start()
 
+    def stop(self) -> None:
+        self.proxy_server.disconnect_now()
+        self.proxy_client.disconnect_now()
+        self.proxy_client.destroy()
+
+        self._stop_event.set()
+        self._worker_should_process.set()
+        self._event_queue.put((None, 0))
+        if self._worker_thread_id:
+            self._worker_thread_id.join()
+        self._channel_queue.put((None, 0))
+        if self._channel_thread_id:
+            self._channel_thread_id.join()
+
+
+class Proxy:
+    logger = logging.getLogger("proxy")
+
+    def __init__(self, max_sessions: int | None = None) -> None:
+        self.max_sessions = max(1, max_sessions or setting.proxy_max_sessions)
+        # one spare peer slot so a client over the limit can be told to go away instead of timing out
+        self.proxy_server = ProxyServer(setting.proxy_server, setting.proxy_port, self.max_sessions + 1)
+        self.logger.info(f"proxy server listening on {setting.proxy_server}:{setting.proxy_port} ({self.max_sessions} session(s))")
+
+        self.server_data: UpdateServerData | None = None
+        self.client_version: UpdateClientVersion | None = None
+        self._unsubs = [
+            subscribe(UpdateServerData, self._on_server_data),
+            subscribe(UpdateClientVersion, self._on_client_version),
+        ]
+
+        self.running = True
+        self._started = False
+        self._main_loop_thread_id: threading.Thread | None = None
+
+        addr = f"tcp://127.0.0.1:{os.getenv('PORT', 6712)}"
+        self.broker = Broker(self._on_channel_packet, addr)
+        self.logger.debug(f"starting broker on {addr}")
+        self.broker.start()
+        self.broker.set_handler(Packet.TYPE_STATE_REQUEST, self._state_request)
+
+        self.sessions: dict[int, Session] = {}
+        self._peer_sessions: dict[int, Session] = {}
+        self._sessions_lock = threading.Lock()
+        self._new_session()
+        self.logger.debug("proxy client initialized")
+
+    # the default session, which is the only one unless `max_sessions` is raised
+    @property
+    def session(self) -> Session:
+        return self.sessions[0]
+
+    @property
+    def state(self) -> State:
+        return self.session.state
+
+    @property
+    def proxy_client(self) -> ProxyClient:
+        return self.session.proxy_client
+
+    @property
+    def from_client_packet(self) -> int:
+        return sum(session.from_client_packet for session in self.sessions.values())
+
+    @property
+    def from_server_packet(self) -> int:
+        return sum(session.from_server_packet for session in self.sessions.values())
+
+    def _new_session(self) -> Session:
+        with self._sessions_lock:
+            session = Session(self, len(self.sessions))
+            self.sessions[session.id] = session
+
+        if self._started:
+            session.start()
+
+        return session
+
+    def _on_channel_packet(self, pkt: PreparedPacket | None) -> None:
+        if pkt is None:
+            return
+
+        if (session := self.sessions.get(pkt.session or 0)) is None:
+            self.logger.warning(f"dropping packet for unknown session {pkt.session}: {pkt!r}")
+            return
+
+        session.put_channel(pkt)
+
+    def _state_request(self, _id: bytes, pkt: Packet, fn: BrokerFunction) -> None:
+        if pkt.state_request.HasField("session"):
+            sessions = [self.sessions.get(pkt.state_request.session)]
+        else:
+            sessions = list(self.sessions.values())
+
+        for session in sessions:
+            if session is None:
+                fn.reply(Packet(type=Packet.TYPE_STATE_RESPONSE, state_response=StateResponse(state=State().to_proto()), session=pkt.state_request.session))
+                continue
+
+            fn.reply(
+                Packet(
+                    type=Packet.TYPE_STATE_RESPONSE,
+                    state_response=StateResponse(state=session.state.to_proto()),
+                    session=session.id,
+                )
+            )
+
+    def _on_server_data(self, _channel: str, event: UpdateServerData) -> None:
+        self.logger.info(f"server_data: {event.server}:{event.port}")
+        self.server_data = event
+
+    def _on_client_version(self, _channel: str, event: UpdateClientVersion) -> None:
+        self.logger.info(f"client version: version={event.version} protocol={event.protocol}")
+        self.client_version = event
+
+    def disconnect_all(self) -> None:
+        for session in self.sessions.values():
+            session.disconnect_all()
+
+    def set_processing(self, process: bool) -> None:
+        """pause or resume the packet workers of every session"""
+        for session in self.sessions.values():
+            if process:
+                session._worker_should_process.set()
+            else:
+                session._worker_should_process.clear()
+
+    def _pick_session(self) -> Session | None:
+        idle = [session for session in self.sessions.values() if not session.client_connected]
+        if idle:
+            # a client coming back from OnSendToServer reconnects from a new port, so it can't be told
+            # apart by address. sessions waiting for a redirect are handed out first
+            return min(idle, key=lambda session: (not session.redirecting, session.id))
+
+        if len(self.sessions) < self.max_sessions:
+            return self._new_session()
+
+        return None
+
+    def _on_client_event(self, event: PyENetEvent) -> None:
+        key = peer_key(event.peer)
+        match event.type:
+            case ENetEventType.CONNECT:
+                if (session := self._pick_session()) is None:
+                    self.logger.warning(f"all {self.max_sessions} session(s) are in use, refusing client")
+                    enet_peer_disconnect_now(event.peer, 0)
+                    return
+
+                self.logger.info(f"growtopia client attached to session {session.id}")
+                self._peer_sessions[key] = session
+                session.attach(event.peer)
+            case ENetEventType.RECEIVE:
+                if session := self._peer_sessions.get(key):
+                    session.put_client_event(event)
+            case ENetEventType.DISCONNECT:
+                if session := self._peer_sessions.pop(key, None):
+                    session.put_client_event(event)
+
+    def start(self, block: bool = False) -> None:
+        self.running = True
+        self._started = True
+        self.logger.info("proxy running")
+
+        for session in self.sessions.values():
+            session.state.update_status(self.broker, Status.WAITING_FOR_SERVER_DATA)
+            session.start()
+
         if block:
             try:
                 self._main_loop()
@@ -390,75 +613,25 @@ class Proxy:
 
         self.broker.stop()
 
-        self.proxy_server.disconnect_now()
-        self.proxy_client.disconnect_now()
+        for session in self.sessions.values():
+            session.stop()
 
+        self.proxy_server.disconnect_now()
         self.proxy_server.destroy()
-        self.proxy_client.destroy()
-
-        self._stop_event.set()
-        self._worker_should_process.set()
-        self._event_queue.put((None, 0))
-        if self._worker_thread_id:
-            self._worker_thread_id.join()
-        self._channel_queue.put((None, 0))
-        if self._channel_thread_id:
-            self._channel_thread_id.join()
 
     def _main_loop(self) -> None:
-        while self.running:
-            self.state.update_status(self.broker, Status.WAITING_FOR_SERVER_DATA)
-            if not self.server_data:
-                self.logger.info("waiting for server_data...")
-                while self.running and not self.server_data:
-                    time.sleep(0.16)
-
-            self.proxy_client.disconnect_now()
-            self.proxy_client = ProxyClient()
-
-            self.state.update_status(self.broker, Status.CONNECTING)
-            self.logger.info("waiting for growtopia to connect...")
-            while self.running and not self.proxy_server.peer:
-                self.proxy_server.poll()
-                time.sleep(0.16)
+        if not self.server_data:
+            self.logger.info("waiting for server_data...")
 
-            if not self.running:
-                break
-
-            assert self.server_data
-
-            self.logger.info(f"proxy_client connecting to {self.server_data.server}:{self.server_data.port}")
-            self.proxy_client.connect(self.server_data.server, self.server_data.port)
-            self.logger.info("all connected! now polling for events")
-            self.state.update_status(self.broker, Status.CONNECTED)
-
-            self._worker_should_process.set()
-            while self.running:
-                handled = False
-
-                for proxy, direction in (
-                    (self.proxy_server, DIRECTION_CLIENT_TO_SERVER),
-                    (self.proxy_client, DIRECTION_SERVER_TO_CLIENT),
-                ):
-                    if event := proxy.poll():
-                        self._event_queue.put((ProxyEvent(event, direction), self._packet_version))
-                        handled = True
-
-                if time.time() - self._last_telemetry_update > self._telemetry_update_interval:
-                    self.state.telemetry.server_ping = ctypes.cast(self.proxy_client.peer, ctypes.POINTER(ENetPeer)).contents.roundTripTime if self.proxy_client.peer else 0
-                    self.state.telemetry.client_ping = ctypes.cast(self.proxy_server.peer, ctypes.POINTER(ENetPeer)).contents.roundTripTime if self.proxy_server.peer else 0
-                    with self.broker.suppressed_log():
-                        self.state.emit_telemetry(self.broker)
+        while self.running:
+            handled = False
 
-                if self._should_reconnect.is_set():
-                    self.disconnect_all()
-                    self._should_reconnect.clear()
-                    with self.broker.suppressed_log():
-                        self.state.emit_telemetry(self.broker)
-                    break
+            if event := self.proxy_server.poll():
+                self._on_client_event(event)
+                handled = True
 
-                if not handled:
-                    time.sleep(0.01)
+            for session in list(self.sessions.values()):
+                handled |= session.poll()
 
-            self._worker_should_process.clear()
-            self._packet_version += 1
+            if not handled:
+                time.sleep(0.01)
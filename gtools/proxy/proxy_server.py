@@ -1,7 +1,10 @@
-from gtools.proxy.enet import ENetPeerBase, PyENetEvent
+from gtools.proxy.enet import ENetPeerBase, PyENetEvent, peer_key
 from thirdparty.enet.bindings import (
     ENetAddress,
     ENetEventType,
+    ENetHost,
+    ENetPeer,
+    Pointer,
     byref,
     enet_address_set_host,
     enet_host_compress_with_range_coder,
@@ -14,12 +17,13 @@ from thirdparty.enet.bindings import (
 
 
 class ProxyServer(ENetPeerBase):
-    def __init__(self, host: str, port: int) -> None:
+    def __init__(self, host: str, port: int, max_peers: int = 1) -> None:
         self.addr = ENetAddress(port=port)
         enet_address_set_host(byref(self.addr), host.encode())
 
         self.peer = None
-        self.host = enet_host_create(byref(self.addr), 1, 2, 0, 0)
+        self.peers: dict[int, Pointer[ENetPeer]] = {}
+        self.host = enet_host_create(byref(self.addr), max_peers, 2, 0, 0)
         if not self.host:
             raise RuntimeError("host is null")
         enet_host_compress_with_range_coder(self.host)
@@ -27,16 +31,36 @@ class ProxyServer(ENetPeerBase):
         enet_host_use_new_packet_for_server(self.host)
 
     def poll(self) -> PyENetEvent | None:
+        last = self.peer
         event = super().poll()
         if event:
             if event.type == ENetEventType.CONNECT:
                 self.logger.debug("growtopia client connected")
                 self.peer = event.peer
+                self.peers[peer_key(event.peer)] = event.peer
                 enet_peer_timeout(self.peer, 0, 30000, 0)
             elif event.type == ENetEventType.RECEIVE:
                 pass
             elif event.type == ENetEventType.DISCONNECT:
                 self.logger.debug("growtopia client disconnected")
-                self.peer = None
+                self.peers.pop(peer_key(event.peer), None)
+                # `peer` tracks the most recent client, keep it if another one went away
+                self.peer = last if last and peer_key(last) != peer_key(event.peer) else None
 
         return event
+
+
+class ProxyServerPeer(ENetPeerBase):
+    """one game client of a `ProxyServer`, sends go to this peer only. the host is owned by the server"""
+
+    def __init__(self, host: Pointer[ENetHost]) -> None:
+        self.host = host
+        self.addr = None
+        self.peer = None
+
+    def poll(self) -> PyENetEvent | None:
+        # events of the shared host are dispatched by whoever polls the ProxyServer
+        return None
+
+    def destroy(self) -> None:
+        pass
@@ -1,7 +1,10 @@
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import IntEnum, auto
+import copy
 import logging
 import time
+from typing import Iterable
 import zlib
 from pyglm.glm import ivec2, vec2
 
@@ -17,7 +20,7 @@ from gtools.core.growtopia.strkv import StrKV
 from gtools.core.growtopia.variant import Variant
 from gtools.core.growtopia.world import Npc, NpcEvent, NpcType, Tile, World, WorldEvent
 from gtools.protogen import growtopia_pb2
-from gtools.protogen.extension_pb2 import DIRECTION_SERVER_TO_CLIENT, INTEREST_STATE_UPDATE, Packet
+from gtools.protogen.extension_pb2 import DIRECTION_SERVER_TO_CLIENT
 from gtools.protogen.state_pb2 import (
     STATE_ENTER_WORLD,
     STATE_EXIT_WORLD,
@@ -38,6 +41,7 @@ from gtools.protogen.state_pb2 import (
     STATE_UPDATE_CLOTHING,
     STATE_UPDATE_STATUS,
     STATE_UPDATE_TREE_STATE,
+    BrokerTelemetry,
     EnterWorld,
     ModifyInventory,
     ModifyItem,
@@ -101,6 +105,8 @@ class Telemetry:
     client_ping: int = 0
     enter_world_time: float = 0
     logged_in_time: float = 0
+    # pending tables of the broker, only filled in on the extension side
+    broker: BrokerTelemetry = field(default_factory=BrokerTelemetry)
 
 
 class Status(IntEnum):
@@ -120,16 +126,32 @@ class State:
     status: Status = Status.DISCONNECTED
     inventory: Inventory = field(default_factory=Inventory)
     telemetry: Telemetry = field(default_factory=Telemetry)
+    # proxy session this state belongs to, tags every state update sent to extensions
+    session: int | None = None
+    # state updates held back by `batch_updates`, published together when it exits
+    _outbox: list[StateUpdate] | None = field(default=None, repr=False, compare=False)
 
     logger = logging.getLogger("state")
 
     @classmethod
-    def from_proto(cls, proto: growtopia_pb2.State) -> "State":
+    def from_proto(cls, proto: growtopia_pb2.State, session: int | None = None) -> "State":
         return cls(
             world=World.from_proto(proto.world),
             me=Me.from_proto(proto.me),
             status=Status(proto.status),
             inventory=Inventory.from_proto(proto.inventory),
+            session=session,
+        )
+
+    def fork(self) -> "State":
+        """copy on write copy, see `World.fork`. this state becomes a read only snapshot"""
+        return State(
+            world=self.world.fork() if self.world else None,
+            me=copy.copy(self.me),
+            status=self.status,
+            inventory=self.inventory.copy(),
+            telemetry=copy.deepcopy(self.telemetry),
+            session=self.session,
         )
 
     def to_proto(self) -> growtopia_pb2.State:
@@ -140,9 +162,41 @@ class State:
             inventory=self.inventory.to_proto(),
         )
 
+    @contextmanager
+    def coalesce(self):
+        """coalesce world updates applied in this scope, see `World.coalesce`"""
+        if self.world is None:
+            yield
+            return
+
+        with self.world.coalesce():
+            yield
+
+    def update_many(self, upds: Iterable[StateUpdate]) -> None:
+        with self.coalesce():
+            for upd in upds:
+                self.update(upd)
+
     def send_state_update(self, broker: Broker, upd: StateUpdate) -> None:
         self.update(upd)
-        broker.process_event_any(INTEREST_STATE_UPDATE, Packet(type=Packet.TYPE_STATE_UPDATE, state_update=upd))
+        if self._outbox is not None:
+            self._outbox.append(upd)
+        else:
+            broker.publish_state(self.session, [upd], self.me.net_id)
+
+    @contextmanager
+    def batch_updates(self, broker: Broker):
+        """state updates sent in this scope reach extensions as one batch"""
+        if self._outbox is not None:
+            yield
+            return
+
+        self._outbox = []
+        try:
+            yield
+        finally:
+            outbox, self._outbox = self._outbox, None
+            broker.publish_state(self.session, outbox, self.me.net_id)
 
     def update_status(self, broker: Broker, status: Status) -> None:
         match status:
@@ -168,12 +222,18 @@ class State:
                     client_ping=self.telemetry.client_ping,
                     time_since_login=now - self.telemetry.logged_in_time if self.telemetry.logged_in_time != 0.0 else 0.0,
                     time_in_world=now - self.telemetry.enter_world_time if self.telemetry.enter_world_time != 0.0 else 0.0,
+                    broker=broker.telemetry(),
                 ),
             ),
         )
 
     def emit_event(self, broker: Broker, event: PreparedPacket) -> None:
         """emit event only sends command through the protobuf, no state update should be happening inside this function"""
+        # a single packet can carry thousands of tile changes (SEND_TILE_UPDATE_DATA_MULTIPLE, npc full state, ...)
+        with self.coalesce(), self.batch_updates(broker):
+            self._emit_event(broker, event)
+
+    def _emit_event(self, broker: Broker, event: PreparedPacket) -> None:
         pkt = event.as_net
         match pkt.type:
             case NetType.GAME_MESSAGE:
@@ -595,6 +655,7 @@ class State:
                 self.me.client_ping = upd.set_my_telemetry.client_ping
                 self.me.time_since_login = upd.set_my_telemetry.time_since_login
                 self.me.time_in_world = upd.set_my_telemetry.time_in_world
+                self.telemetry.broker.CopyFrom(upd.set_my_telemetry.broker)
             case StateUpdateWhat.STATE_PLAYER_UPDATE:
                 if not self.world:
                     self.logger.warning("player update, but world is not initialized")
@@ -609,7 +670,7 @@ class State:
                     net_id = self.me.net_id
 
                 if player := self.world.get_player(net_id):
-                    player.pos = pos
+                    self.world.move_player(player, pos)
                     player.flags = TankFlags(upd.player_update.flags)
 
                 self.world.broadcast(WorldEvent.PLAYER_UPDATE)
@@ -764,7 +825,7 @@ class State:
                                 npc.param2 = tgt.param2
                             if tgt.param3 != 0.0:
                                 npc.param3 = tgt.param3
-                            npc.pos = vec2(tgt.x, tgt.y)
+                            self.world.move_npc(npc, vec2(tgt.x, tgt.y))
                             self.world.broadcast(WorldEvent.NPC_UPDATE)
             case StateUpdateWhat.STATE_RELOAD_ITEMS_DATABASE:
                 data = zlib.decompress(upd.reload_items_database.data)
@@ -13,10 +13,14 @@ from gtools import setting
 
 class HTTPHandler(BaseHTTPRequestHandler):
     logger = logging.getLogger("http_handler")
+    # keep-alive, like the real server_data endpoint
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
 
     def do_POST(self) -> None:
         if not self.path.startswith("/growtopia/server_data.php"):
             self.send_response(404)
+            self.send_header("Content-Length", "0")
             self.end_headers()
             return
 
@@ -63,7 +67,6 @@ class HTTPHandler(BaseHTTPRequestHandler):
         self.send_response(200)
         self.send_header("Content-Type", "text/plain")
         self.send_header("Content-Length", str(len(body)))
-        self.send_header("Connection", "close")
         self.end_headers()
         self.wfile.write(body)
 
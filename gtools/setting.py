@@ -10,6 +10,7 @@ from watchdog.events import DirModifiedEvent, FileModifiedEvent, FileSystemEvent
 from watchdog.observers import Observer
 
 from gtools.core.mixin import JsonMixin
+from gtools.core.resolver import DEFAULT_DOH_ENDPOINTS
 from gtools.core.utils import get_growtopia, get_home
 from gtools.core.wsl import is_running_wsl
 
@@ -45,14 +46,41 @@ class Setting(JsonMixin):
     server_data_url: str = field(default="www.growtopia1.com")
     proxy_server: str = field(default="127.0.0.1")
     proxy_port: int = field(default=16999)
+    # number of game clients a single proxy serves concurrently, each with its own upstream and state
+    proxy_max_sessions: int = field(default=1)
     http_server_host: str = field(default="127.0.0.1")
     http_server_port: int = field(default=443)
     appdir: Path = field(default=APPDIR)
     gt_path: Path = field(default_factory=get_growtopia)
     broker_addr: str = field(default="tcp://127.0.0.1:6712")
+    # DoH json endpoints raced for name resolution, answers are cached on disk for their TTL
+    doh_endpoints: list[str] = field(default_factory=lambda: list(DEFAULT_DOH_ENDPOINTS))
+    dns_timeout: float = field(default=3.0)
+    # keep-alive connections to the server_data upstream, and how long a response is reused for an identical request
+    server_data_max_connections: int = field(default=4)
+    server_data_cache_ttl: float = field(default=5.0)
     spoof_hwident: bool = field(default=True)
     heartbeat_interval: float = field(default=1.0)
     heartbeat_threshold: float = field(default=5.0)
+    # seconds the broker waits for an extension to answer a packet before giving up on it
+    broker_pending_timeout: float = field(default=2.0)
+    # what an expired packet turns into: "pass", "cancel" or "drop", for block chains and for send-and-cancel
+    broker_expire_block: str = field(default="pass")
+    broker_expire_send_and_cancel: str = field(default="pass")
+    # packets one extension may have unanswered before new ones skip it, and how long a block chain waits for room
+    broker_max_in_flight: int = field(default=256)
+    broker_in_flight_wait: float = field(default=0.0)
+    # position updates per player per second a state update subscription gets unless it sets its own, 0 is all of them
+    state_position_rate: float = field(default=0.0)
+    # tile extras and cbor data of a parsed world are decoded on first access instead of up front
+    world_lazy_extra: bool = field(default=True)
+    # bytes past a tile World.deserialize fails on that are searched for the next tile, and how many tiles in a row
+    # have to parse from a candidate before parsing resumes there. the budget caps bytes parsed plus offsets tried
+    # across all resyncs of one world, in multiples of its size. past it the tiles left are given up on and the tail
+    # is read from the back
+    world_resync_window: int = field(default=4096)
+    world_resync_confirm: int = field(default=4)
+    world_resync_budget: float = field(default=2.0)
     panic_on_packet_error: bool = field(default=False)
 
     """
@@ -66,6 +94,11 @@ class Setting(JsonMixin):
     anomaly_byte_compensation: bool = field(default=True)
 
     opengl_error_checking: bool = field(default=False)
+    # time per frame spent uploading mesh data built in the background, the rest waits for the next frame
+    mesh_upload_budget_ms: float = field(default=4.0)
+    # same for decoded textures, and how much VRAM texture arrays may hold before unused ones are evicted
+    texture_upload_budget_ms: float = field(default=2.0)
+    texture_vram_budget_mb: int = field(default=512)
 
     server: ServerSetting = field(default_factory=ServerSetting)
 
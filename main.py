@@ -1,45 +1,27 @@
 import argparse
 import logging
-import multiprocessing as mp
 import os
 from pathlib import Path
-from queue import Queue
 import sys
 import threading
 import time
 import traceback
+from typing import TYPE_CHECKING
 
 from gtools import flags
 from gtools.core.block_sigint import block_sigint
-from gtools.core.growtopia.world_renderer_cpu import RenderOptions, render_world_image
-from gtools.core.growtopia.packet import NetPacket, NetType, PreparedPacket
-from gtools.core.growtopia.strkv import StrKV
-from gtools.core.growtopia.world import World
 from gtools.core.hosts import HostsFileManager
+from gtools.core.importtime import profile_imports
 from gtools.core.log import setup_logger
-from gtools.core.mixer import AudioMixer
-from gtools.core.network import is_up, resolve_doh
 from gtools.core.privilege import elevate, is_elevated, is_elevated_child
 from gtools.core.wsl import is_running_wsl
-from gtools.protogen.extension_pb2 import (
-    BLOCKING_MODE_BLOCK,
-    DIRECTION_SERVER_TO_CLIENT,
-    DIRECTION_UNSPECIFIED,
-    INTEREST_TANK_PACKET,
-    Interest,
-    PendingPacket,
-)
-from gtools.proxy.accountmgr import AccountManager
-from gtools.proxy.http_proxy import setup_server as setup_http_proxy
-from gtools.server.http_server import setup_server as setup_http_server
-from gtools.proxy.extension.server.broker import Broker
-from gtools.proxy.extension.client.sdk import Extension, register_thread
-from gtools.proxy.proxy import Proxy
-from gtools.server.server import Server
-from thirdparty.enet.bindings import ENetPacketFlag
 from gtools import setting
 from gtools.setting import Setting
-from extension.utils import UtilityExtension
+
+# subcommands import what they need when they run, keep this module cheap to import
+# so `setting`, `acc` and spawned extension processes don't pay for numpy, zmq or items.dat
+if TYPE_CHECKING:
+    from gtools.proxy.extension.client.sdk import Extension
 
 
 def get_host_mgr() -> HostsFileManager:
@@ -149,7 +131,17 @@ def check_hosts() -> None:
                     print(f"changed proxy target server to {orig.ip}")
 
 
-def run_proxy() -> None:
+def load_extension(spec: str) -> "Extension":
+    """instantiate `module:Class` with no arguments"""
+    import importlib
+
+    module, _, name = spec.partition(":")
+    if not name:
+        raise ValueError(f"expected module:Class, got {spec!r}")
+    return getattr(importlib.import_module(module), name)()
+
+
+def run_proxy(inproc: list[str] | None = None) -> None:
     try:
         check_hosts()
         if is_elevated_child():
@@ -159,18 +151,33 @@ def run_proxy() -> None:
     except PermissionError:
         elevate(wait_for_child=True)
 
+    from gtools.proxy.http_proxy import setup_server as setup_http_proxy
+    from gtools.proxy.proxy import Proxy
+
     server = setup_http_proxy()
     t = threading.Thread(target=lambda: server.serve_forever())
     t.start()
-    Proxy().start(block=True)
+
+    proxy = Proxy()
+    # in process extensions talk to the broker without zmq or serialization, for simple handlers that
+    # don't need their own process
+    extensions = [load_extension(spec) for spec in inproc or []]
+    for ext in extensions:
+        ext.start(inproc=True)
+    proxy.start(block=True)
 
     with block_sigint():
+        for ext in extensions:
+            ext.stop()
         server.shutdown()
         server.server_close()
         t.join()
 
 
 def run_server() -> None:
+    from gtools.server.http_server import setup_server as setup_http_server
+    from gtools.server.server import Server
+
     server = setup_http_server()
     t = threading.Thread(target=lambda: server.serve_forever())
     t.start()
@@ -184,6 +191,8 @@ def run_server() -> None:
 
 
 def test_server() -> None:
+    from gtools.core.network import is_up, resolve_doh
+
     for host in ("www.growtopia1.com", "www.growtopia2.com"):
         print(f"checking for {host}")
 
@@ -204,7 +213,7 @@ def test_server() -> None:
         print("checking alternate host...")
 
 
-def _run(e: type[Extension], *args) -> None:
+def _run(e: "type[Extension]", *args) -> None:
     e(*args).start(block=True)
 
 
@@ -214,10 +223,10 @@ if __name__ == "__main__":
 
     parser = argparse.ArgumentParser()
     parser.add_argument("-v", "--verbose", action="store_true", help="verbose logging")
+    parser.add_argument("--import-profile", action="store_true", help="run the command under -X importtime and print where startup time went")
     subparsers = parser.add_subparsers(dest="cmd", help="sub-command to run")
 
     for name, help_txt in [
-        ("proxy", "run the proxy"),
         ("server", "run the server"),
         ("ext_test", "run extension test"),
         ("test", "run network checks"),
@@ -226,6 +235,14 @@ if __name__ == "__main__":
     ]:
         subparsers.add_parser(name, parents=[global_parent], help=help_txt)
 
+    proxy = subparsers.add_parser("proxy", parents=[global_parent], help="run the proxy")
+    proxy.add_argument(
+        "--inproc",
+        action="append",
+        metavar="MODULE:CLASS",
+        help="load an extension into the proxy process, e.g. extension.utils:UtilityExtension (repeatable)",
+    )
+
     gui = subparsers.add_parser("gui", parents=[global_parent], help="run gui")
     gui.add_argument("-w", "--world", help="path to world packet file", required=False)
     gui.add_argument("--dev", help="enable dev mode", action="store_true", default=False)
@@ -236,6 +253,7 @@ if __name__ == "__main__":
 
     music = subparsers.add_parser("music", parents=[global_parent], help="simulate world music")
     music.add_argument("world", help="path to world packet file")
+    music.add_argument("-o", "--out", help="render the music into an audio file instead of playing it", required=False)
 
     sett = subparsers.add_parser("setting", parents=[global_parent], help="manipulate settings")
     sett_sub = sett.add_subparsers(dest="setting_op", help="setting operation")
@@ -269,6 +287,9 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    if args.import_profile:
+        sys.exit(profile_imports([arg for arg in sys.argv if arg != "--import-profile"]))
+
     if args.cmd is None:
         parser.print_help()
         sys.exit(1)
@@ -285,27 +306,13 @@ if __name__ == "__main__":
         acc.print_help()
         sys.exit(1)
 
-    class SimpleExtension(Extension):
-        def __init__(self, name: str, priority: int) -> None:
-            super().__init__(name=name, interest=[Interest(interest=INTEREST_TANK_PACKET, priority=priority, blocking_mode=BLOCKING_MODE_BLOCK, direction=DIRECTION_UNSPECIFIED)])
-
-        def process(self, event: PendingPacket) -> PendingPacket | None:
-            p = NetPacket.deserialize(event.buf)
-            p.tank.net_id = (p.tank.net_id * 31 + int(self._name.split(b"-")[-1].decode())) & 0x7FFFFFFF
-            event.buf = p.serialize()
-
-            return self.forward(event)
-
-        def destroy(self) -> None:
-            pass
-
     level = logging.DEBUG if args.verbose else logging.INFO
     setup_logger(log_dir=setting.appdir / "logs", level=level)
 
     if args.cmd == "test":
         test_server()
     elif args.cmd == "proxy":
-        run_proxy()
+        run_proxy(args.inproc)
     elif args.cmd == "server":
         run_server()
     elif args.cmd == "gui":
@@ -315,6 +322,8 @@ if __name__ == "__main__":
         Panel.dev_mode = args.dev
         app = App((setting.appdir / "worlds" / args.world if not Path(args.world).is_absolute() else args.world) if args.world else None).run()
     elif args.cmd == "acc":
+        from gtools.proxy.accountmgr import AccountManager
+
         repr = lambda x: "".join([f"{x['name']} [v{x.get('_version', 0)}]:\n", "\n".join([f"    {k}={v}" for k, v in x["ident"].items()])])
         if args.acc_op == "list":
             for acc in AccountManager.get_all():
@@ -386,6 +395,38 @@ if __name__ == "__main__":
                 print(f"successfully restored from {bak}")
                 exit(0)
     elif args.cmd == "ext_test":
+        import multiprocessing as mp
+
+        from gtools.core.growtopia.packet import NetPacket, PreparedPacket
+        from gtools.protogen.extension_pb2 import (
+            BLOCKING_MODE_BLOCK,
+            DIRECTION_SERVER_TO_CLIENT,
+            DIRECTION_UNSPECIFIED,
+            INTEREST_TANK_PACKET,
+            Interest,
+            PendingPacket,
+        )
+        from gtools.proxy.extension.client.sdk import Extension
+        from gtools.proxy.extension.server.broker import Broker
+        from thirdparty.enet.bindings import ENetPacketFlag
+        from extension.utils import UtilityExtension
+
+        class SimpleExtension(Extension):
+            def __init__(self, name: str, priority: int) -> None:
+                super().__init__(
+                    name=name, interest=[Interest(interest=INTEREST_TANK_PACKET, priority=priority, blocking_mode=BLOCKING_MODE_BLOCK, direction=DIRECTION_UNSPECIFIED)]
+                )
+
+            def process(self, event: PendingPacket) -> PendingPacket | None:
+                p = NetPacket.deserialize(event.buf)
+                p.tank.net_id = (p.tank.net_id * 31 + int(self._name.split(b"-")[-1].decode())) & 0x7FFFFFFF
+                event.buf = p.serialize()
+
+                return self.forward(event)
+
+            def destroy(self) -> None:
+                pass
+
         b = Broker()
         b.start()
         exts: list[mp.Process] = []
@@ -419,6 +460,23 @@ if __name__ == "__main__":
 
         b.stop()
     elif args.cmd == "stress":
+        import multiprocessing as mp
+        from queue import Queue
+
+        from gtools.core.growtopia.packet import NetPacket, NetType, PreparedPacket
+        from gtools.core.growtopia.strkv import StrKV
+        from gtools.protogen.extension_pb2 import (
+            BLOCKING_MODE_BLOCK,
+            DIRECTION_SERVER_TO_CLIENT,
+            DIRECTION_UNSPECIFIED,
+            INTEREST_TANK_PACKET,
+            Interest,
+            PendingPacket,
+        )
+        from gtools.proxy.extension.client.sdk import Extension, register_thread
+        from gtools.proxy.extension.server.broker import Broker
+        from thirdparty.enet.bindings import ENetPacketFlag
+
         if not flags.BENCHMARK:
             os.environ["BENCHMARK"] = "1"
             os.execvpe(sys.executable, [sys.executable] + sys.argv, os.environ)
@@ -456,6 +514,9 @@ if __name__ == "__main__":
         p.join()
         b.stop()
     elif args.cmd == "world_test":
+        from gtools.core.growtopia.packet import NetPacket
+        from gtools.core.growtopia.world import World
+
         logger = logging.getLogger("world")
         logger.setLevel(logging.CRITICAL)
         logging.getLogger("tank_packet").setLevel(logging.CRITICAL)
@@ -468,6 +529,9 @@ if __name__ == "__main__":
                 traceback.print_exc()
                 break
     elif args.cmd == "render":
+        from gtools.core.growtopia.world import World
+        from gtools.core.growtopia.world_renderer_cpu import RenderOptions, render_world_image
+
         world = World.from_tank(Path(args.world).read_bytes())
         start = time.perf_counter()
         img = render_world_image(world, options=RenderOptions(scale=max(0.01, args.scale)))
@@ -476,7 +540,23 @@ if __name__ == "__main__":
 
         if is_running_wsl():
             time.sleep(1)
+    elif args.cmd == "music" and args.out:
+        from gtools.core.growtopia.note import render_sheet
+        from gtools.core.growtopia.world import World
+        from gtools.core.mixer import TARGET_SR
+
+        world = World.from_tank(Path(args.world).read_bytes())
+        sheet = world.get_sheet()
+
+        start = time.perf_counter()
+        buf = render_sheet(sheet, args.out)
+        elapsed = time.perf_counter() - start
+        duration = len(buf) / TARGET_SR
+        print(f"rendered {sheet.total_notes} notes ({duration:.2f}s of audio) in {elapsed:.3f}s, {duration / max(elapsed, 1e-9):.1f}x realtime", flush=True)
     elif args.cmd == "music":
+        from gtools.core.growtopia.world import World
+        from gtools.core.mixer import AudioMixer
+
         world = World.from_tank(Path(args.world).read_bytes())
         mixer = AudioMixer()
         mixer.master_gain = 0.7
@@ -0,0 +1,62 @@
+import os
+import timeit
+from typing import Callable
+
+import click
+
+from gtools.core.growtopia import crypto
+
+
+def _ref_rolling_chksum(buf: bytes, shift: int) -> int:
+    chksum = 0
+    for i, b in enumerate(buf):
+        shifted = (b + shift + i + 2) & 0xFF
+        chksum = (chksum + shift + i + shifted) & 0xFFFFFFFF
+    return chksum
+
+
+def _ref_rolling_chksum2(buf: bytes, shift: int) -> int:
+    chksum = 0
+    for i, b in enumerate(buf):
+        chksum = (chksum + shift + i + b) & 0xFFFFFFFF
+    return chksum
+
+
+def _ref_rolling_shift(buf: bytes, shift: int) -> bytes:
+    return bytes([(b + shift + i) & 0xFF for i, b in enumerate(buf)])
+
+
+def _ref_proton_hash(data: bytes) -> int:
+    hash_val = 0x55555555
+    for byte in data:
+        hash_val = byte + ((hash_val & 0xFFFFFFFF) >> 27) + ((hash_val << 5) & 0xFFFFFFFF)
+        hash_val &= 0xFFFFFFFF
+    return hash_val
+
+
+def _time(fn: Callable[[], object], budget: float = 0.2) -> float:
+    timer = timeit.Timer(fn)
+    n, _ = timer.autorange()
+    n = max(1, int(n * budget / 0.2))
+    return min(timer.repeat(3, n)) / n * 1e6
+
+
+@click.command()
+@click.option("--size", "sizes", multiple=True, type=int, default=[32, 1024, 65536], help="buffer sizes in bytes")
+def bench_checksum(sizes: tuple[int, ...]) -> None:
+    """checksum/hash fast paths against the old per byte python loops"""
+    print(f"native library: {'yes' if crypto._c_rolling_chksum is not None else 'no'}")
+    print(f"{'function':<18} {'size':>7} {'reference':>12} {'current':>12} {'speedup':>8}")
+
+    for size in sizes:
+        buf = os.urandom(size)
+        rows = [
+            ("rolling_chksum", lambda: _ref_rolling_chksum(buf, 0x63BC), lambda: crypto.rolling_chksum(buf, 0x63BC)),
+            ("rolling_chksum2", lambda: _ref_rolling_chksum2(buf, 0x63BC), lambda: crypto.rolling_chksum2(buf, 0x63BC)),
+            ("rolling_shift", lambda: _ref_rolling_shift(buf, 0xBE), lambda: crypto.rolling_shift(buf, 0xBE)),
+            ("proton_hash", lambda: _ref_proton_hash(buf), lambda: crypto.proton_hash(buf)),
+        ]
+        for name, ref, cur in rows:
+            ref_us = _time(ref)
+            cur_us = _time(cur)
+            print(f"{name:<18} {size:>7} {ref_us:>10.2f}us {cur_us:>10.2f}us {ref_us / cur_us:>7.1f}x")
@@ -23,6 +23,7 @@ except ImportError:
     HAS_RICH = False
 
 from gtools import setting
+from gtools.core.growtopia.item_columns import ItemColumns, diff_columns, load_columns
 from gtools.core.growtopia.items_dat import Item, ItemDatabase
 
 FIELD_DESCRIPTIONS: dict[str, str] = {
@@ -123,16 +124,8 @@ def _file_date(path: Path) -> str:
     return dt.strftime("%B %d, %Y  %H:%M")
 
 
-def _item_diff(new: Item, old: Item) -> list[tuple[str, str, str]]:
-    out: list[tuple[str, str, str]] = []
-    for f in dataclasses.fields(new):
-        if f.name in ("id", "texture_file_hash", "extra_file_hash", "renderer_data_file_hash"):
-            continue
-        nv = getattr(new, f.name)
-        ov = getattr(old, f.name)
-        if nv != ov:
-            out.append((f.name, _fmt(ov), _fmt(nv)))
-    return out
+def _item_diff(new: Item, old: Item, names: list[str]) -> list[tuple[str, str, str]]:
+    return [(name, _fmt(getattr(old, name)), _fmt(getattr(new, name))) for name in names]
 
 
 @dataclasses.dataclass
@@ -151,36 +144,39 @@ class DiffResult:
         return len(self.added) + len(self.removed) + len(self.modified)
 
 
-def compute_diff(
-    new: ItemDatabase,
-    old: ItemDatabase,
+def compute_column_diff(
+    new: ItemColumns,
+    old: ItemColumns,
     new_path: Path | None = None,
     old_path: Path | None = None,
 ) -> DiffResult:
-    new_ids = set(new.items)
-    old_ids = set(old.items)
-
-    added = [new.items[i] for i in sorted(new_ids - old_ids)]
-    removed = [old.items[i] for i in sorted(old_ids - new_ids)]
+    diff = diff_columns(new, old)
     modified: list[tuple[Item, Item, list]] = []
-
-    for item_id in sorted(new_ids & old_ids):
-        changes = _item_diff(new.items[item_id], old.items[item_id])
-        if changes:
-            modified.append((new.items[item_id], old.items[item_id], changes))
+    for new_row, old_row, names in diff.modified:
+        new_item, old_item = new.item(new_row), old.item(old_row)
+        modified.append((new_item, old_item, _item_diff(new_item, old_item, names)))
 
     return DiffResult(
         same_schema=new.version == old.version,
         new_version=new.version,
         old_version=old.version,
-        added=added,
-        removed=removed,
+        added=[new.item(int(r)) for r in diff.added],
+        removed=[old.item(int(r)) for r in diff.removed],
         modified=modified,
         new_path=new_path,
         old_path=old_path,
     )
 
 
+def compute_diff(
+    new: ItemDatabase,
+    old: ItemDatabase,
+    new_path: Path | None = None,
+    old_path: Path | None = None,
+) -> DiffResult:
+    return compute_column_diff(ItemColumns.from_database(new), ItemColumns.from_database(old), new_path=new_path, old_path=old_path)
+
+
 def _item_to_dict(item: Item) -> dict:
     return {f.name: _fmt(getattr(item, f.name)) for f in dataclasses.fields(item)}
 
@@ -756,9 +752,7 @@ def mine(
     if old_dat and new_dat:
         new_path = Path(new_dat)
         old_path = Path(old_dat)
-        new_db = ItemDatabase.load(new_path)
-        old_db = ItemDatabase.load(old_path)
-        result = compute_diff(new_db, old_db, new_path=new_path, old_path=old_path)
+        result = compute_column_diff(load_columns(new_path), load_columns(old_path), new_path=new_path, old_path=old_path)
         if output_json:
             render_json([result], consecutive=False)
         else:
@@ -784,9 +778,7 @@ def mine(
         newest, oldest = selected[0], selected[-1]
         if not output_json:
             print(f"comparing:\n  NEW: {newest}\n  OLD: {oldest}\n", file=sys.stderr)
-        new_db = ItemDatabase.load(newest)
-        old_db = ItemDatabase.load(oldest)
-        result = compute_diff(new_db, old_db, new_path=newest, old_path=oldest)
+        result = compute_column_diff(load_columns(newest), load_columns(oldest), new_path=newest, old_path=oldest)
         if output_json:
             render_json([result], consecutive=False)
         else:
@@ -801,13 +793,16 @@ def mine(
         )
 
     all_results: list[DiffResult] = []
+    # walking oldest -> newest, each version is loaded once and reused as the next pair's old side
+    prev: tuple[Path, ItemColumns] | None = None
     for i, (newer, older) in enumerate(pairs, 1):
         if not output_json:
             print(f"[{i}/{len(pairs)}]  {older.name}  ->  {newer.name}", file=sys.stderr)
 
-        new_db = ItemDatabase.load(newer)
-        old_db = ItemDatabase.load(older)
-        result = compute_diff(new_db, old_db, new_path=newer, old_path=older)
+        old_cols = prev[1] if prev is not None and prev[0] == older else load_columns(older)
+        new_cols = load_columns(newer)
+        prev = (newer, new_cols)
+        result = compute_column_diff(new_cols, old_cols, new_path=newer, old_path=older)
         all_results.append(result)
 
         if not output_json:
@@ -0,0 +1,81 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+import http.client
+import logging
+import ssl
+import statistics
+import threading
+import time
+from typing import Callable
+
+import click
+
+from gtools.core.http_pool import HTTPSPool
+from gtools.server.http_server import HTTPHandler, ThreadedHTTPServer
+
+_BODY = b"version=5.11&platform=0&protocol=216"
+_PATH = "/growtopia/server_data.php"
+_HEADERS = {"Host": "www.growtopia1.com", "Content-Type": "application/x-www-form-urlencoded"}
+
+
+class _QuietHandler(HTTPHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _stand_in() -> ThreadedHTTPServer:
+    httpd = ThreadedHTTPServer(("127.0.0.1", 0), _QuietHandler)
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain("resources/cert.pem", "resources/key.pem")
+    httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+def _fresh(port: int) -> None:
+    # what the proxy did before pooling, new context and handshake for every request
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.VerifyMode.CERT_NONE
+    with closing(http.client.HTTPSConnection("127.0.0.1", port, timeout=10, context=context)) as conn:
+        conn.request("POST", _PATH, _BODY, headers=_HEADERS)
+        conn.getresponse().read()
+
+
+def _run(n: int, concurrency: int, fn: Callable[[], None]) -> tuple[float, list[float]]:
+    def timed() -> float:
+        start = time.perf_counter()
+        fn()
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        latencies = list(pool.map(lambda _: timed(), range(n)))
+    return (time.perf_counter() - start) * 1000, latencies
+
+
+def _report(name: str, total: float, latencies: list[float]) -> None:
+    latencies.sort()
+    p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+    print(f"{name:<8} {total:>9.1f}ms total {statistics.median(latencies):>7.2f}ms p50 {p95:>7.2f}ms p95")
+
+
+@click.command()
+@click.option("-n", default=200, type=int, help="requests per mode")
+@click.option("-c", "--concurrency", default=4, type=int, help="requests in flight")
+def bench_server_data(n: int, concurrency: int) -> None:
+    """server_data.php upstream fetch, fresh tls connection per request vs the keep-alive pool, against a local stand-in"""
+    logging.getLogger("http_handler").setLevel(logging.WARNING)
+    httpd = _stand_in()
+    port = httpd.server_address[1]
+
+    try:
+        _report("fresh", *_run(n, concurrency, lambda: _fresh(port)))
+
+        pool = HTTPSPool("127.0.0.1", port, max_connections=concurrency)
+        _report("pooled", *_run(n, concurrency, lambda: pool.request("POST", _PATH, _BODY, headers=_HEADERS) and None))
+        print(pool.stats)
+        pool.close()
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
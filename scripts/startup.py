@@ -0,0 +1,65 @@
+import datetime
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import click
+
+from gtools import setting
+from gtools.core.importtime import parse_importtime
+
+ROOT = Path(__file__).parent.parent
+
+COMMANDS: list[tuple[str, list[str]]] = [
+    ("main --help", ["main.py", "--help"]),
+    ("main setting list", ["main.py", "setting", "list"]),
+    ("import world", ["-c", "import gtools.core.growtopia.world"]),
+    ("import sdk", ["-c", "import gtools.proxy.extension.client.sdk"]),
+    ("import proxy", ["-c", "import gtools.proxy.proxy"]),
+]
+
+
+def _measure(argv: list[str]) -> tuple[float, float]:
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime", *argv], cwd=ROOT, capture_output=True, text=True, errors="replace")
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        raise click.ClickException(f"{' '.join(argv)} exited with {proc.returncode}:\n{proc.stderr[-2000:]}")
+
+    imports = sum(e.cumulative_us for e in parse_importtime(proc.stderr.splitlines()) if e.depth == 0)
+    return wall * 1000, imports / 1000
+
+
+@click.command()
+@click.option("-n", default=5, type=int, help="runs per command")
+@click.option("--save/--no-save", default=True, help="append the result to the startup benchmark history")
+def startup(n: int, save: bool) -> None:
+    """cold start benchmark, each run is a fresh interpreter"""
+    history = setting.appdir / "bench" / "startup.jsonl"
+    prev: dict[str, float] = {}
+    if history.exists():
+        lines = history.read_text().splitlines()
+        if lines:
+            prev = json.loads(lines[-1])["results"]
+
+    results: dict[str, float] = {}
+    for name, argv in COMMANDS:
+        runs = [_measure(argv) for _ in range(n)]
+        wall = statistics.median(r[0] for r in runs)
+        imports = statistics.median(r[1] for r in runs)
+        results[name] = round(wall, 2)
+
+        delta = ""
+        if name in prev:
+            delta = f" ({wall - prev[name]:+.1f}ms)"
+        print(f"{name:<24} {wall:>8.1f}ms wall {imports:>8.1f}ms imports{delta}")
+
+    if save:
+        history.parent.mkdir(parents=True, exist_ok=True)
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+        with history.open("a") as f:
+            f.write(json.dumps({"time": datetime.datetime.now().isoformat(), "rev": rev, "n": n, "results": results}) + "\n")
+        print(f"saved to {history}")
@@ -1,6 +1,13 @@
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import logging
+from pathlib import Path
+import textwrap
+import time
+
 import click
-from gtools.core.growtopia.packet import NetPacket
-from gtools.core.growtopia.world import World
+from gtools import setting
+from gtools.core.growtopia.world import ParseIssue, World
 from gtools.core.wsl import windows_home
 
 
@@ -8,7 +15,66 @@ from gtools.core.wsl import windows_home
 @click.argument("name")
 def world(name: str) -> None:
     f = windows_home() / ".gtools/worlds" / name
-    pkt = NetPacket.deserialize(f.read_bytes())
-    w = World.from_tank(pkt.tank)
+    w = World.load(f)
 
     print(w)
+
+
+def _quiet() -> None:
+    # every issue is logged as it is found, the summary has them all
+    logging.disable(logging.CRITICAL)
+
+
+def _check(path: Path) -> tuple[Path, float, list[ParseIssue], int, str | None]:
+    start = time.perf_counter()
+    try:
+        w = World.load(path)
+    except Exception as e:
+        return path, time.perf_counter() - start, [], -1, f"{type(e).__name__}: {e}"
+    return path, time.perf_counter() - start, w.parse_issues, w.garbage_start, None
+
+
+@click.command()
+@click.argument("paths", nargs=-1, type=click.Path(exists=True, path_type=Path))
+@click.option("-j", "--jobs", type=int, default=None, help="worker processes, the cpu count by default")
+@click.option("-v", "--verbose", is_flag=True, help="print every issue with a hexdump")
+def world_health(paths: tuple[Path, ...], jobs: int | None, verbose: bool) -> None:
+    """parse every captured world (the ones in appdir/worlds unless PATHS are given) and summarize how it went"""
+    files = sorted(f for p in (paths or (setting.appdir / "worlds",)) for f in ([p] if p.is_file() else p.iterdir()) if f.is_file())
+    if not files:
+        print("no worlds")
+        return
+
+    with ProcessPoolExecutor(jobs, initializer=_quiet) as pool:
+        results = list(pool.map(_check, files, chunksize=4))
+
+    clean = recovered = unrecovered = errors = 0
+    suspects: Counter[str] = Counter()
+    for path, elapsed, issues, garbage_start, error in results:
+        if error:
+            errors += 1
+            print(f"\x1b[31m{path.name}\x1b[0m: {error}")
+            continue
+        if not issues:
+            clean += 1
+            continue
+
+        suspects.update(issue.suspect for issue in issues)
+        if garbage_start != -1:
+            unrecovered += 1
+            status = f"\x1b[31mgave up at tile {garbage_start}\x1b[0m"
+        else:
+            recovered += 1
+            status = "\x1b[33mrecovered\x1b[0m" if all(issue.exact for issue in issues) else "\x1b[33mrecovered, tile indices may be off\x1b[0m"
+        print(f"{path.name}: {len(issues)} bad tile(s), {status} ({elapsed * 1000:.0f}ms)")
+        for issue in issues:
+            print(textwrap.indent(str(issue), "  ") if verbose else f"  tile {issue.tile} at {issue.offset}, suspect extra {issue.suspect}: {issue.error}")
+
+    print()
+    print(f"{len(results)} worlds: {clean} clean, {recovered} recovered, {unrecovered} unrecovered, {errors} failed to load")
+    if suspects:
+        print("suspect extras:")
+        for suspect, count in suspects.most_common():
+            print(f"  {suspect:<32} {count}")
+    slowest = max(results, key=lambda r: r[1])
+    print(f"slowest: {slowest[0].name} {slowest[1] * 1000:.0f}ms, total {sum(r[1] for r in results):.1f}s of parsing")
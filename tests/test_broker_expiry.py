@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+from gtools import setting
+from gtools.core.growtopia.packet import NetPacket, NetType, PreparedPacket, TankPacket
+from gtools.protogen.extension_pb2 import (
+    BLOCKING_MODE_BLOCK,
+    DIRECTION_UNSPECIFIED,
+    INTEREST_TANK_PACKET,
+    Interest,
+    PendingPacket,
+)
+from gtools.proxy.extension.client.sdk import Extension, dispatch_fallback
+from gtools.proxy.extension.server.broker import Broker
+from thirdparty.enet.bindings import ENetPacketFlag
+
+ADDR = "tcp://127.0.0.1:6832"
+
+
+class Stalled(Extension):
+    """adds one to net_id, but only once `release` is set"""
+
+    def __init__(self, name: str, priority: int = 0) -> None:
+        super().__init__(
+            name=name, interest=[Interest(interest=INTEREST_TANK_PACKET, priority=priority, blocking_mode=BLOCKING_MODE_BLOCK, direction=DIRECTION_UNSPECIFIED)], broker_addr=ADDR
+        )
+        self.release = threading.Event()
+        self.release.set()
+
+    @dispatch_fallback
+    def process(self, event: PendingPacket) -> PendingPacket | None:
+        self.release.wait(5)
+        p = NetPacket.deserialize(event.buf)
+        p.tank.net_id += 1
+        event.buf = p.serialize()
+        return self.forward(event)
+
+
+def _pkt(net_id: int = 0) -> PreparedPacket:
+    return PreparedPacket(NetPacket(type=NetType.TANK_PACKET, data=TankPacket(net_id=net_id)), DIRECTION_UNSPECIFIED, ENetPacketFlag.NONE)
+
+
+@pytest.fixture
+def broker(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(setting, "broker_pending_timeout", 0.2)
+    b = Broker(addr=ADDR)
+    b.start()
+    yield b
+    b.stop()
+
+
+def test_expired_hop_passes_to_next(broker: Broker) -> None:
+    stalled, ok = Stalled("expiry-stalled", priority=1), Stalled("expiry-ok")
+    try:
+        for ext in (stalled, ok):
+            assert ext.start(inproc=True).wait_true(5)
+
+        stalled.release.clear()
+        start = time.monotonic()
+        res = broker.process_event(_pkt())
+        assert res
+        pending, cancelled = res
+        assert not cancelled
+        assert time.monotonic() - start < 2
+        # only the extension that answered touched it
+        assert NetPacket.deserialize(pending.buf).tank.net_id == 1
+
+        # the late reply is dropped instead of resurrecting the chain
+        stalled.release.set()
+        time.sleep(0.1)
+        telemetry = broker.telemetry()
+        assert telemetry.expired == 1
+        assert telemetry.pending_chains == 0 and not telemetry.in_flight
+
+        res = broker.process_event(_pkt())
+        assert res and NetPacket.deserialize(res[0].buf).tank.net_id == 2
+    finally:
+        stalled.release.set()
+        for ext in (stalled, ok):
+            ext.stop()
+
+
+def test_expired_hop_cancels(broker: Broker, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(setting, "broker_expire_block", "cancel")
+    stalled = Stalled("expiry-cancel")
+    try:
+        assert stalled.start(inproc=True).wait_true(5)
+        stalled.release.clear()
+        res = broker.process_event(_pkt())
+        assert res and res[1]
+    finally:
+        stalled.release.set()
+        stalled.stop()
+
+
+def test_full_extension_is_shed(broker: Broker, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(setting, "broker_max_in_flight", 1)
+    monkeypatch.setattr(setting, "broker_pending_timeout", 5.0)
+    stalled = Stalled("expiry-shed")
+    try:
+        assert stalled.start(inproc=True).wait_true(5)
+        stalled.release.clear()
+
+        first = threading.Thread(target=broker.process_event, args=(_pkt(),))
+        first.start()
+        deadline = time.monotonic() + 5
+        while not broker.telemetry().in_flight and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # the only extension is full, the packet goes through untouched
+        assert broker.process_event(_pkt()) is None
+        assert broker.telemetry().shed == 1
+
+        stalled.release.set()
+        first.join(5)
+        assert not first.is_alive()
+    finally:
+        stalled.release.set()
+        stalled.stop()
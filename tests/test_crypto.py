@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from gtools.core.growtopia import crypto
+
+
+# the original per byte implementations
+def ref_proton_hash(data: bytes) -> int:
+    hash_val = 0x55555555
+    for byte in data:
+        hash_val = byte + ((hash_val & 0xFFFFFFFF) >> 27) + ((hash_val << 5) & 0xFFFFFFFF)
+        hash_val &= 0xFFFFFFFF
+    if hash_val & 0x80000000:
+        hash_val -= 0x100000000
+    return hash_val
+
+
+def ref_rolling_chksum(buf: bytes, shift: int) -> int:
+    chksum = 0
+    for i, b in enumerate(buf):
+        shifted = (b + shift + i + 2) & 0xFF
+        chksum = (chksum + shift + i + shifted) & 0xFFFFFFFF
+    return chksum
+
+
+def ref_rolling_chksum2(buf: bytes, shift: int) -> int:
+    chksum = 0
+    for i, b in enumerate(buf):
+        chksum = (chksum + shift + i + b) & 0xFFFFFFFF
+    return chksum
+
+
+def ref_rolling_shift(buf: bytes, shift: int) -> bytes:
+    return bytes([(b + shift + i) & 0xFF for i, b in enumerate(buf)])
+
+
+def ref_hex_rolling_shift(buf: bytes) -> bytes:
+    return bytes((b + (0x9E if chr(b) in "abcdef" else 0xBE) + i) & 0xFF for i, b in enumerate(buf))
+
+
+def _cases(seed: int) -> list[tuple[bytes, int]]:
+    rng = random.Random(seed)
+    cases = [(b"", 0), (b"\xff" * 300, 0xFFFFFFFF), (b"0123456789abcdefABCDEF", 0x63BC)]
+    for _ in range(200):
+        n = rng.choice([rng.randint(0, 16), rng.randint(0, 5000)])
+        cases.append((rng.randbytes(n), rng.choice([0, 0xBE, 0x63BC, rng.randint(0, 2**32 - 1)])))
+    return cases
+
+
+@pytest.fixture(params=["native", "numpy"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "native":
+        if crypto._c_rolling_chksum is None:
+            pytest.skip("crypto library not built")
+    else:
+        for name in ("_c_proton_hash", "_c_rolling_chksum", "_c_rolling_chksum2", "_c_rolling_shift", "_c_hex_rolling_shift"):
+            monkeypatch.setattr(crypto, name, None)
+    return request.param
+
+
+def test_rolling_matches_reference(backend: str) -> None:
+    for buf, shift in _cases(1):
+        assert crypto.rolling_chksum(buf, shift) == ref_rolling_chksum(buf, shift)
+        assert crypto.rolling_chksum2(buf, shift) == ref_rolling_chksum2(buf, shift)
+        assert crypto.rolling_shift(buf, shift) == ref_rolling_shift(buf, shift)
+
+
+def test_hex_rolling_shift_matches_reference(backend: str) -> None:
+    rng = random.Random(2)
+    for buf, _ in _cases(2):
+        assert crypto.hex_rolling_shift(buf) == ref_hex_rolling_shift(buf)
+        hexed = bytes(rng.choice(b"0123456789abcdefABCDEF") for _ in range(len(buf)))
+        assert crypto.hex_rolling_shift(hexed) == ref_hex_rolling_shift(hexed)
+
+
+def test_proton_hash_matches_reference(backend: str) -> None:
+    cases = [buf for buf, _ in _cases(3)]
+    for buf in cases:
+        assert crypto.proton_hash(buf) == ref_proton_hash(buf)
+    assert crypto.proton_hash_many(cases) == [ref_proton_hash(buf) for buf in cases]
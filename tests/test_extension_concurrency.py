@@ -0,0 +1,183 @@
+import threading
+import time
+
+from gtools.core.growtopia.packet import NetPacket, NetType, PreparedPacket, TankPacket, TankType
+from gtools.protogen.extension_pb2 import (
+    BLOCKING_MODE_BLOCK,
+    BLOCKING_MODE_SEND_AND_FORGET,
+    DIRECTION_UNSPECIFIED,
+    INTEREST_CALL_FUNCTION,
+    INTEREST_STATE,
+    Interest,
+    Packet,
+    PendingPacket,
+    StateResponse,
+)
+from gtools.protogen.state_pb2 import STATE_SET_MY_TELEMETRY, SetMyTelemetry, StateUpdate
+from gtools.proxy.extension.client.executor import Ordering, StrandPool
+from gtools.proxy.extension.client.sdk import Extension, dispatch
+from gtools.proxy.extension.server.broker import Broker, PacketCallback
+from gtools.proxy.state import State
+from thirdparty.enet.bindings import ENetPacketFlag
+
+ADDR = "tcp://127.0.0.1:6822"
+
+
+def _tank(type: TankType, net_id: int = 0) -> PreparedPacket:
+    return PreparedPacket(NetPacket(type=NetType.TANK_PACKET, data=TankPacket(type=type, net_id=net_id)), DIRECTION_UNSPECIFIED, ENetPacketFlag.NONE)
+
+
+class Mixed(Extension):
+    def __init__(self, ordering_sleep: float = 0.0) -> None:
+        super().__init__(name="mixed", interest=[], broker_addr=ADDR, workers=4)
+        self.sleep = ordering_sleep
+        self.seen: list[int] = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    @dispatch(Interest(interest=INTEREST_CALL_FUNCTION, blocking_mode=BLOCKING_MODE_SEND_AND_FORGET, direction=DIRECTION_UNSPECIFIED, id=1))
+    def slow(self, event: PendingPacket) -> PendingPacket | None:
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.sleep)
+        with self._lock:
+            self.running -= 1
+            self.seen.append(NetPacket.deserialize(event.buf).tank.net_id)
+
+    @dispatch(Interest(interest=INTEREST_STATE, blocking_mode=BLOCKING_MODE_BLOCK, direction=DIRECTION_UNSPECIFIED, id=2))
+    def fast(self, event: PendingPacket) -> PendingPacket | None:
+        return self.forward(event)
+
+
+def test_strand_pool_orders_per_key() -> None:
+    pool = StrandPool("test", 4)
+    out: dict[int, list[int]] = {0: [], 1: []}
+    done = threading.Semaphore(0)
+
+    def job(key: int, i: int) -> None:
+        time.sleep(0.001 * (i % 3))
+        out[key].append(i)
+        done.release()
+
+    for i in range(30):
+        pool.submit(i % 2, 0, lambda i=i: job(i % 2, i))
+    for _ in range(30):
+        assert done.acquire(timeout=5)
+    pool.stop()
+
+    assert out[0] == list(range(0, 30, 2))
+    assert out[1] == list(range(1, 30, 2))
+
+
+def test_block_chain_does_not_wait_for_slow_handler() -> None:
+    b = Broker(addr=ADDR)
+    b.start()
+    ext = Mixed(ordering_sleep=0.3)
+    try:
+        assert ext.start(inproc=True).wait_true(5)
+
+        for i in range(4):
+            b.process_event(_tank(TankType.CALL_FUNCTION, i), PacketCallback())
+
+        start = time.monotonic()
+        res = b.process_event(_tank(TankType.STATE))
+        assert res and not res[1]
+        assert time.monotonic() - start < 0.2
+
+        deadline = time.monotonic() + 5
+        while len(ext.seen) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # Ordering.INTEREST is the default, in order and never concurrent
+        assert ext.seen == [0, 1, 2, 3]
+        assert ext.max_running == 1
+
+        deadline = time.monotonic() + 5
+        while not b.handler_stats().get(b"mixed") and time.monotonic() < deadline:
+            time.sleep(0.05)
+        stats = b.handler_stats()[b"mixed"]
+        assert stats[2].count == 1
+        assert stats[1].count >= 1 and stats[1].max_ns >= 0.25e9
+    finally:
+        ext.stop()
+        b.stop()
+
+
+class Unordered(Mixed):
+    @dispatch(Interest(interest=INTEREST_CALL_FUNCTION, blocking_mode=BLOCKING_MODE_SEND_AND_FORGET, direction=DIRECTION_UNSPECIFIED, id=3), Ordering.NONE)
+    def unordered(self, event: PendingPacket) -> PendingPacket | None:
+        return self.slow(event)
+
+
+def test_unordered_handler_runs_concurrently() -> None:
+    b = Broker(addr=ADDR)
+    b.start()
+    ext = Unordered(ordering_sleep=0.1)
+    try:
+        assert ext.start(inproc=True).wait_true(5)
+        for i in range(4):
+            b.process_event(_tank(TankType.CALL_FUNCTION, i), PacketCallback())
+
+        deadline = time.monotonic() + 5
+        while len(ext.seen) < 4 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sorted(ext.seen) == [0, 1, 2, 3]
+        assert ext.max_running > 1
+    finally:
+        ext.stop()
+        b.stop()
+
+
+def test_state_update_copies_when_snapshot_is_held() -> None:
+    ext = Mixed()
+    ext.start(inproc=True)
+    try:
+        update = StateUpdate(what=STATE_SET_MY_TELEMETRY, set_my_telemetry=SetMyTelemetry(server_ping=10))
+
+        before = ext.state
+        ext._apply_state_updates(None, [update])
+        assert ext.state is before and before.me.server_ping == 10
+
+        snapshot = ext._snapshot()
+        update.set_my_telemetry.server_ping = 20
+        ext._apply_state_updates(None, [update])
+        assert snapshot.me.server_ping == 10
+        assert ext.state is not snapshot and ext.state.me.server_ping == 20
+    finally:
+        ext.stop()
+
+
+def test_bound_session_state_follows_the_fork() -> None:
+    ext = Mixed()
+    ext.start(inproc=True)
+    try:
+        ext._on_state_response(Packet(type=Packet.TYPE_STATE_RESPONSE, state_response=StateResponse(state=State().to_proto()), session=0))
+        assert ext.states[0] is ext.state
+
+        snapshot = ext._snapshot()
+        ext._apply_state_updates(0, [StateUpdate(what=STATE_SET_MY_TELEMETRY, set_my_telemetry=SetMyTelemetry(server_ping=10))])
+        assert ext.state is not snapshot
+        assert ext.states[0] is ext.state and ext.states[0].me.server_ping == 10
+    finally:
+        ext.stop()
+
+
+def test_state_read_off_the_writer_thread_is_a_snapshot() -> None:
+    ext = Mixed()
+    ext.start(inproc=True)
+    try:
+        update = StateUpdate(what=STATE_SET_MY_TELEMETRY, set_my_telemetry=SetMyTelemetry(server_ping=10))
+        ext._apply_state_updates(None, [update])
+
+        seen: list[State] = []
+        reader = threading.Thread(target=lambda: seen.append(ext.state))
+        reader.start()
+        reader.join()
+
+        update.set_my_telemetry.server_ping = 20
+        ext._apply_state_updates(None, [update])
+        assert seen[0].me.server_ping == 10
+        assert ext.state.me.server_ping == 20
+    finally:
+        ext.stop()
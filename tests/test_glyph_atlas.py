@@ -0,0 +1,71 @@
+from pathlib import Path
+import random
+
+import numpy as np
+
+from gtools.gui.lib.glyph_atlas import GlyphMetrics, SkylinePacker, load_atlas, save_atlas, unpack_mono_bitmap
+
+
+def test_unpack_mono_bitmap_matches_per_row() -> None:
+    rng = np.random.default_rng(1)
+    width, rows, pitch = 13, 7, 4
+    buffer = rng.integers(0, 256, rows * pitch, dtype=np.uint8).tobytes()
+
+    expected = np.zeros((rows, width), dtype=np.uint8)
+    for y in range(rows):
+        bits = np.unpackbits(np.frombuffer(buffer[y * pitch : (y + 1) * pitch], dtype=np.uint8), bitorder="big")
+        expected[y] = bits[:width] * 255
+
+    assert np.array_equal(unpack_mono_bitmap(list(buffer), width, rows, pitch), expected)
+
+
+def test_skyline_packer_rects_do_not_overlap() -> None:
+    packer = SkylinePacker(256, 256)
+    rng = random.Random(3)
+    used = np.zeros((256, 256), dtype=bool)
+    placed = 0
+
+    for _ in range(200):
+        w, h = rng.randint(4, 40), rng.randint(4, 40)
+        pos = packer.insert(w, h)
+        if pos is None:
+            continue
+        x, y = pos
+        assert 0 <= x and x + w <= 256 and 0 <= y and y + h <= 256
+        assert not used[y : y + h, x : x + w].any()
+        used[y : y + h, x : x + w] = True
+        placed += 1
+
+    assert placed > 40
+
+
+def test_skyline_packer_full() -> None:
+    packer = SkylinePacker(32, 32)
+    assert packer.insert(32, 32) == (0, 0)
+    assert packer.insert(1, 1) is None
+    assert packer.insert(64, 1) is None
+
+
+def test_atlas_cache_roundtrip(tmp_path: Path) -> None:
+    packer = SkylinePacker(64, 64)
+    page = np.zeros((64, 64), dtype=np.uint16)
+    x, y = packer.insert(10, 12) or (0, 0)
+    page[y : y + 12, x : x + 10] = 1234
+    glyphs = {"A": GlyphMetrics(0, x, y, 10, 12, -1, 11, 640), " ": GlyphMetrics(0, 0, 0, 0, 0, 0, 0, 256), "中": GlyphMetrics(0, 20, 0, 5, 5, 0, 4, 512)}
+
+    path = tmp_path / "fonts" / "atlas.npz"
+    save_atlas(path, [page], glyphs, [packer.skyline])
+    loaded = load_atlas(path)
+
+    assert loaded is not None
+    pages, loaded_glyphs, skylines = loaded
+    assert np.array_equal(pages[0], page)
+    assert loaded_glyphs == glyphs
+    assert skylines == [packer.skyline]
+
+
+def test_atlas_cache_ignores_garbage(tmp_path: Path) -> None:
+    path = tmp_path / "atlas.npz"
+    assert load_atlas(path) is None
+    path.write_bytes(b"not a zip")
+    assert load_atlas(path) is None
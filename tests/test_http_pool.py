@@ -0,0 +1,92 @@
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+import socketserver
+import ssl
+import threading
+from typing import Iterator
+
+import pytest
+
+from gtools.core.http_pool import HTTPSPool
+
+RESOURCES = Path(__file__).parent.parent / "resources"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    httpd = _Server(("127.0.0.1", 0), _Handler)
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(RESOURCES / "cert.pem", RESOURCES / "key.pem")
+    httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_pool_reuses_connections(server: _Server) -> None:
+    pool = HTTPSPool("127.0.0.1", server.server_address[1])
+    for i in range(5):
+        status, _, body = pool.request("POST", "/", f"hello {i}".encode())
+        assert status == 200 and body == f"hello {i}".encode()
+
+    assert pool.stats.connects == 1
+    assert pool.stats.reused == 4
+    pool.close()
+
+
+def test_pool_resumes_tls_session(server: _Server) -> None:
+    pool = HTTPSPool("127.0.0.1", server.server_address[1], idle_timeout=0)
+    for _ in range(3):
+        pool.request("POST", "/", b"x")
+
+    assert pool.stats.connects == 3
+    assert pool.stats.resumed == 2
+    pool.close()
+
+
+def test_pool_retries_dropped_idle_connection(server: _Server) -> None:
+    pool = HTTPSPool("127.0.0.1", server.server_address[1])
+    pool.request("POST", "/", b"x")
+
+    # the server side goes away while the connection sits idle
+    for conn in pool._idle:
+        assert conn.sock is not None
+        conn.sock.shutdown(2)
+
+    status, _, body = pool.request("POST", "/", b"y")
+    assert (status, body) == (200, b"y")
+    assert pool.stats.connects == 2
+    pool.close()
+
+
+def test_pool_bounds_concurrency(server: _Server) -> None:
+    pool = HTTPSPool("127.0.0.1", server.server_address[1], max_connections=2)
+    threads = [threading.Thread(target=pool.request, args=("POST", "/", b"x")) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert pool.stats.requests == 8
+    assert pool.stats.connects <= 2
+    pool.close()
@@ -0,0 +1,152 @@
+from queue import Empty, Queue
+
+import pytest
+
+from gtools.core.growtopia.packet import NetPacket, NetType, PreparedPacket, TankPacket
+from gtools.core.transport.inproc import InprocDealer, InprocRouter
+from gtools.core.transport.protocol import Event
+from gtools.protogen.extension_pb2 import (
+    BLOCKING_MODE_BLOCK,
+    DIRECTION_SERVER_TO_CLIENT,
+    DIRECTION_UNSPECIFIED,
+    INTEREST_TANK_PACKET,
+    Interest,
+    Packet,
+    PendingPacket,
+)
+from gtools.proxy.extension.client.sdk import Extension, dispatch_fallback
+from gtools.proxy.extension.server.broker import Broker
+from thirdparty.enet.bindings import ENetPacketFlag
+
+ADDR = "tcp://127.0.0.1:6812"
+
+
+class AddOne(Extension):
+    def __init__(self, name: str, priority: int = 0) -> None:
+        super().__init__(
+            name=name, interest=[Interest(interest=INTEREST_TANK_PACKET, priority=priority, blocking_mode=BLOCKING_MODE_BLOCK, direction=DIRECTION_UNSPECIFIED)], broker_addr=ADDR
+        )
+
+    @dispatch_fallback
+    def process(self, event: PendingPacket) -> PendingPacket | None:
+        p = NetPacket.deserialize(event.buf)
+        p.tank.net_id += 1
+        event.buf = p.serialize()
+        return self.forward(event)
+
+
+def test_router_dealer_roundtrip() -> None:
+    router = InprocRouter[str, str]("inproc-test-roundtrip")
+    dealer = InprocDealer[str, str](b"a", "inproc-test-roundtrip")
+    router.start()
+    dealer.start()
+    try:
+        assert dealer.recv_event(timeout=1) == Event.CONNECTED
+        assert router.has_peer(b"a")
+
+        msg = ["not copied"]
+        dealer.send(msg)  # pyright: ignore[reportArgumentType]
+        received = router.recv(timeout=1)
+        assert received is not None
+        ident, got = received
+        assert ident == b"a" and got is msg
+
+        router.send((b"a", "back"))
+        router.send((b"nobody", "dropped"))
+        assert dealer.recv(timeout=1) == "back"
+        with pytest.raises(Empty):
+            dealer.recv_nowait()
+    finally:
+        dealer.stop()
+        router.stop()
+
+
+def test_dealer_reattaches_across_router_restart() -> None:
+    dealer = InprocDealer[str, str](b"a", "inproc-test-restart")
+    dealer.start()
+    with pytest.raises(Empty):
+        dealer.recv_event(timeout=0.05)
+
+    router = InprocRouter[str, str]("inproc-test-restart")
+    router.start()
+    assert dealer.recv_event(timeout=1) == Event.CONNECTED
+    router.stop()
+    assert dealer.recv_event(timeout=1) == Event.DISCONNECTED
+    assert router.recv(timeout=1) is None
+
+    router = InprocRouter[str, str]("inproc-test-restart")
+    router.start()
+    try:
+        assert dealer.recv_event(timeout=1) == Event.CONNECTED
+        dealer.send("hi")
+        assert router.recv(timeout=1) == (b"a", "hi")
+    finally:
+        dealer.stop()
+        router.stop()
+
+
+def test_broker_chain_inproc() -> None:
+    b = Broker(addr=ADDR)
+    b.start()
+
+    exts = [AddOne(f"inproc-{i}", priority=i) for i in range(3)]
+    try:
+        for ext in exts:
+            assert ext.start(inproc=True).wait_true(5)
+
+        for i in range(50):
+            pkt = NetPacket(type=NetType.TANK_PACKET, data=TankPacket(net_id=i))
+            res = b.process_event(PreparedPacket(pkt, DIRECTION_UNSPECIFIED, ENetPacketFlag.NONE))
+            assert res
+            pending, cancelled = res
+            assert not cancelled
+            assert pending._hit_count == 3
+            assert NetPacket.deserialize(pending.buf).tank.net_id == i + 3
+
+        for ext in exts:
+            assert ext.stop().wait_true(5)
+        assert not b._extension_mgr.get_all_extension()
+    finally:
+        b.stop()
+
+
+def test_push_inproc() -> None:
+    queue: Queue[PreparedPacket | None] = Queue()
+    b = Broker(queue, addr=ADDR)
+    b.start()
+
+    ext = AddOne("inproc-push")
+    try:
+        assert ext.start(inproc=True).wait_true(5)
+        for i in range(20):
+            ext.push(PreparedPacket(NetPacket(type=NetType.TANK_PACKET, data=TankPacket(net_id=i)), DIRECTION_SERVER_TO_CLIENT, ENetPacketFlag.NONE))
+        for i in range(20):
+            pkt = queue.get(timeout=5)
+            assert pkt and pkt.as_net.tank.net_id == i
+    finally:
+        ext.stop()
+        b.stop()
+
+
+def test_fanout_copies_per_inproc_peer() -> None:
+    b = Broker(addr=ADDR)
+    b.start()
+
+    dealers = [InprocDealer[Packet, Packet](ident, ADDR) for ident in (b"fanout-a", b"fanout-b", b"fanout-c")]
+    try:
+        for dealer in dealers:
+            dealer.start()
+            assert dealer.recv_event(timeout=1) == Event.CONNECTED
+
+        b._fanout([b"fanout-a", b"fanout-b", b"fanout-c"], Packet(type=Packet.TYPE_STATE_REQUEST))
+        got = [dealer.recv(timeout=1) for dealer in dealers]
+        assert all(pkt is not None and pkt.type == Packet.TYPE_STATE_REQUEST for pkt in got)
+        assert len({id(pkt) for pkt in got}) == 3
+
+        assert got[0] is not None
+        got[0].type = Packet.TYPE_DISCONNECT
+        assert [pkt.type for pkt in got[1:] if pkt is not None] == [Packet.TYPE_STATE_REQUEST] * 2
+    finally:
+        for dealer in dealers:
+            dealer.stop()
+        b.stop()
@@ -0,0 +1,78 @@
+from dataclasses import fields
+from pathlib import Path
+import random
+
+import numpy as np
+
+from gtools.core.growtopia.item_columns import DIFF_IGNORED, ItemColumns, diff_columns
+from gtools.core.growtopia.items_dat import Item, ItemDatabase, ItemFlag, ItemInfoColor, ItemInfoType
+
+
+def _item(rng: random.Random, item_id: int) -> Item:
+    item = Item(id=item_id)
+    item.name = f"item {item_id}".encode()
+    item.flags = ItemFlag(rng.choice([0, 1, 4]))
+    item.item_type = rng.choice(list(ItemInfoType))
+    item.rarity = rng.randint(0, 999)
+    item.texture_file = rng.choice([b"tiles_page1.rttex", b"tiles_page2.rttex"])
+    item.seed_color = ItemInfoColor(rng.getrandbits(32))
+    item.ingredients = (rng.randint(0, 100), rng.randint(0, 100))
+    item.chair_leg_offset_x = rng.randint(-50, 50)
+    return item
+
+
+def _databases(seed: int) -> tuple[ItemDatabase, ItemDatabase]:
+    rng = random.Random(seed)
+    old = {i: _item(rng, i) for i in range(0, 400, 2)}
+    new = {i: _item(rng, i) if rng.random() < 0.1 else Item(**{f.name: getattr(old[i], f.name) for f in fields(Item)}) for i in old if rng.random() > 0.05}
+    for i in range(400, 420, 2):
+        new[i] = _item(rng, i)
+    return ItemDatabase(19, new), ItemDatabase(18, old)
+
+
+def _reference(new: ItemDatabase, old: ItemDatabase) -> tuple[list[int], list[int], dict[int, list[str]]]:
+    modified: dict[int, list[str]] = {}
+    for i in sorted(set(new.items) & set(old.items)):
+        names = [f.name for f in fields(Item) if f.name not in DIFF_IGNORED and getattr(new.items[i], f.name) != getattr(old.items[i], f.name)]
+        if names:
+            modified[i] = names
+    return sorted(set(new.items) - set(old.items)), sorted(set(old.items) - set(new.items)), modified
+
+
+def test_diff_matches_itemwise_reference() -> None:
+    new_db, old_db = _databases(1)
+    new, old = ItemColumns.from_database(new_db), ItemColumns.from_database(old_db)
+    diff = diff_columns(new, old)
+
+    added, removed, modified = _reference(new_db, old_db)
+    assert new.ids[diff.added].tolist() == added
+    assert old.ids[diff.removed].tolist() == removed
+    assert {int(new.ids[n]): names for n, _, names in diff.modified} == modified
+    assert modified
+
+
+def test_item_roundtrip() -> None:
+    db, _ = _databases(2)
+    cols = ItemColumns.from_database(db)
+    for row, item_id in enumerate(cols.ids):
+        assert cols.item(row) == db.items[int(item_id)]
+
+
+def test_cache_roundtrip(tmp_path: Path) -> None:
+    db, _ = _databases(3)
+    cols = ItemColumns.from_database(db)
+    path = tmp_path / "cols.npz"
+    cols.save(path)
+
+    loaded = ItemColumns.load(path)
+    assert loaded is not None
+    assert loaded.version == cols.version
+    assert np.array_equal(loaded.ids, cols.ids)
+    assert [loaded.item(r) for r in range(len(loaded))] == [cols.item(r) for r in range(len(cols))]
+    assert not diff_columns(loaded, cols).modified
+
+
+def test_cache_rejects_garbage(tmp_path: Path) -> None:
+    path = tmp_path / "cols.npz"
+    path.write_bytes(b"nope")
+    assert ItemColumns.load(path) is None
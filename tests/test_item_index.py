@@ -0,0 +1,69 @@
+from pathlib import Path
+
+import pytest
+
+from gtools.core.growtopia.item_index import ItemIndex, fts_query
+from gtools.core.growtopia.items_dat import Item, ItemDatabase, ItemFlag, ItemInfoType
+
+
+def _db() -> ItemDatabase:
+    items = {
+        0: Item(id=0, name=b"Blank", item_type=ItemInfoType.FIST),
+        2: Item(id=2, name=b"Dirt", item_type=ItemInfoType.DEADLY, rarity=1, texture_file=b"tiles_page1.rttex", info=b"It's dirt."),
+        4: Item(id=4, name=b"Lava", item_type=ItemInfoType.DEADLY, rarity=5, flags=ItemFlag(4), texture_file=b"tiles_page1.rttex", info=b"Hot, burns dirt."),
+        6: Item(id=6, name=b"Dirt Seed", item_type=ItemInfoType.SEED, rarity=1),
+        8: Item(id=8, name=b"Legendary Wings", item_type=ItemInfoType.CLOTHES, rarity=999, flags=ItemFlag(5), texture_file=b"player_back.rttex"),
+    }
+    return ItemDatabase(19, items, source_hash="abc")
+
+
+@pytest.fixture
+def index(tmp_path: Path) -> ItemIndex:
+    return ItemIndex.for_database(_db(), tmp_path)
+
+
+def test_get(index: ItemIndex) -> None:
+    row = index.get(2)
+    assert row is not None
+    assert row["name"] == "Dirt" and row["rarity"] == 1 and row["item_type"] == ItemInfoType.DEADLY
+    assert index.get(3) is None
+    assert index.version == 19
+
+
+def test_search_prefers_names(index: ItemIndex) -> None:
+    ids = [r["id"] for r in index.search("dirt")]
+    assert sorted(ids[:2]) == [2, 6] and ids[2:] == [4]
+    assert [r["id"] for r in index.search("legend")] == [8]
+    assert index.search("!!!") == []
+
+
+def test_find_filters(index: ItemIndex) -> None:
+    assert [r["id"] for r in index.find(item_type=ItemInfoType.DEADLY)] == [2, 4]
+    assert [r["id"] for r in index.find(min_rarity=5, order_by="-rarity")] == [8, 4]
+    assert [r["id"] for r in index.find(flags_all=4)] == [4, 8]
+    assert [r["id"] for r in index.find(flags_any=1)] == [8]
+    assert [r["id"] for r in index.find(texture_file="tiles_page1.rttex", text="hot")] == [4]
+    with pytest.raises(ValueError):
+        index.find(order_by="id; DROP TABLE items")
+
+
+def test_find_blank_text(index: ItemIndex) -> None:
+    everything = [r["id"] for r in index.find()]
+    assert [r["id"] for r in index.find(text="")] == everything
+    assert [r["id"] for r in index.find(text="  \t")] == everything
+    assert [r["id"] for r in index.find(text="", item_type=ItemInfoType.DEADLY)] == [2, 4]
+    assert index.find(text="!!!") == []
+
+
+def test_built_once_per_hash(tmp_path: Path) -> None:
+    first = ItemIndex.for_database(_db(), tmp_path)
+    mtime = first.path.stat().st_mtime_ns
+    second = ItemIndex.for_database(_db(), tmp_path)
+
+    assert second.path == first.path
+    assert second.path.stat().st_mtime_ns == mtime
+
+
+def test_fts_query_escapes() -> None:
+    assert fts_query('dirt "seed') == '"dirt"* "seed"*'
+    assert fts_query("") == ""
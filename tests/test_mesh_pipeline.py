@@ -0,0 +1,77 @@
+import threading
+import time
+
+from gtools.gui.lib.mesh_pipeline import MeshPipeline
+
+
+def _wait_idle(pipeline: MeshPipeline, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while pipeline._in_flight and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_pipeline_uploads_finished_builds() -> None:
+    pipeline: MeshPipeline[int, int] = MeshPipeline(workers=2)
+    for i in range(10):
+        pipeline.submit(i, lambda i=i: i * i)
+    _wait_idle(pipeline)
+
+    uploaded: dict[int, int] = {}
+    assert pipeline.drain(uploaded.__setitem__, budget_ms=1000) == 10
+    assert uploaded == {i: i * i for i in range(10)}
+    assert not pipeline.busy
+    pipeline.shutdown()
+
+
+def test_pipeline_newer_submit_supersedes() -> None:
+    pipeline: MeshPipeline[str, int] = MeshPipeline(workers=1)
+    gate = threading.Event()
+    pipeline.submit("block", lambda: gate.wait() and 0)
+    pipeline.submit("a", lambda: 1)
+    pipeline.submit("a", lambda: 2)
+    gate.set()
+    _wait_idle(pipeline)
+
+    uploaded: list[tuple[str, int]] = []
+    pipeline.drain(lambda k, v: uploaded.append((k, v)), budget_ms=1000)
+    assert ("a", 2) in uploaded and ("a", 1) not in uploaded
+    pipeline.shutdown()
+
+
+def test_pipeline_respects_budget() -> None:
+    pipeline: MeshPipeline[int, int] = MeshPipeline(workers=1)
+    for i in range(5):
+        pipeline.submit(i, lambda i=i: i)
+    _wait_idle(pipeline)
+
+    def slow_upload(key: int, value: int) -> None:
+        time.sleep(0.01)
+
+    # at least one per frame even when a single upload blows the budget
+    assert pipeline.drain(slow_upload, budget_ms=0) == 1
+    assert pipeline.pending == 4
+    assert pipeline.drain(slow_upload, budget_ms=1000) == 4
+    pipeline.shutdown()
+
+
+def test_pipeline_failed_build_is_dropped() -> None:
+    pipeline: MeshPipeline[int, int] = MeshPipeline(workers=1)
+    pipeline.submit(0, lambda: 1 // 0)
+    pipeline.submit(1, lambda: 1)
+    _wait_idle(pipeline)
+
+    uploaded: list[int] = []
+    assert pipeline.drain(lambda k, v: uploaded.append(k), budget_ms=1000) == 1
+    assert uploaded == [1]
+    pipeline.shutdown()
+
+
+def test_pipeline_cancel_discards_results() -> None:
+    pipeline: MeshPipeline[int, int] = MeshPipeline(workers=1)
+    pipeline.submit(0, lambda: 0)
+    _wait_idle(pipeline)
+    pipeline.cancel()
+
+    assert pipeline.drain(lambda k, v: None, budget_ms=1000) == 0
+    assert not pipeline.busy
+    pipeline.shutdown()
@@ -0,0 +1,97 @@
+from gtools.core.growtopia.note import CompiledSheet, InstrumentSet, Note, Sheet
+
+
+def _note(ts: int, instrument: InstrumentSet = InstrumentSet.PIANO, base: int = Note.C) -> Note:
+    return Note(base=base, octave=0, instrument=instrument, timestamp=ts)
+
+
+def _play(sheet: Sheet, ticks: int) -> list[int]:
+    played: list[int] = []
+    sheet.on_note_played = lambda n: played.append(n.timestamp)
+    for _ in range(ticks):
+        sheet.advance_playhead()
+    return played
+
+
+def test_compiled_columns_sorted() -> None:
+    compiled = CompiledSheet([_note(5), _note(1), _note(3), _note(3)])
+
+    assert compiled.columns == [1, 3, 5]
+    assert len(compiled.events[3]) == 2
+    assert compiled.start == 1
+    assert compiled.end == 5
+
+
+def test_compiled_seek() -> None:
+    compiled = CompiledSheet([_note(2), _note(10), _note(20)])
+
+    assert compiled.seek(0) == 0
+    assert compiled.seek(10) == 1
+    assert compiled.seek(11) == 2
+    assert compiled.next_column(11) == 20
+    assert compiled.next_column(21) is None
+
+
+def test_compiled_markers_not_events() -> None:
+    compiled = CompiledSheet(
+        [
+            _note(0, InstrumentSet.REPEAT_BEGIN),
+            _note(1, InstrumentSet.BLANK),
+            _note(2, InstrumentSet.REPEAT_END),
+        ]
+    )
+
+    assert compiled.columns == [0, 1, 2]
+    assert compiled.events == {}
+    assert compiled.jumps[2, _note(2).to_index()] == 0
+
+
+def test_compiled_jump_without_begin() -> None:
+    compiled = CompiledSheet([_note(4, InstrumentSet.REPEAT_END)])
+
+    assert compiled.jumps[4, _note(4).to_index()] is None
+
+
+def test_compiled_incremental_update() -> None:
+    compiled = CompiledSheet([_note(0), _note(8, InstrumentSet.REPEAT_END)])
+    row = _note(0).to_index()
+    assert compiled.jumps[8, row] is None
+
+    compiled.update_columns({4: [_note(4, InstrumentSet.REPEAT_BEGIN)]})
+    assert compiled.columns == [0, 4, 8]
+    assert compiled.jumps[8, row] == 4
+
+    compiled.update_columns({4: []})
+    assert compiled.columns == [0, 8]
+    assert compiled.jumps[8, row] is None
+
+    compiled.update_columns({8: [_note(8)]})
+    assert compiled.jumps == {}
+    assert compiled.repeat_ends == {}
+    assert compiled.repeat_ends_in(row, 0, 100) == []
+
+
+def test_sheet_repeat_plays_twice() -> None:
+    sheet = Sheet(100, [_note(0), _note(1), _note(2, InstrumentSet.REPEAT_END), _note(3)], None)
+
+    assert _play(sheet, 7) == [0, 1, 0, 1, 3]
+
+
+def test_sheet_update_columns_matches_rebuild() -> None:
+    notes = [_note(0), _note(1, InstrumentSet.REPEAT_BEGIN), _note(2), _note(3, InstrumentSet.REPEAT_END), _note(4)]
+    full = Sheet(100, notes, None)
+
+    incremental = Sheet(100, [_note(0), _note(4)], None)
+    incremental.update_columns({1: [notes[1]], 2: [notes[2]], 3: [notes[3]]})
+
+    assert incremental.start == full.start
+    assert incremental.end == full.end
+    assert _play(incremental, 8) == _play(full, 8)
+
+
+def test_sheet_seek_to() -> None:
+    sheet = Sheet(100, [_note(0), _note(5), _note(9)], None)
+
+    sheet.seek_to(5)
+    assert _play(sheet, 1) == [5]
+    assert sheet.next_event() == 9
@@ -1,7 +1,7 @@
 import binascii
 import time
 from gtools.core.growtopia.create import chat, chat_seq, console_message
-from gtools.core.growtopia.packet import EmptyPacket, NetPacket, NetType, TankFlags, TankPacket, TankType
+from gtools.core.growtopia.packet import EmptyPacket, NetPacket, NetType, PreparedPacket, TankFlags, TankPacket, TankType
 import pytest
 import struct
 
@@ -163,6 +163,17 @@ def test_netpacket_server_hello_and_serialize_roundtrip() -> None:
     assert pkt.serialize() == raw
 
 
+def test_prepared_packet_pending_keeps_session() -> None:
+    raw = struct.pack("<I", NetType.SERVER_HELLO.value) + b"\x00"
+
+    pkt = PreparedPacket.from_pending(PreparedPacket(raw, DIRECTION_CLIENT_TO_SERVER, ENetPacketFlag.RELIABLE, session=3).to_pending())
+    assert pkt.session == 3
+    assert pkt.as_raw == raw
+
+    pkt = PreparedPacket.from_pending(PreparedPacket(raw, DIRECTION_CLIENT_TO_SERVER, ENetPacketFlag.RELIABLE).to_pending())
+    assert pkt.session is None
+
+
 def test_netpacket_tank_roundtrip_and_snapshot() -> None:
     tank = _make_basic_tank()
     net = NetPacket(NetType.TANK_PACKET, tank)
@@ -1,5 +1,6 @@
 import time
 
+from gtools.flags import BENCHMARK
 from gtools.core.growtopia.packet import NetPacket, NetType, PreparedPacket, TankPacket
 from gtools.core.highres_sleep import nanosleep
 from gtools.protogen.extension_pb2 import PendingPacket
@@ -77,3 +78,40 @@ def test_packet_scheduler_multiple_delta_times() -> None:
 
     finally:
         scheduler.stop()
+
+
+def test_packet_scheduler_replay_accuracy() -> None:
+    output_packets: list[tuple[int, PreparedPacket | None]] = []
+    scheduler = PacketScheduler(lambda pkt: output_packets.append((time.monotonic_ns(), pkt)))
+
+    try:
+        # a captured sequence pushed all at once, 1ms apart with a few packets sharing a timestamp
+        base = time.monotonic_ns()
+        offsets = [i * 1_000_000 for i in range(200)] + [100_000_000] * 5
+        for i, offset in enumerate(offsets):
+            pkt = PendingPacket()
+            pkt._rtt_ns = base + offset
+            pkt.buf = NetPacket(type=NetType.TANK_PACKET, data=TankPacket(net_id=i)).serialize()
+            scheduler.push(pkt)
+
+        deadline = time.monotonic() + 5
+        while len(output_packets) < len(offsets) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        scheduler.stop()
+
+        assert [pkt.as_net.tank.net_id for _, pkt in output_packets if pkt] == sorted(range(len(offsets)), key=lambda i: (offsets[i], i))
+
+        start = output_packets[0][0]
+        errors = sorted(abs((ts - start) - offset) for (ts, _), offset in zip(output_packets, sorted(offsets)))
+        p99 = errors[len(errors) * 99 // 100]
+        # sending everything at once would be ~100ms off, a loaded box stays well under this
+        assert p99 < 20_000_000, f"p99 replay error {p99 / 1e3:.1f}us"
+        if BENCHMARK:
+            assert p99 < 1_000_000, f"p99 replay error {p99 / 1e3:.1f}us"
+
+        jitter = scheduler.jitter()
+        assert jitter.count == len(offsets)
+        assert jitter.p50_ns < 500_000, f"median lateness {jitter.p50_ns / 1e3:.1f}us"
+
+    finally:
+        scheduler.stop()
@@ -0,0 +1,95 @@
+from gtools.gui.residency import LayerResidency
+
+SIZE = (1024, 1024)
+PAGE = LayerResidency.page_capacity(SIZE)
+PAGE_BYTES = SIZE[0] * SIZE[1] * 4 * PAGE
+
+
+def _residency(pages: int) -> tuple[LayerResidency, list[object], list[object]]:
+    created: list[object] = []
+    freed: list[object] = []
+
+    def new_page(size: tuple[int, int], capacity: int) -> object:
+        created.append(handle := object())
+        return handle
+
+    return LayerResidency(pages * PAGE_BYTES, new_page=new_page, free_page=freed.append), created, freed
+
+
+def test_acquire_hit_and_miss() -> None:
+    res, created, _ = _residency(1)
+    a, miss_a = res.acquire("a", SIZE, owner="w1")
+    again, miss_again = res.acquire("a", SIZE, owner="w2")
+
+    assert miss_a and not miss_again
+    assert again is a
+    assert (res.stats.hits, res.stats.misses) == (1, 1)
+    assert len(created) == 1
+
+
+def test_pages_are_fixed_capacity() -> None:
+    res, created, _ = _residency(4)
+    slots = [res.acquire(str(i), SIZE, owner="w")[0] for i in range(PAGE + 1)]
+
+    assert len(created) == 2
+    assert {s.layer for s in slots[:PAGE]} == set(range(PAGE))
+    assert slots[PAGE].page is not slots[0].page
+
+
+def test_evicts_least_recently_released() -> None:
+    res, created, _ = _residency(1)
+    for i in range(PAGE):
+        res.acquire(str(i), SIZE, owner=f"w{i}")
+
+    res.release("w1")
+    res.release("w0")
+    slot, miss = res.acquire("new", SIZE, owner="w")
+
+    assert miss and len(created) == 1
+    assert res.get("1") is None and res.get("0") is not None
+    assert slot.layer == 1
+    assert res.stats.evictions == 1
+
+
+def test_referenced_textures_are_never_evicted() -> None:
+    res, created, _ = _residency(1)
+    res.acquire("pinned", SIZE)
+    for i in range(PAGE - 1):
+        res.acquire(str(i), SIZE, owner="w")
+
+    # everything is in use, going over budget beats evicting a live layer
+    res.acquire("new", SIZE, owner="w")
+    assert len(created) == 2
+    assert res.get("pinned") is not None
+
+
+def test_release_keeps_cache_until_needed() -> None:
+    res, _, _ = _residency(2)
+    res.acquire("a", SIZE, owner="w")
+    res.release("w")
+
+    assert res.get("a") is not None
+    _, miss = res.acquire("a", SIZE, owner="w2")
+    assert not miss
+
+
+def test_trim_frees_empty_pages_over_budget() -> None:
+    res, created, freed = _residency(1)
+    res.acquire("pinned", SIZE)
+    for i in range(PAGE):
+        res.acquire(str(i), SIZE, owner="w")
+    assert len(created) == 2
+
+    res.release("w")
+    assert res.stats.bytes <= res.budget_bytes
+    assert len(freed) == 1
+    assert res.get("pinned") is not None
+
+
+def test_drop_frees_layer() -> None:
+    res, _, _ = _residency(1)
+    slot, _ = res.acquire("a", SIZE, owner="w")
+    res.drop("a")
+
+    assert res.get("a") is None
+    assert res.acquire("b", SIZE, owner="w")[0].layer == slot.layer
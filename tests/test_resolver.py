@@ -0,0 +1,100 @@
+from pathlib import Path
+import threading
+import time
+
+import pytest
+
+from gtools.core.resolver import FakeBackend, HappyEyeballsBackend, ResolveError, Resolver
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_resolver_caches_for_ttl() -> None:
+    backend = FakeBackend({"a.test": ["1.2.3.4"]}, ttl=60)
+    clock = Clock()
+    resolver = Resolver(backend, clock=clock, min_ttl=0)
+
+    assert resolver.resolve("a.test") == ["1.2.3.4"]
+    assert resolver.resolve("a.test") == ["1.2.3.4"]
+    assert backend.queries == 1
+
+    clock.now += 61
+    resolver.resolve("a.test")
+    assert backend.queries == 2
+
+
+def test_resolver_clamps_ttl() -> None:
+    backend = FakeBackend({"a.test": ["1.2.3.4"]}, ttl=0)
+    clock = Clock()
+    resolver = Resolver(backend, clock=clock, min_ttl=30)
+
+    resolver.resolve("a.test")
+    clock.now += 29
+    resolver.resolve("a.test")
+    assert backend.queries == 1
+
+
+def test_resolver_persists(tmp_path: Path) -> None:
+    path = tmp_path / "dns_cache.json"
+    clock = Clock()
+    Resolver(FakeBackend({"a.test": ["1.2.3.4"]}), cache_path=path, clock=clock).resolve("a.test")
+
+    backend = FakeBackend({})
+    assert Resolver(backend, cache_path=path, clock=clock).resolve("a.test") == ["1.2.3.4"]
+    assert backend.queries == 0
+
+
+def test_resolver_serves_stale_on_failure() -> None:
+    backend = FakeBackend({"a.test": ["1.2.3.4"]}, ttl=60)
+    clock = Clock()
+    resolver = Resolver(backend, clock=clock)
+    resolver.resolve("a.test")
+
+    backend.records.clear()
+    clock.now += 3600
+    assert resolver.resolve("a.test") == ["1.2.3.4"]
+
+    with pytest.raises(ResolveError):
+        resolver.resolve("b.test")
+
+
+def test_resolver_coalesces_concurrent_lookups() -> None:
+    backend = FakeBackend({"a.test": ["1.2.3.4"]}, delay=0.05)
+    resolver = Resolver(backend)
+    results: list[list[str]] = []
+
+    threads = [threading.Thread(target=lambda: results.append(resolver.resolve("a.test"))) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == [["1.2.3.4"]] * 8
+    assert backend.queries == 1
+
+
+def test_happy_eyeballs_prefers_first_answer() -> None:
+    slow = FakeBackend({"a.test": ["1.1.1.1"]}, delay=1.0)
+    fast = FakeBackend({"a.test": ["2.2.2.2"]})
+    backend = HappyEyeballsBackend([slow, fast], stagger=0.01)
+
+    start = time.monotonic()
+    assert backend.query("a.test", timeout=2.0).addresses == ["2.2.2.2"]
+    assert time.monotonic() - start < 0.5
+
+
+def test_happy_eyeballs_falls_through_failures() -> None:
+    backend = HappyEyeballsBackend([FakeBackend({}), FakeBackend({"a.test": ["3.3.3.3"]})], stagger=5.0)
+    assert backend.query("a.test", timeout=1.0).addresses == ["3.3.3.3"]
+
+
+def test_happy_eyeballs_times_out() -> None:
+    backend = HappyEyeballsBackend([FakeBackend({"a.test": ["1.1.1.1"]}, delay=1.0)])
+    with pytest.raises(ResolveError):
+        backend.query("a.test", timeout=0.05)
@@ -0,0 +1,59 @@
+from gtools.core.growtopia.packet import NetPacket, NetType, PreparedPacket, TankPacket
+from gtools.protogen.extension_pb2 import (
+    BLOCKING_MODE_BLOCK,
+    DIRECTION_SERVER_TO_CLIENT,
+    DIRECTION_UNSPECIFIED,
+    INTEREST_TANK_PACKET,
+    Interest,
+    PendingPacket,
+)
+from gtools.proxy.extension.client.sdk import Extension, dispatch_fallback
+from gtools.proxy.extension.server.broker import Broker
+from thirdparty.enet.bindings import ENetPacketFlag
+
+ADDR = "tcp://127.0.0.1:6842"
+
+
+class Recorder(Extension):
+    def __init__(self, name: str, session: int | None) -> None:
+        super().__init__(
+            name=name,
+            interest=[Interest(interest=INTEREST_TANK_PACKET, blocking_mode=BLOCKING_MODE_BLOCK, direction=DIRECTION_UNSPECIFIED)],
+            broker_addr=ADDR,
+            session=session,
+        )
+        self.seen: list[tuple[int | None, int]] = []
+
+    @dispatch_fallback
+    def process(self, event: PendingPacket) -> PendingPacket | None:
+        self.seen.append((event.session if event.HasField("session") else None, NetPacket.deserialize(event.buf).tank.net_id))
+        return self.forward(event)
+
+
+def _pkt(session: int | None, net_id: int) -> PreparedPacket:
+    # tagged the way Session._worker tags game traffic
+    return PreparedPacket(NetPacket(type=NetType.TANK_PACKET, data=TankPacket(net_id=net_id)), DIRECTION_SERVER_TO_CLIENT, ENetPacketFlag.NONE, session=session)
+
+
+def test_pinned_extension_sees_only_its_session() -> None:
+    b = Broker(addr=ADDR)
+    b.start()
+
+    a, c, any_ = Recorder("session-a", 1), Recorder("session-b", 2), Recorder("session-any", None)
+    try:
+        for ext in (a, c, any_):
+            assert ext.start(inproc=True).wait_true(5)
+
+        for i in range(10):
+            for session in (1, 2):
+                res = b.process_event(_pkt(session, i * 10 + session))
+                assert res and not res[1]
+                assert res[0].session == session
+
+        assert a.seen == [(1, i * 10 + 1) for i in range(10)]
+        assert c.seen == [(2, i * 10 + 2) for i in range(10)]
+        assert len(any_.seen) == 20
+    finally:
+        for ext in (a, c, any_):
+            ext.stop()
+        b.stop()
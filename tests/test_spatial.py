@@ -0,0 +1,103 @@
+import math
+import random
+
+from pyglm.glm import vec2
+
+from gtools.core.spatial import TileBucketIndex
+
+
+def _brute_radius(points: dict[int, vec2], pos: vec2, radius: float) -> set[int]:
+    return {k for k, p in points.items() if (p.x - pos.x) ** 2 + (p.y - pos.y) ** 2 <= radius * radius}
+
+
+def test_insert_and_at() -> None:
+    index: TileBucketIndex[str] = TileBucketIndex()
+    index.insert(1, "a", vec2(10, 10))
+    index.insert(2, "b", vec2(40, 10))
+    index.insert(3, "c", vec2(31.9, 0))
+
+    assert sorted(index.at(0, 0)) == ["a", "c"]
+    assert index.at(1, 0) == ["b"]
+    assert index.at(5, 5) == []
+    assert len(index) == 3
+
+
+def test_move_changes_bucket() -> None:
+    index: TileBucketIndex[str] = TileBucketIndex()
+    index.insert(1, "a", vec2(10, 10))
+    index.move(1, vec2(100, 100))
+
+    assert index.at(0, 0) == []
+    assert index.at(3, 3) == ["a"]
+    assert len(index) == 1
+
+
+def test_remove() -> None:
+    index: TileBucketIndex[str] = TileBucketIndex()
+    index.insert(1, "a", vec2(10, 10))
+
+    assert index.remove(1) == "a"
+    assert index.remove(1) is None
+    assert index.at(0, 0) == []
+    assert 1 not in index
+
+
+def test_negative_positions() -> None:
+    index: TileBucketIndex[str] = TileBucketIndex()
+    index.insert(1, "a", vec2(-1, -1))
+
+    assert index.at(-1, -1) == ["a"]
+
+
+def test_in_cells() -> None:
+    index: TileBucketIndex[int] = TileBucketIndex()
+    for i in range(10):
+        index.insert(i, i, vec2(i * 32 + 1, 0))
+
+    assert sorted(index.in_cells(2, 0, 4, 0)) == [2, 3, 4]
+    assert sorted(index.in_cells(-100, -100, 100, 100)) == list(range(10))
+
+
+def test_in_radius_matches_brute_force() -> None:
+    rng = random.Random(0)
+    index: TileBucketIndex[int] = TileBucketIndex()
+    points: dict[int, vec2] = {}
+    for i in range(500):
+        p = vec2(rng.uniform(0, 3200), rng.uniform(0, 1920))
+        points[i] = p
+        index.insert(i, i, p)
+
+    for _ in range(50):
+        pos = vec2(rng.uniform(-100, 3300), rng.uniform(-100, 2000))
+        radius = rng.uniform(0, 400)
+        assert set(index.in_radius(pos, radius)) == _brute_radius(points, pos, radius)
+
+
+def test_nearest_matches_brute_force() -> None:
+    rng = random.Random(1)
+    index: TileBucketIndex[int] = TileBucketIndex()
+    points: dict[int, vec2] = {}
+    for i in range(300):
+        p = vec2(rng.uniform(0, 3200), rng.uniform(0, 1920))
+        points[i] = p
+        index.insert(i, i, p)
+
+    for _ in range(50):
+        pos = vec2(rng.uniform(-500, 3700), rng.uniform(-500, 2400))
+        found = index.nearest(pos)
+        assert found is not None
+
+        best = min(math.dist(p, pos) for p in points.values())
+        assert math.isclose(math.dist(points[found], pos), best)
+
+
+def test_nearest_with_filter_and_radius() -> None:
+    index: TileBucketIndex[int] = TileBucketIndex()
+    index.insert(1, 1, vec2(0, 0))
+    index.insert(2, 2, vec2(64, 0))
+    index.insert(3, 3, vec2(1000, 0))
+
+    assert index.nearest(vec2(0, 0), where=lambda x: x != 1) == 2
+    assert index.nearest(vec2(500, 0), max_radius=100) is None
+    assert index.nearest(vec2(0, 0), where=lambda x: False) is None
+    assert TileBucketIndex().nearest(vec2(0, 0)) is None
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from gtools.core.importtime import parse_importtime
+from gtools.core.lazy import lazy_import
+
+ROOT = Path(__file__).parent.parent
+
+HEAVY = ["numpy", "zmq", "PIL", "google.protobuf", "rapidfuzz", "gtools.baked.items", "gtools.core.growtopia.items_dat", "gtools.core.growtopia.world"]
+
+
+def test_main_import_is_light() -> None:
+    code = f"import sys, main; print(','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+    assert proc.stdout.strip() == ""
+
+
+def test_lazy_import_defers_execution(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / "lazy_probe.py").write_text("from pathlib import Path\nPath(__file__).with_suffix('.loaded').touch()\nVALUE = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "lazy_probe", raising=False)
+
+    mod = lazy_import("lazy_probe")
+    assert not (tmp_path / "lazy_probe.loaded").exists()
+    assert mod.VALUE == 42
+    assert (tmp_path / "lazy_probe.loaded").exists()
+    assert lazy_import("lazy_probe") is mod
+
+
+def test_parse_importtime() -> None:
+    lines = [
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     _io",
+        "import time:       300 |        420 |   encodings",
+        "import time:      1000 |       1500 | gtools",
+        "unrelated output",
+    ]
+    entries = parse_importtime(lines)
+
+    assert [(e.name, e.self_us, e.cumulative_us, e.depth) for e in entries] == [
+        ("_io", 120, 120, 2),
+        ("encodings", 300, 420, 1),
+        ("gtools", 1000, 1500, 0),
+    ]
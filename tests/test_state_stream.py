@@ -0,0 +1,147 @@
+import time
+
+from gtools.protogen.extension_pb2 import INTEREST_STATE_UPDATE, Interest, InterestStateUpdate, Packet, TileRegion
+from gtools.protogen.growtopia_pb2 import Player, Tile
+from gtools.protogen.state_pb2 import (
+    STATE_MODIFY_INVENTORY,
+    STATE_MODIFY_WORLD,
+    STATE_MODIFY_WORLD_BATCHED,
+    STATE_PLAYER_JOIN,
+    STATE_PLAYER_UPDATE,
+    STATE_UPDATE_STATUS,
+    ModifyInventory,
+    ModifyWorld,
+    ModifyWorldBatched,
+    PlayerUpdate,
+    StateUpdate,
+)
+from gtools.proxy.extension.client.sdk import Extension as ClientExtension
+from gtools.proxy.extension.server.broker import Broker
+from gtools.proxy.extension.server.handler import Extension, ExtensionHandler
+from gtools.proxy.extension.server.state_stream import StateStream, pack_state_updates, unpack_state_updates
+from gtools.proxy.state import State, Status
+
+
+def _pos(net_id: int, x: float, y: float) -> StateUpdate:
+    return StateUpdate(what=STATE_PLAYER_UPDATE, player_update=PlayerUpdate(net_id=net_id, x=x, y=y, flags=net_id))
+
+
+def _tile(x: int, y: int) -> StateUpdate:
+    return StateUpdate(what=STATE_MODIFY_WORLD, modify_world=ModifyWorld(op=ModifyWorld.OP_PLACE, tile=Tile(fg_id=2, x=x, y=y)))
+
+
+def _client(id: bytes, f: InterestStateUpdate | None = None) -> ExtensionHandler:
+    interest = Interest(interest=INTEREST_STATE_UPDATE, state_update=f) if f else Interest(interest=INTEREST_STATE_UPDATE)
+    return ExtensionHandler(Extension(id, [interest]), interest)
+
+
+class Sink:
+    def __init__(self) -> None:
+        self.sent: list[tuple[list[bytes], Packet]] = []
+
+    def __call__(self, ids, pkt: Packet) -> None:
+        self.sent.append((list(ids), pkt))
+
+    def updates(self, id: bytes) -> list[StateUpdate]:
+        out: list[StateUpdate] = []
+        for ids, pkt in self.sent:
+            if id in ids:
+                out.extend([pkt.state_update] if pkt.type == Packet.TYPE_STATE_UPDATE else unpack_state_updates(pkt.state_update_batch))
+        return out
+
+
+def test_pack_roundtrip_keeps_order() -> None:
+    updates = [_pos(1, 100.5, 200.25), StateUpdate(what=STATE_UPDATE_STATUS, update_status=3), _pos(2, 96.0, 64.0), _pos(1, 101.0, 199.75), _tile(1, 2)]
+    batch = pack_state_updates(updates)
+    assert len(batch.updates) == 2
+    assert list(batch.positions.dx) == [6432, -288, 320]
+    assert unpack_state_updates(batch) == updates
+
+
+def test_unfiltered_subscribers_share_one_packet() -> None:
+    sink = Sink()
+    stream = StateStream(sink)
+    stream.publish([_client(b"a"), _client(b"b")], 3, [_pos(1, 1, 1), _tile(0, 0)])
+
+    assert len(sink.sent) == 1
+    ids, pkt = sink.sent[0]
+    assert ids == [b"a", b"b"]
+    assert pkt.type == Packet.TYPE_STATE_UPDATE_BATCH and pkt.session == 3
+
+
+def test_filters() -> None:
+    sink = Sink()
+    stream = StateStream(sink)
+    me_only = _client(b"me", InterestStateUpdate(me=True))
+    region = _client(b"region", InterestStateUpdate(region=TileRegion(x=0, y=0, w=10, h=10)))
+    kinds = _client(b"kinds", InterestStateUpdate(what=[STATE_PLAYER_JOIN]))
+
+    batched = StateUpdate(what=STATE_MODIFY_WORLD_BATCHED, modify_world_batched=ModifyWorldBatched(events=[ModifyWorld(tile=Tile(x=1, y=1)), ModifyWorld(tile=Tile(x=50, y=1))]))
+    join = StateUpdate(what=STATE_PLAYER_JOIN, player_join=Player(netID=7))
+    updates = [_pos(0, 1, 1), _pos(7, 2, 2), _pos(9, 3, 3), _tile(5, 5), _tile(20, 5), batched, join]
+    stream.publish([me_only, region, kinds], None, updates, me_net_id=7)
+
+    assert [u.player_update.net_id for u in sink.updates(b"me") if u.what == STATE_PLAYER_UPDATE] == [0, 7]
+    assert join in sink.updates(b"me") and _tile(20, 5) in sink.updates(b"me")
+
+    got = sink.updates(b"region")
+    assert _tile(5, 5) in got and _tile(20, 5) not in got
+    assert [len(u.modify_world_batched.events) for u in got if u.what == STATE_MODIFY_WORLD_BATCHED] == [1]
+    assert sum(u.what == STATE_PLAYER_UPDATE for u in got) == 3
+
+    assert sink.updates(b"kinds") == [join]
+
+
+def test_position_rate_coalesces_to_latest() -> None:
+    now = [0]
+    sink = Sink()
+    stream = StateStream(sink, clock=lambda: now[0])
+    client = _client(b"a", InterestStateUpdate(position_rate=10))
+
+    for i in range(5):
+        now[0] = i * 10_000_000
+        stream.publish([client], None, [_pos(1, i, i)])
+    assert [u.player_update.x for u in sink.updates(b"a")] == [0]
+
+    now[0] = 50_000_000
+    stream.flush_due()
+    assert len(sink.sent) == 1
+    now[0] = 100_000_000
+    stream.flush_due()
+    assert [u.player_update.x for u in sink.updates(b"a")] == [0, 4]
+
+    stream.forget(b"a")
+    stream.flush_due()
+    assert len(sink.sent) == 2
+
+
+class Subscriber(ClientExtension):
+    def __init__(self) -> None:
+        super().__init__(
+            name="state-subscriber",
+            interest=[Interest(interest=INTEREST_STATE_UPDATE, state_update=InterestStateUpdate(what=[STATE_UPDATE_STATUS, STATE_MODIFY_INVENTORY]))],
+            broker_addr="tcp://127.0.0.1:6842",
+        )
+
+
+def test_batched_updates_reach_extension_state() -> None:
+    b = Broker(addr="tcp://127.0.0.1:6842")
+    b.start()
+    ext = Subscriber()
+    try:
+        assert ext.start(inproc=True).wait_true(5)
+
+        state = State()
+        with state.batch_updates(b):
+            state.send_state_update(b, StateUpdate(what=STATE_MODIFY_INVENTORY, modify_inventory=ModifyInventory(id=2, to_add=5)))
+            state.send_state_update(b, _pos(0, 32, 32))
+            state.update_status(b, Status.CONNECTED)
+
+        deadline = time.monotonic() + 5
+        while ext.state.status != Status.CONNECTED and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert ext.state.status == Status.CONNECTED
+        assert ext.state.inventory.get(2) and ext.state.inventory[2].amount == 5
+    finally:
+        ext.stop()
+        b.stop()
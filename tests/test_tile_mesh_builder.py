@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from gtools.core.growtopia.items_dat import ItemInfoVisualEffect, item_database
+from gtools.core.growtopia.packet import NetPacket
+from gtools.core.growtopia.world import SeedTile, Tile, TileFlags, VendingMachineTile, World
+from gtools.gui.lib.tile_mesh_builder import INSTANCE_FLOATS, TileMeshBuilder
+
+TEST_FILES = [x for x in Path("tests/res").glob("*") if x.is_file()]
+
+
+@dataclass(frozen=True)
+class _Slot:
+    array: tuple[int, int]
+    layer: int
+    width: int
+    height: int
+
+
+def _resolver() -> tuple[dict[str, _Slot], Callable[[str], _Slot]]:
+    slots: dict[str, _Slot] = {}
+
+    def resolve(file: str) -> _Slot:
+        # a few fake texture sizes so instances get split across arrays
+        size = (256, 256) if len(file) % 2 else (512, 1024)
+        slots[file] = _Slot(size, len(slots), *size)
+        return slots[file]
+
+    return slots, resolve
+
+
+def _expected_row(slot: _Slot, tile: Tile, id: int, tex_index: int) -> np.ndarray:
+    tex_pos, flipped = tile.tex_pos(id, tex_index)
+    u0, u1 = tex_pos.x * 32 / slot.width, (tex_pos.x + 1) * 32 / slot.width
+    if flipped:
+        u0, u1 = u1, u0
+
+    tint = 0xFFFFFFFF
+    if item_database.get(id).visual_effect == ItemInfoVisualEffect.DISCOLOR:
+        tint = item_database.get(id + 1).seed_overlay_color.to_rgba()
+
+    row = np.array(
+        [tile.pos.x * 32, tile.pos.y * 32, u0, tex_pos.y * 32 / slot.height, u1, (tex_pos.y + 1) * 32 / slot.height, slot.layer, tile.get_paint_index(), 0], dtype=np.float32
+    )
+    row.view(np.uint32)[8] = tint
+    return row
+
+
+def _rows(out: dict, layer: str) -> np.ndarray:
+    arrays = list(out[layer].values())
+    return np.concatenate(arrays) if arrays else np.zeros((0, INSTANCE_FLOATS), dtype=np.float32)
+
+
+def _sort(rows: np.ndarray) -> np.ndarray:
+    return rows[np.lexsort(rows.view(np.uint32).T[::-1])]
+
+
+@pytest.mark.parametrize("path", TEST_FILES, ids=[p.name for p in TEST_FILES])
+def test_builder_matches_per_tile(path: Path) -> None:
+    world = World.from_tank(NetPacket.deserialize(path.read_bytes()).tank)
+    tiles = list(world.tiles.values())
+    slots, resolve = _resolver()
+
+    out = TileMeshBuilder(resolve).build(tiles)
+
+    bg = [_expected_row(slots[item_database.get(t.bg_id).texture_file.decode()], t, t.bg_id, t.bg_tex_index) for t in tiles if t.bg_id]
+    fg = [
+        _expected_row(slots[item_database.get(t.fg_id).texture_file.decode()], t, t.fg_id, t.fg_tex_index)
+        for t in tiles
+        if t.fg_id and not isinstance(t.extra, (VendingMachineTile, SeedTile))
+    ]
+    vending = sum(1 for t in tiles if t.fg_id and isinstance(t.extra, VendingMachineTile))
+
+    assert np.array_equal(_sort(_rows(out, "bg")).view(np.uint32), _sort(np.array(bg).reshape(-1, INSTANCE_FLOATS)).view(np.uint32))
+
+    fg_rows = _rows(out, "fg")
+    assert len(fg_rows) == len(fg) + vending
+    if not vending:
+        assert np.array_equal(_sort(fg_rows).view(np.uint32), _sort(np.array(fg).reshape(-1, INSTANCE_FLOATS)).view(np.uint32))
+
+    for array, rows in out["bg"].items():
+        assert all(slot.array == array for slot in slots.values() if slot.layer in rows[:, 6].astype(int))
+
+
+def test_builder_flip_and_paint() -> None:
+    item = next(i for i in item_database.items.values() if i.id and i.id % 2 == 0 and i.get_tex_stride() == 0)
+    tile = Tile(fg_id=item.id, flags=TileFlags.FLIPPED_X | TileFlags.PAINTED_RED)
+    slots, resolve = _resolver()
+
+    out = TileMeshBuilder(resolve).build([tile])
+    (rows,) = out["fg"].values()
+
+    expected = _expected_row(slots[item.texture_file.decode()], tile, item.id, 0)
+    assert np.array_equal(rows[0].view(np.uint32), expected.view(np.uint32))
+    assert rows[0, 7] == tile.get_paint_index() != 0
+
+
+def test_builder_empty() -> None:
+    out = TileMeshBuilder(lambda _: _Slot((1, 1), 0, 1, 1)).build([])
+    assert all(not per_array for per_array in out.values())
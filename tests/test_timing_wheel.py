@@ -0,0 +1,53 @@
+from gtools.core.timing_wheel import TimingWheel
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_expires_in_deadline_order() -> None:
+    clock = Clock()
+    wheel = TimingWheel[str](tick=0.1, slots=8, clock=clock)
+    wheel.schedule("b", 0.3)
+    wheel.schedule("a", 0.1)
+    wheel.schedule("c", 0.35)
+
+    clock.now = 0.05
+    assert wheel.advance() == []
+    clock.now = 0.25
+    assert wheel.advance() == ["a"]
+    clock.now = 1.0
+    assert wheel.advance() == ["b", "c"]
+    assert len(wheel) == 0
+
+
+def test_cancel_and_reschedule() -> None:
+    clock = Clock()
+    wheel = TimingWheel[str](tick=0.1, slots=8, clock=clock)
+    wheel.schedule("a", 0.1)
+    wheel.schedule("b", 0.1)
+    assert wheel.cancel("a")
+    assert not wheel.cancel("a")
+    wheel.schedule("b", 0.5)
+    assert "b" in wheel and "a" not in wheel
+
+    clock.now = 0.3
+    assert wheel.advance() == []
+    clock.now = 0.5
+    assert wheel.advance() == ["b"]
+
+
+def test_deadline_past_one_revolution() -> None:
+    clock = Clock()
+    wheel = TimingWheel[int](tick=0.1, slots=4, clock=clock)
+    wheel.schedule(1, 1.0)
+
+    for step in range(1, 10):
+        clock.now = step / 10
+        assert wheel.advance() == []
+    clock.now = 1.0
+    assert wheel.advance() == [1]
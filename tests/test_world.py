@@ -1,9 +1,17 @@
+import random
+import time
 from pathlib import Path
 
 import pytest
 
+from pyglm.glm import vec2
+
+from gtools.core.buffer import Buffer
 from gtools.core.growtopia.packet import NetPacket
+from gtools.core.growtopia.player import Player
+from gtools.core.growtopia.world import _TILE_EXTRA_LAYOUT, Npc, NpcType, TileExtra, TileExtraType, TileFlags, WorldSnapshot
 from gtools.proxy.state import World
+from gtools.setting import setting
 
 TEST_FILES = [x for x in Path("tests/res").glob("*") if x.is_file()]
 
@@ -35,3 +43,126 @@ def test_buffer_conversion(path: Path) -> None:
     out = world.serialize()
 
     assert data == out
+
+
+@pytest.mark.parametrize("path", TEST_FILES, ids=[p.name for p in TEST_FILES])
+def test_snapshot_conversion(path: Path, tmp_path: Path) -> None:
+    pkt = NetPacket.deserialize(path.read_bytes())
+    orig = World.deserialize(pkt.tank.extended_data)
+    orig.players[3] = Player(net_id=3, name=b"someone", pos=vec2(64, 96))
+    orig.npcs[1] = Npc(type=NpcType.GHOST, id=1, pos=vec2(10, 20), target_pos=vec2(30, 40), param3=1.5)
+
+    orig.snapshot().save(tmp_path / "world")
+    for mapped in (True, False):
+        loaded = WorldSnapshot.load(tmp_path / "world", mapped=mapped).to_world()
+
+        assert loaded.serialize() == orig.serialize()
+        assert [(t.fg_tex_index, t.bg_tex_index) for t in loaded.tiles.values()] == [(t.fg_tex_index, t.bg_tex_index) for t in orig.tiles.values()]
+        assert [p.to_proto() for p in loaded.players.values()] == [p.to_proto() for p in orig.players.values()]
+        assert loaded.npcs == orig.npcs
+
+    assert World.load(tmp_path / "world").serialize() == orig.serialize()
+    assert World.load(path).serialize() == orig.serialize()
+
+
+@pytest.mark.parametrize("path", TEST_FILES, ids=[p.name for p in TEST_FILES])
+def test_lazy_extra(path: Path) -> None:
+    data = NetPacket.deserialize(path.read_bytes()).tank.extended_data
+    eager = World.deserialize(data, lazy=False)
+    lazy = World.deserialize(data, lazy=True)
+
+    assert any(tile.pending("extra") for tile in lazy.tiles.values())
+    assert lazy.serialize() == data
+    assert lazy.copy().serialize() == data
+
+    fork = lazy.fork()
+    for idx, tile in eager.tiles.items():
+        forked = fork.get_tile(idx)
+        assert forked and forked.extra == tile.extra
+        assert lazy.tiles[idx].extra == tile.extra
+        assert lazy.tiles[idx].json_data == tile.json_data
+    assert lazy.serialize() == data
+
+
+def test_extra_layouts_match_serializers() -> None:
+    # fixed size byte fields, every other bytes field is a length prefixed string
+    fixed: dict[tuple[int, str], int] = {(TileExtraType.PET_BATTLE_CAGE_TILE, "unk1"): 12, (TileExtraType.TRAINING_PORT_TILE, "unk3"): 13}
+    for type in _TILE_EXTRA_LAYOUT:
+        extra = TileExtra.new(TileExtraType(type))
+        extra.type = TileExtraType(type)
+        for name in extra.__slots__:
+            if isinstance(getattr(extra, name), bytes):
+                setattr(extra, name, bytes(fixed.get((type, name), 3)))
+
+        s = Buffer(extra.serialize(2, 0))
+        assert TileExtra.skip_extra(s, 2, 0), type
+        assert s.eof(), type
+
+
+def _tile_offsets(world: World) -> list[int]:
+    offsets = [25 + len(world.name)]
+    for idx in range(world.nb_tiles):
+        offsets.append(offsets[-1] + len(world.tiles[idx].serialize(world.version)))
+    return offsets
+
+
+@pytest.mark.parametrize("path", TEST_FILES, ids=[p.name for p in TEST_FILES])
+def test_resync_past_unknown_extra(path: Path) -> None:
+    data = NetPacket.deserialize(path.read_bytes()).tank.extended_data
+    orig = World.deserialize(data)
+    offsets = _tile_offsets(orig)
+
+    with_extra = [idx for idx, tile in orig.tiles.items() if tile.flags & TileFlags.HAS_EXTRA_DATA]
+    bad = with_extra[len(with_extra) // 2]
+    corrupt = bytearray(data)
+    corrupt[offsets[bad] + 8 + (2 if orig.tiles[bad].flags & TileFlags.LOCKED else 0)] = 0xFE
+    world = World.deserialize(bytes(corrupt))
+
+    [issue] = world.parse_issues
+    assert issue.tile == bad and issue.offset == offsets[bad]
+    assert issue.resumed_at == offsets[bad + 1] and issue.exact
+    assert issue.suspect == "unknown 0xfe" and f"{offsets[bad]:08x}" in issue.hexdump()
+    assert world.garbage_start == -1
+    assert world.dropped == orig.dropped
+    for idx, tile in orig.tiles.items():
+        if idx != bad:
+            assert world.tiles[idx].serialize() == tile.serialize()
+    assert world.tiles[bad].extra is None and world.tiles[bad].fg_id == orig.tiles[bad].fg_id
+
+
+@pytest.mark.parametrize("path", TEST_FILES, ids=[p.name for p in TEST_FILES])
+def test_resync_bounded_on_many_bad_tiles(path: Path) -> None:
+    data = NetPacket.deserialize(path.read_bytes()).tank.extended_data
+    orig = World.deserialize(data)
+    offsets = _tile_offsets(orig)
+
+    rng = random.Random(path.name)
+    for _ in range(10):
+        corrupt = bytearray(data)
+        for _ in range(8):
+            corrupt[rng.randrange(offsets[0], offsets[-1])] = rng.randrange(256)
+
+        start = time.perf_counter()
+        world = World.deserialize(bytes(corrupt))
+        # a clean parse takes well under 100ms, unbounded these went past a second
+        assert time.perf_counter() - start < 1
+        if world.garbage_start != -1 or all(issue.exact for issue in world.parse_issues):
+            assert world.dropped == orig.dropped
+
+
+def test_resync_out_of_budget_reads_tail_reversed(monkeypatch: pytest.MonkeyPatch) -> None:
+    data = NetPacket.deserialize(TEST_FILES[0].read_bytes()).tank.extended_data
+    orig = World.deserialize(data)
+    offsets = _tile_offsets(orig)
+
+    bad = orig.nb_tiles // 2
+    corrupt = bytearray(data)
+    corrupt[offsets[bad] : offsets[bad] + 2] = b"\xff\xff"
+    monkeypatch.setattr(setting, "world_resync_budget", 0)
+    world = World.deserialize(bytes(corrupt))
+
+    [issue] = world.parse_issues
+    assert issue.tile == bad and issue.resumed_at is None
+    assert world.garbage_start == bad
+    assert world.dropped == orig.dropped
+    assert all(world.tiles[idx].serialize() == orig.tiles[idx].serialize() for idx in range(bad))
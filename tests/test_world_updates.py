@@ -1,10 +1,19 @@
-from gtools.core.growtopia.world import World, WorldEvent
+from gtools.baked.items import DIRT, DIRT_SEED, SMALL_LOCK, WORLD_LOCK
+from gtools.core.growtopia.items_dat import item_database
+from gtools.core.growtopia.player import Player
+from gtools.core.growtopia.world import DroppedItem, LockTile, SeedTile, Tile, TileExtraType, World, WorldEvent
 from pyglm.glm import ivec2, vec2
 import logging
 
 logging.basicConfig(level=logging.ERROR)
 
 
+def _tile(world: World, x: int, y: int | None = None) -> Tile:
+    tile = world.get_tile(x) if y is None else world.get_tile(x, y)
+    assert tile
+    return tile
+
+
 def test_world_tile_events() -> None:
     world = World()
     world.name = b"TEST"
@@ -64,3 +73,132 @@ def test_world_dropped_events() -> None:
     world.set_dropped(uid, 10)
     if events_called != 4:
         raise AssertionError(f"set_dropped: events_called is {events_called}, expected 4")
+
+
+def test_world_coalesce_connections(monkeypatch) -> None:
+    world = World()
+    world.width = 10
+    world.height = 10
+    world.fill()
+
+    updated: list[int] = []
+    monkeypatch.setattr(World, "update_tile_connection", lambda self, tile: updated.append(tile.index))
+
+    with world.coalesce():
+        for x in range(3, 6):
+            world.update_3x3_connection(ivec2(x, 5))
+        assert updated == []
+
+    # three overlapping 3x3 regions, recomputed once each
+    assert sorted(updated) == [y * 10 + x for y in range(4, 7) for x in range(2, 7)]
+
+
+def test_world_coalesce_single_batch() -> None:
+    world = World()
+    world.width = 10
+    world.height = 10
+    world.fill()
+
+    batches: list[list[tuple[int, int]]] = []
+    world.subscribe(WorldEvent.TILE_UPDATE, batch=batches.append)
+
+    with world.coalesce():
+        with world.coalesce():
+            world.broadcast(WorldEvent.TILE_UPDATE, 1, 1)
+        world.broadcast(WorldEvent.TILE_UPDATE, 1, 1)
+        world.broadcast(WorldEvent.TILE_UPDATE, 2, 1)
+        assert batches == []
+
+    assert batches == [[(1, 1), (2, 1)]]
+
+
+def test_world_fork_copy_on_write() -> None:
+    world = World()
+    world.width = 10
+    world.height = 10
+    world.fill()
+    _tile(world, 1, 1).fg_id = 8
+    world.add_player(Player(net_id=1, pos=vec2(32, 32)))
+    world.dropped.items.append(DroppedItem(id=2, pos=vec2(64, 64), amount=5, uid=1))
+    world.dropped.nb_items = 1
+
+    fork = world.fork()
+    assert fork.tiles[1 * 10 + 1] is world.tiles[1 * 10 + 1]
+
+    fork.destroy_tile(ivec2(1, 1))
+    fork.move_player(fork.players[1], vec2(96, 96))
+    fork.set_dropped(1, 1)
+
+    assert _tile(fork, 1, 1).fg_id == 0 and _tile(world, 1, 1).fg_id == 8
+    assert fork.players[1].pos == vec2(96, 96) and world.players[1].pos == vec2(32, 32)
+    assert fork.dropped.items[0].amount == 1 and world.dropped.items[0].amount == 5
+    assert fork.player_index.at(3, 3) == [fork.players[1]] and world.player_index.at(3, 3) == []
+    # only the tiles the fork touched were copied
+    assert fork.tiles[2] is world.tiles[2]
+    assert fork.tiles[1 * 10 + 1] is not world.tiles[1 * 10 + 1]
+
+    fork.resize(5, 5)
+    assert len(world.tiles) == 100 and all(t.index == i for i, t in world.tiles.items())
+
+
+def test_world_tile_index() -> None:
+    world = World()
+    world.width = 10
+    world.height = 10
+    world.fill()
+    world.place_tile(DIRT, ivec2(1, 1))
+    assert [t.index for t in world.tiles_with_item(DIRT)] == [11]
+
+    # from here on the index is kept up to date instead of rebuilt
+    world.place_tile(DIRT, ivec2(2, 1))
+    world.destroy_tile(ivec2(1, 1))
+    assert [t.index for t in world.tiles_with_item(DIRT)] == [12]
+
+    for pos, id in ((0, WORLD_LOCK), (99, SMALL_LOCK)):
+        tile = _tile(world, pos)
+        tile.fg_id = id
+        tile.extra = LockTile(type=TileExtraType.LOCK_TILE, owner_uid=7)
+    world.reindex_tiles()
+
+    world.update_lock(ivec2(0, 0), 7, WORLD_LOCK, iter([1, 2]))
+    world.update_lock(ivec2(9, 9), 7, SMALL_LOCK, iter([98]))
+    lock = world.get_world_lock()
+    assert lock and lock.index == 0
+    assert [t.index for t in world.locked_tiles(lock)] == [1, 2]
+    assert [t.index for t in world.locks_owned_by(7)] == [0, 99]
+    assert len(world.tiles_with_extra(TileExtraType.LOCK_TILE)) == 2
+
+    # relocking drops the tiles the lock held before
+    world.update_lock(ivec2(0, 0), 7, WORLD_LOCK, iter([3]))
+    assert [t.index for t in world.locked_tiles(lock)] == [3]
+    assert not _tile(world, 1).lock_index
+
+    world.place_fg(lock, 0)
+    assert world.locked_tiles(lock) == [] and world.get_world_lock() is None
+    assert not _tile(world, 3).lock_index
+
+    world.place_tile(DIRT_SEED, ivec2(5, 5))
+    seed = _tile(world, 5, 5)
+    ready_at = world.tree_ready_at(seed)
+    assert ready_at and world.next_ready_tree() == (ready_at, seed)
+    assert world.ready_trees(ready_at - 1) == []
+    assert world.ready_trees(ready_at) == [seed]
+    world.update_tree(seed, 0, True, False, False)
+    assert world.ready_trees(ready_at) == [] and world.next_ready_tree() is None
+
+    # a tree that came with the world has been growing for time_passed
+    grown = _tile(world, 6, 6)
+    grown.fg_id = DIRT_SEED
+    grown.extra = SeedTile(type=TileExtraType.SEED_TILE, time_passed=item_database.get(DIRT_SEED).grow_time)
+    world.reindex_tiles()
+    assert world.ready_trees(world.received_at) == [grown]
+
+    # a fork reuses the index until it changes a tile, and reading it leaves the tiles shared
+    fork = world.fork()
+    assert fork.tile_index is world.tile_index
+    assert fork.ready_trees(world.received_at) == [grown] and fork.ready_trees(world.received_at)[0] is grown
+    assert not fork._owned_tiles
+    fork.update_tree(_tile(fork, 6, 6), 0, True, False, False)
+    assert fork.tile_index is not world.tile_index
+    assert fork.ready_trees(world.received_at) == [] and world.ready_trees(world.received_at) == [grown]
+    assert [t.index for t in fork.tiles_with_item(DIRT)] == [t.index for t in world.tiles_with_item(DIRT)]